@@ -8,22 +8,32 @@ This script evaluates the triage engine's classification accuracy by:
 4. Calculating accuracy metrics (overall, per-CWE, precision, recall, F1)
 5. Generating a detailed benchmark report with failure analysis
 
+With --timing, it instead measures triage and fix generation speed on a
+synthetic scan (many findings per source file) and reports time per finding.
+
 Usage:
     python scripts/benchmark_triage.py \\
         --dataset tests/fixtures/benchmark_dataset/ground_truth.json \\
         --report docs/reports/triage-benchmark.md
+
+    python scripts/benchmark_triage.py --timing --files 50 --findings 5000
 """
 
 import argparse
 import json
 import sys
+import tempfile
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from flowspec_cli.security.fixer.generator import FixGenerator, FixGeneratorConfig
 from flowspec_cli.security.models import Confidence, Finding, Location, Severity
-from flowspec_cli.security.triage.engine import TriageEngine
+from flowspec_cli.security.source_cache import get_source_cache
+from flowspec_cli.security.triage.engine import TriageConfig, TriageEngine
+from flowspec_cli.security.triage.llm import FakeLLMClient
 
 
 @dataclass
@@ -145,6 +155,154 @@ class BenchmarkResult:
     failures: list[Failure] = field(default_factory=list)
 
 
+@dataclass
+class TimingResult:
+    """Speed of one timed pass over a synthetic scan."""
+
+    name: str
+    findings: int
+    seconds: float
+    cache_hits: int
+    cache_misses: int
+    llm_requests: int = 0
+
+    @property
+    def ms_per_finding(self) -> float:
+        """Milliseconds per finding."""
+        return self.seconds * 1000 / self.findings if self.findings else 0.0
+
+
+def generate_timing_findings(
+    root: Path, num_files: int, num_findings: int, lines_per_file: int = 2000
+) -> list[Finding]:
+    """Write synthetic source files and spread findings across them.
+
+    Args:
+        root: Directory to write source files into
+        num_files: Number of source files
+        num_findings: Total number of findings
+        lines_per_file: Lines in each source file
+
+    Returns:
+        Findings pointing at the generated files
+    """
+    cwes = ["CWE-89", "CWE-79", "CWE-22", "CWE-798", "CWE-327", None]
+    files = []
+    for i in range(num_files):
+        path = root / f"module_{i}.py"
+        path.write_text(
+            "".join(
+                f"query = 'SELECT * FROM t WHERE id=' + user_input  # {n}\n"
+                for n in range(lines_per_file)
+            )
+        )
+        files.append(path)
+
+    findings = []
+    for i in range(num_findings):
+        line = (i * 37) % lines_per_file + 1
+        findings.append(
+            Finding(
+                id=f"PERF-{i:05d}",
+                scanner="benchmark",
+                severity=Severity.HIGH,
+                title="Synthetic finding",
+                description="Synthetic finding for timing",
+                location=Location(
+                    file=files[i % num_files],
+                    line_start=line,
+                    line_end=line,
+                    code_snippet="query = ...",
+                ),
+                cwe_id=cwes[i % len(cwes)],
+                confidence=Confidence.MEDIUM,
+            )
+        )
+    return findings
+
+
+def run_timing_benchmark(
+    num_files: int,
+    num_findings: int,
+    latency: float = 0.0,
+    workers: int = 8,
+    batch_size: int = 10,
+) -> list[TimingResult]:
+    """Time triage and fix generation on a synthetic scan.
+
+    Uses FakeLLMClient, so timings exclude real model latency unless
+    latency is set.
+
+    Args:
+        num_files: Number of source files in the synthetic scan
+        num_findings: Number of findings in the synthetic scan
+        latency: Simulated seconds per LLM request
+        workers: Worker threads for the concurrent triage pass
+        batch_size: Findings per LLM request for the concurrent triage pass
+
+    Returns:
+        TimingResult per pass (cold and warm source cache, concurrent)
+    """
+    cache = get_source_cache()
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="triage-bench-") as tmp:
+        findings = generate_timing_findings(Path(tmp), num_files, num_findings)
+        llm = FakeLLMClient(latency=latency)
+        concurrent = TriageConfig(max_workers=workers, llm_batch_size=batch_size)
+        fixer = FixGenerator(config=FixGeneratorConfig(validate_syntax=False))
+
+        passes = [
+            ("triage (cold cache)", True, lambda: TriageEngine(llm).triage(findings)),
+            ("triage (warm cache)", False, lambda: TriageEngine(llm).triage(findings)),
+            (
+                "triage (concurrent)",
+                False,
+                lambda: TriageEngine(llm, concurrent).triage(findings),
+            ),
+            ("fix generation", False, lambda: fixer.generate_fixes(findings)),
+        ]
+        for name, cold, run in passes:
+            if cold:
+                cache.clear()
+            hits, misses = cache.hits, cache.misses
+            calls = llm.calls
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            results.append(
+                TimingResult(
+                    name=name,
+                    findings=len(findings),
+                    seconds=elapsed,
+                    cache_hits=cache.hits - hits,
+                    cache_misses=cache.misses - misses,
+                    llm_requests=llm.calls - calls,
+                )
+            )
+
+    return results
+
+
+def print_timing_results(results: list[TimingResult], num_files: int) -> None:
+    """Print timing benchmark results."""
+    print("\n" + "=" * 70)
+    print("TIMING SUMMARY")
+    print("=" * 70)
+    print(
+        f"{'Pass':<22} {'Findings':>9} {'Total (s)':>10} {'ms/finding':>11} "
+        f"{'Reads':>6} {'LLM':>6}"
+    )
+    for r in results:
+        print(
+            f"{r.name:<22} {r.findings:>9} {r.seconds:>10.3f} "
+            f"{r.ms_per_finding:>11.3f} {r.cache_misses:>6} {r.llm_requests:>6}"
+        )
+    print(f"\nSource files: {num_files} (Reads = files read from disk)")
+    print("LLM = requests sent to the fake LLM client")
+    print("=" * 70)
+
+
 def load_benchmark_dataset(path: Path) -> tuple[dict[str, Any], list[dict]]:
     """Load benchmark dataset from JSON file.
 
@@ -471,13 +629,11 @@ def main() -> int:
     parser.add_argument(
         "--dataset",
         type=Path,
-        required=True,
         help="Path to ground_truth.json dataset",
     )
     parser.add_argument(
         "--report",
         type=Path,
-        required=True,
         help="Path to write markdown report",
     )
     parser.add_argument(
@@ -485,9 +641,55 @@ def main() -> int:
         action="store_true",
         help="Use LLM-powered classification (requires API key)",
     )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Measure time per finding on a synthetic scan instead of accuracy",
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=50,
+        help="Source files in the synthetic scan (--timing, default: 50)",
+    )
+    parser.add_argument(
+        "--findings",
+        type=int,
+        default=5000,
+        help="Findings in the synthetic scan (--timing, default: 5000)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Simulated seconds per LLM request (--timing, default: 0)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Worker threads for concurrent triage (--timing, default: 8)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10,
+        help="Findings per LLM request for concurrent triage (--timing, default: 10)",
+    )
 
     args = parser.parse_args()
 
+    if args.timing:
+        print(f"Timing {args.findings} findings across {args.files} files...")
+        results = run_timing_benchmark(
+            args.files, args.findings, args.latency, args.workers, args.batch_size
+        )
+        print_timing_results(results, args.files)
+        return 0
+
+    if args.dataset is None or args.report is None:
+        parser.error("--dataset and --report are required unless --timing is set")
+
     # Validate dataset exists
     if not args.dataset.exists():
         print(f"Error: Dataset not found: {args.dataset}", file=sys.stderr)
@@ -35,6 +35,7 @@ import sys
 import tempfile
 import tomllib
 import zipfile
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Tuple
@@ -7684,7 +7685,7 @@ def backlog_migrate(
     console.print()
 
     # Import migration module
-    from .backlog import TaskMapper
+    from .backlog.mapper import TaskMapper
 
     # Create mapper
     mapper = TaskMapper(output_dir)
@@ -7762,11 +7763,8 @@ def backlog_migrate(
                 f"{'Tasks Created':<20} [green]{result['tasks_created']}[/green]"
             )
 
-        # Count completed vs pending
-        from .backlog.parser import TaskParser
-
-        parser = TaskParser()
-        tasks = parser.parse_tasks_file(source_path)
+        # Count completed vs pending from compact task records
+        tasks = mapper.parser.scan_tasks_file(source_path)
         completed = sum(1 for t in tasks if t.is_completed)
         pending = len(tasks) - completed
 
@@ -7927,7 +7925,7 @@ def tasks(
         raise typer.Exit(1)
 
     # Handle backlog format
-    from .backlog import TaskMapper
+    from .backlog.mapper import TaskMapper
 
     # Determine backlog directory
     backlog_dir = (
@@ -9323,7 +9321,7 @@ def security_scan(
         "text",
         "--format",
         "-f",
-        help="Output format (text|json|sarif)",
+        help="Output format (text|json|jsonl|sarif)",
     ),
     output: Optional[Path] = typer.Option(
         None,
@@ -9331,6 +9329,24 @@ def security_scan(
         "-o",
         help="Output file (defaults to stdout)",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        "-i",
+        help="Only scan files changed since the last scan, reusing stored findings",
+    ),
+    baseline: Optional[str] = typer.Option(
+        None,
+        "--baseline",
+        help="Also rescan files that differ from this git ref (with "
+        "--incremental; changes since the last scan are always rescanned)",
+    ),
+    jobs: Optional[str] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Parallel Semgrep workers over balanced file shards (number or 'auto')",
+    ),
 ):
     """Run security scan on target directory.
 
@@ -9348,10 +9364,17 @@ def security_scan(
         flowspec security scan --tool semgrep            # Specify scanner
         flowspec security scan --fail-on critical        # Fail only on critical
         flowspec security scan --format json -o out.json # JSON output to file
+        flowspec security scan --format jsonl            # One finding per line
+        flowspec security scan --incremental             # Rescan changed files only
+        flowspec security scan -i --baseline origin/main # Changes since main
+        flowspec security scan --jobs auto               # One worker per CPU
     """
 
     from flowspec_cli.security.adapters.semgrep import SemgrepAdapter
-    from flowspec_cli.security.exporters.json import JSONExporter
+    from flowspec_cli.security.exporters.json import (
+        JSONExporter,
+        JSONLinesExporter,
+    )
     from flowspec_cli.security.exporters.markdown import MarkdownExporter
     from flowspec_cli.security.exporters.sarif import SARIFExporter
     from flowspec_cli.security.models import Severity
@@ -9369,6 +9392,13 @@ def security_scan(
         )
         raise typer.Exit(2)
 
+    if baseline and not incremental:
+        console.print("[red]--baseline requires --incremental[/red]")
+        raise typer.Exit(2)
+    if incremental and not target.is_dir():
+        console.print("[red]--incremental requires a directory target[/red]")
+        raise typer.Exit(2)
+
     # Initialize orchestrator
     orchestrator = ScannerOrchestrator()
 
@@ -9416,12 +9446,39 @@ def security_scan(
                 console.print(f"[red]Invalid config: {config}[/red]")
                 raise typer.Exit(2)
 
-    # Run scan with progress indicator
+    if jobs is not None:
+        if jobs != "auto" and not (jobs.isdigit() and int(jobs) > 0):
+            console.print(f"[red]Invalid --jobs value: {jobs}[/red]")
+            raise typer.Exit(2)
+        semgrep_config = scanner_config.setdefault("semgrep", {})
+        semgrep_config["jobs"] = jobs if jobs == "auto" else int(jobs)
+
+    # Findings are streamed from the scanners to the exporters; only
+    # per-severity counts and the first rows of the text table are kept
+    severity_counts: Counter[Severity] = Counter()
+    table_rows: list = []
+
+    def tally(findings):
+        for finding in findings:
+            severity_counts[finding.severity] += 1
+            if format == "text" and len(table_rows) < MAX_TABLE_FINDINGS:
+                table_rows.append(finding)
+            yield finding
+
+    scanning = "[bold blue]Scanning for security vulnerabilities...[/bold blue]"
     try:
-        with console.status(
-            "[bold blue]Scanning for security vulnerabilities...[/bold blue]"
-        ):
-            findings = orchestrator.scan(
+        if incremental:
+            # Merging stored findings needs the whole result anyway
+            with console.status(scanning):
+                scan_result = orchestrator.scan_incremental(
+                    target=target,
+                    scanners=tool,
+                    config=scanner_config,
+                    baseline_ref=baseline,
+                )
+            findings = scan_result.findings
+        else:
+            findings = orchestrator.iter_scan(
                 target=target,
                 scanners=tool,
                 deduplicate=True,
@@ -9431,39 +9488,50 @@ def security_scan(
         console.print(f"[red]Scan failed: {e}[/red]")
         raise typer.Exit(2)
 
-    # Output results based on format
-    if format == "sarif":
-        exporter = SARIFExporter()
-        result = exporter.export(findings)  # Returns dict
-        output_text = json.dumps(result, indent=2)
-
-        if output:
-            output.write_text(output_text)
-            console.print(f"[green]✓ SARIF output written to {output}[/green]")
+    # Keep JSON/SARIF on stdout parseable
+    if incremental and (format == "text" or output):
+        if scan_result.full_scan:
+            summary = "no baseline found, scanned all files"
         else:
-            console.print_json(data=result)
-
-    elif format == "json":
-        exporter = JSONExporter(pretty=True)
-        result = exporter.export_dict(findings)  # Returns dict
-        output_text = json.dumps(result, indent=2)
-
-        if output:
-            output.write_text(output_text)
-            console.print(f"[green]✓ JSON output written to {output}[/green]")
+            summary = (
+                f"{len(scan_result.changed_files)} changed, "
+                f"{len(scan_result.deleted_files)} deleted files; "
+                f"reused {scan_result.reused_findings} stored findings"
+            )
+        console.print(f"[dim]Incremental scan: {summary}[/dim]", highlight=False)
+
+    # Output results based on format. Exporters write one finding at a time,
+    # so neither the findings nor the document are held in memory.
+    exporters = {
+        "sarif": (SARIFExporter(), "SARIF output"),
+        "json": (JSONExporter(pretty=True), "JSON output"),
+        "jsonl": (JSONLinesExporter(), "JSON Lines output"),
+    }
+    exporter, written = exporters.get(format, (MarkdownExporter(), "Markdown report"))
+    try:
+        if format in exporters and not output:
+            exporter.write(tally(findings), sys.stdout)
+            if format != "jsonl":
+                sys.stdout.write("\n")
+            sys.stdout.flush()
         else:
-            console.print_json(data=result)
+            with console.status(scanning):
+                if output:
+                    with output.open("w", encoding="utf-8") as f:
+                        exporter.write(tally(findings), f)
+                else:
+                    for _ in tally(findings):
+                        pass
+    except Exception as e:
+        console.print(f"[red]Scan failed: {e}[/red]")
+        raise typer.Exit(2)
 
-    else:
+    if format not in exporters:
         # Text format with table
-        _print_findings_table(console, findings)
-
-        if output:
-            # Export as markdown for text format
-            exporter = MarkdownExporter()
-            markdown = exporter.export(findings)
-            output.write_text(markdown)
-            console.print(f"\n[green]✓ Markdown report written to {output}[/green]")
+        _print_findings_table(console, table_rows, severity_counts)
+    if output:
+        prefix = "\n" if format not in exporters else ""
+        console.print(f"{prefix}[green]✓ {written} written to {output}[/green]")
 
     # Determine exit code based on fail_on threshold
     severity_order = {
@@ -9474,23 +9542,21 @@ def security_scan(
         Severity.INFO: 4,
     }
 
-    has_failures = any(
-        severity_order[f.severity] <= severity_order[fail_severity] for f in findings
+    total = sum(severity_counts.values())
+    failing_count = sum(
+        count
+        for severity, count in severity_counts.items()
+        if severity_order[severity] <= severity_order[fail_severity]
     )
 
-    if has_failures:
-        failing_count = sum(
-            1
-            for f in findings
-            if severity_order[f.severity] <= severity_order[fail_severity]
-        )
+    if failing_count:
         console.print(
             f"\n[red]✗ Found {failing_count} findings at or above {fail_on} severity[/red]"
         )
         raise typer.Exit(1)
-    elif findings:
+    elif total:
         console.print(
-            f"\n[yellow]Found {len(findings)} findings below {fail_on} threshold[/yellow]"
+            f"\n[yellow]Found {total} findings below {fail_on} threshold[/yellow]"
         )
         raise typer.Exit(0)
     else:
@@ -9498,14 +9564,25 @@ def security_scan(
         raise typer.Exit(0)
 
 
-def _print_findings_table(console: Console, findings: list) -> None:
+# Findings listed in the `security scan` text table; the rest are counted
+MAX_TABLE_FINDINGS = 100
+
+
+def _print_findings_table(
+    console: Console, findings: list, severity_counts: Counter | None = None
+) -> None:
     """Print findings as a rich table.
 
     Args:
         console: Rich console for output
         findings: List of Finding objects to display
+        severity_counts: Counts of all findings per severity, when only
+            the first of them are displayed
     """
-    if not findings:
+    total = len(findings)
+    if severity_counts is not None:
+        total = sum(severity_counts.values())
+    if not total:
         console.print("[green]✓ No security issues found[/green]")
         return
 
@@ -9539,7 +9616,22 @@ def _print_findings_table(console: Console, findings: list) -> None:
 
     console.print()
     console.print(table)
-    console.print(f"\nTotal: {len(findings)} findings")
+    if total > len(findings):
+        console.print(
+            f"[dim]Showing the first {len(findings)}; use --format or --output "
+            "for all findings[/dim]"
+        )
+    if severity_counts:
+        from flowspec_cli.security.models import Severity
+
+        breakdown = ", ".join(
+            f"{severity_counts[severity]} {severity.value}"
+            for severity in Severity
+            if severity_counts[severity]
+        )
+        console.print(f"\nTotal: {total} findings ({breakdown})")
+    else:
+        console.print(f"\nTotal: {total} findings")
 
 
 @security_app.command("triage")
@@ -9559,19 +9651,64 @@ def security_triage(
         "--min-severity",
         help="Minimum severity to show (critical|high|medium|low|info)",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the LLM response cache in .flowspec/cache/llm",
+    ),
 ):
     """AI-assisted triage of security findings.
 
     This command helps you triage security findings with AI assistance.
     (Currently a placeholder for future implementation)
 
+    Findings are loaded through the project's findings database
+    (docs/security/findings.db), which also records them for scan-history
+    diffs.
+
     Examples:
         flowspec security triage findings.json
         flowspec security triage findings.json --min-severity high
+        flowspec security triage findings.json --no-cache
     """
+    from flowspec_cli.security.findings_db import (
+        DB_FILENAME,
+        FINDINGS_DIR,
+        FindingsDB,
+    )
+    from flowspec_cli.security.llm_cache import default_llm_cache
+    from flowspec_cli.security.models import Severity
+
+    try:
+        min_level = Severity(min_severity.lower())
+    except ValueError:
+        console.print(f"[red]Invalid severity level: {min_severity}[/red]")
+        console.print("Valid levels: critical, high, medium, low, info")
+        raise typer.Exit(2)
+    levels = list(Severity)
+    severities = [s.value for s in levels[: levels.index(min_level) + 1]]
+
+    try:
+        with FindingsDB(Path.cwd() / FINDINGS_DIR / DB_FILENAME) as db:
+            scan_id = db.sync_json(findings_file)
+            selected = db.query(scan_id=scan_id, severities=severities, limit=0)
+            changes = db.diff(head_scan=scan_id).summary()
+    except ValueError as e:
+        console.print(f"[red]Invalid findings file: {e}[/red]")
+        raise typer.Exit(2)
+
+    llm_cache = default_llm_cache(enabled=not no_cache)
     console.print("[yellow]Triage command coming in Phase 2[/yellow]")
     console.print(f"Would triage: {findings_file}")
+    console.print(
+        f"Findings at or above {min_level.value}: {selected.total} "
+        f"({changes['new']} new, {changes['fixed']} fixed since the previous scan)"
+    )
     console.print(f"Interactive: {interactive}, Min severity: {min_severity}")
+    console.print(
+        f"LLM cache: {llm_cache.cache_dir if llm_cache else 'disabled'}",
+        highlight=False,
+    )
 
 
 @security_app.command("fix")
@@ -9590,20 +9727,56 @@ def security_fix(
         "--dry-run",
         help="Show fix without applying",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the LLM response cache in .flowspec/cache/llm",
+    ),
 ):
     """Generate and optionally apply security fixes.
 
     This command generates fixes for security findings with AI assistance.
     (Currently a placeholder for future implementation)
 
+    Findings are looked up by id in the findings database for the latest
+    scan results in docs/security.
+
     Examples:
         flowspec security fix SEMGREP-001 --dry-run
         flowspec security fix SEMGREP-001 --apply
+        flowspec security fix SEMGREP-001 --no-cache
     """
+    from flowspec_cli.security.findings_db import FINDINGS_DIR, open_findings_db
+    from flowspec_cli.security.llm_cache import default_llm_cache
+
+    llm_cache = default_llm_cache(enabled=not no_cache)
     console.print("[yellow]Fix command coming in Phase 2[/yellow]")
     if finding_id:
         console.print(f"Would fix: {finding_id}")
+        try:
+            db = open_findings_db(Path.cwd() / FINDINGS_DIR)
+        except ValueError as e:
+            console.print(f"[red]Invalid scan results: {e}[/red]")
+            raise typer.Exit(2)
+        if db is not None:
+            with db:
+                finding = db.get(finding_id)
+            if finding is None:
+                console.print(
+                    f"[yellow]Finding {finding_id} not in the latest scan[/yellow]"
+                )
+            else:
+                location = finding["location"]
+                console.print(
+                    f"Finding: {finding['title']} "
+                    f"({location['file']}:{location['line_start']})",
+                    highlight=False,
+                )
         console.print(f"Apply: {apply}, Dry run: {dry_run}")
+        console.print(
+            f"LLM cache: {llm_cache.cache_dir if llm_cache else 'disabled'}",
+            highlight=False,
+        )
     else:
         console.print("No finding ID provided")
 
@@ -9643,9 +9816,28 @@ def security_audit(
         flowspec security audit --format html --output audit.html
         flowspec security audit --compliance owasp
     """
+    from flowspec_cli.security.findings_db import FINDINGS_DIR, open_findings_db
+
     console.print("[yellow]Audit command coming in Phase 2[/yellow]")
     console.print(f"Would audit: {target}")
     console.print(f"Format: {format}, Compliance: {compliance}")
+
+    project_dir = target if target.is_dir() else target.parent
+    try:
+        db = open_findings_db(project_dir / FINDINGS_DIR)
+    except ValueError as e:
+        console.print(f"[red]Invalid scan results: {e}[/red]")
+        raise typer.Exit(2)
+    if db is not None:
+        with db:
+            counts = db.counts_by_severity()
+            changes = db.diff().summary()
+        summary = ", ".join(f"{count} {level}" for level, count in counts.items())
+        console.print(f"Latest scan: {sum(counts.values())} findings ({summary})")
+        console.print(
+            f"Since the previous scan: {changes['new']} new, "
+            f"{changes['fixed']} fixed, {changes['persisting']} persisting"
+        )
     if output:
         console.print(f"Output: {output}")
 
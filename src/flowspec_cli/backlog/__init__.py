@@ -10,6 +10,7 @@ from .shim import (
     start_task,
     task_archive,
     task_create,
+    task_create_batch,
     task_edit,
     task_list,
     task_search,
@@ -26,6 +27,7 @@ __all__ = [
     "start_task",
     "task_archive",
     "task_create",
+    "task_create_batch",
     "task_edit",
     "task_list",
     "task_search",
@@ -0,0 +1,818 @@
+"""In-process file backend for backlog CLI operations.
+
+This module interprets backlog CLI commands by reading and writing the
+``backlog/tasks/*.md`` files directly, so a shim call costs a file read or
+write instead of starting a Node.js process. Task creation is batched: IDs for
+any number of new tasks are allocated from a single scan of the backlog.
+
+The backend only handles commands it can reproduce faithfully. Anything else
+(unknown flags, subtasks, interactive views) returns None so callers fall back
+to the backlog CLI. The backend is also bypassed when direct file access would
+diverge from the CLI:
+
+    - No ``backlog/config.yml`` or ``backlog/tasks`` directory
+    - Writes when ``auto_commit`` is enabled (the CLI commits every change)
+    - Task creation when ``check_active_branches`` is enabled and task IDs on
+      other active branches cannot be read with git
+
+Backend selection is controlled by the FLOWSPEC_BACKLOG_BACKEND environment
+variable: "cli" (default) always runs the backlog CLI, "files" uses this
+backend whenever it is safe.
+
+Example:
+    >>> backend = FileBacklogBackend(Path.cwd())
+    >>> task_ids = backend.create_tasks([{"title": "Fix XSS in login form"}])
+    >>> exit_code, stdout, stderr = backend.run(["task", task_ids[0], "--plain"])
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV = "FLOWSPEC_BACKLOG_BACKEND"
+
+# Directories (relative to backlog/) whose task IDs are taken when allocating
+ID_DIRS = ("tasks", "drafts", "completed", "archive/tasks", "archive/drafts")
+
+TASK_FILE_PATTERN = re.compile(r"^(task-\d+(?:\.\d+)*)(?: - .*)?\.md$")
+
+STATUS_ICONS = {"to do": "○", "in progress": "◐", "done": "✔"}
+
+SEPARATOR = "-" * 50
+
+CommandResult = tuple[int, str, str]
+
+
+class _FrontmatterLoader(yaml.SafeLoader):
+    """SafeLoader that keeps dates as strings so they round-trip unchanged."""
+
+
+_FrontmatterLoader.yaml_implicit_resolvers = {
+    key: [(tag, regexp) for tag, regexp in resolvers if not tag.endswith(":timestamp")]
+    for key, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+class _FrontmatterDumper(yaml.SafeDumper):
+    """SafeDumper that indents block sequences like the backlog CLI."""
+
+    def increase_indent(self, flow: bool = False, indentless: bool = False):
+        return super().increase_indent(flow, False)
+
+
+def _represent_str(dumper: yaml.SafeDumper, value: str) -> yaml.ScalarNode:
+    # Quote strings with colons (dates, 'workflow:Specified') as the CLI does
+    style = "'" if ":" in value and "\n" not in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_FrontmatterDumper.add_representer(str, _represent_str)
+
+
+@dataclass
+class BacklogTask:
+    """A task file loaded from the backlog.
+
+    Attributes:
+        path: Path to the task markdown file.
+        frontmatter: Parsed YAML frontmatter, in file order.
+        body: Markdown body after the frontmatter.
+    """
+
+    path: Path
+    frontmatter: dict[str, Any]
+    body: str
+
+    @property
+    def task_id(self) -> str:
+        return str(self.frontmatter.get("id", ""))
+
+    @property
+    def title(self) -> str:
+        return str(self.frontmatter.get("title", ""))
+
+    @property
+    def status(self) -> str:
+        return str(self.frontmatter.get("status", ""))
+
+    @property
+    def priority(self) -> str | None:
+        priority = self.frontmatter.get("priority")
+        return str(priority) if priority else None
+
+    @property
+    def labels(self) -> list[str]:
+        return [str(label) for label in self.frontmatter.get("labels") or []]
+
+    @property
+    def assignees(self) -> list[str]:
+        return [str(name) for name in self.frontmatter.get("assignee") or []]
+
+    def render(self) -> str:
+        """Render the task file content."""
+        frontmatter = yaml.dump(
+            self.frontmatter,
+            Dumper=_FrontmatterDumper,
+            sort_keys=False,
+            allow_unicode=True,
+            default_flow_style=False,
+            width=float("inf"),
+        )
+        return f"---\n{frontmatter}---\n{self.body}"
+
+
+def task_id_key(task_id: str) -> tuple[int, ...]:
+    """Numeric sort key for a task ID ('task-12.3' -> (12, 3))."""
+    number = task_id.lower().removeprefix("task-")
+    try:
+        return tuple(int(part) for part in number.split("."))
+    except ValueError:
+        return ()
+
+
+def sanitize_title(title: str) -> str:
+    """Convert a task title to the backlog CLI's file name form."""
+    slug = re.sub(r"\s+", "-", title.strip())
+    slug = re.sub(r"[^A-Za-z0-9._-]", "", slug)
+    return re.sub(r"-{2,}", "-", slug).strip("-")
+
+
+def parse_task_file(path: Path) -> BacklogTask:
+    """Load a task file into a BacklogTask.
+
+    Raises:
+        ValueError: If the file has no valid YAML frontmatter.
+    """
+    content = path.read_text(encoding="utf-8")
+    if not content.startswith("---"):
+        raise ValueError(f"Task file has no frontmatter: {path}")
+    try:
+        _, raw_frontmatter, body = content.split("---", 2)
+        frontmatter = yaml.load(raw_frontmatter, Loader=_FrontmatterLoader) or {}
+    except (ValueError, yaml.YAMLError) as e:
+        raise ValueError(f"Invalid task file {path}: {e}") from e
+    if not isinstance(frontmatter, dict):
+        raise ValueError(f"Invalid task frontmatter: {path}")
+    # Body is kept verbatim after the closing marker's newline
+    return BacklogTask(path=path, frontmatter=frontmatter, body=body[1:])
+
+
+def get_section(body: str, title: str) -> str | None:
+    """Return the text of a '## title' section without marker comments."""
+    lines = _section_lines(body, title)
+    if lines is None:
+        return None
+    content = [
+        line
+        for line in lines
+        if not (line.strip().startswith("<!--") and line.strip().endswith("-->"))
+    ]
+    return "\n".join(content).strip()
+
+
+def set_section(body: str, title: str, marker: str, content: str) -> str:
+    """Replace (or append) a '## title' section wrapped in SECTION markers."""
+    section = [
+        f"## {title}",
+        "",
+        f"<!-- SECTION:{marker}:BEGIN -->",
+        content.strip(),
+        f"<!-- SECTION:{marker}:END -->",
+    ]
+    leading = body[: len(body) - len(body.lstrip("\n"))] or "\n"
+    lines = body.strip("\n").split("\n")
+    start, end = _section_bounds(lines, title)
+    if start is None:
+        # Plans precede notes, everything else is appended
+        notes_start, _ = _section_bounds(lines, "Implementation Notes")
+        if title == "Implementation Plan" and notes_start is not None:
+            lines[notes_start:notes_start] = section + [""]
+        else:
+            lines.extend([""] + section)
+    else:
+        lines[start:end] = section
+    return leading + "\n".join(lines).strip("\n") + "\n"
+
+
+def _section_bounds(lines: list[str], title: str) -> tuple[int | None, int]:
+    heading = f"## {title}"
+    for start, line in enumerate(lines):
+        if line.strip() == heading:
+            end = start + 1
+            while end < len(lines) and not lines[end].startswith("## "):
+                end += 1
+            # Keep blank lines separating this section from the next
+            while end > start + 1 and not lines[end - 1].strip():
+                end -= 1
+            return start, end
+    return None, len(lines)
+
+
+def _section_lines(body: str, title: str) -> list[str] | None:
+    lines = body.split("\n")
+    start, end = _section_bounds(lines, title)
+    if start is None:
+        return None
+    return lines[start + 1 : end]
+
+
+class FileBacklogBackend:
+    """Backlog operations performed directly on task files.
+
+    Attributes:
+        workspace_root: Project root containing the backlog directory.
+        backlog_dir: The backlog directory (workspace_root / "backlog").
+        tasks_dir: Directory of active task files.
+        config: Parsed backlog/config.yml.
+    """
+
+    def __init__(self, workspace_root: Path):
+        """Initialize backend for a workspace.
+
+        Args:
+            workspace_root: Project root containing the backlog directory.
+        """
+        self.workspace_root = Path(workspace_root)
+        self.backlog_dir = self.workspace_root / "backlog"
+        self.tasks_dir = self.backlog_dir / "tasks"
+        self._config_stamp = self._read_config_stamp()
+        self.config = self._load_config()
+        self._index: dict[str, str] = {}
+        self._index_mtime_ns: int | None = None
+
+    # --- Safety ---
+
+    def is_available(self, *, write: bool = False) -> bool:
+        """Check whether direct file access matches CLI behavior.
+
+        Args:
+            write: Whether the operation modifies task files.
+
+        Returns:
+            True if the backend can be used for the operation.
+        """
+        if self.config is None or not self.tasks_dir.is_dir():
+            return False
+        if write and self.config.get("auto_commit"):
+            return False
+        return True
+
+    def _read_config_stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = (self.backlog_dir / "config.yml").stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def config_changed(self) -> bool:
+        """Check whether backlog/config.yml changed since it was loaded."""
+        return self._read_config_stamp() != self._config_stamp
+
+    def _load_config(self) -> dict[str, Any] | None:
+        config_path = self.backlog_dir / "config.yml"
+        try:
+            config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(f"Could not read backlog config: {e}")
+            return None
+        return config if isinstance(config, dict) else None
+
+    # --- Task lookup ---
+
+    def _task_index(self) -> dict[str, str]:
+        """Map lowercase task IDs to file names, rescanning on directory change."""
+        mtime_ns = self.tasks_dir.stat().st_mtime_ns
+        if mtime_ns != self._index_mtime_ns:
+            index = {}
+            with os.scandir(self.tasks_dir) as entries:
+                for entry in entries:
+                    match = TASK_FILE_PATTERN.match(entry.name)
+                    if match:
+                        index[match.group(1).lower()] = entry.name
+            self._index = index
+            self._index_mtime_ns = mtime_ns
+        return self._index
+
+    def find_task(self, task_id: str) -> Path | None:
+        """Find an active task file by ID ('task-12', 'TASK-012' or '12')."""
+        index = self._task_index()
+        key = task_id.strip().lower()
+        if not key.startswith("task-"):
+            key = f"task-{key}"
+        if key in index:
+            return self.tasks_dir / index[key]
+
+        # IDs may be written with different zero padding
+        wanted = task_id_key(key)
+        if not wanted:
+            return None
+        for candidate, filename in index.items():
+            if task_id_key(candidate) == wanted:
+                return self.tasks_dir / filename
+        return None
+
+    def load_tasks(self) -> list[BacklogTask]:
+        """Load all active tasks, sorted by ID."""
+        tasks = []
+        for filename in self._task_index().values():
+            try:
+                tasks.append(parse_task_file(self.tasks_dir / filename))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable task file {filename}: {e}")
+        return sorted(tasks, key=lambda task: task_id_key(task.task_id))
+
+    # --- Command dispatch ---
+
+    def run(self, args: list[str]) -> CommandResult | None:
+        """Run a backlog CLI command in-process.
+
+        Args:
+            args: Command arguments (excluding 'backlog').
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr), or None if the command is not
+            supported and should be run by the backlog CLI.
+        """
+        if len(args) < 2 or args[0] != "task":
+            return None
+
+        handlers = {
+            "create": self._run_create,
+            "edit": self._run_edit,
+            "list": self._run_list,
+            "search": self._run_search,
+            "archive": self._run_archive,
+            "view": self._run_view,
+        }
+        command, rest = args[1], args[2:]
+        if command not in handlers:
+            # `backlog task <id> --plain` is shorthand for view
+            command, rest = "view", args[1:]
+
+        try:
+            return handlers[command](rest)
+        except _Unsupported:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"File backend failed, falling back to backlog CLI: {e}")
+            return None
+
+    def _run_create(self, args: list[str]) -> CommandResult:
+        title, options = _parse_args(
+            args,
+            single={"--description", "--priority"},
+            multi={"--label", "--ac"},
+        )
+        task_ids = self.create_tasks(
+            [
+                {
+                    "title": title,
+                    "description": options.get("--description"),
+                    "priority": options.get("--priority"),
+                    "labels": options.get("--label"),
+                    "acceptance_criteria": options.get("--ac"),
+                }
+            ]
+        )
+        if task_ids is None:
+            raise _Unsupported
+        if not task_ids:
+            return 1, "", "Task creation failed"
+        path = self.find_task(task_ids[0])
+        return 0, f"Created task {task_ids[0]}\nFile: {path}\n", ""
+
+    def _run_edit(self, args: list[str]) -> CommandResult:
+        task_id, options = _parse_args(
+            args,
+            single={"-s", "--title", "--priority", "--plan", "--notes"},
+            multi={"-l", "-a", "--check-ac", "--uncheck-ac"},
+        )
+        if not self.is_available(write=True):
+            raise _Unsupported
+        path = self.find_task(task_id)
+        if path is None:
+            return 1, "", f"Task {task_id} not found."
+        task = parse_task_file(path)
+
+        if "-s" in options:
+            status = self._canonical_status(options["-s"])
+            if status is None:
+                raise _Unsupported
+            task.frontmatter["status"] = status
+        if "--title" in options:
+            task.frontmatter["title"] = options["--title"]
+        if "--priority" in options:
+            task.frontmatter["priority"] = options["--priority"].lower()
+        if "-l" in options:
+            task.frontmatter["labels"] = options["-l"]
+        if "-a" in options:
+            task.frontmatter["assignee"] = options["-a"]
+
+        for flag, checked in (("--check-ac", True), ("--uncheck-ac", False)):
+            for index in options.get(flag, []):
+                body = _set_criterion(task.body, int(index), checked)
+                if body is None:
+                    return 1, "", f"Acceptance criterion #{index} not found."
+                task.body = body
+
+        if "--plan" in options:
+            task.body = set_section(
+                task.body, "Implementation Plan", "PLAN", options["--plan"]
+            )
+        if "--notes" in options:
+            task.body = set_section(
+                task.body, "Implementation Notes", "NOTES", options["--notes"]
+            )
+
+        task.frontmatter["updated_date"] = _now()
+        new_path = path
+        if "--title" in options:
+            new_path = self.tasks_dir / self._filename(task.task_id, task.title)
+        _write_atomic(new_path, task.render())
+        if new_path != path:
+            path.unlink()
+        return 0, f"Updated task {task.task_id}\n", ""
+
+    def _run_view(self, args: list[str]) -> CommandResult:
+        task_id, options = _parse_args(args, flags={"--plain"})
+        if "--plain" not in options:
+            raise _Unsupported
+        path = self.find_task(task_id)
+        if path is None:
+            return 1, "", f"Task {task_id} not found."
+        return 0, format_task_plain(parse_task_file(path)), ""
+
+    def _run_list(self, args: list[str]) -> CommandResult:
+        _, options = _parse_args(
+            args, single={"-s", "-a"}, multi={"-l"}, flags={"--plain"}, positional=0
+        )
+        if "--plain" not in options:
+            raise _Unsupported
+        tasks = self.load_tasks()
+        if "-s" in options:
+            status = options["-s"].lower()
+            tasks = [task for task in tasks if task.status.lower() == status]
+        if "-l" in options:
+            wanted = {label.lower() for label in options["-l"]}
+            tasks = [
+                task
+                for task in tasks
+                if wanted & {label.lower() for label in task.labels}
+            ]
+        if "-a" in options:
+            assignee = options["-a"].lower().lstrip("@")
+            tasks = [
+                task
+                for task in tasks
+                if assignee in {name.lower().lstrip("@") for name in task.assignees}
+            ]
+        return 0, self._format_list_plain(tasks), ""
+
+    def _run_search(self, args: list[str]) -> CommandResult:
+        query, options = _parse_args(
+            args, single={"--status", "--priority", "--limit"}, flags={"--plain"}
+        )
+        terms = query.lower().split()
+        results = []
+        for task in self.load_tasks():
+            if "--status" in options and task.status.lower() != (
+                options["--status"].lower()
+            ):
+                continue
+            if "--priority" in options and (task.priority or "").lower() != (
+                options["--priority"].lower()
+            ):
+                continue
+            haystack = " ".join(
+                [task.task_id, task.title, " ".join(task.labels), task.body]
+            ).lower()
+            if all(term in haystack for term in terms):
+                results.append(task)
+        if "--limit" in options:
+            results = results[: int(options["--limit"])]
+
+        lines = ["Tasks:"] if results else ["No tasks found."]
+        lines.extend(
+            f"  {task.task_id} - {task.title} ({task.status})" for task in results
+        )
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _run_archive(self, args: list[str]) -> CommandResult:
+        task_id, _ = _parse_args(args)
+        if not self.is_available(write=True):
+            raise _Unsupported
+        path = self.find_task(task_id)
+        if path is None:
+            return 1, "", f"Task {task_id} not found."
+        archive_dir = self.backlog_dir / "archive" / "tasks"
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        task_id = parse_task_file(path).task_id
+        os.replace(path, archive_dir / path.name)
+        return 0, f"Archived task {task_id}\n", ""
+
+    # --- Batched creation ---
+
+    def create_tasks(self, specs: list[dict[str, Any]]) -> list[str] | None:
+        """Create many tasks with one ID allocation pass.
+
+        Args:
+            specs: Task definitions with keys: title (required), description,
+                priority, labels, acceptance_criteria, status, assignee.
+
+        Returns:
+            Created task IDs in input order (stopping at the first write
+            failure), or None if direct creation is not safe here (use the
+            backlog CLI instead).
+        """
+        if not self.is_available(write=True):
+            return None
+        taken = self._taken_ids()
+        if taken is None:
+            return None
+
+        next_number = max((key[0] for key in taken if key), default=0) + 1
+        padding = int(self.config.get("zero_padded_ids") or 0)
+        default_status = str(self.config.get("default_status") or "To Do")
+        created_date = _now()
+        task_ids = []
+
+        for spec in specs:
+            task_id = f"task-{next_number:0{padding}d}"
+            next_number += 1
+
+            frontmatter: dict[str, Any] = {
+                "id": task_id,
+                "title": spec["title"],
+                "status": spec.get("status") or default_status,
+                "assignee": list(spec.get("assignee") or []),
+                "created_date": created_date,
+                "labels": list(spec.get("labels") or []),
+                "dependencies": [],
+            }
+            if spec.get("priority"):
+                frontmatter["priority"] = str(spec["priority"]).lower()
+
+            body_parts = []
+            if spec.get("description"):
+                body_parts.append(
+                    "## Description\n\n<!-- SECTION:DESCRIPTION:BEGIN -->\n"
+                    f"{spec['description']}\n<!-- SECTION:DESCRIPTION:END -->"
+                )
+            criteria = spec.get("acceptance_criteria") or []
+            if criteria:
+                items = "\n".join(
+                    f"- [ ] #{number} {text}" for number, text in enumerate(criteria, 1)
+                )
+                body_parts.append(
+                    f"## Acceptance Criteria\n<!-- AC:BEGIN -->\n{items}\n<!-- AC:END -->"
+                )
+
+            task = BacklogTask(
+                path=self.tasks_dir / self._filename(task_id, spec["title"]),
+                frontmatter=frontmatter,
+                body="\n" + "\n\n".join(body_parts) + "\n" if body_parts else "",
+            )
+            try:
+                _write_atomic(task.path, task.render())
+            except OSError as e:
+                logger.error(f"Failed to write task {task_id}: {e}")
+                break
+            task_ids.append(task_id)
+
+        return task_ids
+
+    def _taken_ids(self) -> set[tuple[int, ...]] | None:
+        """Collect task IDs in use locally and, if configured, on active branches."""
+        taken = set()
+        for relative in ID_DIRS:
+            directory = self.backlog_dir / relative
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        match = TASK_FILE_PATTERN.match(entry.name)
+                        if match:
+                            taken.add(task_id_key(match.group(1)))
+            except FileNotFoundError:
+                continue
+
+        if self.config.get("check_active_branches"):
+            branch_ids = self._branch_task_ids()
+            if branch_ids is None:
+                return None
+            taken |= branch_ids
+        return taken
+
+    def _branch_task_ids(self) -> set[tuple[int, ...]] | None:
+        """Task IDs on branches with commits in the last active_branch_days."""
+        days = int(self.config.get("active_branch_days") or 30)
+        cutoff = time.time() - days * 24 * 60 * 60
+        try:
+            refs = _git(
+                self.workspace_root,
+                "for-each-ref",
+                "--format=%(committerdate:unix) %(refname)",
+                "refs/heads",
+                "refs/remotes",
+            )
+            taken = set()
+            for line in refs.splitlines():
+                timestamp, _, ref = line.partition(" ")
+                if not timestamp.isdigit() or int(timestamp) < cutoff:
+                    continue
+                paths = _git(
+                    self.workspace_root,
+                    "ls-tree",
+                    "-r",
+                    "--name-only",
+                    ref,
+                    "--",
+                    *(f"backlog/{relative}" for relative in ID_DIRS),
+                )
+                for path in paths.splitlines():
+                    match = TASK_FILE_PATTERN.match(path.rsplit("/", 1)[-1])
+                    if match:
+                        taken.add(task_id_key(match.group(1)))
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Cannot read task IDs from branches: {e}")
+            return None
+        return taken
+
+    # --- Formatting helpers ---
+
+    def _filename(self, task_id: str, title: str) -> str:
+        return f"{task_id} - {sanitize_title(title)}.md"
+
+    def _canonical_status(self, status: str) -> str | None:
+        statuses = self.config.get("statuses") or ["To Do", "In Progress", "Done"]
+        for candidate in statuses:
+            if str(candidate).lower() == status.lower():
+                return str(candidate)
+        return None
+
+    def _format_list_plain(self, tasks: list[BacklogTask]) -> str:
+        if not tasks:
+            return "No tasks found.\n"
+        statuses = [
+            str(status) for status in self.config.get("statuses") or []
+        ] or sorted({task.status for task in tasks})
+        by_status: dict[str, list[BacklogTask]] = {}
+        for task in tasks:
+            by_status.setdefault(task.status, []).append(task)
+        ordered = statuses + [s for s in by_status if s not in statuses]
+
+        lines = []
+        for status in ordered:
+            group = by_status.get(status)
+            if not group:
+                continue
+            lines.append(f"{status}:")
+            for task in group:
+                prefix = f"[{task.priority.upper()}] " if task.priority else ""
+                lines.append(f"  {prefix}{task.task_id} - {task.title}")
+            lines.append("")
+        return "\n".join(lines)
+
+
+def format_task_plain(task: BacklogTask) -> str:
+    """Render a task like `backlog task <id> --plain`."""
+    icon = STATUS_ICONS.get(task.status.lower(), "○")
+    lines = [
+        f"File: {task.path}",
+        "",
+        f"Task {task.task_id} - {task.title}",
+        "=" * 50,
+        "",
+        f"Status: {icon} {task.status}",
+    ]
+    if task.priority:
+        lines.append(f"Priority: {task.priority.capitalize()}")
+    if task.assignees:
+        lines.append(f"Assignee: {', '.join(task.assignees)}")
+    if task.labels:
+        lines.append(f"Labels: {', '.join(task.labels)}")
+    for key, label in (("created_date", "Created"), ("updated_date", "Updated")):
+        if task.frontmatter.get(key):
+            lines.append(f"{label}: {task.frontmatter[key]}")
+    dependencies = task.frontmatter.get("dependencies") or []
+    if dependencies:
+        lines.append(f"Dependencies: {', '.join(str(d) for d in dependencies)}")
+
+    for title, heading in (
+        ("Description", "Description:"),
+        ("Acceptance Criteria", "Acceptance Criteria:"),
+        ("Implementation Plan", "Implementation Plan:"),
+        ("Implementation Notes", "Implementation Notes:"),
+    ):
+        content = get_section(task.body, title)
+        if content:
+            lines.extend(["", heading, SEPARATOR, content])
+
+    return "\n".join(lines) + "\n"
+
+
+class _Unsupported(Exception):
+    """Raised when a command must be delegated to the backlog CLI."""
+
+
+def _parse_args(
+    args: list[str],
+    *,
+    single: set[str] = frozenset(),
+    multi: set[str] = frozenset(),
+    flags: set[str] = frozenset(),
+    positional: int = 1,
+) -> tuple[str, dict[str, Any]]:
+    """Parse CLI arguments, raising _Unsupported on anything unexpected."""
+    positionals: list[str] = []
+    options: dict[str, Any] = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in flags:
+            options[arg] = True
+        elif arg in single or arg in multi:
+            if i + 1 >= len(args):
+                raise _Unsupported
+            i += 1
+            if arg in multi:
+                options.setdefault(arg, []).append(args[i])
+            else:
+                options[arg] = args[i]
+        elif arg.startswith("-"):
+            raise _Unsupported
+        else:
+            positionals.append(arg)
+        i += 1
+    if len(positionals) != positional:
+        raise _Unsupported
+    return (positionals[0] if positionals else ""), options
+
+
+def _set_criterion(body: str, index: int, checked: bool) -> str | None:
+    """Check or uncheck acceptance criterion #index; None if not found."""
+    pattern = re.compile(rf"^(\s*-\s+\[)[ xX](\]\s+#{index}\s)", re.MULTILINE)
+    mark = "x" if checked else " "
+    body, count = pattern.subn(rf"\g<1>{mark}\g<2>", body, count=1)
+    return body if count else None
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True, timeout=30
+    )
+    return result.stdout
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+_backends: dict[Path, FileBacklogBackend] = {}
+
+
+def get_file_backend(workspace_root: Path | None = None) -> FileBacklogBackend | None:
+    """Return the file backend for a workspace if enabled and available.
+
+    The backend is enabled with FLOWSPEC_BACKLOG_BACKEND=files. Instances are
+    reused across calls so the task index is loaded once per process; the
+    configuration is reloaded when backlog/config.yml changes.
+
+    Args:
+        workspace_root: Project root. Defaults to current directory.
+
+    Returns:
+        FileBacklogBackend, or None to use the backlog CLI.
+    """
+    if os.environ.get(BACKEND_ENV, "cli").lower() != "files":
+        return None
+
+    root = Path(workspace_root or Path.cwd()).resolve()
+    backend = _backends.get(root)
+    if backend is None or backend.config_changed():
+        backend = FileBacklogBackend(root)
+        _backends[root] = backend
+    return backend if backend.is_available() else None
@@ -2,30 +2,37 @@
 Dependency graph builder for flowspec tasks.
 
 Builds and visualizes task dependencies to help with planning and execution.
+
+All graph algorithms are iterative and linear (or O(n log n) where a
+deterministic ordering is required), so very large plans neither hit the
+recursion limit nor degrade quadratically.
 """
 
+import heapq
 from typing import Optional
 from collections import defaultdict
-from .parser import Task
+from .parser import Task, TaskRecord
 
 
 class DependencyGraphBuilder:
     """Builder for task dependency graphs."""
 
-    def __init__(self, tasks: list[Task]):
+    def __init__(self, tasks: list[Task | TaskRecord]):
         """
         Initialize the dependency graph builder.
 
         Args:
-            tasks: List of Task objects to build graph from
+            tasks: List of Task objects (or compact TaskRecord objects) to
+                build graph from
         """
         self.tasks = tasks
         self.task_map = {task.task_id: task for task in tasks}
         self.graph: dict[str, list[str]] = defaultdict(list)
+        self.in_degree: dict[str, int] = {}
         self._build_graph()
 
     def _build_graph(self):
-        """Build adjacency list representation of dependency graph."""
+        """Build adjacency list and in-degree table of the dependency graph."""
         for task in self.tasks:
             # Add edges from dependencies to this task
             for dep_id in task.dependencies:
@@ -35,6 +42,11 @@ class DependencyGraphBuilder:
             if task.task_id not in self.graph:
                 self.graph[task.task_id] = []
 
+        # In-degree counts every declared dependency, including dangling ones,
+        # so tasks blocked by missing tasks never become ready
+        for task_id, task in self.task_map.items():
+            self.in_degree[task_id] = len(task.dependencies)
+
     def get_dependencies(self, task_id: str) -> list[str]:
         """
         Get direct dependencies for a task.
@@ -81,19 +93,24 @@ class DependencyGraphBuilder:
             return []
 
         visited.add(task_id)
-        all_deps = []
+        result = []
+        seen = set()
 
-        for dep_id in self.get_dependencies(task_id):
-            all_deps.append(dep_id)
-            all_deps.extend(self.get_all_dependencies(dep_id, visited))
+        # Iterative pre-order DFS (same order as the recursive definition)
+        stack = [iter(self.get_dependencies(task_id))]
+        while stack:
+            dep_id = next(stack[-1], None)
+            if dep_id is None:
+                stack.pop()
+                continue
 
-        # Remove duplicates while preserving order
-        seen = set()
-        result = []
-        for dep in all_deps:
-            if dep not in seen:
-                seen.add(dep)
-                result.append(dep)
+            if dep_id not in seen:
+                seen.add(dep_id)
+                result.append(dep_id)
+
+            if dep_id not in visited and dep_id in self.task_map:
+                visited.add(dep_id)
+                stack.append(iter(self.get_dependencies(dep_id)))
 
         return result
 
@@ -107,28 +124,21 @@ class DependencyGraphBuilder:
         Raises:
             ValueError: If circular dependency detected
         """
-        # Kahn's algorithm for topological sort
-        in_degree = defaultdict(int)
-
-        # Calculate in-degrees
-        for task_id in self.task_map.keys():
-            in_degree[task_id] = len(self.get_dependencies(task_id))
-
-        # Queue of tasks with no dependencies
+        # Kahn's algorithm with a min-heap so ties resolve by task ID
+        in_degree = dict(self.in_degree)
         queue = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        heapq.heapify(queue)
         result = []
 
         while queue:
-            # Sort by task ID to ensure consistent ordering
-            queue.sort()
-            task_id = queue.pop(0)
+            task_id = heapq.heappop(queue)
             result.append(task_id)
 
             # Reduce in-degree for dependent tasks
             for dependent in self.get_dependents(task_id):
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
-                    queue.append(dependent)
+                    heapq.heappush(queue, dependent)
 
         # Check for cycles
         if len(result) != len(self.task_map):
@@ -147,36 +157,33 @@ class DependencyGraphBuilder:
         Returns:
             List of batches, where each batch is a list of task IDs
         """
-        # Build batches using level-by-level topological sort
-        in_degree = {
-            task_id: len(self.get_dependencies(task_id))
-            for task_id in self.task_map.keys()
-        }
+        # Level-by-level Kahn's algorithm: each batch is built only from the
+        # dependents released by the previous batch
+        in_degree = dict(self.in_degree)
+        current_batch = [
+            task_id for task_id, degree in in_degree.items() if degree == 0
+        ]
 
         batches = []
-        remaining = set(self.task_map.keys())
-
-        while remaining:
-            # Find all tasks with no remaining dependencies
-            current_batch = [
-                task_id for task_id in remaining if in_degree[task_id] == 0
-            ]
-
-            if not current_batch:
-                missing = remaining
-                raise ValueError(
-                    f"Circular dependency detected involving tasks: {missing}"
-                )
+        scheduled = 0
 
+        while current_batch:
             # Sort batch for consistent ordering
             current_batch.sort()
             batches.append(current_batch)
+            scheduled += len(current_batch)
 
-            # Remove batch from remaining and update in-degrees
+            next_batch = []
             for task_id in current_batch:
-                remaining.remove(task_id)
                 for dependent in self.get_dependents(task_id):
                     in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_batch.append(dependent)
+            current_batch = next_batch
+
+        if scheduled != len(self.task_map):
+            missing = {task_id for task_id, degree in in_degree.items() if degree > 0}
+            raise ValueError(f"Circular dependency detected involving tasks: {missing}")
 
         return batches
 
@@ -205,32 +212,34 @@ class DependencyGraphBuilder:
         Returns:
             List of task IDs on the critical path
         """
-        # Use dynamic programming to find longest path
-        memo = {}
-
-        def longest_path(task_id: str) -> int:
-            if task_id in memo:
-                return memo[task_id]
-
-            dependents = self.get_dependents(task_id)
-            if not dependents:
-                memo[task_id] = 1
-                return 1
+        if not self.task_map:
+            return []
 
-            max_length = 1 + max(longest_path(dep) for dep in dependents)
-            memo[task_id] = max_length
-            return max_length
+        # Topological order over known tasks; dangling dependencies do not
+        # constrain the path
+        in_degree = {
+            task_id: sum(1 for dep in task.dependencies if dep in self.task_map)
+            for task_id, task in self.task_map.items()
+        }
+        order = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        for task_id in order:
+            for dependent in self.get_dependents(task_id):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    order.append(dependent)
 
-        # Find task with longest path
-        for task_id in self.task_map.keys():
-            longest_path(task_id)
+        if len(order) != len(self.task_map):
+            missing = {task_id for task_id, degree in in_degree.items() if degree > 0}
+            raise ValueError(f"Circular dependency detected involving tasks: {missing}")
 
-        # Reconstruct path
-        if not memo:
-            return []
+        # Longest path starting at each task, filled in reverse topological order
+        length: dict[str, int] = {}
+        for task_id in reversed(order):
+            dependents = self.get_dependents(task_id)
+            length[task_id] = 1 + max((length[dep] for dep in dependents), default=0)
 
-        # Start from task with maximum path length
-        current = max(memo.keys(), key=lambda k: memo[k])
+        # Start from the first task (in task order) with the maximum length
+        current = max(self.task_map.keys(), key=lambda k: length[k])
         path = [current]
 
         # Follow longest path
@@ -240,7 +249,7 @@ class DependencyGraphBuilder:
                 break
 
             # Find dependent with longest path
-            current = max(dependents, key=lambda k: memo[k])
+            current = max(dependents, key=lambda k: length[k])
             path.append(current)
 
         return path
@@ -5,7 +5,7 @@ Provides high-level API for the complete conversion process.
 """
 
 from pathlib import Path
-from .parser import TaskParser, Task
+from .parser import TaskParser, Task, TaskRecord
 from .writer import BacklogWriter
 from .dependency_graph import DependencyGraphBuilder
 
@@ -38,8 +38,8 @@ class TaskMapper:
         Returns:
             Dictionary with generation results and statistics
         """
-        # Parse tasks
-        tasks = self.parser.parse_tasks_file(tasks_file)
+        # Scan compact task records; full tasks are streamed to the writer
+        tasks = self.parser.scan_tasks_file(tasks_file)
 
         if not tasks:
             return {
@@ -72,8 +72,10 @@ class TaskMapper:
                 "critical_path": graph.get_critical_path(),
             }
 
-        # Write tasks
-        created_files = self.writer.write_tasks(tasks, overwrite=overwrite)
+        # Write tasks as they are parsed
+        created_files = self.writer.write_tasks(
+            self.parser.stream_tasks_file(tasks_file, tasks), overwrite=overwrite
+        )
 
         # Generate summary
         return {
@@ -209,7 +211,7 @@ class TaskMapper:
 
         return tasks
 
-    def _group_by_phase(self, tasks: list[Task]) -> dict:
+    def _group_by_phase(self, tasks: list[Task | TaskRecord]) -> dict:
         """Group tasks by phase."""
         by_phase = {}
         for task in tasks:
@@ -219,7 +221,7 @@ class TaskMapper:
             by_phase[phase].append(task.task_id)
         return by_phase
 
-    def _group_by_story(self, tasks: list[Task]) -> dict:
+    def _group_by_story(self, tasks: list[Task | TaskRecord]) -> dict:
         """Group tasks by user story."""
         by_story = {}
         for task in tasks:
@@ -243,13 +245,13 @@ class TaskMapper:
         # Parse new tasks
         new_tasks = self.parser.parse_tasks_file(tasks_file)
 
-        # Check for existing tasks
-
-        conflicts = []
-        for task in new_tasks:
-            task_file = self.writer._get_task_file_path(task)
-            if task_file.exists():
-                conflicts.append(task.task_id)
+        # Check for existing tasks with a single directory listing
+        existing = self.writer._list_task_files()
+        conflicts = [
+            task.task_id
+            for task in new_tasks
+            if self.writer._task_filename(task) in existing
+        ]
 
         if conflicts and conflict_strategy == "skip":
             return {
@@ -3,12 +3,18 @@ Task parser for flowspec format.
 
 Parses tasks from spec.md, plan.md, and tasks.md files following the
 flowspec task format conventions.
+
+Files are read line by line. Very large tasks.md files can be streamed with
+TaskParser.stream_tasks_file(), which keeps only compact TaskRecord entries in
+memory and yields full Task objects one at a time.
 """
 
 import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 @dataclass
@@ -56,6 +62,17 @@ class Task:
         return labels
 
 
+class TaskRecord(NamedTuple):
+    """Compact per-task record used for dependency inference and graphs."""
+
+    task_id: str
+    phase: Optional[str]
+    user_story: Optional[str]
+    is_parallelizable: bool
+    is_completed: bool
+    dependencies: tuple[str, ...]
+
+
 class TaskParser:
     """Parser for flowspec task format."""
 
@@ -94,9 +111,11 @@ class TaskParser:
             raise FileNotFoundError(f"Tasks file not found: {file_path}")
 
         with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+            self.tasks = list(self.iter_tasks(f))
 
-        return self.parse_tasks_content(content)
+        self._infer_dependencies()
+
+        return self.tasks
 
     def parse_tasks_content(self, content: str) -> list[Task]:
         """
@@ -108,10 +127,24 @@ class TaskParser:
         Returns:
             List of parsed Task objects
         """
-        self.tasks = []
-        self.current_phase = None
+        self.tasks = list(self.iter_tasks(content.split("\n")))
 
-        lines = content.split("\n")
+        # Build dependency graph based on task order and phases
+        self._infer_dependencies()
+
+        return self.tasks
+
+    def iter_tasks(self, lines: Iterable[str]) -> Iterator[Task]:
+        """
+        Yield tasks as lines arrive, without inferred dependencies.
+
+        Args:
+            lines: Lines of markdown (e.g., an open file handle)
+
+        Yields:
+            Task objects with their phase set
+        """
+        self.current_phase = None
 
         for line in lines:
             # Check for phase headers
@@ -123,12 +156,72 @@ class TaskParser:
             task = self._parse_task_line(line)
             if task:
                 task.phase = self.current_phase
-                self.tasks.append(task)
+                yield task
 
-        # Build dependency graph based on task order and phases
-        self._infer_dependencies()
+    def scan_tasks_file(self, file_path: Path) -> list[TaskRecord]:
+        """
+        Scan a tasks.md file into compact records with inferred dependencies.
 
-        return self.tasks
+        Only task IDs, phases, user stories and flags are kept, so memory use
+        grows with the number of tasks rather than the size of the file.
+
+        Args:
+            file_path: Path to the tasks.md file
+
+        Returns:
+            List of TaskRecord objects in file order
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Tasks file not found: {file_path}")
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            records = [
+                TaskRecord(
+                    task_id=task.task_id,
+                    phase=task.phase,
+                    user_story=task.user_story,
+                    is_parallelizable=task.is_parallelizable,
+                    is_completed=task.is_completed,
+                    dependencies=(),
+                )
+                for task in self.iter_tasks(f)
+            ]
+
+        for index, dependencies in self._dependency_map(records).items():
+            records[index] = records[index]._replace(dependencies=tuple(dependencies))
+
+        return records
+
+    def stream_tasks_file(
+        self, file_path: Path, records: Optional[list[TaskRecord]] = None
+    ) -> Iterator[Task]:
+        """
+        Stream fully parsed tasks from a tasks.md file.
+
+        Dependencies are inferred from compact records (a first pass over the
+        file unless records from scan_tasks_file() are given), then the file is
+        read again and each Task is yielded as its line is parsed.
+
+        Args:
+            file_path: Path to the tasks.md file
+            records: Optional records from scan_tasks_file() for this file
+
+        Yields:
+            Task objects with inferred dependencies, in file order
+        """
+        if records is None:
+            records = self.scan_tasks_file(file_path)
+
+        dependencies = {
+            record.task_id: record.dependencies
+            for record in records
+            if record.dependencies
+        }
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            for task in self.iter_tasks(f):
+                task.dependencies.extend(dependencies.get(task.task_id, ()))
+                yield task
 
     def _parse_task_line(self, line: str) -> Optional[Task]:
         """
@@ -184,11 +277,23 @@ class TaskParser:
         return None
 
     def _infer_dependencies(self):
+        """Add inferred dependencies to the parsed tasks."""
+        for index, dependencies in self._dependency_map(self.tasks).items():
+            self.tasks[index].dependencies.extend(dependencies)
+
+    def _dependency_map(self, tasks: list) -> dict[int, list[str]]:
         """
         Infer task dependencies based on:
         1. Phase order (Setup → Foundational → User Stories → Polish)
         2. Same user story tasks depend on earlier tasks in that story
         3. Cross-phase dependencies (foundational blocks all user stories)
+
+        Args:
+            tasks: Task or TaskRecord objects in file order
+
+        Returns:
+            Mapping of task position to inferred dependency IDs, for tasks
+            that have any
         """
         phase_order = {
             "setup": 0,
@@ -197,9 +302,11 @@ class TaskParser:
             "polish": 3,
         }
 
-        # Group tasks by phase
+        inferred: dict[int, list[str]] = defaultdict(list)
+
+        # Group task positions by phase
         tasks_by_phase = {}
-        for task in self.tasks:
+        for index, task in enumerate(tasks):
             if not task.phase:
                 continue
 
@@ -211,25 +318,37 @@ class TaskParser:
 
             if phase_key not in tasks_by_phase:
                 tasks_by_phase[phase_key] = []
-            tasks_by_phase[phase_key].append(task)
+            tasks_by_phase[phase_key].append(index)
 
         # Foundational tasks depend on setup tasks
         if "setup" in tasks_by_phase and "foundational" in tasks_by_phase:
-            last_setup_task = tasks_by_phase["setup"][-1]
-            for task in tasks_by_phase["foundational"]:
-                if not task.is_parallelizable:
-                    task.dependencies.append(last_setup_task.task_id)
+            last_setup_task = tasks[tasks_by_phase["setup"][-1]]
+            for index in tasks_by_phase["foundational"]:
+                if not tasks[index].is_parallelizable:
+                    inferred[index].append(last_setup_task.task_id)
 
         # User story tasks depend on foundational tasks
         if "foundational" in tasks_by_phase and "user story" in tasks_by_phase:
-            last_foundational_task = tasks_by_phase["foundational"][-1]
-            for task in tasks_by_phase["user story"]:
+            last_foundational_task = tasks[tasks_by_phase["foundational"][-1]]
+
+            # Index the lowest task ID of each user story across all tasks
+            first_task_by_story: dict[str, str] = {}
+            for t in tasks:
+                if t.user_story:
+                    current = first_task_by_story.get(t.user_story)
+                    if current is None or t.task_id < current:
+                        first_task_by_story[t.user_story] = t.task_id
+
+            for index in tasks_by_phase["user story"]:
+                task = tasks[index]
                 # Only add dependency if it's the first task of a user story
-                if task.user_story and not any(
-                    t.user_story == task.user_story and t.task_id < task.task_id
-                    for t in self.tasks
+                if (
+                    task.user_story
+                    and first_task_by_story[task.user_story] == task.task_id
                 ):
-                    task.dependencies.append(last_foundational_task.task_id)
+                    inferred[index].append(last_foundational_task.task_id)
+
+        return dict(inferred)
 
     def parse_spec_file(self, file_path: Path) -> dict:
         """
@@ -244,27 +363,26 @@ class TaskParser:
         if not file_path.exists():
             raise FileNotFoundError(f"Spec file not found: {file_path}")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
         # Simple user story extraction
         # Look for patterns like "## User Story 1", "## User Story 2", etc.
         user_stories = {}
         current_story = None
 
-        for line in content.split("\n"):
-            if line.startswith("## User Story"):
-                # Extract story number
-                match = re.search(r"User Story\s+(\d+)", line)
-                if match:
-                    story_num = match.group(1)
-                    current_story = f"US{story_num}"
-                    user_stories[current_story] = {
-                        "title": line.strip("#").strip(),
-                        "content": [],
-                    }
-            elif current_story and line.strip():
-                user_stories[current_story]["content"].append(line)
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line.startswith("## User Story"):
+                    # Extract story number
+                    match = re.search(r"User Story\s+(\d+)", line)
+                    if match:
+                        story_num = match.group(1)
+                        current_story = f"US{story_num}"
+                        user_stories[current_story] = {
+                            "title": line.strip("#").strip(),
+                            "content": [],
+                        }
+                elif current_story and line.strip():
+                    user_stories[current_story]["content"].append(line)
 
         return user_stories
 
@@ -281,28 +399,27 @@ class TaskParser:
         if not file_path.exists():
             raise FileNotFoundError(f"Plan file not found: {file_path}")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
         plan_info = {"tech_stack": [], "project_structure": [], "libraries": []}
 
         # Extract tech stack, libraries, project structure
         # This is a simplified extraction - can be enhanced based on actual plan.md format
         current_section = None
 
-        for line in content.split("\n"):
-            line_lower = line.lower()
-
-            if "tech stack" in line_lower or "technology" in line_lower:
-                current_section = "tech_stack"
-            elif "project structure" in line_lower or "directory" in line_lower:
-                current_section = "project_structure"
-            elif "libraries" in line_lower or "dependencies" in line_lower:
-                current_section = "libraries"
-            elif line.strip().startswith("-") and current_section:
-                item = line.strip("- ").strip()
-                if item:
-                    plan_info[current_section].append(item)
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                line_lower = line.lower()
+
+                if "tech stack" in line_lower or "technology" in line_lower:
+                    current_section = "tech_stack"
+                elif "project structure" in line_lower or "directory" in line_lower:
+                    current_section = "project_structure"
+                elif "libraries" in line_lower or "dependencies" in line_lower:
+                    current_section = "libraries"
+                elif line.strip().startswith("-") and current_section:
+                    item = line.strip("- ").strip()
+                    if item:
+                        plan_info[current_section].append(item)
 
         return plan_info
 
@@ -9,6 +9,9 @@ are triggered via CLI, MCP tools, or programmatic calls.
 
 Design:
     - Each function wraps a backlog CLI operation
+    - With FLOWSPEC_BACKLOG_BACKEND=files, operations run in-process against the
+      task files (see backend.py), falling back to the CLI when that is unsafe
+    - task_create_batch() creates many tasks in one pass
     - Events are emitted AFTER successful operations (fail-safe)
     - Functions return structured results including operation success and event emission status
     - All functions are designed to be called from Python code (agents, workflows)
@@ -35,6 +38,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .backend import get_file_backend
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +102,26 @@ def _run_backlog_command(args: list[str], timeout: int = 30) -> tuple[int, str,
         return -1, "", str(e)
 
 
+def _backlog_command(
+    args: list[str], workspace_root: Path | None = None
+) -> tuple[int, str, str]:
+    """Run a backlog command in-process if the file backend is enabled.
+
+    Args:
+        args: Command arguments (excluding 'backlog').
+        workspace_root: Project root directory. Defaults to current directory.
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr).
+    """
+    backend = get_file_backend(workspace_root)
+    if backend is not None:
+        result = backend.run(args)
+        if result is not None:
+            return result
+    return _run_backlog_command(args)
+
+
 def _emit_event(
     event_type: str,
     task_id: str,
@@ -228,7 +253,7 @@ def task_create(
         args.extend(["--parent", parent_task_id])
 
     # Run backlog command
-    exit_code, stdout, stderr = _run_backlog_command(args)
+    exit_code, stdout, stderr = _backlog_command(args, workspace_root)
 
     if exit_code != 0:
         return ShimResult(
@@ -273,6 +298,90 @@ def task_create(
     )
 
 
+def task_create_batch(
+    tasks: list[dict[str, Any]],
+    workspace_root: Path | None = None,
+) -> list[ShimResult]:
+    """Create many backlog tasks with automatic event emission.
+
+    Runs one `backlog task create` per task by default. With
+    FLOWSPEC_BACKLOG_BACKEND=files, task IDs for the whole batch are allocated
+    in one pass and task files are written directly, so creating hundreds of
+    tasks costs no backlog process starts. The CLI is still used when direct
+    file access is unsafe or when any task has a parent (subtask IDs are
+    allocated by the CLI).
+
+    Args:
+        tasks: Task definitions with task_create keyword arguments
+            (title, description, priority, labels, acceptance_criteria,
+            parent_task_id).
+        workspace_root: Project root directory.
+
+    Returns:
+        ShimResult for each task, in input order.
+
+    Example:
+        >>> results = task_create_batch(
+        ...     [{"title": f"Fix finding {i}", "labels": ["security"]} for i in range(500)]
+        ... )
+        >>> created = [r.task_id for r in results if r.success]
+    """
+    if workspace_root is None:
+        workspace_root = Path.cwd()
+
+    backend = get_file_backend(workspace_root)
+    task_ids = None
+    if backend is not None and not any(t.get("parent_task_id") for t in tasks):
+        task_ids = backend.create_tasks(tasks)
+
+    if task_ids is None:
+        return [task_create(**task, workspace_root=workspace_root) for task in tasks]
+
+    results = []
+    for index, task in enumerate(tasks):
+        metadata = {
+            "title": task["title"],
+            "priority": task.get("priority"),
+            "labels": task.get("labels"),
+        }
+        if index >= len(task_ids):
+            results.append(
+                ShimResult(
+                    success=False,
+                    exit_code=1,
+                    output="",
+                    stderr="",
+                    error="Task creation failed",
+                    metadata=metadata,
+                )
+            )
+            continue
+
+        task_id = task_ids[index]
+        event_emitted = _emit_event(
+            event_type="task.created",
+            task_id=task_id,
+            workspace_root=workspace_root,
+            title=task["title"],
+            priority=task.get("priority"),
+            labels=task.get("labels"),
+        )
+        results.append(
+            ShimResult(
+                success=True,
+                exit_code=0,
+                output=f"Created task {task_id}\n",
+                stderr="",
+                task_id=task_id,
+                event_emitted=event_emitted,
+                events_emitted=["task.created"] if event_emitted else [],
+                metadata=metadata,
+            )
+        )
+
+    return results
+
+
 def task_edit(
     task_id: str,
     status: str | None = None,
@@ -351,7 +460,7 @@ def task_edit(
         args.extend(["--notes", notes])
 
     # Run backlog command
-    exit_code, stdout, stderr = _run_backlog_command(args)
+    exit_code, stdout, stderr = _backlog_command(args, workspace_root)
 
     if exit_code != 0:
         return ShimResult(
@@ -415,6 +524,7 @@ def task_edit(
 def task_view(
     task_id: str,
     plain: bool = True,
+    workspace_root: Path | None = None,
 ) -> ShimResult:
     """View a backlog task.
 
@@ -423,6 +533,7 @@ def task_view(
     Args:
         task_id: Task ID to view.
         plain: Use plain text output (AI-friendly).
+        workspace_root: Project root directory.
 
     Returns:
         ShimResult with task content in output.
@@ -431,7 +542,7 @@ def task_view(
     if plain:
         args.append("--plain")
 
-    exit_code, stdout, stderr = _run_backlog_command(args)
+    exit_code, stdout, stderr = _backlog_command(args, workspace_root)
 
     return ShimResult(
         success=exit_code == 0,
@@ -448,6 +559,7 @@ def task_list(
     labels: list[str] | None = None,
     assignee: str | None = None,
     plain: bool = True,
+    workspace_root: Path | None = None,
 ) -> ShimResult:
     """List backlog tasks.
 
@@ -458,6 +570,7 @@ def task_list(
         labels: Filter by labels.
         assignee: Filter by assignee.
         plain: Use plain text output (AI-friendly).
+        workspace_root: Project root directory.
 
     Returns:
         ShimResult with task list in output.
@@ -474,7 +587,7 @@ def task_list(
     if plain:
         args.append("--plain")
 
-    exit_code, stdout, stderr = _run_backlog_command(args)
+    exit_code, stdout, stderr = _backlog_command(args, workspace_root)
 
     return ShimResult(
         success=exit_code == 0,
@@ -490,6 +603,7 @@ def task_search(
     status: str | None = None,
     priority: str | None = None,
     limit: int | None = None,
+    workspace_root: Path | None = None,
 ) -> ShimResult:
     """Search backlog tasks.
 
@@ -500,6 +614,7 @@ def task_search(
         status: Filter by status.
         priority: Filter by priority.
         limit: Maximum number of results.
+        workspace_root: Project root directory.
 
     Returns:
         ShimResult with search results in output.
@@ -513,7 +628,7 @@ def task_search(
     if limit:
         args.extend(["--limit", str(limit)])
 
-    exit_code, stdout, stderr = _run_backlog_command(args)
+    exit_code, stdout, stderr = _backlog_command(args, workspace_root)
 
     return ShimResult(
         success=exit_code == 0,
@@ -546,7 +661,7 @@ def task_archive(
 
     args = ["task", "archive", task_id]
 
-    exit_code, stdout, stderr = _run_backlog_command(args)
+    exit_code, stdout, stderr = _backlog_command(args, workspace_root)
 
     if exit_code != 0:
         return ShimResult(
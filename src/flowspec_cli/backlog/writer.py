@@ -2,26 +2,86 @@
 Backlog.md file writer for flowspec tasks.
 
 Generates Backlog.md format task files from parsed flowspec tasks.
+
+Bulk writes list the tasks directory once, render and write task files in a
+thread pool, and replace each file atomically via a temporary file.
 """
 
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 from .parser import Task
 
 
+def scan_frontmatter(lines: Iterable[str]) -> tuple[Optional[str], list[str]]:
+    """
+    Extract status and labels from a task file's YAML frontmatter.
+
+    Reads lines only up to the closing frontmatter marker, in a single pass.
+
+    Args:
+        lines: Lines of a task file (e.g., an open file handle)
+
+    Returns:
+        Tuple of (status or None, list of labels)
+    """
+    status = None
+    labels: list[str] = []
+    in_labels = False
+
+    for index, line in enumerate(lines):
+        line = line.rstrip("\r\n")
+        if index == 0:
+            if line.strip() != "---":
+                break
+            continue
+        if line.strip() == "---":
+            break
+
+        if in_labels and line.startswith((" ", "-")):
+            item = line.strip()
+            if item.startswith("- "):
+                labels.append(item[2:].strip().strip("'\""))
+            continue
+        in_labels = False
+
+        if line.startswith("status:"):
+            status = line.split(":", 1)[1].strip()
+        elif line.startswith("labels:"):
+            value = line.split(":", 1)[1].strip()
+            if value.startswith("[") and value.endswith("]"):
+                labels.extend(
+                    label.strip().strip("'\"")
+                    for label in value[1:-1].split(",")
+                    if label.strip()
+                )
+            else:
+                in_labels = not value
+
+    return status, labels
+
+
 class BacklogWriter:
     """Writer for Backlog.md format task files."""
 
-    def __init__(self, backlog_dir: Path):
+    # Number of tasks rendered and written per pool round
+    BATCH_SIZE = 512
+
+    def __init__(self, backlog_dir: Path, *, max_workers: Optional[int] = None):
         """
         Initialize the writer.
 
         Args:
             backlog_dir: Path to the backlog directory (e.g., ./backlog)
+            max_workers: Worker threads for bulk writes (default: executor default)
         """
         self.backlog_dir = Path(backlog_dir)
         self.tasks_dir = self.backlog_dir / "tasks"
+        self.max_workers = max_workers
 
     def write_task(
         self,
@@ -46,70 +106,113 @@ class BacklogWriter:
         # Ensure tasks directory exists
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate task filename
-        # Format: task-{id} - {title}.md
-        # Example: task-001 - Create User model.md
-        task_num = task.task_id.replace("T", "").zfill(3)
-        filename = self._sanitize_filename(f"task-{task_num} - {task.description}")
-
-        # Add .md extension if not present
-        if not filename.endswith(".md"):
-            filename += ".md"
-
-        task_file = self.tasks_dir / filename
-
-        # Build frontmatter
-        frontmatter = self._build_frontmatter(
-            task_id=f"task-{task_num}",
-            title=self._clean_title(task.description),
-            status=status,
-            assignee=assignee or [],
-            labels=task.labels,
-            dependencies=task.dependencies,
+        task_file = self._get_task_file_path(task)
+        self._write_atomic(
+            task_file,
+            self._render_task(task, status=status, assignee=assignee, notes=notes),
         )
 
-        # Build body
-        body = self._build_body(task, notes)
-
-        # Write file
-        with open(task_file, "w", encoding="utf-8") as f:
-            f.write(frontmatter)
-            f.write("\n\n")
-            f.write(body)
-
         return task_file
 
     def write_tasks(
-        self, tasks: list[Task], *, status: str = "To Do", overwrite: bool = False
+        self, tasks: Iterable[Task], *, status: str = "To Do", overwrite: bool = False
     ) -> list[Path]:
         """
         Write multiple tasks to Backlog.md format.
 
         Args:
-            tasks: List of Task objects to write
+            tasks: Task objects to write (a list or a stream of tasks)
             status: Default status for all tasks
             overwrite: Whether to overwrite existing task files
 
         Returns:
             List of paths to created task files
         """
-        created_files = []
-
-        for task in tasks:
-            task_file = self._get_task_file_path(task)
+        self.tasks_dir.mkdir(parents=True, exist_ok=True)
 
-            # Skip if file exists and overwrite is False
-            if task_file.exists() and not overwrite:
-                continue
+        # List the directory once instead of checking each target
+        existing = self._list_task_files()
+        created_files = []
 
+        def write(item: tuple[Task, str]) -> Path:
+            task, filename = item
+            task_file = self.tasks_dir / filename
             # Determine status based on task completion
             task_status = "Done" if task.is_completed else status
+            self._write_atomic(task_file, self._render_task(task, status=task_status))
+            return task_file
+
+        task_iter = iter(tasks)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while batch := list(islice(task_iter, self.BATCH_SIZE)):
+                pending: list[tuple[Task, str]] = []
+                scheduled: set[str] = set()
+                for task in batch:
+                    filename = self._task_filename(task)
+
+                    # Skip if file exists and overwrite is False
+                    if filename in existing and not overwrite:
+                        continue
+
+                    # Same target twice in one round: write the earlier task
+                    # first so the later one wins, as with sequential writes
+                    if filename in scheduled:
+                        created_files.extend(executor.map(write, pending))
+                        pending, scheduled = [], set()
+
+                    existing.add(filename)
+                    scheduled.add(filename)
+                    pending.append((task, filename))
 
-            file_path = self.write_task(task, status=task_status)
-            created_files.append(file_path)
+                created_files.extend(executor.map(write, pending))
 
         return created_files
 
+    def _render_task(
+        self,
+        task: Task,
+        *,
+        status: str = "To Do",
+        assignee: Optional[list[str]] = None,
+        notes: Optional[str] = None,
+    ) -> str:
+        """Render the full Backlog.md file content for a task."""
+        task_num = task.task_id.replace("T", "").zfill(3)
+
+        # Build frontmatter
+        frontmatter = self._build_frontmatter(
+            task_id=f"task-{task_num}",
+            title=self._clean_title(task.description),
+            status=status,
+            assignee=assignee or [],
+            labels=task.labels,
+            dependencies=task.dependencies,
+        )
+
+        # Build body
+        body = self._build_body(task, notes)
+
+        return f"{frontmatter}\n\n{body}"
+
+    def _write_atomic(self, task_file: Path, content: str) -> None:
+        """Write content via a temporary file and rename it into place."""
+        tmp_file = task_file.with_name(f".{task_file.name}.tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_file, task_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def _list_task_files(self) -> set[str]:
+        """List file names in the tasks directory in one scan."""
+        try:
+            with os.scandir(self.tasks_dir) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
     def _build_frontmatter(
         self,
         task_id: str,
@@ -247,13 +350,22 @@ class BacklogWriter:
 
         return title
 
-    def _get_task_file_path(self, task: Task) -> Path:
-        """Get the file path for a task without creating it."""
+    def _task_filename(self, task: Task) -> str:
+        """
+        Get the file name for a task.
+
+        Format: task-{id} - {title}.md
+        Example: task-001 - Create User model.md
+        """
         task_num = task.task_id.replace("T", "").zfill(3)
         filename = self._sanitize_filename(f"task-{task_num} - {task.description}")
         if not filename.endswith(".md"):
             filename += ".md"
-        return self.tasks_dir / filename
+        return filename
+
+    def _get_task_file_path(self, task: Task) -> Path:
+        """Get the file path for a task without creating it."""
+        return self.tasks_dir / self._task_filename(task)
 
     def update_task_status(
         self, task_file: Path, new_status: str, completed_date: Optional[str] = None
@@ -315,34 +427,24 @@ class BacklogWriter:
         Returns:
             Dictionary with task counts by status, label, etc.
         """
-        if not self.tasks_dir.exists():
-            return {
-                "total": 0,
-                "by_status": {},
-                "by_label": {},
-            }
-
-        task_files = list(self.tasks_dir.glob("task-*.md"))
-
         stats = {
-            "total": len(task_files),
+            "total": 0,
             "by_status": {},
             "by_label": {},
         }
 
-        for task_file in task_files:
-            with open(task_file, "r", encoding="utf-8") as f:
-                content = f.read()
+        # One directory scan, then only the frontmatter of each file is read
+        for filename in self._list_task_files():
+            if not (filename.startswith("task-") and filename.endswith(".md")):
+                continue
 
-            # Extract status
-            for line in content.split("\n"):
-                if line.startswith("status:"):
-                    status = line.split(":", 1)[1].strip()
-                    stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
+            stats["total"] += 1
+            with open(self.tasks_dir / filename, "r", encoding="utf-8") as f:
+                status, labels = scan_frontmatter(f)
 
-                # Extract labels
-                if line.startswith("  - ") and "labels:" in content.split(line)[0]:
-                    label = line.strip("- ").strip()
-                    stats["by_label"][label] = stats["by_label"].get(label, 0) + 1
+            if status is not None:
+                stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
+            for label in labels:
+                stats["by_label"][label] = stats["by_label"].get(label, 0) + 1
 
         return stats
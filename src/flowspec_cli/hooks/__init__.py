@@ -10,6 +10,7 @@ Main components:
 - config: Hook configuration parser and loader
 - emitter: Event emission and hook triggering
 - runner: Secure hook execution with audit logging
+- daemon: Local emit daemon for low-latency emission from hook scripts
 
 Example:
     >>> from flowspec_cli.hooks import Event, EventEmitter, load_hooks_config
@@ -26,6 +27,7 @@ from .config import (
     load_hooks_config,
     validate_hooks_config_file,
 )
+from .daemon import EmitDaemon, EmitDaemonError
 from .emitter import (
     EventEmitter,
     emit_event,
@@ -70,6 +72,9 @@ __all__ = [
     "emit_spec_created",
     "emit_task_completed",
     "emit_implement_completed",
+    # Daemon
+    "EmitDaemon",
+    "EmitDaemonError",
     # Runner
     "HookRunner",
     "HookResult",
@@ -9,6 +9,7 @@ Commands:
 - list: List configured hooks
 - audit: View hook execution audit log
 - test: Test a specific hook with a mock event
+- daemon: Serve event emission over a local socket for hook scripts
 
 Example:
     $ flowspec hooks emit spec.created --spec-id my-feature
@@ -16,12 +17,13 @@ Example:
     $ flowspec hooks list
     $ flowspec hooks audit --tail 10
     $ flowspec hooks test run-tests implement.completed
+    $ flowspec hooks daemon --status
 """
 
 from __future__ import annotations
 
 import json
-import socket
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -36,6 +38,14 @@ from .config import (
     load_hooks_config,
     validate_hooks_config_file,
 )
+from .daemon import (
+    DEFAULT_IDLE_TIMEOUT,
+    EmitDaemon,
+    EmitDaemonError,
+    build_event,
+    default_socket_path,
+    send_request,
+)
 from .emitter import EventEmitter
 from .events import Event
 from .security import AuditLogger
@@ -138,32 +148,16 @@ def hooks_emit(
     # Determine project root
     workspace_root = Path(project_root) if project_root else Path.cwd()
 
-    # Build event context
-    context: dict = {}
-    if task_id:
-        context["task_id"] = task_id
-    if spec_id:
-        context["feature"] = spec_id
-
-    # Add agent-specific context for agent.* events
-    if event_type.startswith("agent."):
-        # Default agent_id to claude-code@<hostname>
-        resolved_agent_id = agent_id or f"claude-code@{socket.gethostname()}"
-        context["agent_id"] = resolved_agent_id
-        context["machine"] = socket.gethostname()
-
-        if progress is not None:
-            context["progress_percent"] = progress
-        if message:
-            context["status_message"] = message
-
-    # Create event
+    # Create event (agent.* events get agent_id, machine and progress context)
     try:
-        event = Event(
-            event_type=event_type,
-            project_root=str(workspace_root),
-            feature=spec_id,
-            context=context if context else None,
+        event = build_event(
+            workspace_root,
+            event_type,
+            spec_id=spec_id,
+            task_id=task_id,
+            progress=progress,
+            message=message,
+            agent_id=agent_id,
         )
     except Exception as e:
         console.print(f"[red]Error creating event:[/red] {e}")
@@ -547,7 +541,9 @@ def hooks_test(
     # Execute hook
     from .runner import HookRunner
 
-    runner = HookRunner(workspace_root=workspace_root)
+    runner = HookRunner(
+        workspace_root=workspace_root, security_config=config.security_config()
+    )
 
     try:
         result = runner.run_hook(hook, event)
@@ -580,5 +576,95 @@ def hooks_test(
     raise typer.Exit(result.exit_code)
 
 
+@hooks_app.command("daemon")
+def hooks_daemon(
+    stop: bool = typer.Option(
+        False,
+        "--stop",
+        help="Stop the running daemon for this project",
+    ),
+    status: bool = typer.Option(
+        False,
+        "--status",
+        help="Show whether a daemon is running for this project",
+    ),
+    idle_timeout: int = typer.Option(
+        DEFAULT_IDLE_TIMEOUT,
+        "--idle-timeout",
+        help="Exit after this many seconds without requests (0 = never)",
+        min=0,
+    ),
+    socket_path: Optional[str] = typer.Option(
+        None,
+        "--socket",
+        help="Socket path (default: per-project path in the runtime directory)",
+    ),
+    project_root: Optional[str] = typer.Option(
+        None,
+        "--project-root",
+        help="Project root directory (default: current directory)",
+    ),
+):
+    """Run the emit daemon for low-latency event emission.
+
+    The daemon keeps the hooks configuration and hook runner loaded and
+    serves emit requests on a Unix socket. Claude Code hook scripts use it
+    through .claude/hooks/emit_client.py, which starts the daemon on
+    demand and falls back to `flowspec hooks emit` when it is unavailable.
+    The daemon reloads hooks.yaml when it changes and exits when idle.
+
+    Examples:
+        # Run in the foreground
+        flowspec hooks daemon
+
+        # Check or stop the daemon for this project
+        flowspec hooks daemon --status
+        flowspec hooks daemon --stop
+    """
+    if sys.platform == "win32":
+        console.print("[red]The emit daemon requires Unix domain sockets[/red]")
+        raise typer.Exit(1)
+
+    workspace_root = Path(project_root) if project_root else Path.cwd()
+    path = Path(socket_path) if socket_path else default_socket_path(workspace_root)
+
+    if stop or status:
+        try:
+            response = send_request(
+                path, {"command": "shutdown" if stop else "ping"}, timeout=5.0
+            )
+        except EmitDaemonError:
+            console.print(f"[yellow]No emit daemon running[/yellow] ({path})")
+            raise typer.Exit(0 if stop else 1)
+
+        if stop:
+            console.print("[green]Emit daemon stopped[/green]")
+        else:
+            console.print(
+                f"[green]Emit daemon running[/green] (pid {response.get('pid')}, "
+                f"{response.get('requests')} requests, "
+                f"{response.get('hooks')} hooks, up {response.get('uptime_s')}s)"
+            )
+            console.print(f"[dim]Socket: {path}[/dim]")
+        raise typer.Exit(0)
+
+    try:
+        daemon = EmitDaemon(
+            workspace_root=workspace_root,
+            socket_path=path,
+            idle_timeout=idle_timeout,
+        )
+        daemon.bind()
+    except EmitDaemonError as e:
+        console.print(f"[red]Error starting emit daemon:[/red] {e}")
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Emit daemon listening on[/cyan] {path}")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        daemon.close()
+
+
 # Export for main CLI integration
 __all__ = ["hooks_app"]
@@ -350,6 +350,49 @@ def _validate_working_directory(
         ) from e
 
 
+def _validate_dependencies(hooks_config: HooksConfig) -> list[str]:
+    """Check depends_on entries reference known hooks and contain no cycles.
+
+    Args:
+        hooks_config: Parsed hooks configuration.
+
+    Returns:
+        List of error messages (empty if dependencies are valid).
+    """
+    errors: list[str] = []
+    known = {hook.name for hook in hooks_config.hooks}
+    remaining: dict[str, set[str]] = {}
+
+    for hook in hooks_config.hooks:
+        for dep in hook.depends_on:
+            if dep == hook.name:
+                errors.append(f"Hook '{hook.name}' depends on itself")
+            elif dep not in known:
+                errors.append(f"Hook '{hook.name}' depends on unknown hook '{dep}'")
+        remaining[hook.name] = {
+            dep for dep in hook.depends_on if dep in known and dep != hook.name
+        }
+
+    # Repeatedly remove hooks whose dependencies are resolved; anything left
+    # over is part of (or blocked by) a cycle
+    resolved: set[str] = set()
+    progress = True
+    while progress:
+        progress = False
+        for name, deps in list(remaining.items()):
+            if deps <= resolved:
+                resolved.add(name)
+                del remaining[name]
+                progress = True
+
+    if remaining:
+        errors.append(
+            f"Circular depends_on between hooks: {', '.join(sorted(remaining))}"
+        )
+
+    return errors
+
+
 def validate_hooks_config_file(
     config_path: str | Path,
     project_root: str | Path | None = None,
@@ -411,6 +454,9 @@ def validate_hooks_config_file(
         duplicates = [name for name in hook_names if hook_names.count(name) > 1]
         errors.append(f"Duplicate hook names found: {', '.join(set(duplicates))}")
 
+    # Check depends_on references and cycles
+    errors.extend(_validate_dependencies(hooks_config))
+
     # Check script files exist
     hooks_dir = project_root / ".flowspec" / "hooks"
     for hook in hooks_config.hooks:
@@ -0,0 +1,442 @@
+"""Local emit daemon for low-latency hook event emission.
+
+Claude Code hook scripts emit flowspec events on every matching tool use.
+Running ``flowspec hooks emit`` for each one imports the whole CLI and
+reloads hooks.yaml every time. The emit daemon keeps a warm
+:class:`EventEmitter` (compiled hooks config, hook runner, worker pool)
+behind a Unix socket, so each emission costs one local round trip.
+
+Protocol: one JSON object per line in each direction.
+
+Requests:
+    {"command": "emit", "event_type": "task.completed", "task_id": "task-1",
+     "spec_id": null, "progress": null, "message": null, "agent_id": null,
+     "wait": true, "dry_run": false}
+    {"command": "ping"}
+    {"command": "shutdown"}
+
+Emit requests take the same arguments as ``flowspec hooks emit`` and build
+the event with :func:`build_event`, so both paths emit identical events.
+
+Responses:
+    {"ok": true, "results": [...]}  (emit with wait)
+    {"ok": true, "queued": true}    (emit without wait)
+    {"ok": false, "error": "..."}
+
+The daemon reloads hooks.yaml when its modification time or size changes
+and exits after ``idle_timeout`` seconds without requests. Sockets live in
+a per-user directory (mode 0700) under ``$XDG_RUNTIME_DIR`` or the system
+temp directory, named after a hash of the project root. The thin client in
+``templates/hooks/emit_client.py`` derives the same path without importing
+flowspec_cli.
+
+Example:
+    >>> daemon = EmitDaemon(workspace_root=Path("/project"))
+    >>> daemon.serve_forever()  # Blocks until idle timeout or shutdown
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import _find_hooks_config, load_hooks_config
+from .emitter import EventEmitter
+from .events import Event
+from .schema import HooksConfig
+
+logger = logging.getLogger(__name__)
+
+# Exit after this many seconds without requests (15 minutes)
+DEFAULT_IDLE_TIMEOUT = 900
+
+# Largest request line accepted from a client (1 MiB)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class EmitDaemonError(Exception):
+    """Raised when the emit daemon cannot start or be reached."""
+
+    pass
+
+
+def default_socket_path(workspace_root: Path) -> Path:
+    """Get the emit daemon socket path for a project.
+
+    Must stay in sync with ``socket_path`` in templates/hooks/emit_client.py.
+
+    Args:
+        workspace_root: Project root directory.
+
+    Returns:
+        Path to the Unix socket for this project.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    digest = hashlib.sha256(str(Path(workspace_root).resolve()).encode()).hexdigest()
+    return Path(runtime_dir) / f"flowspec-{os.getuid()}" / f"emit-{digest[:16]}.sock"
+
+
+def is_private_dir(path: Path) -> bool:
+    """Check that a socket directory is a real directory only we can use.
+
+    Must stay in sync with ``is_private_dir`` in templates/hooks/emit_client.py.
+    """
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and stat.S_IMODE(st.st_mode) == 0o700
+    )
+
+
+def ensure_private_dir(path: Path) -> None:
+    """Create a socket directory, refusing one another user may control.
+
+    The default directory name is predictable, so another local user could
+    pre-create it to intercept or spoof emits.
+
+    Raises:
+        EmitDaemonError: If the directory cannot be created or is not owned
+            by the current user with mode 0700.
+    """
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError as e:
+        raise EmitDaemonError(f"Cannot create socket directory {path}: {e}") from e
+    if not is_private_dir(path):
+        raise EmitDaemonError(
+            f"Refusing socket directory {path}: it must be a directory owned "
+            "by the current user with mode 0700"
+        )
+
+
+def send_request(
+    socket_path: Path, request: dict[str, Any], timeout: float = 30.0
+) -> dict[str, Any]:
+    """Send one request to a running emit daemon and return its response.
+
+    Args:
+        socket_path: Daemon socket path.
+        request: Request object (see module docstring).
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        Decoded response object.
+
+    Raises:
+        EmitDaemonError: If the daemon is not reachable or replies badly.
+    """
+    if not is_private_dir(socket_path.parent):
+        raise EmitDaemonError(f"Untrusted socket directory {socket_path.parent}")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        return json.loads(line)
+    except (OSError, ValueError) as e:
+        raise EmitDaemonError(f"Emit daemon at {socket_path} unavailable: {e}") from e
+
+
+def build_event(
+    workspace_root: Path,
+    event_type: str,
+    spec_id: str | None = None,
+    task_id: str | None = None,
+    progress: int | None = None,
+    message: str | None = None,
+    agent_id: str | None = None,
+) -> Event:
+    """Build an event the way ``flowspec hooks emit`` does.
+
+    Args:
+        workspace_root: Project root directory.
+        event_type: Event type (e.g., "task.completed").
+        spec_id: Spec/feature ID.
+        task_id: Task ID.
+        progress: Progress percentage (agent.* events).
+        message: Status message (agent.* events).
+        agent_id: Agent identifier (agent.* events, default:
+            claude-code@<hostname>).
+
+    Returns:
+        Event ready for emission.
+    """
+    context: dict[str, Any] = {}
+    if task_id:
+        context["task_id"] = task_id
+    if spec_id:
+        context["feature"] = spec_id
+
+    # Add agent-specific context for agent.* events
+    if event_type.startswith("agent."):
+        hostname = socket.gethostname()
+        context["agent_id"] = agent_id or f"claude-code@{hostname}"
+        context["machine"] = hostname
+
+        if progress is not None:
+            context["progress_percent"] = progress
+        if message:
+            context["status_message"] = message
+
+    return Event(
+        event_type=event_type,
+        project_root=str(workspace_root),
+        feature=spec_id,
+        context=context if context else None,
+    )
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one newline-delimited JSON request per connection."""
+
+    server: _EmitServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+        if not line:
+            return
+
+        if len(line) > MAX_REQUEST_BYTES:
+            response: dict[str, Any] = {"ok": False, "error": "Request too large"}
+        else:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+                response = self.server.emit_daemon.handle(request)
+            except ValueError as e:
+                response = {"ok": False, "error": f"Invalid request: {e}"}
+            except Exception as e:
+                logger.error(f"Emit daemon request failed: {e}", exc_info=True)
+                response = {"ok": False, "error": str(e)}
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class _EmitServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: EmitDaemon):
+        self.emit_daemon = daemon
+        super().__init__(socket_path, _RequestHandler)
+
+
+class EmitDaemon:
+    """Serves event emission for one project over a Unix socket.
+
+    Attributes:
+        workspace_root: Project root directory.
+        socket_path: Unix socket the daemon listens on.
+        idle_timeout: Seconds without requests before exiting (0 = never).
+        emitter: Warm emitter shared by all requests.
+
+    Example:
+        >>> daemon = EmitDaemon(workspace_root=Path.cwd())
+        >>> daemon.serve_forever()
+    """
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        socket_path: Path | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        """Initialize daemon and load hooks configuration.
+
+        Args:
+            workspace_root: Project root directory.
+            socket_path: Socket path (default: per-project path from
+                default_socket_path()).
+            idle_timeout: Seconds without requests before exiting
+                (default: 900, 0 disables).
+        """
+        self.workspace_root = Path(workspace_root).resolve()
+        self.socket_path = socket_path or default_socket_path(self.workspace_root)
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.requests = 0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_activity = time.monotonic()
+        self._server: _EmitServer | None = None
+        self._socket_inode: int | None = None
+
+        self._config_key = self._config_stat()
+        self.emitter = EventEmitter(
+            workspace_root=self.workspace_root, config=self._load_config()
+        )
+
+    def _config_stat(self) -> tuple[str, int, int] | None:
+        """Identify the current hooks.yaml by path, mtime and size."""
+        config_file = _find_hooks_config(self.workspace_root)
+        if config_file is None:
+            return None
+        try:
+            stat = config_file.stat()
+        except OSError:
+            return None
+        return (str(config_file), stat.st_mtime_ns, stat.st_size)
+
+    def _load_config(self) -> HooksConfig:
+        """Load hooks.yaml, falling back to an empty config like the CLI."""
+        try:
+            return load_hooks_config(project_root=self.workspace_root)
+        except Exception as e:
+            logger.warning(f"Failed to load hooks config: {e}")
+            return HooksConfig.empty()
+
+    def reload_if_changed(self) -> bool:
+        """Reload hooks.yaml if it changed since it was last loaded.
+
+        Returns:
+            True if the configuration was reloaded.
+        """
+        key = self._config_stat()
+        with self._lock:
+            if key == self._config_key:
+                return False
+            self._config_key = key
+            # Keep the emitter so its runner and worker pool stay warm
+            self.emitter.config = self._load_config()
+        logger.info("Hooks configuration changed, reloaded")
+        return True
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle a decoded request.
+
+        Args:
+            request: Request object (see module docstring).
+
+        Returns:
+            Response object.
+        """
+        self._last_activity = time.monotonic()
+        self.requests += 1
+        command = request.get("command", "emit")
+
+        if command == "ping":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "workspace_root": str(self.workspace_root),
+                "uptime_s": round(time.time() - self.started_at, 1),
+                "requests": self.requests,
+                "hooks": len(self.emitter.config.hooks),
+            }
+
+        if command == "shutdown":
+            self._stop.set()
+            return {"ok": True}
+
+        if command != "emit":
+            return {"ok": False, "error": f"Unknown command: {command}"}
+
+        event_type = request.get("event_type")
+        if not event_type or not isinstance(event_type, str):
+            return {"ok": False, "error": "Missing event_type"}
+        event = build_event(
+            self.workspace_root,
+            event_type,
+            spec_id=request.get("spec_id"),
+            task_id=request.get("task_id"),
+            progress=request.get("progress"),
+            message=request.get("message"),
+            agent_id=request.get("agent_id"),
+        )
+
+        self.reload_if_changed()
+
+        if request.get("dry_run"):
+            matching = self.emitter.config.get_matching_hooks(event)
+            return {"ok": True, "results": [], "would_run": [h.name for h in matching]}
+
+        if not request.get("wait", True):
+            self.emitter.emit_async(event)
+            return {"ok": True, "queued": True, "event_id": event.event_id}
+
+        results = self.emitter.emit(event)
+        return {
+            "ok": True,
+            "event_id": event.event_id,
+            "results": [result.to_dict() for result in results],
+        }
+
+    def bind(self) -> None:
+        """Create the socket, replacing a stale one from a dead daemon.
+
+        Raises:
+            EmitDaemonError: If another daemon is already serving the socket,
+                the socket directory is not private, or Unix sockets are not
+                supported.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise EmitDaemonError("Unix sockets are not supported on this platform")
+
+        ensure_private_dir(self.socket_path.parent)
+        if self.socket_path.exists():
+            try:
+                send_request(self.socket_path, {"command": "ping"}, timeout=1.0)
+            except EmitDaemonError:
+                self.socket_path.unlink(missing_ok=True)
+            else:
+                raise EmitDaemonError(
+                    f"Emit daemon already running on {self.socket_path}"
+                )
+
+        try:
+            self._server = _EmitServer(str(self.socket_path), self)
+        except OSError as e:
+            raise EmitDaemonError(f"Cannot listen on {self.socket_path}: {e}") from e
+        os.chmod(self.socket_path, 0o600)
+        self._socket_inode = self.socket_path.stat().st_ino
+        self._server.timeout = 0.5
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown or idle timeout, then clean up."""
+        if self._server is None:
+            self.bind()
+        server = self._server
+        assert server is not None
+
+        logger.info(f"Emit daemon listening on {self.socket_path}")
+        try:
+            while not self._stop.is_set():
+                server.handle_request()
+                idle = time.monotonic() - self._last_activity
+                if self.idle_timeout and idle > self.idle_timeout:
+                    logger.info("Emit daemon idle, exiting")
+                    break
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """Ask serve_forever() to return after the current poll interval."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Close the server and remove the socket if it is still ours."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        try:
+            if self.socket_path.stat().st_ino == self._socket_inode:
+                self.socket_path.unlink()
+        except OSError:
+            pass
@@ -7,6 +7,8 @@ ensuring event emission never breaks workflow execution.
 Features:
 - Synchronous event emission with immediate hook execution
 - Asynchronous event emission (fire-and-forget) for non-critical events
+- Concurrent execution of parallel hooks on a bounded worker pool, with
+  depends_on ordering between hooks
 - Fail-safe design: errors in hooks don't break workflows
 - Performance optimized: <50ms overhead per event emission
 - Dry-run mode for testing without side effects
@@ -23,12 +25,14 @@ Example:
 from __future__ import annotations
 
 import logging
+import queue
 import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .runner import HookResult
+    from .runner import HookResult, HookRunner
 
 from .config import load_hooks_config
 from .events import (
@@ -37,10 +41,13 @@ from .events import (
     create_spec_created_event,
     create_task_completed_event,
 )
-from .schema import HooksConfig
+from .schema import HookDefinition, HooksConfig
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of hooks executing concurrently per emitter
+DEFAULT_MAX_WORKERS = 4
+
 
 class EventEmitter:
     """Emits events and triggers matching hooks.
@@ -49,10 +56,16 @@ class EventEmitter:
     It loads hook configuration, matches events against hook definitions,
     and executes matching hooks via the HookRunner.
 
+    Hooks run one after another in config order unless they set
+    ``parallel: true`` or ``depends_on``. Parallel hooks run concurrently on
+    a bounded worker pool shared by all events of this emitter; a hook with
+    ``depends_on`` starts once the named hooks have succeeded.
+
     Attributes:
         workspace_root: Project root directory.
         config: Hooks configuration (loaded from hooks.yaml).
         dry_run: If True, log hooks without executing them.
+        max_workers: Maximum number of hooks executing concurrently.
 
     Example:
         >>> emitter = EventEmitter(workspace_root=Path("/project"))
@@ -66,6 +79,7 @@ class EventEmitter:
         workspace_root: Path,
         config: HooksConfig | None = None,
         dry_run: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """Initialize emitter with workspace and optional config.
 
@@ -74,6 +88,8 @@ class EventEmitter:
             config: Pre-loaded hooks configuration (optional). If not provided,
                 configuration will be loaded from workspace_root/.flowspec/hooks/hooks.yaml.
             dry_run: If True, log hooks without executing them (for testing).
+            max_workers: Maximum number of parallel hooks executing at once
+                (default: 4).
 
         Example:
             >>> emitter = EventEmitter(workspace_root=Path.cwd())
@@ -83,6 +99,7 @@ class EventEmitter:
         """
         self.workspace_root = workspace_root
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
 
         # Load config if not provided
         if config is None:
@@ -97,12 +114,20 @@ class EventEmitter:
         else:
             self.config = config
 
+        # Runner, worker pool and background worker are created on first use
+        # and shared by all events emitted through this emitter
+        self._lock = threading.Lock()
+        self._runner: HookRunner | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._async_queue: queue.SimpleQueue[Event] = queue.SimpleQueue()
+        self._async_worker: threading.Thread | None = None
+
     def emit(self, event: Event) -> list[HookResult]:
         """Emit event and run all matching hooks synchronously.
 
         This is the primary method for event emission. It:
         1. Finds all hooks that match the event
-        2. Executes each hook in sequence
+        2. Executes serial hooks in sequence and parallel hooks concurrently
         3. Collects and returns all results
 
         Hook execution errors are caught and logged but don't raise exceptions,
@@ -112,8 +137,9 @@ class EventEmitter:
             event: Event to emit.
 
         Returns:
-            List of HookResult instances, one per executed hook. Returns empty
-            list if no hooks match or if all hooks are disabled.
+            List of HookResult instances, one per executed hook, in config
+            order. Returns empty list if no hooks match or if all hooks are
+            disabled.
 
         Example:
             >>> event = Event(event_type="task.completed", project_root="/tmp")
@@ -122,9 +148,6 @@ class EventEmitter:
             ...     if not result.success:
             ...         print(f"Hook {result.hook_name} failed: {result.error}")
         """
-        # Import here to avoid circular dependency
-        from .runner import HookRunner
-
         # Find matching hooks
         matching_hooks = self.config.get_matching_hooks(event)
 
@@ -141,62 +164,29 @@ class EventEmitter:
                 logger.info(f"  - {hook.name}")
             return []
 
-        # Execute hooks and collect results
+        if any(hook.parallel or hook.depends_on for hook in matching_hooks):
+            return self._emit_concurrent(matching_hooks, event)
+
+        # Execute hooks in sequence and collect results
         results: list[HookResult] = []
-        runner = HookRunner(workspace_root=self.workspace_root)
 
         for hook in matching_hooks:
-            try:
-                result = runner.run_hook(hook, event)
-                results.append(result)
-
-                # Log result
-                if result.success:
-                    logger.info(
-                        f"Hook '{hook.name}' completed in {result.duration_ms}ms"
-                    )
-                else:
-                    logger.warning(
-                        f"Hook '{hook.name}' failed (exit={result.exit_code}): "
-                        f"{result.error or 'See stderr'}"
-                    )
+            result = self._run_hook(hook, event)
+            results.append(result)
 
-                # Check fail_mode: stop on first failure?
-                if not result.success and hook.fail_mode == "stop":
-                    logger.error(
-                        f"Hook '{hook.name}' failed with fail_mode=stop. "
-                        "Stopping hook execution."
-                    )
-                    break
-
-            except Exception as e:
-                # Catch all exceptions to ensure fail-safe behavior
-                logger.error(
-                    f"Unexpected error executing hook '{hook.name}': {e}",
-                    exc_info=True,
-                )
-                # Create error result
-                from .runner import HookResult
-
-                error_result = HookResult(
-                    hook_name=hook.name,
-                    success=False,
-                    exit_code=-1,
-                    stdout="",
-                    stderr="",
-                    duration_ms=0,
-                    error=str(e),
-                )
-                results.append(error_result)
+            # Check fail_mode: stop on first failure?
+            if self._should_stop(hook, result):
+                break
 
         return results
 
     def emit_async(self, event: Event) -> None:
         """Emit event asynchronously (fire-and-forget).
 
-        Executes hooks in a background thread without waiting for completion.
-        Useful for non-critical events like logging or notifications where
-        you don't want to block the workflow.
+        Queues the event for a single background worker thread and returns
+        without waiting for hooks to complete. Events are processed in the
+        order they were queued. Useful for non-critical events like logging
+        or notifications where you don't want to block the workflow.
 
         Note: Results are not returned. Hook failures are logged but not
         raised. Use emit() if you need results or failure handling.
@@ -209,8 +199,23 @@ class EventEmitter:
             >>> emitter.emit_async(event)  # Returns immediately
             >>> # Hook execution happens in background
         """
+        self._async_queue.put(event)
+
+        with self._lock:
+            if self._async_worker is None:
+                self._async_worker = threading.Thread(
+                    target=self._process_async_queue,
+                    name="hook-emit-worker",
+                    daemon=True,
+                )
+                self._async_worker.start()
 
-        def _emit_in_background():
+        logger.debug(f"Event {event.event_type} emitted asynchronously")
+
+    def _process_async_queue(self) -> None:
+        """Emit queued events forever (runs in the background worker)."""
+        while True:
+            event = self._async_queue.get()
             try:
                 self.emit(event)
             except Exception as e:
@@ -219,13 +224,163 @@ class EventEmitter:
                     exc_info=True,
                 )
 
-        thread = threading.Thread(
-            target=_emit_in_background,
-            name=f"hook-emit-{event.event_type}",
-            daemon=True,
+    def _get_runner(self) -> HookRunner:
+        """Get the emitter's hook runner, creating it on first use."""
+        with self._lock:
+            if self._runner is None:
+                # Import here to avoid circular dependency
+                from .runner import HookRunner
+
+                self._runner = HookRunner(
+                    workspace_root=self.workspace_root,
+                    security_config=self.config.security_config(),
+                )
+            return self._runner
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the bounded worker pool for parallel hooks."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hook"
+                )
+            return self._executor
+
+    def _run_hook(self, hook: HookDefinition, event: Event) -> HookResult:
+        """Run one hook, converting unexpected errors into a failed result."""
+        try:
+            result = self._get_runner().run_hook(hook, event)
+
+            # Log result
+            if result.success:
+                logger.info(f"Hook '{hook.name}' completed in {result.duration_ms}ms")
+            else:
+                logger.warning(
+                    f"Hook '{hook.name}' failed (exit={result.exit_code}): "
+                    f"{result.error or 'See stderr'}"
+                )
+            return result
+
+        except Exception as e:
+            # Catch all exceptions to ensure fail-safe behavior
+            logger.error(
+                f"Unexpected error executing hook '{hook.name}': {e}",
+                exc_info=True,
+            )
+            # Create error result
+            from .runner import HookResult
+
+            return HookResult(
+                hook_name=hook.name,
+                success=False,
+                exit_code=-1,
+                stdout="",
+                stderr="",
+                duration_ms=0,
+                error=str(e),
+            )
+
+    def _should_stop(self, hook: HookDefinition, result: HookResult) -> bool:
+        """Check whether a hook result stops further hook execution."""
+        if result.success or hook.fail_mode != "stop":
+            return False
+        logger.error(
+            f"Hook '{hook.name}' failed with fail_mode=stop. Stopping hook execution."
         )
-        thread.start()
-        logger.debug(f"Event {event.event_type} emitted asynchronously")
+        return True
+
+    def _emit_concurrent(
+        self, hooks: list[HookDefinition], event: Event
+    ) -> list[HookResult]:
+        """Run hooks on the worker pool, honouring ordering and dependencies.
+
+        A serial hook waits for every hook listed before it; a parallel hook
+        waits only for the closest serial hook before it. ``depends_on``
+        additionally requires the named hooks to succeed, otherwise the hook
+        is skipped. After a ``fail_mode: stop`` failure no further hooks are
+        started, and hooks already running are allowed to finish.
+
+        Args:
+            hooks: Matching hooks in config order.
+            event: Event that triggered the hooks.
+
+        Returns:
+            Results of executed hooks, in config order.
+        """
+        index = {hook.name: i for i, hook in enumerate(hooks)}
+        waits_for: list[set[int]] = []
+        requires: list[set[int]] = []
+        last_serial: int | None = None
+
+        for i, hook in enumerate(hooks):
+            required = set()
+            for name in hook.depends_on:
+                if name in index:
+                    required.add(index[name])
+                else:
+                    logger.debug(
+                        f"Hook '{hook.name}' dependency '{name}' did not match "
+                        f"{event.event_type}; ignoring"
+                    )
+
+            if hook.parallel:
+                after = set() if last_serial is None else {last_serial}
+            else:
+                after = set(range(i))
+                last_serial = i
+
+            requires.append(required)
+            waits_for.append(after | required)
+
+        executor = self._get_executor()
+        results: dict[int, HookResult] = {}
+        done: set[int] = set()
+        pending = list(range(len(hooks)))
+        running: dict[Future[HookResult], int] = {}
+        stopped = False
+
+        while pending or running:
+            # Start every hook whose predecessors have finished; skipping a
+            # hook can unblock others, so rescan until nothing changes
+            changed = not stopped
+            while changed:
+                changed = False
+                for i in [i for i in pending if waits_for[i] <= done]:
+                    pending.remove(i)
+                    failed = [
+                        hooks[j].name
+                        for j in sorted(requires[i])
+                        if j not in results or not results[j].success
+                    ]
+                    if failed:
+                        logger.warning(
+                            f"Skipping hook '{hooks[i].name}': dependency "
+                            f"{', '.join(failed)} did not succeed"
+                        )
+                        done.add(i)
+                        changed = True
+                    else:
+                        future = executor.submit(self._run_hook, hooks[i], event)
+                        running[future] = i
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i = running.pop(future)
+                results[i] = future.result()
+                done.add(i)
+                if not stopped and self._should_stop(hooks[i], results[i]):
+                    stopped = True
+
+        if pending and not stopped:
+            logger.error(
+                "Circular hook dependencies, not executed: "
+                f"{', '.join(hooks[i].name for i in pending)}"
+            )
+
+        return [results[i] for i in sorted(results)]
 
 
 # --- Convenience functions for common events ---
@@ -18,11 +18,18 @@ Example:
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
+from itertools import chain
 from typing import Any
 
 from .events import Event
+from .security import SecurityConfig
+
+# Characters that make an event type pattern a wildcard (fnmatch syntax)
+_WILDCARD_CHARS = re.compile(r"[*?[]")
 
 
 @dataclass
@@ -181,6 +188,9 @@ class HookDefinition:
         env: Environment variables
         fail_mode: Error handling mode ("continue" or "stop")
         enabled: Whether hook is enabled (default: True)
+        parallel: Run concurrently with neighbouring parallel hooks
+            (default: False, hooks run one after another in config order)
+        depends_on: Names of hooks that must succeed before this hook runs
 
     Example:
         >>> hook = HookDefinition(
@@ -204,6 +214,8 @@ class HookDefinition:
     env: dict[str, str] = field(default_factory=dict)
     fail_mode: str = "continue"  # "continue" or "stop"
     enabled: bool = True
+    parallel: bool = False
+    depends_on: list[str] = field(default_factory=list)
 
     def is_enabled(self) -> bool:
         """Check if hook is enabled.
@@ -286,6 +298,10 @@ class HookDefinition:
         # Add optional fields
         if self.description is not None:
             result["description"] = self.description
+        if self.parallel:
+            result["parallel"] = self.parallel
+        if self.depends_on:
+            result["depends_on"] = self.depends_on
 
         return result
 
@@ -327,19 +343,172 @@ class HookDefinition:
             env=data.get("env", {}),
             fail_mode=data.get("fail_mode", "continue"),
             enabled=data.get("enabled", True),
+            parallel=data.get("parallel", False),
+            depends_on=data.get("depends_on", []),
         )
 
 
+# Compiled context filter: (mode, context field, expected value)
+_CompiledFilter = tuple[tuple[str, str, Any], ...]
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a list of filter values to a frozenset if all are hashable."""
+    if isinstance(value, (list, tuple, set)):
+        try:
+            return frozenset(value)
+        except TypeError:
+            pass
+    return value
+
+
+def _contains(values: Any, item: Any) -> bool:
+    """Membership test that treats unhashable or mistyped items as absent."""
+    try:
+        return item in values
+    except TypeError:
+        return False
+
+
+def _compile_filter(filters: dict[str, Any]) -> _CompiledFilter:
+    """Compile an EventMatcher filter into (mode, field, expected) entries.
+
+    Mirrors EventMatcher._match_filters: ``*_any`` and ``*_all`` fields
+    match against list context values, list values match any listed value,
+    anything else is an exact match.
+    """
+    compiled = []
+    for filter_field, expected_value in filters.items():
+        if filter_field.endswith("_any"):
+            compiled.append(("any", filter_field[:-4], _freeze(expected_value)))
+        elif filter_field.endswith("_all"):
+            compiled.append(("all", filter_field[:-4], expected_value))
+        elif isinstance(expected_value, list):
+            compiled.append(("in", filter_field, _freeze(expected_value)))
+        else:
+            compiled.append(("eq", filter_field, expected_value))
+    return tuple(compiled)
+
+
+def _filter_matches(compiled: _CompiledFilter, context: dict[str, Any]) -> bool:
+    """Check an event context against a compiled filter."""
+    for mode, name, expected in compiled:
+        if mode == "eq":
+            if context.get(name) != expected:
+                return False
+        elif mode == "in":
+            if not _contains(expected, context.get(name)):
+                return False
+        else:
+            actual = context.get(name, [])
+            if not isinstance(actual, list):
+                return False
+            if mode == "any":
+                if not any(_contains(expected, label) for label in actual):
+                    return False
+            elif not all(_contains(actual, label) for label in expected):
+                return False
+    return True
+
+
+class _HookIndex:
+    """Event-type index over a hook list, compiled once per configuration.
+
+    Exact event types are looked up in a dict. Wildcard patterns are
+    compiled to regexes and grouped by the literal namespace before their
+    first ``.`` (``task.*`` is only tried for ``task.`` events); patterns
+    without a literal namespace are tried for every event type. The hooks
+    matching each event type are cached, so repeated events of the same
+    type only evaluate context filters.
+    """
+
+    # Distinct event types cached before the cache is reset
+    CACHE_LIMIT = 1024
+
+    def __init__(self, hooks: list[HookDefinition]):
+        self.hooks = hooks
+        self.size = len(hooks)
+        self.exact: dict[str, list[tuple[int, _CompiledFilter | None]]] = {}
+        self.by_namespace: dict[
+            str, list[tuple[int, re.Pattern[str], _CompiledFilter | None]]
+        ] = {}
+        self.unscoped: list[tuple[int, re.Pattern[str], _CompiledFilter | None]] = []
+        self._cache: dict[
+            str, list[tuple[HookDefinition, tuple[_CompiledFilter, ...] | None]]
+        ] = {}
+
+        for position, hook in enumerate(hooks):
+            for matcher in hook.events:
+                compiled = (
+                    None if matcher.filter is None else _compile_filter(matcher.filter)
+                )
+                # fnmatch normalizes case on case-insensitive platforms
+                pattern = os.path.normcase(matcher.type)
+                wildcard = _WILDCARD_CHARS.search(pattern)
+                if wildcard is None:
+                    self.exact.setdefault(pattern, []).append((position, compiled))
+                    continue
+
+                regex = re.compile(translate(pattern))
+                prefix = pattern[: wildcard.start()]
+                if "." in prefix:
+                    namespace = prefix.split(".", 1)[0]
+                    self.by_namespace.setdefault(namespace, []).append(
+                        (position, regex, compiled)
+                    )
+                else:
+                    self.unscoped.append((position, regex, compiled))
+
+    def candidates(
+        self, event_type: str
+    ) -> list[tuple[HookDefinition, tuple[_CompiledFilter, ...] | None]]:
+        """Get hooks whose event type patterns match, in config order.
+
+        Returns:
+            List of (hook, filters) pairs. ``filters`` is None if a matcher
+            without filters matched, otherwise the filters of all matching
+            matchers (any one of which must pass).
+        """
+        cached = self._cache.get(event_type)
+        if cached is not None:
+            return cached
+
+        key = os.path.normcase(event_type)
+        matched: dict[int, list[_CompiledFilter | None]] = {}
+        for position, compiled in self.exact.get(key, ()):
+            matched.setdefault(position, []).append(compiled)
+
+        namespace = key.split(".", 1)[0]
+        for position, regex, compiled in chain(
+            self.by_namespace.get(namespace, ()), self.unscoped
+        ):
+            if regex.match(key):
+                matched.setdefault(position, []).append(compiled)
+
+        cached = [
+            (
+                self.hooks[position],
+                None if None in filters else tuple(filters),
+            )
+            for position, filters in sorted(matched.items())
+        ]
+        if len(self._cache) >= self.CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[event_type] = cached
+        return cached
+
+
 @dataclass
 class HooksConfig:
     """Complete hooks configuration.
 
-    Contains version, defaults, and all hook definitions.
+    Contains version, defaults, security settings and all hook definitions.
 
     Attributes:
         version: Configuration schema version
         defaults: Default values applied to all hooks
         hooks: List of hook definitions
+        security: Hook runner security settings (persist_validation_cache)
 
     Example:
         >>> config = HooksConfig(
@@ -358,10 +527,29 @@ class HooksConfig:
     version: str
     hooks: list[HookDefinition]
     defaults: dict[str, Any] = field(default_factory=dict)
+    security: dict[str, Any] = field(default_factory=dict)
+    _index: _HookIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.compile()
+
+    def compile(self) -> None:
+        """Build the event-matching index for the current hooks.
+
+        Runs at construction, and again automatically when ``hooks`` is
+        replaced or changes length. Call it after editing the event matchers
+        of existing hooks in place.
+        """
+        self._index = _HookIndex(self.hooks)
 
     def get_matching_hooks(self, event: Event) -> list[HookDefinition]:
         """Get all enabled hooks that match an event.
 
+        Uses the compiled index, so matching cost depends on the hooks that
+        can match the event type rather than on the total number of hooks.
+
         Args:
             event: Event to match.
 
@@ -373,10 +561,24 @@ class HooksConfig:
             >>> event = Event(event_type="spec.created", project_root="/tmp")
             >>> matching = config.get_matching_hooks(event)
         """
+        index = self._index
+        if (
+            index is None
+            or index.hooks is not self.hooks
+            or index.size != len(self.hooks)
+        ):
+            self.compile()
+            index = self._index
+
+        context = event.context or {}
         return [
             hook
-            for hook in self.hooks
-            if hook.is_enabled() and hook.matches_event(event)
+            for hook, filters in index.candidates(event.event_type)
+            if hook.is_enabled()
+            and (
+                filters is None
+                or any(_filter_matches(compiled, context) for compiled in filters)
+            )
         ]
 
     def get_hook_by_name(self, name: str) -> HookDefinition | None:
@@ -405,8 +607,22 @@ class HooksConfig:
         }
         if self.defaults:
             result["defaults"] = self.defaults
+        if self.security:
+            result["security"] = self.security
         return result
 
+    def security_config(self) -> SecurityConfig:
+        """Get the security configuration for running these hooks.
+
+        Returns:
+            SecurityConfig built from the ``security`` section.
+        """
+        return SecurityConfig(
+            persist_validation_cache=bool(
+                self.security.get("persist_validation_cache", False)
+            )
+        )
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> HooksConfig:
         """Create config from dictionary.
@@ -434,6 +650,7 @@ class HooksConfig:
             version=data["version"],
             hooks=hooks,
             defaults=defaults,
+            security=data.get("security", {}),
         )
 
     @classmethod
@@ -466,8 +683,16 @@ HOOKS_CONFIG_JSON_SCHEMA = {
                 "shell": {"type": "string"},
                 "fail_mode": {"type": "string", "enum": ["continue", "stop"]},
                 "enabled": {"type": "boolean"},
+                "parallel": {"type": "boolean"},
             },
         },
+        "security": {
+            "type": "object",
+            "properties": {
+                "persist_validation_cache": {"type": "boolean"},
+            },
+            "additionalProperties": False,
+        },
         "hooks": {
             "type": "array",
             "minItems": 0,
@@ -536,6 +761,11 @@ HOOKS_CONFIG_JSON_SCHEMA = {
                         "enum": ["continue", "stop"],
                     },
                     "enabled": {"type": "boolean"},
+                    "parallel": {"type": "boolean"},
+                    "depends_on": {
+                        "type": "array",
+                        "items": {"type": "string", "pattern": "^[a-z0-9-]+$"},
+                    },
                 },
             },
         },
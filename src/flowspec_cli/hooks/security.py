@@ -22,15 +22,40 @@ Example:
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
 import logging
+import os
 import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Verify and checkpoint the audit chain after this many new bytes
+CHECKPOINT_INTERVAL_BYTES = 1024 * 1024
+
+# Environment variable holding the checkpoint signing key; without it no
+# checkpoints are written or trusted
+AUDIT_KEY_ENV = "FLOWSPEC_AUDIT_KEY"
+
+# Bytes read per step when reading the audit log backwards
+REVERSE_READ_BLOCK_SIZE = 64 * 1024
+
+# Persisted script validation cache, relative to the workspace root
+VALIDATION_CACHE_FILE = ".flowspec/hooks/validation-cache.json"
+VALIDATION_CACHE_VERSION = 2
+
+# Scripts modified this close to their last check are re-hashed even if
+# their size and mtime match, since a same-size rewrite within the
+# filesystem's timestamp granularity would otherwise go unnoticed
+RACY_WINDOW_NS = 2_000_000_000
+
 
 @dataclass
 class SecurityConfig:
@@ -55,6 +80,175 @@ class SecurityConfig:
     blocked_commands: list[str] = field(default_factory=list)
     max_output_size: int = 1024 * 1024  # 1MB max stdout/stderr
     allow_network: bool = False  # Network access (v2)
+    persist_validation_cache: bool = False  # Keep script verdicts on disk
+
+
+@dataclass
+class ScriptVerdict:
+    """Cached result of validating one version of a script.
+
+    Attributes:
+        mtime_ns: Script modification time when checked.
+        size: Script size in bytes when checked.
+        sha256: SHA-256 of the script content.
+        patterns: Fingerprint of the patterns the script was checked with.
+        warnings: Security warnings found.
+        checked_ns: When the script was last read.
+    """
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    patterns: str
+    warnings: list[str]
+    checked_ns: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "sha256": self.sha256,
+            "patterns": self.patterns,
+            "warnings": self.warnings,
+            "checked_ns": self.checked_ns,
+        }
+
+
+class ScriptValidationCache:
+    """Script validation verdicts keyed by (path, mtime, size, SHA-256).
+
+    An unchanged script (same size and mtime) is served from the cache
+    without being read. A touched script with the same content is hashed
+    but not rescanned. Verdicts are dropped when the script content or
+    the validator's patterns change.
+
+    Use get_validation_cache() to share one cache per process.
+
+    Attributes:
+        path: File the cache is persisted to (None for memory only).
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file to load and persist verdicts (optional).
+        """
+        self.path = path
+        self._entries: dict[str, ScriptVerdict] = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != VALIDATION_CACHE_VERSION:
+                return
+            self._entries = {
+                key: ScriptVerdict(**entry) for key, entry in data["scripts"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable validation cache {self.path}: {e}")
+
+    def _save(self) -> None:
+        """Write the cache atomically (best effort)."""
+        data = {
+            "version": VALIDATION_CACHE_VERSION,
+            "scripts": {key: v.to_dict() for key, v in self._entries.items()},
+        }
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write validation cache: {e}")
+
+    def get(
+        self,
+        script_path: Path,
+        patterns: str,
+        scan: Callable[[bytes], list[str]],
+    ) -> ScriptVerdict:
+        """Get the verdict for a script, scanning it only if needed.
+
+        Args:
+            script_path: Script to validate.
+            patterns: Fingerprint of the patterns scan() checks.
+            scan: Returns the warnings for the script content.
+
+        Returns:
+            The script's verdict.
+
+        Raises:
+            OSError: If the script cannot be read.
+        """
+        key = os.path.abspath(script_path)
+        stat = script_path.stat()
+        with self._lock:
+            cached = self._entries.get(key)
+        if (
+            cached is not None
+            and cached.patterns == patterns
+            and cached.mtime_ns == stat.st_mtime_ns
+            and cached.size == stat.st_size
+            and cached.checked_ns - stat.st_mtime_ns > RACY_WINDOW_NS
+        ):
+            return cached
+
+        checked_ns = time.time_ns()
+        content = script_path.read_bytes()
+        sha256 = hashlib.sha256(content).hexdigest()
+        if cached is not None and (cached.sha256, cached.patterns) == (
+            sha256,
+            patterns,
+        ):
+            warnings = cached.warnings  # Touched, not changed
+        else:
+            warnings = scan(content)
+
+        verdict = ScriptVerdict(
+            mtime_ns=stat.st_mtime_ns,
+            size=len(content),
+            sha256=sha256,
+            patterns=patterns,
+            warnings=warnings,
+            checked_ns=checked_ns,
+        )
+        with self._lock:
+            self._entries[key] = verdict
+            if self.path is not None:
+                self._save()
+        return verdict
+
+    def clear(self) -> None:
+        """Drop all cached verdicts."""
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                self._save()
+
+
+# Process-wide caches, one per persistence path (None = memory only)
+_validation_caches: dict[Path | None, ScriptValidationCache] = {}
+_validation_caches_lock = threading.Lock()
+
+
+def get_validation_cache(path: Path | None = None) -> ScriptValidationCache:
+    """Get the process-wide validation cache for a persistence path.
+
+    Args:
+        path: File to persist verdicts to, or None for the in-memory cache.
+    """
+    with _validation_caches_lock:
+        cache = _validation_caches.get(path)
+        if cache is None:
+            cache = _validation_caches[path] = ScriptValidationCache(path)
+        return cache
 
 
 class SecurityValidator:
@@ -110,11 +304,36 @@ class SecurityValidator:
         self.config = config
         self.workspace_root = workspace_root
 
+        cache_path = None
+        if config.persist_validation_cache:
+            cache_path = workspace_root / VALIDATION_CACHE_FILE
+        self.validation_cache = get_validation_cache(cache_path)
+
+        # Verdicts are reused only while the checked patterns are the same
+        self._patterns_key = hashlib.sha256(
+            json.dumps([self.DANGEROUS_PATTERNS, config.blocked_commands]).encode()
+        ).hexdigest()
+
+    def _scan(self, content: bytes) -> list[str]:
+        """Find dangerous patterns in script content."""
+        # Normalize CRLF/CR line endings so $-anchored patterns match
+        text = content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        return [
+            description
+            for pattern, description in self.DANGEROUS_PATTERNS
+            if re.search(pattern, text, re.MULTILINE)
+        ]
+
+    def _verdict(self, script_path: Path) -> ScriptVerdict:
+        """Get the (cached) validation verdict for a script."""
+        return self.validation_cache.get(script_path, self._patterns_key, self._scan)
+
     def validate_script_content(self, script_path: Path) -> list[str]:
         """Check script content for dangerous patterns.
 
         Scans script file for potentially dangerous shell commands and patterns.
-        Returns a list of warning messages for any detected issues.
+        Returns a list of warning messages for any detected issues. Verdicts
+        are cached per script version, so unchanged scripts are not rescanned.
 
         Args:
             script_path: Path to script file to validate.
@@ -134,20 +353,17 @@ class SecurityValidator:
         warnings = []
 
         try:
-            content = script_path.read_text(encoding="utf-8")
+            verdict = self._verdict(script_path)
         except OSError as e:
             logger.error(f"Failed to read script {script_path}: {e}")
             raise
 
-        # Check for dangerous patterns
-        for pattern, description in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, content, re.MULTILINE):
-                warnings.append(
-                    f"Dangerous pattern detected in {script_path.name}: {description}"
-                )
-                logger.warning(
-                    f"Security warning: {description} found in {script_path}"
-                )
+        # Report dangerous patterns
+        for description in verdict.warnings:
+            warnings.append(
+                f"Dangerous pattern detected in {script_path.name}: {description}"
+            )
+            logger.warning(f"Security warning: {description} found in {script_path}")
 
         return warnings
 
@@ -173,13 +389,187 @@ class SecurityValidator:
             Script hash: a3b5c7d9e1f2...
         """
         try:
-            content = script_path.read_bytes()
-            return hashlib.sha256(content).hexdigest()
+            return self._verdict(script_path).sha256
         except OSError as e:
             logger.error(f"Failed to read script {script_path} for hashing: {e}")
             raise
 
 
+def _iter_lines_reversed(path: Path) -> Iterator[bytes]:
+    """Yield a file's lines from last to first.
+
+    Seeks backwards in blocks, so only the blocks holding the lines
+    consumed are read. Lines may span any number of blocks.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b""
+        while position > 0:
+            size = min(REVERSE_READ_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + partial).split(b"\n")
+            # The first line may continue in the previous block
+            partial = lines.pop(0)
+            yield from reversed(lines)
+        yield partial
+
+
+def _chain_hash(entry: dict[str, Any], previous_hash: str) -> str:
+    """Compute an entry's hash: SHA-256 of (entry JSON + previous hash)."""
+    entry_json = json.dumps(entry, sort_keys=True)
+    chain_input = f"{entry_json}{previous_hash}"
+    return hashlib.sha256(chain_input.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class AuditCheckpoint:
+    """Signed record of a verified position in the audit hash chain.
+
+    Because every entry hash covers all earlier entries, a checkpoint
+    whose hash still matches the log vouches for everything before it.
+
+    Attributes:
+        segment: Sequence number of the log segment.
+        line: Line number (within the segment) of the checkpointed entry.
+        start: Byte offset where the checkpointed entry's line starts.
+        offset: Byte offset just past the checkpointed entry's line.
+        entry_hash: Chain hash of the checkpointed entry.
+        signature: HMAC-SHA256 over the fields above.
+    """
+
+    segment: int
+    line: int
+    start: int
+    offset: int
+    entry_hash: str
+    signature: str = ""
+
+    def _payload(self) -> bytes:
+        return (
+            f"{self.segment}:{self.line}:{self.start}:{self.offset}:{self.entry_hash}"
+        ).encode("utf-8")
+
+    def sign(self, key: bytes) -> None:
+        """Sign the checkpoint with an HMAC key."""
+        self.signature = hmac.new(key, self._payload(), hashlib.sha256).hexdigest()
+
+    def has_valid_signature(self, key: bytes) -> bool:
+        """Check the checkpoint's signature."""
+        expected = hmac.new(key, self._payload(), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, self.signature)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "segment": self.segment,
+            "line": self.line,
+            "start": self.start,
+            "offset": self.offset,
+            "entry_hash": self.entry_hash,
+            "signature": self.signature,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AuditCheckpoint:
+        """Create from dictionary."""
+        return cls(
+            segment=int(data["segment"]),
+            line=int(data["line"]),
+            start=int(data["start"]),
+            offset=int(data["offset"]),
+            entry_hash=str(data["entry_hash"]),
+            signature=str(data["signature"]),
+        )
+
+
+@dataclass
+class _SegmentResult:
+    """Outcome of verifying (part of) one audit log segment.
+
+    When a segment is verified without the previous segment's last hash,
+    its first hashed entry is returned unchecked in ``first`` as
+    (line, entry JSON, stored hash) so the caller can stitch the chain.
+    """
+
+    errors: list[str] = field(default_factory=list)
+    first: tuple[int, str, str] | None = None
+    last_hash: str | None = None
+    last_line: int = 0
+    last_start: int = 0
+    last_offset: int = 0
+
+
+def _verify_segment(
+    path: Path,
+    label: str,
+    start: int = 0,
+    line_num: int = 0,
+    previous_hash: str | None = "",
+) -> _SegmentResult:
+    """Verify the hash chain of one log segment from a byte offset.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        path: Segment file.
+        label: Prefix for error messages.
+        start: Byte offset to start at (just past a verified entry).
+        line_num: Line number of the entry before ``start``.
+        previous_hash: Hash the first entry chains from, or None if it is
+            not known yet (parallel verification).
+    """
+    result = _SegmentResult()
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            position = start
+            for raw in f:
+                line_start = position
+                position += len(raw)
+                line_num += 1
+                if not raw.strip():
+                    continue
+
+                try:
+                    entry = json.loads(raw)
+                except ValueError as e:
+                    result.errors.append(f"{label}Line {line_num}: Invalid JSON: {e}")
+                    continue
+
+                # Verify entry hash
+                if not isinstance(entry, dict) or "entry_hash" not in entry:
+                    result.errors.append(f"{label}Line {line_num}: Missing entry_hash")
+                    continue
+
+                stored_hash = entry.pop("entry_hash")
+                if previous_hash is None:
+                    result.first = (
+                        line_num,
+                        json.dumps(entry, sort_keys=True),
+                        stored_hash,
+                    )
+                else:
+                    expected_hash = _chain_hash(entry, previous_hash)
+                    if stored_hash != expected_hash:
+                        result.errors.append(
+                            f"{label}Line {line_num}: Hash mismatch "
+                            f"(expected {expected_hash[:8]}..., got {stored_hash[:8]}...)"
+                        )
+
+                previous_hash = stored_hash
+                result.last_hash = stored_hash
+                result.last_line = line_num
+                result.last_start = line_start
+                result.last_offset = position
+    except OSError as e:
+        result.errors.append(f"Failed to read audit log: {e}")
+    return result
+
+
 class AuditLogger:
     """Enhanced audit logger with integrity verification.
 
@@ -191,9 +581,22 @@ class AuditLogger:
     - Integrity verification via hash chains
     - Tamper detection
     - Query and analysis of audit history
+    - Signed checkpoints for incremental verification
+    - Optional rotation into numbered segments (audit.log.000001, ...)
+      with the hash chain carried across segments
+
+    Checkpoints are kept in ``<log>.checkpoints`` and signed with the key
+    in ``FLOWSPEC_AUDIT_KEY``; failed periodic checks are recorded there
+    too, unsigned, so they are not retried before another
+    ``checkpoint_interval`` bytes are logged. The key must be kept
+    outside the workspace: anyone who can read it can forge checkpoints.
+    Without it, no checkpoints are written and every verification is a
+    full check.
 
     Attributes:
         log_path: Path to audit log file.
+        max_bytes: Rotate the log before it grows past this size.
+        checkpoint_interval: Checkpoint after this many new bytes.
 
     Example:
         >>> logger = AuditLogger(Path(".flowspec/hooks/audit.log"))
@@ -206,16 +609,35 @@ class AuditLogger:
         >>> assert valid, f"Audit log tampered: {errors}"
     """
 
-    def __init__(self, log_path: Path):
+    def __init__(
+        self,
+        log_path: Path,
+        max_bytes: int | None = None,
+        checkpoint_interval: int | None = CHECKPOINT_INTERVAL_BYTES,
+    ):
         """Initialize audit logger.
 
         Args:
             log_path: Path to audit log file (will be created if needed).
+            max_bytes: Rotate the log into a numbered segment before it
+                grows past this size (None disables rotation).
+            checkpoint_interval: Verify and checkpoint the chain after
+                this many newly logged bytes (None disables checkpoints
+                while logging).
 
         Example:
             >>> logger = AuditLogger(Path(".flowspec/hooks/audit.log"))
         """
         self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_path = log_path.with_name(f"{log_path.name}.checkpoints")
+        self._segment_pattern = re.compile(rf"{re.escape(log_path.name)}\.(\d{{6}})")
+        self._last_checkpoint: AuditCheckpoint | None = None
+        # Where the last periodic check ended, as (segment, offset)
+        self._last_check: tuple[int, int] | None = None
+        # Segment list, reused until the current log is rotated
+        self._segments: list[tuple[int, Path]] | None = None
         # Ensure log directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -248,24 +670,41 @@ class AuditLogger:
 
         # Add entry hash (hash of entry + previous hash)
         entry_copy = entry.copy()
-        entry_json = json.dumps(entry_copy, sort_keys=True)
-        chain_input = f"{entry_json}{previous_hash}"
-        entry_hash = hashlib.sha256(chain_input.encode("utf-8")).hexdigest()
-        entry_copy["entry_hash"] = entry_hash
+        entry_copy["entry_hash"] = _chain_hash(entry, previous_hash)
+        line = json.dumps(entry_copy) + "\n"
 
         # Append to log
         try:
+            self._maybe_rotate(len(line.encode("utf-8")))
             with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry_copy) + "\n")
+                f.write(line)
         except OSError as e:
             logger.error(f"Failed to write audit log: {e}")
             raise
 
-    def verify_integrity(self) -> tuple[bool, list[str]]:
+        self._maybe_checkpoint()
+
+    def verify_integrity(
+        self,
+        incremental: bool = False,
+        parallel: bool = False,
+        max_workers: int | None = None,
+    ) -> tuple[bool, list[str]]:
         """Verify audit log hasn't been tampered with.
 
-        Validates the hash chain in the audit log. Each entry's hash
-        should match the hash of (entry + previous_hash).
+        Validates the hash chain across all log segments. Each entry's
+        hash should match the hash of (entry + previous_hash). With a
+        signing key configured, a successful verification is recorded as
+        a signed checkpoint.
+
+        Args:
+            incremental: Start from the last trusted checkpoint instead of
+                the first entry (a full check without a signing key).
+                Entries before the checkpoint were verified when it was
+                written.
+            parallel: Verify segments concurrently in worker processes and
+                stitch the chain together afterwards.
+            max_workers: Worker processes for parallel verification.
 
         Returns:
             Tuple of (is_valid, error_messages).
@@ -279,60 +718,237 @@ class AuditLogger:
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        if not self.log_path.exists():
+        segments = [(seq, path) for seq, path in self.segments() if path.exists()]
+        if not segments:
             # Empty/missing log is valid
             return True, []
 
+        # Where to start: the first entry, or the last trusted checkpoint
+        start, line_num, previous_hash = 0, 0, ""
+        checkpoint = self._trusted_checkpoint() if incremental else None
+        if checkpoint is not None:
+            segments = [(seq, p) for seq, p in segments if seq >= checkpoint.segment]
+            start, line_num = checkpoint.offset, checkpoint.line
+            previous_hash = checkpoint.entry_hash
+
+        jobs = [
+            (
+                path,
+                "" if path == self.log_path else f"{path.name}: ",
+                start if i == 0 else 0,
+                line_num if i == 0 else 0,
+                previous_hash if i == 0 else None,
+            )
+            for i, (_, path) in enumerate(segments)
+        ]
+        if parallel and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_verify_segment, *zip(*jobs)))
+        else:
+            results = []
+            carried = previous_hash
+            for path, label, seg_start, seg_line, _ in jobs:
+                result = _verify_segment(path, label, seg_start, seg_line, carried)
+                carried = result.last_hash or carried
+                results.append(result)
+
+        # Stitch the chain across segment boundaries
         errors = []
-        previous_hash = ""
-
-        try:
-            with open(self.log_path, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, start=1):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError as e:
-                        errors.append(f"Line {line_num}: Invalid JSON: {e}")
-                        continue
-
-                    # Verify entry hash
-                    if "entry_hash" not in entry:
-                        errors.append(f"Line {line_num}: Missing entry_hash")
-                        continue
+        carried = previous_hash
+        last: tuple[int, _SegmentResult] | None = None
+        for (seq, _), job, result in zip(segments, jobs, results):
+            label = job[1]
+            if result.first is not None:
+                first_line, entry_json, stored_hash = result.first
+                expected_hash = hashlib.sha256(
+                    f"{entry_json}{carried}".encode("utf-8")
+                ).hexdigest()
+                if stored_hash != expected_hash:
+                    errors.append(
+                        f"{label}Line {first_line}: Hash mismatch "
+                        f"(expected {expected_hash[:8]}..., got {stored_hash[:8]}...)"
+                    )
+            errors.extend(result.errors)
+            if result.last_hash is not None:
+                carried = result.last_hash
+                last = (seq, result)
+
+        if not errors and last is not None:
+            seq, result = last
+            self._write_checkpoint(
+                AuditCheckpoint(
+                    segment=seq,
+                    line=result.last_line,
+                    start=result.last_start,
+                    offset=result.last_offset,
+                    entry_hash=result.last_hash or "",
+                )
+            )
 
-                    stored_hash = entry["entry_hash"]
-                    entry_copy = {k: v for k, v in entry.items() if k != "entry_hash"}
-                    entry_json = json.dumps(entry_copy, sort_keys=True)
-                    chain_input = f"{entry_json}{previous_hash}"
-                    expected_hash = hashlib.sha256(
-                        chain_input.encode("utf-8")
-                    ).hexdigest()
+        return len(errors) == 0, errors
 
-                    if stored_hash != expected_hash:
-                        errors.append(
-                            f"Line {line_num}: Hash mismatch "
-                            f"(expected {expected_hash[:8]}..., got {stored_hash[:8]}...)"
-                        )
+    def segments(self) -> list[tuple[int, Path]]:
+        """Get the log's segments in chain order as (sequence, path).
 
-                    previous_hash = stored_hash
+        Rotated segments come first; the current log file is last and
+        has the next sequence number. The list is cached: a rotation (by
+        any process) creates the segment with the current log's number,
+        so only that path is checked before reusing it.
+        """
+        cached = self._segments
+        if cached is not None and not self._segment_path(cached[-1][0]).exists():
+            return list(cached)
+
+        rotated = []
+        for path in self.log_path.parent.glob(f"{self.log_path.name}.*"):
+            match = self._segment_pattern.fullmatch(path.name)
+            if match:
+                rotated.append((int(match.group(1)), path))
+        rotated.sort()
+        current = rotated[-1][0] + 1 if rotated else 1
+        self._segments = rotated + [(current, self.log_path)]
+        return list(self._segments)
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.log_path.with_name(f"{self.log_path.name}.{seq:06d}")
+
+    def _maybe_rotate(self, incoming: int) -> None:
+        """Move the current log to a numbered segment if it is full."""
+        if self.max_bytes is None:
+            return
+        try:
+            size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size and size + incoming > self.max_bytes:
+            seq = self.segments()[-1][0]
+            os.replace(self.log_path, self._segment_path(seq))
+
+    def _maybe_checkpoint(self) -> None:
+        """Verify and checkpoint the chain once enough has been logged."""
+        if self.checkpoint_interval is None or self._signing_key() is None:
+            return
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            return
+
+        # Count from where the last check ended, whether it succeeded
+        # (a checkpoint) or failed, so a failed check is not repeated on
+        # every append
+        last_check = self._last_check or self._read_last_check()
+        current_seq = self.segments()[-1][0]
+        new_bytes = size
+        if last_check is not None and last_check[0] == current_seq:
+            new_bytes -= last_check[1]
+        elif last_check is not None:
+            new_bytes = max(size, self.checkpoint_interval)  # Rotated since
+        if new_bytes < self.checkpoint_interval:
+            return
+
+        self._last_check = (current_seq, size)
+        valid, errors = self.verify_integrity(incremental=True)
+        if not valid:
+            logger.warning(f"Audit log integrity check failed: {errors[0]}")
+            self._append_check_record(
+                {"segment": current_seq, "offset": size, "failed": True}
+            )
+
+    def _read_last_check(self) -> tuple[int, int] | None:
+        """Get where the last recorded check ended, from the checkpoint file."""
+        try:
+            for line in _iter_lines_reversed(self.checkpoint_path):
+                if line.strip():
+                    data = json.loads(line)
+                    return int(data["segment"]), int(data["offset"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
 
+    def _append_check_record(self, record: dict[str, Any]) -> bool:
+        """Append a checkpoint or failed-check record (best effort)."""
+        try:
+            with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
         except OSError as e:
-            errors.append(f"Failed to read audit log: {e}")
-
-        return len(errors) == 0, errors
+            logger.warning(f"Failed to write audit checkpoint: {e}")
+            return False
+        self._last_check = (int(record["segment"]), int(record["offset"]))
+        return True
+
+    def _signing_key(self) -> bytes | None:
+        """Get the checkpoint signing key (None if no key is configured)."""
+        env_key = os.environ.get(AUDIT_KEY_ENV)
+        return env_key.encode("utf-8") if env_key else None
+
+    def _write_checkpoint(self, checkpoint: AuditCheckpoint) -> None:
+        """Sign and append a checkpoint (best effort)."""
+        last = self._last_checkpoint
+        if last is not None and (last.segment, last.offset) >= (
+            checkpoint.segment,
+            checkpoint.offset,
+        ):
+            return
+        key = self._signing_key()
+        if key is None:
+            return
+        checkpoint.sign(key)
+        if self._append_check_record(checkpoint.to_dict()):
+            self._last_checkpoint = checkpoint
+
+    def _trusted_checkpoint(self) -> AuditCheckpoint | None:
+        """Find the newest checkpoint that is signed and matches the log."""
+        try:
+            lines = self.checkpoint_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return None
+        key = self._signing_key()
+        if key is None:
+            return None
+
+        paths = dict(self.segments())
+        for line in reversed(lines):
+            try:
+                data = json.loads(line)
+                if data.get("failed"):
+                    continue  # Failed-check record, not a checkpoint
+                checkpoint = AuditCheckpoint.from_dict(data)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+            if not checkpoint.has_valid_signature(key):
+                logger.warning("Ignoring audit checkpoint with invalid signature")
+                continue
+            path = paths.get(checkpoint.segment)
+            if path is not None and self._checkpoint_matches(path, checkpoint):
+                self._last_checkpoint = checkpoint
+                return checkpoint
+        return None
+
+    def _checkpoint_matches(self, path: Path, checkpoint: AuditCheckpoint) -> bool:
+        """Check the checkpointed entry is still in place and unchanged."""
+        try:
+            with open(path, "rb") as f:
+                f.seek(checkpoint.start)
+                raw = f.read(checkpoint.offset - checkpoint.start)
+            entry = json.loads(raw)
+        except (OSError, ValueError):
+            return False
+        return (
+            raw.endswith(b"\n")
+            and isinstance(entry, dict)
+            and entry.get("entry_hash") == checkpoint.entry_hash
+        )
 
     def get_recent_entries(self, count: int = 10) -> list[dict[str, Any]]:
         """Get recent audit entries for review.
 
-        Retrieves the most recent N entries from the audit log.
-        Useful for monitoring and debugging.
+        Retrieves the most recent N entries from the audit log by reading
+        it backwards, so only the end of the log is read. Useful for
+        monitoring and debugging.
 
         Args:
             count: Number of recent entries to retrieve (default: 10).
+                Zero or less retrieves all entries.
 
         Returns:
             List of audit entry dictionaries, most recent first.
@@ -342,65 +958,61 @@ class AuditLogger:
             >>> for entry in entries:
             ...     print(f"{entry['timestamp']}: {entry['hook_name']} -> {entry['success']}")
         """
-        if not self.log_path.exists():
-            return []
-
-        entries = []
+        entries: list[dict[str, Any]] = []
 
         try:
-            with open(self.log_path, encoding="utf-8") as f:
-                for line in f:
+            # Newest segment first
+            for _, path in reversed(self.segments()):
+                if not path.exists():
+                    continue
+                for line in _iter_lines_reversed(path):
+                    if 0 < count <= len(entries):
+                        return entries
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        entry = json.loads(line)
-                        entries.append(entry)
+                        entries.append(json.loads(line))
                     except json.JSONDecodeError:
                         # Skip malformed lines
                         continue
-
-            # Return most recent N entries (reverse order)
-            return list(reversed(entries[-count:]))
-
         except OSError:
             return []
 
+        return entries
+
     def _get_last_entry_hash(self) -> str:
         """Get hash from last log entry for chain continuation.
 
+        After a rotation the current log is empty, so the chain continues
+        from the newest rotated segment.
+
         Returns:
             Hash from last entry, or empty string if no entries.
         """
-        if not self.log_path.exists():
-            return ""
+        for _, path in reversed(self.segments()):
+            entry_hash = self._last_hash_in(path)
+            if entry_hash is not None:
+                return entry_hash
+        return ""
 
-        try:
-            # Read last line (most recent entry)
-            with open(self.log_path, "rb") as f:
-                # Seek to end and read backwards to find last line
-                f.seek(0, 2)  # End of file
-                file_size = f.tell()
-                if file_size == 0:
-                    return ""
-
-                # Read last 4KB to find last line
-                chunk_size = min(4096, file_size)
-                f.seek(-chunk_size, 2)
-                chunk = f.read(chunk_size)
-
-                # Find last newline-delimited JSON
-                lines = chunk.decode("utf-8", errors="ignore").strip().split("\n")
-                for line in reversed(lines):
-                    line = line.strip()
-                    if line:
-                        try:
-                            entry = json.loads(line)
-                            return entry.get("entry_hash", "")
-                        except json.JSONDecodeError:
-                            continue
+    def _last_hash_in(self, path: Path) -> str | None:
+        """Get the hash of the last entry in a segment (None if empty)."""
+        if not path.exists():
+            return None
 
+        try:
+            # Read backwards to the most recent entry, however long it is
+            for line in _iter_lines_reversed(path):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                return entry.get("entry_hash", "")
         except OSError:
             pass
 
-        return ""
+        return None
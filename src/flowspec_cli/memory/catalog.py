@@ -0,0 +1,197 @@
+"""Memory Catalog - Cached metadata for task memory files.
+
+This module provides the MemoryCatalog class, a JSON-lines catalog of every
+active and archived task memory file stored at backlog/memory/.index/catalog.jsonl.
+Each record holds the task ID, location, size, mtime and parsed frontmatter.
+
+The catalog is reconciled with the memory directories in a single os.scandir
+pass per directory. Frontmatter is only re-read for files whose mtime or size
+changed, so listing, statistics and age-based cleanup cost one stat per file
+instead of several existence checks, stats and reads.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .index import ensure_index_dir, scan_memory_files
+
+logger = logging.getLogger(__name__)
+
+FrontmatterParser = Callable[[str], Tuple[Dict[str, str], str]]
+
+
+@dataclass
+class MemoryRecord:
+    """Catalog entry for a single task memory file.
+
+    Attributes:
+        task_id: Task identifier (e.g., "task-375")
+        status: "active" or "archived"
+        directory: Directory containing the memory file
+        size: File size in bytes
+        mtime: Last modification time (POSIX timestamp)
+        metadata: Parsed YAML frontmatter key-value pairs
+    """
+
+    task_id: str
+    status: str
+    directory: Path
+    size: int
+    mtime: float
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def path(self) -> Path:
+        """Path to the memory file."""
+        return self.directory / f"{self.task_id}.md"
+
+
+class MemoryCatalog:
+    """JSON-lines metadata catalog for task memory files.
+
+    Attributes:
+        memory_dir: Directory containing active task memory files
+        archive_dir: Directory containing archived task memory files
+        catalog_path: Path to the catalog.jsonl file
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        memory_dir: Path,
+        archive_dir: Optional[Path] = None,
+        parse_frontmatter: Optional[FrontmatterParser] = None,
+    ):
+        """Initialize catalog for a memory directory.
+
+        Args:
+            memory_dir: Directory containing active task memory files
+            archive_dir: Directory containing archived memories.
+                Defaults to memory_dir / "archive".
+            parse_frontmatter: Callable returning (metadata, body) for file
+                content. If None, frontmatter is not recorded.
+        """
+        self.memory_dir = memory_dir
+        self.archive_dir = archive_dir or memory_dir / "archive"
+        self.catalog_path = memory_dir / ".index" / "catalog.jsonl"
+        self._parse_frontmatter = parse_frontmatter
+
+    def records(self, active: bool = True, archived: bool = True) -> List[MemoryRecord]:
+        """Return catalog records, refreshed against the memory directories.
+
+        Args:
+            active: Include active memories
+            archived: Include archived memories
+
+        Returns:
+            List of MemoryRecord, active first, each group sorted by task ID
+        """
+        cached = self._load()
+        dirty = False
+        records: List[MemoryRecord] = []
+        entries: List[dict] = []
+
+        for key, directory, name, stat in scan_memory_files(
+            self.memory_dir, self.archive_dir
+        ):
+            status = "archived" if key.startswith("archive/") else "active"
+            previous = cached.pop(key, None)
+            if (
+                previous is not None
+                and previous["mtime_ns"] == stat.st_mtime_ns
+                and previous["size"] == stat.st_size
+            ):
+                metadata = previous["metadata"]
+                entries.append(previous)
+            else:
+                metadata = self._read_metadata(directory / name)
+                entries.append(
+                    {
+                        "key": key,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "metadata": metadata,
+                    }
+                )
+                dirty = True
+
+            records.append(
+                MemoryRecord(
+                    task_id=name[:-3],
+                    status=status,
+                    directory=directory,
+                    size=stat.st_size,
+                    mtime=stat.st_mtime,
+                    metadata=metadata,
+                )
+            )
+
+        # Leftover cached entries belong to files that no longer exist
+        if dirty or cached:
+            self._save(entries)
+
+        return sorted(
+            (
+                record
+                for record in records
+                if (active and record.status == "active")
+                or (archived and record.status == "archived")
+            ),
+            key=lambda record: (record.status != "active", record.task_id),
+        )
+
+    def _read_metadata(self, path: Path) -> Dict[str, str]:
+        """Read and parse only the frontmatter block of a memory file."""
+        if self._parse_frontmatter is None:
+            return {}
+        try:
+            with path.open(encoding="utf-8") as f:
+                first = f.readline()
+                if first.strip() != "---":
+                    return {}
+                lines = [first]
+                for line in f:
+                    lines.append(line)
+                    if line.strip() == "---":
+                        break
+                else:
+                    return {}
+        except (OSError, UnicodeDecodeError):
+            return {}
+        metadata, _ = self._parse_frontmatter("".join(lines) + "\n")
+        return metadata
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            lines = self.catalog_path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            logger.warning(f"Could not read memory catalog: {e}")
+            return {}
+
+        try:
+            # Decode all lines in one call; per-line json.loads dominates load time
+            header, *entries = json.loads("[" + ",".join(lines) + "]")
+            if header.get("version") != self.VERSION:
+                return {}
+            return {entry["key"]: entry for entry in entries}
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Rebuilding corrupt memory catalog: {e}")
+            return {}
+
+    def _save(self, entries: List[dict]) -> None:
+        lines = [json.dumps({"version": self.VERSION})]
+        lines.extend(json.dumps(entry) for entry in entries)
+        try:
+            ensure_index_dir(self.catalog_path.parent)
+            tmp_path = self.catalog_path.with_suffix(".jsonl.tmp")
+            tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            os.replace(tmp_path, self.catalog_path)
+        except OSError as e:
+            logger.warning(f"Could not save memory catalog: {e}")
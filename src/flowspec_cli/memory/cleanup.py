@@ -55,28 +55,25 @@ class CleanupManager:
             >>> archived = manager.archive_older_than(30)
             >>> print(f"Archived {len(archived)} task memories")
         """
-        threshold = datetime.now() - timedelta(days=days)
+        threshold = (datetime.now() - timedelta(days=days)).timestamp()
         archived_tasks = []
 
-        active_tasks = self.store.list_active()
-
-        for task_id in active_tasks:
-            memory_path = self.store.get_path(task_id)
+        for record in self.store.catalog.records(archived=False):
+            if record.mtime >= threshold:
+                continue
 
-            # Get last modified time
+            task_id = record.task_id
+            mtime = datetime.fromtimestamp(record.mtime)
             try:
-                mtime = datetime.fromtimestamp(memory_path.stat().st_mtime)
-
-                if mtime < threshold:
-                    if dry_run:
-                        logger.info(
-                            f"[DRY RUN] Would archive {task_id} (last modified: {mtime})"
-                        )
-                    else:
-                        self.store.archive(task_id)
-                        logger.info(f"Archived {task_id} (last modified: {mtime})")
-
-                    archived_tasks.append(task_id)
+                if dry_run:
+                    logger.info(
+                        f"[DRY RUN] Would archive {task_id} (last modified: {mtime})"
+                    )
+                else:
+                    self.store.archive(task_id)
+                    logger.info(f"Archived {task_id} (last modified: {mtime})")
+
+                archived_tasks.append(task_id)
             except FileNotFoundError:
                 logger.warning(f"Memory file not found during cleanup: {task_id}")
                 continue
@@ -108,30 +105,27 @@ class CleanupManager:
             >>> # Actually delete after review
             >>> deleted = manager.delete_archived_older_than(90)
         """
-        threshold = datetime.now() - timedelta(days=days)
+        threshold = (datetime.now() - timedelta(days=days)).timestamp()
         deleted_tasks = []
 
-        archived_tasks = self.store.list_archived()
-
-        for task_id in archived_tasks:
-            archive_path = self.store.archive_dir / f"{task_id}.md"
+        for record in self.store.catalog.records(active=False):
+            if record.mtime >= threshold:
+                continue
 
-            # Get last modified time
+            task_id = record.task_id
+            mtime = datetime.fromtimestamp(record.mtime)
             try:
-                mtime = datetime.fromtimestamp(archive_path.stat().st_mtime)
-
-                if mtime < threshold:
-                    if dry_run:
-                        logger.info(
-                            f"[DRY RUN] Would delete {task_id} (last modified: {mtime})"
-                        )
-                    else:
-                        self.store.delete(task_id, from_archive=True)
-                        logger.info(
-                            f"Deleted archived memory {task_id} (last modified: {mtime})"
-                        )
-
-                    deleted_tasks.append(task_id)
+                if dry_run:
+                    logger.info(
+                        f"[DRY RUN] Would delete {task_id} (last modified: {mtime})"
+                    )
+                else:
+                    self.store.delete(task_id, from_archive=True)
+                    logger.info(
+                        f"Deleted archived memory {task_id} (last modified: {mtime})"
+                    )
+
+                deleted_tasks.append(task_id)
             except FileNotFoundError:
                 logger.warning(
                     f"Archived memory file not found during cleanup: {task_id}"
@@ -158,35 +152,22 @@ class CleanupManager:
             >>> stats = manager.get_stats()
             >>> print(f"Active: {stats['active_count']}, Archived: {stats['archived_count']}")
         """
-        now = datetime.now()
-
-        # Get active memories
-        active_tasks = self.store.list_active()
-        active_count = len(active_tasks)
-
-        oldest_active_days = 0
-        if active_tasks:
-            oldest_active_mtime = min(
-                datetime.fromtimestamp(self.store.get_path(task_id).stat().st_mtime)
-                for task_id in active_tasks
-                if self.store.get_path(task_id).exists()
-            )
-            oldest_active_days = (now - oldest_active_mtime).days
-
-        # Get archived memories
-        archived_tasks = self.store.list_archived()
-        archived_count = len(archived_tasks)
-
-        oldest_archived_days = 0
-        if archived_tasks:
-            oldest_archived_mtime = min(
-                datetime.fromtimestamp(
-                    (self.store.archive_dir / f"{task_id}.md").stat().st_mtime
-                )
-                for task_id in archived_tasks
-                if (self.store.archive_dir / f"{task_id}.md").exists()
-            )
-            oldest_archived_days = (now - oldest_archived_mtime).days
+        now = datetime.now().timestamp()
+
+        # Single catalog pass over active and archived memories
+        active_count = archived_count = 0
+        oldest_active_mtime = oldest_archived_mtime = now
+        for record in self.store.catalog.records():
+            if record.status == "active":
+                active_count += 1
+                oldest_active_mtime = min(oldest_active_mtime, record.mtime)
+            else:
+                archived_count += 1
+                oldest_archived_mtime = min(oldest_archived_mtime, record.mtime)
+
+        seconds_per_day = 24 * 60 * 60
+        oldest_active_days = int((now - oldest_active_mtime) // seconds_per_day)
+        oldest_archived_days = int((now - oldest_archived_mtime) // seconds_per_day)
 
         return {
             "active_count": active_count,
@@ -218,45 +218,28 @@ def list_memories(
     store = TaskMemoryStore(base_path=workspace_root)
 
     # Determine which memories to list
-    if all_memories:
-        active_ids = store.list_active()
-        archived_ids = store.list_archived()
-        memories = [(tid, "active") for tid in active_ids] + [
-            (tid, "archived") for tid in archived_ids
-        ]
-    elif archived:
-        archived_ids = store.list_archived()
-        memories = [(tid, "archived") for tid in archived_ids]
-    else:
-        active_ids = store.list_active()
-        memories = [(tid, "active") for tid in active_ids]
+    records = store.catalog.records(
+        active=all_memories or not archived, archived=all_memories or archived
+    )
 
-    if not memories:
+    if not records:
         location = "archived" if archived else "active"
         if all_memories:
             location = "any"
         console.print(f"[yellow]No {location} task memories found[/yellow]")
         raise typer.Exit(0)
 
-    # Get file stats for sorting
-    memory_data = []
-    for task_id, status in memories:
-        if status == "archived":
-            path = store.archive_dir / f"{task_id}.md"
-        else:
-            path = store.get_path(task_id)
-
-        if path.exists():
-            stat = path.stat()
-            memory_data.append(
-                {
-                    "task_id": task_id,
-                    "status": status,
-                    "size": stat.st_size,
-                    "modified": stat.st_mtime,
-                    "path": path,
-                }
-            )
+    # Catalog records already carry size and mtime
+    memory_data = [
+        {
+            "task_id": record.task_id,
+            "status": record.status,
+            "size": record.size,
+            "modified": record.mtime,
+            "path": record.path,
+        }
+        for record in records
+    ]
 
     # Sort by modified time (newest first)
     memory_data.sort(key=lambda x: x["modified"], reverse=True)
@@ -337,12 +320,8 @@ def search(
     workspace_root = Path(project_root) if project_root else Path.cwd()
     store = TaskMemoryStore(base_path=workspace_root)
 
-    # Get list of memories to search
-    task_ids = store.list_active()
-    if include_archived:
-        task_ids.extend(store.list_archived())
-
-    if not task_ids:
+    # The search index refreshes itself against the memory directories
+    if not store.search_index.documents(include_archived=include_archived):
         console.print("[yellow]No task memories to search[/yellow]")
         raise typer.Exit(0)
 
@@ -353,53 +332,10 @@ def search(
         console.print(f"[red]Invalid regex pattern:[/red] {e}")
         raise typer.Exit(1)
 
-    # Search through memories
-    results = []
-    for task_id in task_ids:
-        # Determine path
-        if task_id in store.list_archived():
-            path = store.archive_dir / f"{task_id}.md"
-            status = "archived"
-        else:
-            path = store.get_path(task_id)
-            status = "active"
-
-        if not path.exists():
-            continue
-
-        # Read and search content
-        try:
-            content = path.read_text()
-            lines = content.split("\n")
-
-            for i, line in enumerate(lines):
-                if pattern.search(line):
-                    # Get context lines
-                    start = max(0, i - context)
-                    end = min(len(lines), i + context + 1)
-                    context_lines = lines[start:end]
-
-                    results.append(
-                        {
-                            "task_id": task_id,
-                            "status": status,
-                            "line_num": i + 1,
-                            "line": line,
-                            "context": context_lines,
-                            "context_start": start + 1,
-                        }
-                    )
-
-                    # Check limit
-                    if len(results) >= limit:
-                        break
-
-            if len(results) >= limit:
-                break
-
-        except Exception as e:
-            console.print(f"[dim]Warning: Error reading {task_id}: {e}[/dim]")
-            continue
+    # Only files the index reports as candidates are read
+    results = store.search(
+        query, include_archived=include_archived, limit=limit, context=context
+    )
 
     # Output results
     if not results:
@@ -557,39 +493,34 @@ def cleanup(
 
     operations = []
 
-    # Find memories to archive
-    if archive_older_than is not None:
-        archive_cutoff = now - (archive_older_than * 24 * 60 * 60)
-
-        for task_id in store.list_active():
-            path = store.get_path(task_id)
-            if path.exists():
-                modified = path.stat().st_mtime
-                if modified < archive_cutoff:
-                    operations.append(
-                        {
-                            "type": "archive",
-                            "task_id": task_id,
-                            "age_days": (now - modified) / (24 * 60 * 60),
-                        }
-                    )
+    # One catalog pass covers both archive and delete candidates
+    archive_cutoff = (
+        now - (archive_older_than * 24 * 60 * 60)
+        if archive_older_than is not None
+        else None
+    )
+    delete_cutoff = (
+        now - (delete_older_than * 24 * 60 * 60)
+        if delete_older_than is not None
+        else None
+    )
 
-    # Find memories to delete
-    if delete_older_than is not None:
-        delete_cutoff = now - (delete_older_than * 24 * 60 * 60)
-
-        for task_id in store.list_archived():
-            path = store.archive_dir / f"{task_id}.md"
-            if path.exists():
-                modified = path.stat().st_mtime
-                if modified < delete_cutoff:
-                    operations.append(
-                        {
-                            "type": "delete",
-                            "task_id": task_id,
-                            "age_days": (now - modified) / (24 * 60 * 60),
-                        }
-                    )
+    for record in store.catalog.records(
+        active=archive_cutoff is not None, archived=delete_cutoff is not None
+    ):
+        if record.status == "active":
+            op_type, cutoff = "archive", archive_cutoff
+        else:
+            op_type, cutoff = "delete", delete_cutoff
+
+        if record.mtime < cutoff:
+            operations.append(
+                {
+                    "type": op_type,
+                    "task_id": record.task_id,
+                    "age_days": (now - record.mtime) / (24 * 60 * 60),
+                }
+            )
 
     # Display operations
     if not operations:
@@ -673,31 +604,21 @@ def stats(
     workspace_root = Path(project_root) if project_root else Path.cwd()
     store = TaskMemoryStore(base_path=workspace_root)
 
-    # Collect statistics
-    active_ids = store.list_active()
-    archived_ids = store.list_archived()
-
-    # Calculate sizes and ages
+    # Collect sizes and ages in a single catalog pass
     active_sizes = []
     active_ages = []
-    now = datetime.now().timestamp()
-
-    for task_id in active_ids:
-        path = store.get_path(task_id)
-        if path.exists():
-            stat = path.stat()
-            active_sizes.append(stat.st_size)
-            active_ages.append((now - stat.st_mtime) / (24 * 60 * 60))
-
     archived_sizes = []
     archived_ages = []
+    now = datetime.now().timestamp()
 
-    for task_id in archived_ids:
-        path = store.archive_dir / f"{task_id}.md"
-        if path.exists():
-            stat = path.stat()
-            archived_sizes.append(stat.st_size)
-            archived_ages.append((now - stat.st_mtime) / (24 * 60 * 60))
+    for record in store.catalog.records():
+        age_days = (now - record.mtime) / (24 * 60 * 60)
+        if record.status == "active":
+            active_sizes.append(record.size)
+            active_ages.append(age_days)
+        else:
+            archived_sizes.append(record.size)
+            archived_ages.append(age_days)
 
     # Compile stats
     stats_data = {
@@ -0,0 +1,480 @@
+"""Memory Search Index - Persistent inverted index for task memory search.
+
+This module provides the MemorySearchIndex class, an on-disk inverted index
+over task memory files stored under backlog/memory/.index/. The index maps
+lowercased word tokens to the memory files containing them, so searches only
+need to open files that can possibly match.
+
+The index is stored as two files:
+- search.json: Compacted snapshot (documents table and token postings)
+- search.log: Append-only journal of incremental updates since the snapshot
+
+TaskMemoryStore appends to the journal on every write, which keeps updates
+cheap. Before answering a query the index is reconciled with the directory
+contents by comparing each file's mtime and size, so edits made outside the
+CLI are picked up, and the journal is folded back into the snapshot.
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Word tokenizer shared by indexing and query planning
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Quantifier in {m}, {m,}, {,n} or {m,n} form
+_BRACE_QUANTIFIER = re.compile(r"\{\d*(?:,\d*)?\}")
+
+# Escapes followed by a character code or group number
+_NUMERIC_ESCAPES = frozenset("xuUN0123456789")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Return the set of lowercased word tokens in text."""
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+def ensure_index_dir(index_dir: Path) -> None:
+    """Create the index directory with a .gitignore excluding its contents.
+
+    Indexes under backlog/memory/.index/ are local caches and must not be
+    committed or merged.
+    """
+    if not index_dir.exists():
+        index_dir.mkdir(parents=True, exist_ok=True)
+        (index_dir / ".gitignore").write_text("*\n")
+
+
+def scan_memory_files(
+    memory_dir: Path, archive_dir: Path
+) -> Iterator[Tuple[str, Path, str, os.stat_result]]:
+    """Scan active and archived memory files with one os.scandir pass each.
+
+    Args:
+        memory_dir: Directory containing active task memory files
+        archive_dir: Directory containing archived task memory files
+
+    Yields:
+        (key, directory, name, stat) tuples where key is the path relative
+        to memory_dir (e.g. "task-42.md" or "archive/task-42.md"). Paths are
+        not materialized because Path construction dominates large scans.
+    """
+    for directory, prefix in ((memory_dir, ""), (archive_dir, "archive/")):
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("task-") and name.endswith(".md")):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield prefix + name, directory, name, stat
+
+
+def extract_literals(pattern: str) -> Optional[List[str]]:
+    """Extract literal runs that every match of a regex must contain.
+
+    The extraction is conservative: anything the parser does not fully
+    understand (alternation, inline flags, numeric escapes) disables index
+    filtering, and content inside groups is ignored because groups may be
+    optional.
+
+    Args:
+        pattern: Regular expression (assumed to compile)
+
+    Returns:
+        List of required literal substrings (lowercased), or None if the
+        pattern cannot be narrowed and every file must be scanned
+    """
+    runs: List[str] = []
+    current: List[str] = []
+    depth = 0
+    i = 0
+
+    def flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1] if i + 1 < len(pattern) else ""
+            if escaped in _NUMERIC_ESCAPES:
+                # \xNN, \uNNNN, \N{...}, octal or backreference: the run
+                # would be cut at the wrong place, so scan every file
+                return None
+            if escaped.isalnum() or escaped == "_":
+                # Character class, anchor, or backreference (\d, \b, \1, ...)
+                flush()
+            elif depth == 0:
+                current.append(escaped)
+            i += 2
+            continue
+        if char == "[":
+            flush()
+            i += 1
+            if i < len(pattern) and pattern[i] == "^":
+                i += 1
+            if i < len(pattern) and pattern[i] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+            continue
+        if char == "|" or (char == "(" and pattern.startswith("(?", i)):
+            return None
+        if char == "(":
+            flush()
+            depth += 1
+        elif char == ")":
+            flush()
+            depth = max(0, depth - 1)
+        elif char in "*?":
+            # Preceding character is optional
+            if current:
+                current.pop()
+            flush()
+        elif char == "+":
+            flush()
+        elif char == "{":
+            quantifier = _BRACE_QUANTIFIER.match(pattern, i)
+            if quantifier:
+                if current:
+                    current.pop()
+                flush()
+                i = quantifier.end()
+                continue
+            flush()
+        elif char in ".^$":
+            flush()
+        elif depth == 0:
+            current.append(char)
+        i += 1
+
+    flush()
+    return [run.lower() for run in runs if TOKEN_PATTERN.search(run)] or None
+
+
+class MemorySearchIndex:
+    """Inverted index over active and archived task memory files.
+
+    Documents are keyed by their path relative to the memory directory
+    (e.g. "task-42.md" or "archive/task-42.md"). Each indexed version of a
+    document gets a fresh integer id; postings that refer to superseded ids
+    are ignored on read and dropped on compaction.
+
+    Attributes:
+        memory_dir: Directory containing active task memory files
+        archive_dir: Directory containing archived task memory files
+        index_dir: Directory holding the snapshot and journal files
+    """
+
+    VERSION = 1
+
+    def __init__(self, memory_dir: Path, archive_dir: Optional[Path] = None):
+        """Initialize index for a memory directory.
+
+        Args:
+            memory_dir: Directory containing active task memory files
+            archive_dir: Directory containing archived memories.
+                Defaults to memory_dir / "archive".
+        """
+        self.memory_dir = memory_dir
+        self.archive_dir = archive_dir or memory_dir / "archive"
+        self.index_dir = memory_dir / ".index"
+        self.snapshot_path = self.index_dir / "search.json"
+        self.journal_path = self.index_dir / "search.log"
+
+        self._loaded = False
+        self._dirty = False
+        self._next_id = 0
+        # key -> (doc_id, mtime_ns, size)
+        self._docs: Dict[str, Tuple[int, int, int]] = {}
+        # token -> list of doc ids (may contain superseded ids)
+        self._postings: Dict[str, List[int]] = {}
+
+    # --- Incremental updates (journal) ---
+
+    def update(self, path: Path) -> None:
+        """Record the current contents of a memory file in the index.
+
+        Args:
+            path: Path to an active or archived memory file
+        """
+        key = self._key_for(path)
+        if key is None:
+            return
+        try:
+            stat = path.stat()
+            tokens = tokenize(path.read_text())
+        except OSError:
+            self.remove(path)
+            return
+        self._append_journal(
+            {
+                "op": "put",
+                "key": key,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "tokens": sorted(tokens),
+            }
+        )
+        if self._loaded:
+            self._put(key, stat.st_mtime_ns, stat.st_size, tokens)
+
+    def remove(self, path: Path) -> None:
+        """Drop a memory file from the index.
+
+        Args:
+            path: Path to an active or archived memory file
+        """
+        key = self._key_for(path)
+        if key is None:
+            return
+        self._append_journal({"op": "del", "key": key})
+        if self._loaded:
+            self._docs.pop(key, None)
+
+    # --- Querying ---
+
+    def refresh(self) -> None:
+        """Load the index and reconcile it with the memory directories.
+
+        Files whose mtime or size differ from the indexed version are
+        re-tokenized, new files are added, and missing files are dropped.
+        The snapshot is rewritten if anything changed.
+        """
+        self._load()
+
+        seen: Set[str] = set()
+        for key, directory, name, stat in scan_memory_files(
+            self.memory_dir, self.archive_dir
+        ):
+            seen.add(key)
+            indexed = self._docs.get(key)
+            if (
+                indexed
+                and indexed[1] == stat.st_mtime_ns
+                and indexed[2] == stat.st_size
+            ):
+                continue
+            path = directory / name
+            try:
+                tokens = tokenize(path.read_text())
+            except OSError as e:
+                logger.warning(f"Could not index memory file {path}: {e}")
+                continue
+            self._put(key, stat.st_mtime_ns, stat.st_size, tokens)
+
+        for key in set(self._docs) - seen:
+            del self._docs[key]
+            self._dirty = True
+
+        if self._dirty:
+            self._save()
+
+    def documents(self, include_archived: bool = False) -> List[Tuple[str, str, Path]]:
+        """List indexed memory files.
+
+        Args:
+            include_archived: Include archived memories after active ones
+
+        Returns:
+            List of (task_id, status, path) tuples, active first, each group
+            sorted by task ID
+        """
+        if not self._loaded:
+            self.refresh()
+        return self._resolve(self._docs.keys(), include_archived)
+
+    def candidates(
+        self, query: str, include_archived: bool = False
+    ) -> List[Tuple[str, str, Path]]:
+        """List memory files that may contain a match for a regex query.
+
+        The result is a superset of the files with matching lines; callers
+        still verify matches line by line, but only on these files.
+
+        Args:
+            query: Regular expression (case-insensitive, assumed to compile)
+            include_archived: Include archived memories after active ones
+
+        Returns:
+            List of (task_id, status, path) tuples in documents() order
+        """
+        if not self._loaded:
+            self.refresh()
+
+        literals = extract_literals(query)
+        if literals is None:
+            return self._resolve(self._docs.keys(), include_archived)
+
+        live_ids = {doc[0]: key for key, doc in self._docs.items()}
+        matched: Optional[Set[int]] = None
+        for literal in literals:
+            doc_ids = self._match_literal(literal)
+            matched = doc_ids if matched is None else matched & doc_ids
+            if not matched:
+                return []
+
+        keys = [live_ids[doc_id] for doc_id in matched or () if doc_id in live_ids]
+        return self._resolve(keys, include_archived)
+
+    # --- Internals ---
+
+    def _match_literal(self, literal: str) -> Set[int]:
+        """Return ids of documents whose tokens can contain a literal run.
+
+        Inner tokens of the run must match indexed tokens exactly; the first
+        token may be a suffix and the last a prefix of an indexed token, and
+        a token touching both ends of the run may occur anywhere inside one.
+        """
+        result: Optional[Set[int]] = None
+        for match in TOKEN_PATTERN.finditer(literal):
+            token = match.group()
+            open_left = match.start() == 0
+            open_right = match.end() == len(literal)
+
+            if not open_left and not open_right:
+                doc_ids = set(self._postings.get(token, ()))
+            else:
+                doc_ids = set()
+                for indexed, postings in self._postings.items():
+                    if open_left and open_right:
+                        hit = token in indexed
+                    elif open_left:
+                        hit = indexed.endswith(token)
+                    else:
+                        hit = indexed.startswith(token)
+                    if hit:
+                        doc_ids.update(postings)
+
+            result = doc_ids if result is None else result & doc_ids
+            if not result:
+                return set()
+        return result or set()
+
+    def _resolve(
+        self, keys: Iterable[str], include_archived: bool
+    ) -> List[Tuple[str, str, Path]]:
+        active = []
+        archived = []
+        for key in keys:
+            if key.startswith("archive/"):
+                if include_archived:
+                    name = key[len("archive/") :]
+                    archived.append((name[:-3], "archived", self.archive_dir / name))
+            else:
+                active.append((key[:-3], "active", self.memory_dir / key))
+        return sorted(active) + sorted(archived)
+
+    def _key_for(self, path: Path) -> Optional[str]:
+        if path.suffix != ".md" or not path.stem.startswith("task-"):
+            return None
+        if path.parent == self.archive_dir:
+            return f"archive/{path.name}"
+        if path.parent == self.memory_dir:
+            return path.name
+        return None
+
+    def _put(self, key: str, mtime_ns: int, size: int, tokens: Iterable[str]) -> None:
+        doc_id = self._next_id
+        self._next_id += 1
+        self._docs[key] = (doc_id, mtime_ns, size)
+        for token in tokens:
+            self._postings.setdefault(token, []).append(doc_id)
+        self._dirty = True
+
+    def _append_journal(self, record: dict) -> None:
+        try:
+            ensure_index_dir(self.index_dir)
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            # The index is a cache; refresh() recovers from a missed update
+            logger.warning(f"Could not update memory search index: {e}")
+
+    def _load(self) -> None:
+        self._docs = {}
+        self._postings = {}
+        self._next_id = 0
+        self._dirty = False
+
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            if snapshot.get("version") == self.VERSION:
+                self._next_id = snapshot["next_id"]
+                self._postings = snapshot["postings"]
+                self._docs = {
+                    key: (doc_id, mtime_ns, size)
+                    for key, (doc_id, mtime_ns, size) in snapshot["docs"].items()
+                }
+            else:
+                self._dirty = True
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Rebuilding corrupt memory search index: {e}")
+            self._docs, self._postings, self._next_id = {}, {}, 0
+            self._dirty = True
+
+        try:
+            with self.journal_path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn write; refresh() re-indexes the file
+                    if record.get("op") == "put":
+                        self._put(
+                            record["key"],
+                            record["mtime_ns"],
+                            record["size"],
+                            record["tokens"],
+                        )
+                    elif record.get("op") == "del":
+                        self._docs.pop(record["key"], None)
+                    self._dirty = True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not read memory search journal: {e}")
+
+        self._loaded = True
+
+    def _save(self) -> None:
+        live_ids = {doc[0] for doc in self._docs.values()}
+        postings = {}
+        for token, doc_ids in self._postings.items():
+            kept = [doc_id for doc_id in doc_ids if doc_id in live_ids]
+            if kept:
+                postings[token] = kept
+        self._postings = postings
+
+        snapshot = {
+            "version": self.VERSION,
+            "next_id": self._next_id,
+            "docs": {key: list(doc) for key, doc in self._docs.items()},
+            "postings": postings,
+        }
+        try:
+            ensure_index_dir(self.index_dir)
+            tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+            os.replace(tmp_path, self.snapshot_path)
+            self.journal_path.unlink(missing_ok=True)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save memory search index: {e}")
@@ -9,6 +9,8 @@ that includes @import directives for active task memory files.
 
 Token-aware injection ensures memory doesn't exceed 2000 tokens per task,
 truncating from oldest content when necessary to preserve recent context.
+Token counting and truncation are delegated to TruncationEngine, which uses a
+pluggable tokenizer (an offline BPE-style estimator by default).
 
 Example:
     ```python
@@ -24,6 +26,8 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from .truncation import Tokenizer, TruncationEngine
+
 
 class ContextInjector:
     """Manages injection of task memory into CLAUDE.md and other agent configs.
@@ -32,6 +36,8 @@ class ContextInjector:
         base_path: Root directory of the project
         claude_md_path: Path to backlog/CLAUDE.md file
         max_tokens: Maximum tokens allowed per task (default: 2000)
+        tokenizer: Token counter used for budgeting
+        engine: TruncationEngine applying the token budget
     """
 
     # Template for the Active Task Context section
@@ -47,20 +53,28 @@ class ContextInjector:
         re.MULTILINE | re.DOTALL,
     )
 
-    # Token estimation: approximately 4 characters per token
-    # This is a conservative estimate based on GPT tokenization
+    # Legacy character-ratio estimate, available via CharRatioTokenizer
     CHARS_PER_TOKEN = 4
 
-    def __init__(self, base_path: Optional[Path] = None, max_tokens: int = 2000):
+    def __init__(
+        self,
+        base_path: Optional[Path] = None,
+        max_tokens: int = 2000,
+        tokenizer: Optional[Tokenizer] = None,
+    ):
         """Initialize injector with optional custom base path.
 
         Args:
             base_path: Root directory of the project. Defaults to current working directory.
             max_tokens: Maximum tokens allowed per task memory (default: 2000)
+            tokenizer: Token counter. Defaults to the offline BPE estimator;
+                pass CharRatioTokenizer(CHARS_PER_TOKEN) for the legacy estimate.
         """
         self.base_path = base_path or Path.cwd()
         self.claude_md_path = self.base_path / "backlog" / "CLAUDE.md"
         self.max_tokens = max_tokens
+        self.engine = TruncationEngine(tokenizer)
+        self.tokenizer = self.engine.tokenizer
 
     def update_active_task(self, task_id: Optional[str] = None) -> None:
         """Update CLAUDE.md with @import for active task memory.
@@ -157,10 +171,7 @@ class ContextInjector:
         return None
 
     def estimate_tokens(self, text: str) -> int:
-        """Estimate token count for text using character-based approximation.
-
-        Uses a conservative estimate of ~4 characters per token, which is
-        typical for English text with GPT-style tokenization.
+        """Estimate token count for text using the configured tokenizer.
 
         Args:
             text: Text to estimate token count for
@@ -168,17 +179,20 @@ class ContextInjector:
         Returns:
             Estimated token count
         """
-        return len(text) // self.CHARS_PER_TOKEN
+        return self.tokenizer.count(text)
 
     def truncate_memory_content(self, content: str) -> str:
         """Truncate memory content to stay within token limit.
 
         Preserves recent content by truncating from the oldest sections.
-        The strategy:
-        1. Always keep the header (Task Memory: {task_id}, metadata)
-        2. Truncate from the Notes section first (oldest content)
-        3. If still too large, truncate from Key Decisions
-        4. Always preserve Context section (recent context)
+        The strategy (see TruncationEngine):
+        1. Always keep the header (frontmatter, Task Memory title)
+        2. Always keep Context sections (e.g. Context, Critical Context)
+        3. Keep other sections such as Key Decisions whole while they fit
+        4. Fill the remaining budget with Notes, line by line
+
+        Results are memoized by content hash, so repeated injections of an
+        unchanged memory file do no work.
 
         Args:
             content: Full memory content to truncate
@@ -186,98 +200,7 @@ class ContextInjector:
         Returns:
             Truncated content within token limit
         """
-        # Check if content is within limit
-        estimated_tokens = self.estimate_tokens(content)
-        if estimated_tokens <= self.max_tokens:
-            return content
-
-        max_chars = self.max_tokens * self.CHARS_PER_TOKEN
-
-        # Try to preserve structure by keeping header and recent sections
-        lines = content.split("\n")
-
-        # Find section boundaries
-        header_end = 0
-        context_start = None
-        key_decisions_start = None
-        notes_start = None
-
-        for i, line in enumerate(lines):
-            if line.startswith("## Context"):
-                context_start = i
-            elif line.startswith("## Key Decisions"):
-                key_decisions_start = i
-            elif line.startswith("## Notes"):
-                notes_start = i
-            elif i < 10 and (
-                line.startswith("**") or line.startswith("# Task Memory:")
-            ):
-                header_end = max(header_end, i)
-
-        # Strategy: Keep header + Context, truncate Notes and Key Decisions if needed
-        preserved_lines = []
-
-        # Always keep header (first few lines with metadata)
-        preserved_lines.extend(lines[: header_end + 1])
-
-        # Always keep Context section if it exists
-        if context_start is not None:
-            context_end = (
-                key_decisions_start
-                if key_decisions_start
-                else notes_start
-                if notes_start
-                else len(lines)
-            )
-            preserved_lines.extend(lines[context_start:context_end])
-
-        # Add Key Decisions if we have space
-        if key_decisions_start is not None:
-            decisions_end = notes_start if notes_start else len(lines)
-            decisions_section = lines[key_decisions_start:decisions_end]
-
-            # Check if adding decisions keeps us within limit
-            test_content = "\n".join(preserved_lines + decisions_section)
-            if len(test_content) <= max_chars:
-                preserved_lines.extend(decisions_section)
-
-        # Add Notes section if we still have space
-        # Reserve space for truncation notice (approximately 60 chars)
-        truncation_notice = (
-            f"*[Content truncated - exceeded {self.max_tokens} token limit]*"
-        )
-        reserved_space = len(truncation_notice) + 10  # +10 for newlines
-
-        if notes_start is not None:
-            notes_section = lines[notes_start:]
-
-            # Try to add as much of notes as we can
-            test_content = "\n".join(preserved_lines + notes_section)
-            if len(test_content) <= max_chars - reserved_space:
-                # All notes fit
-                preserved_lines.extend(notes_section)
-            else:
-                # Add notes line by line until we hit the limit
-                notes_added = False
-                for line in notes_section:
-                    test_content = "\n".join(preserved_lines + [line])
-                    if len(test_content) > max_chars - reserved_space:
-                        # Hit limit - add truncation notice
-                        if notes_added:
-                            preserved_lines.append("")
-                            preserved_lines.append(truncation_notice)
-                        break
-                    preserved_lines.append(line)
-                    notes_added = True
-
-        truncated = "\n".join(preserved_lines)
-
-        # Final safety check - hard truncate if still too large
-        if len(truncated) > max_chars:
-            truncated = truncated[: max_chars - len(truncation_notice) - 5]
-            truncated += f"\n\n{truncation_notice}"
-
-        return truncated
+        return self.engine.truncate(content, self.max_tokens).content
 
     def get_memory_path(self, task_id: str) -> Path:
         """Get the path to a task's memory file.
@@ -317,15 +240,14 @@ class ContextInjector:
 
         content = memory_path.read_text()
 
-        # Check if truncation needed
-        estimated_tokens = self.estimate_tokens(content)
-        if estimated_tokens <= self.max_tokens:
+        # Single pass: count tokens and truncate only if needed
+        result = self.engine.truncate(content, self.max_tokens)
+        if not result.truncated:
             # No truncation needed - use standard injection
             self.update_active_task(task_id)
             return
 
-        # Truncate content and write to a temporary injection file
-        truncated = self.truncate_memory_content(content)
+        truncated = result.content
 
         # Write truncated version to a temp file for injection
         truncated_path = self.get_memory_path(f"{task_id}.truncated")
@@ -5,10 +5,14 @@ in the backlog/memory/ directory. Task memory files track implementation context
 decisions, approaches, and notes for individual tasks.
 """
 
+import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+from .catalog import MemoryCatalog
+from .index import MemorySearchIndex
 
 
 class TaskMemoryStore:
@@ -27,6 +31,8 @@ class TaskMemoryStore:
         memory_dir: Directory containing active task memory files
         archive_dir: Directory containing archived task memory files
         template_dir: Directory containing memory templates
+        search_index: Inverted index used by search()
+        catalog: Metadata catalog used for listing, stats and cleanup
     """
 
     # Valid task ID pattern: task-<identifier> format
@@ -49,6 +55,11 @@ class TaskMemoryStore:
         self.memory_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
 
+        self.search_index = MemorySearchIndex(self.memory_dir, self.archive_dir)
+        self.catalog = MemoryCatalog(
+            self.memory_dir, self.archive_dir, self._parse_frontmatter
+        )
+
     def _validate_task_id(self, task_id: str) -> None:
         """Validate task ID format to prevent path traversal attacks.
 
@@ -121,6 +132,7 @@ class TaskMemoryStore:
         # Write memory file
         memory_path = self.get_path(task_id)
         memory_path.write_text(content)
+        self.search_index.update(memory_path)
 
         return memory_path
 
@@ -215,6 +227,7 @@ class TaskMemoryStore:
         # Serialize with updated metadata
         updated_content = self._serialize_frontmatter(metadata, body)
         memory_path.write_text(updated_content)
+        self.search_index.update(memory_path)
 
     def archive(self, task_id: str) -> None:
         """Move task memory to archive.
@@ -231,6 +244,8 @@ class TaskMemoryStore:
 
         archive_path = self.archive_dir / memory_path.name
         memory_path.rename(archive_path)
+        self.search_index.remove(memory_path)
+        self.search_index.update(archive_path)
 
     def restore(self, task_id: str) -> None:
         """Restore task memory from archive.
@@ -251,6 +266,8 @@ class TaskMemoryStore:
             raise FileExistsError(f"Active task memory already exists: {task_id}")
 
         archive_path.rename(memory_path)
+        self.search_index.remove(archive_path)
+        self.search_index.update(memory_path)
 
     def delete(self, task_id: str, from_archive: bool = False) -> None:
         """Permanently delete task memory.
@@ -272,6 +289,7 @@ class TaskMemoryStore:
             raise FileNotFoundError(f"Task memory not found in {location}: {task_id}")
 
         memory_path.unlink()
+        self.search_index.remove(memory_path)
 
     def list_active(self) -> List[str]:
         """List all active task memory IDs.
@@ -279,15 +297,7 @@ class TaskMemoryStore:
         Returns:
             List of task IDs with active memory files
         """
-        if not self.memory_dir.exists():
-            return []
-
-        memory_files = [
-            f.stem
-            for f in self.memory_dir.iterdir()
-            if f.is_file() and f.suffix == ".md" and f.stem.startswith("task-")
-        ]
-        return sorted(memory_files)
+        return self._list_ids(self.memory_dir)
 
     def list_archived(self) -> List[str]:
         """List all archived task memory IDs.
@@ -295,15 +305,81 @@ class TaskMemoryStore:
         Returns:
             List of task IDs with archived memory files
         """
-        if not self.archive_dir.exists():
+        return self._list_ids(self.archive_dir)
+
+    def _list_ids(self, directory: Path) -> List[str]:
+        """List task IDs of memory files in a directory.
+
+        Uses the file type reported by os.scandir, so no per-file stat() is
+        needed on platforms that provide it.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return sorted(
+                    entry.name[:-3]
+                    for entry in entries
+                    if entry.name.endswith(".md")
+                    and entry.name.startswith("task-")
+                    and entry.is_file()
+                )
+        except FileNotFoundError:
             return []
 
-        archive_files = [
-            f.stem
-            for f in self.archive_dir.iterdir()
-            if f.is_file() and f.suffix == ".md" and f.stem.startswith("task-")
-        ]
-        return sorted(archive_files)
+    def search(
+        self,
+        query: str,
+        include_archived: bool = False,
+        limit: int = 50,
+        context: int = 2,
+    ) -> List[Dict[str, Any]]:
+        """Search task memories for lines matching a regex.
+
+        The search index narrows the files to read; only candidate files are
+        scanned line by line.
+
+        Args:
+            query: Regular expression (case-insensitive)
+            include_archived: If True, also search archived memories
+            limit: Maximum number of matching lines to return
+            context: Number of context lines around each match
+
+        Returns:
+            List of match dicts with task_id, status, line_num, line,
+            context (list of lines) and context_start keys
+
+        Raises:
+            re.error: If query is not a valid regular expression
+        """
+        pattern = re.compile(query, re.IGNORECASE)
+
+        results: List[Dict[str, Any]] = []
+        for task_id, status, path in self.search_index.candidates(
+            query, include_archived=include_archived
+        ):
+            try:
+                lines = path.read_text().split("\n")
+            except (OSError, UnicodeDecodeError):
+                # Removed or unreadable since the index was refreshed
+                continue
+
+            for i, line in enumerate(lines):
+                if pattern.search(line):
+                    start = max(0, i - context)
+                    end = min(len(lines), i + context + 1)
+                    results.append(
+                        {
+                            "task_id": task_id,
+                            "status": status,
+                            "line_num": i + 1,
+                            "line": line,
+                            "context": lines[start:end],
+                            "context_start": start + 1,
+                        }
+                    )
+                    if len(results) >= limit:
+                        return results
+
+        return results
 
     def exists(self, task_id: str, check_archive: bool = False) -> bool:
         """Check if task memory exists.
@@ -424,6 +500,7 @@ class TaskMemoryStore:
         # Write back
         updated_content = self._serialize_frontmatter(metadata, body)
         memory_path.write_text(updated_content)
+        self.search_index.update(memory_path)
 
     def clear(self, task_id: str) -> None:
         """Clear task memory content while preserving metadata.
@@ -478,3 +555,4 @@ class TaskMemoryStore:
         # Write cleared content with preserved metadata
         cleared_content = self._serialize_frontmatter(metadata, empty_body)
         memory_path.write_text(cleared_content)
+        self.search_index.update(memory_path)
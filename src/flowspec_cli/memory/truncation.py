@@ -0,0 +1,228 @@
+"""Truncation Engine - Token-budgeted, section-aware memory truncation.
+
+This module provides the truncation engine used by ContextInjector to fit task
+memory into an agent's context budget:
+
+- Tokenizer: Protocol for pluggable token counters
+- BPEEstimator: Offline estimator modelled on BPE pre-tokenization (default)
+- CharRatioTokenizer: Legacy ~4 characters per token approximation
+- TruncationEngine: Single-pass, section-aware truncation with memoization
+
+The engine counts tokens once per line and keeps running byte and token totals
+while assembling output, so cost is linear in memory size. Results are
+memoized by the SHA-256 of the memory content and the token budget.
+"""
+
+import hashlib
+import math
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, Tuple
+
+
+class Tokenizer(Protocol):
+    """Counts tokens in text."""
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in text."""
+        ...
+
+
+class CharRatioTokenizer:
+    """Character-ratio token approximation (len(text) // chars_per_token)."""
+
+    def __init__(self, chars_per_token: int = 4):
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        return len(text) // self.chars_per_token
+
+
+class BPEEstimator:
+    """Offline token estimator modelled on GPT-style BPE tokenizers.
+
+    Text is split the way BPE tokenizers pre-tokenize it (words with an
+    optional leading space, digit runs, punctuation runs, whitespace runs),
+    and each piece is costed from its shape:
+
+    - Words of up to 7 ASCII letters are one token; longer words cost one
+      token per 4 letters. Non-ASCII characters cost one token each.
+    - Digits are grouped in threes, punctuation in pairs.
+    - Whitespace runs cost one token per 8 characters.
+
+    The estimate errs on the high side for prose so token budgets hold
+    against real tokenizers without requiring a vocabulary download.
+    """
+
+    PIECE_PATTERN = re.compile(r" ?[^\W\d_]+| ?\d+| ?(?:[^\w\s]|_)+|\s+")
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for match in self.PIECE_PATTERN.finditer(text):
+            piece = match.group()
+            if piece.isspace():
+                tokens += math.ceil(len(piece) / 8)
+                continue
+            body = piece.lstrip(" ")
+            if body[0].isdigit():
+                tokens += math.ceil(len(body) / 3)
+            elif body[0].isalpha():
+                if body.isascii():
+                    tokens += 1 if len(body) <= 7 else math.ceil(len(body) / 4)
+                else:
+                    ascii_letters = sum(1 for char in body if char.isascii())
+                    tokens += math.ceil(ascii_letters / 4) + len(body) - ascii_letters
+            else:
+                tokens += math.ceil(len(body) / 2)
+        return tokens
+
+
+@dataclass
+class TruncationResult:
+    """Outcome of truncating memory content.
+
+    Attributes:
+        content: Content within the token budget
+        tokens: Token count of content
+        bytes: UTF-8 size of content
+        truncated: True if anything was removed
+    """
+
+    content: str
+    tokens: int
+    bytes: int
+    truncated: bool
+
+
+class TruncationEngine:
+    """Section-aware truncation of task memory to a token budget.
+
+    Content is split on level-2 headings. Sections are kept by priority:
+
+    1. The preamble (frontmatter, title) and any "Context" section
+       (e.g. "## Context", "## Critical Context") are always kept.
+    2. Other sections except Notes are kept whole, in document order,
+       while they fit.
+    3. Notes are added line by line with the remaining budget.
+
+    Output keeps document order and ends with a truncation notice when
+    anything was removed.
+
+    Attributes:
+        tokenizer: Token counter used for budgeting
+        cache_size: Maximum number of memoized results
+    """
+
+    NOTICE_TEMPLATE = "*[Content truncated - exceeded {max_tokens} token limit]*"
+
+    def __init__(self, tokenizer: Optional[Tokenizer] = None, cache_size: int = 64):
+        """Initialize engine.
+
+        Args:
+            tokenizer: Token counter. Defaults to BPEEstimator.
+            cache_size: Maximum number of memoized results
+        """
+        self.tokenizer = tokenizer or BPEEstimator()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int], TruncationResult]" = OrderedDict()
+
+    def truncate(self, content: str, max_tokens: int) -> TruncationResult:
+        """Truncate content to at most max_tokens tokens.
+
+        Args:
+            content: Full memory content
+            max_tokens: Token budget
+
+        Returns:
+            TruncationResult for the (possibly unchanged) content
+        """
+        key = (hashlib.sha256(content.encode("utf-8")).hexdigest(), max_tokens)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        total = self.tokenizer.count(content)
+        if total <= max_tokens:
+            result = TruncationResult(
+                content, total, len(content.encode("utf-8")), False
+            )
+        else:
+            result = self._truncate(content, max_tokens)
+
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _truncate(self, content: str, max_tokens: int) -> TruncationResult:
+        notice = self.NOTICE_TEMPLATE.format(max_tokens=max_tokens)
+        # Notice is appended after a blank line: two newlines plus the notice
+        budget = max_tokens - self.tokenizer.count("\n\n" + notice)
+
+        lines = content.split("\n")
+        costs = [self.tokenizer.count(line) + 1 for line in lines]
+        sections = self._split_sections(lines)
+
+        keep = [False] * len(lines)
+        used = 0
+
+        # Priority 1: preamble and context sections (trimmed only if they alone
+        # exceed the budget)
+        for title, start, end in sections:
+            if title is None or "context" in title.lower():
+                for i in range(start, end):
+                    if used + costs[i] > budget:
+                        break
+                    keep[i] = True
+                    used += costs[i]
+
+        # Priority 2: remaining sections, whole, in document order
+        for title, start, end in sections:
+            if title is None or "context" in title.lower() or title.startswith("Notes"):
+                continue
+            section_cost = sum(costs[start:end])
+            if used + section_cost <= budget:
+                keep[start:end] = [True] * (end - start)
+                used += section_cost
+
+        # Priority 3: notes, line by line
+        for title, start, end in sections:
+            if title is not None and title.startswith("Notes"):
+                for i in range(start, end):
+                    if used + costs[i] > budget:
+                        break
+                    keep[i] = True
+                    used += costs[i]
+
+        kept = [line for line, flag in zip(lines, keep) if flag]
+
+        # Per-line costs bound the joined cost for additive tokenizers; verify
+        # and trim for tokenizers where that does not hold
+        text = "\n".join(kept).rstrip("\n") + "\n\n" + notice
+        tokens = self.tokenizer.count(text)
+        while tokens > max_tokens and kept:
+            kept.pop()
+            text = "\n".join(kept).rstrip("\n") + "\n\n" + notice
+            tokens = self.tokenizer.count(text)
+
+        return TruncationResult(text, tokens, len(text.encode("utf-8")), True)
+
+    @staticmethod
+    def _split_sections(lines: List[str]) -> List[Tuple[Optional[str], int, int]]:
+        """Split lines into (title, start, end) sections on level-2 headings.
+
+        The preamble before the first heading has title None.
+        """
+        sections: List[Tuple[Optional[str], int, int]] = []
+        title: Optional[str] = None
+        start = 0
+        for i, line in enumerate(lines):
+            if line.startswith("## "):
+                if i > start or title is not None:
+                    sections.append((title, start, i))
+                title = line[3:].strip()
+                start = i
+        sections.append((title, start, len(lines)))
+        return sections
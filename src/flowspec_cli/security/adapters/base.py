@@ -8,10 +8,15 @@ See ADR-005 for architectural decisions.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
 
 from flowspec_cli.security.models import Finding
 
+# Config key for a threading.Event that asks a running scan to stop.
+# Runtime-only: it is not serialized and does not affect results.
+CANCEL_EVENT = "cancel_event"
+
 
 class ScannerAdapter(ABC):
     """Abstract base class for security scanner integrations.
@@ -103,9 +108,47 @@ class ScannerAdapter(ABC):
             - exclude: List of paths to exclude
             - timeout: Scan timeout in seconds
             - severity_threshold: Minimum severity to report
+            - cancel_event: threading.Event set to cancel (CANCEL_EVENT)
         """
         pass
 
+    def iter_scan(self, target: Path, config: dict | None = None) -> Iterator[Finding]:
+        """Run scanner and yield findings as they are parsed.
+
+        The default implementation yields from scan(). Adapters that can
+        parse tool output incrementally should override this so large
+        result sets are never held in memory at once.
+
+        Args:
+            target: Directory or file to scan.
+            config: Scanner-specific configuration options (optional).
+
+        Yields:
+            Security findings in UFFormat.
+        """
+        yield from self.scan(target, config)
+
+    def scan_files(
+        self, files: list[Path], config: dict | None = None
+    ) -> list[Finding]:
+        """Scan specific files (used by incremental scans).
+
+        The default implementation scans each file separately. Adapters
+        whose tool accepts several targets should override this to run
+        the tool once.
+
+        Args:
+            files: Files to scan.
+            config: Scanner-specific configuration options (optional).
+
+        Returns:
+            List of security findings in UFFormat.
+        """
+        findings = []
+        for file in files:
+            findings.extend(self.scan(file, config))
+        return findings
+
     @abstractmethod
     def get_install_instructions(self) -> str:
         """Get installation instructions for this scanner.
@@ -7,13 +7,195 @@ output to the Unified Finding Format (UFFormat).
 See ADR-005 for architectural decisions.
 """
 
+import fnmatch
+import heapq
 import json
+import os
 import subprocess
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-from flowspec_cli.security.adapters.base import ScannerAdapter
+from flowspec_cli.security.adapters.base import CANCEL_EVENT, ScannerAdapter
 from flowspec_cli.security.adapters.discovery import ToolDiscovery
+from flowspec_cli.security.incremental import SKIP_DIRS
 from flowspec_cli.security.models import Confidence, Finding, Location, Severity
+from flowspec_cli.security.streaming import iter_json_array
+
+# File extension to Semgrep language, used to balance shards
+LANGUAGE_EXTENSIONS = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".rb": "ruby",
+    ".php": "php",
+    ".cs": "csharp",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".hpp": "cpp",
+    ".rs": "rust",
+    ".swift": "swift",
+    ".sh": "bash",
+    ".tf": "terraform",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".html": "html",
+}
+
+# Approximate fixed cost of a file in a shard, in bytes of source
+SHARD_FILE_OVERHEAD = 4096
+
+# Smallest memory budget (MB) worth giving a Semgrep worker
+MIN_WORKER_MEMORY_MB = 1024
+
+GIT_LS_FILES_TIMEOUT = 30
+
+# Seconds between timeout/cancellation checks while Semgrep runs
+WATCH_INTERVAL = 0.1
+
+
+def file_language(path: Path) -> str:
+    """Get the Semgrep language of a file ("other" if unknown)."""
+    if path.name == "Dockerfile":
+        return "dockerfile"
+    return LANGUAGE_EXTENSIONS.get(path.suffix.lower(), "other")
+
+
+def _is_excluded(relative: str, patterns: list[str]) -> bool:
+    """Check a relative path against Semgrep-style exclude globs.
+
+    A pattern matches the path, any parent directory, or any path component.
+    """
+    parts = relative.split("/")
+    candidates = [relative, *parts]
+    candidates += ["/".join(parts[:i]) for i in range(1, len(parts))]
+    for pattern in patterns:
+        pattern = pattern.strip("/")
+        if any(fnmatch.fnmatch(candidate, pattern) for candidate in candidates):
+            return True
+    return False
+
+
+def _git_files(root: Path) -> list[str] | None:
+    """List tracked and untracked, non-ignored files under root via git."""
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(root),
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=GIT_LS_FILES_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return [name for name in result.stdout.split("\0") if name]
+
+
+def _walk_files(root: Path) -> list[str]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        directory = Path(dirpath)
+        files.extend(
+            (directory / name).relative_to(root).as_posix() for name in filenames
+        )
+    return files
+
+
+def list_target_files(target: Path, exclude: list[str] | None = None) -> list[Path]:
+    """List the files a Semgrep scan of target would cover.
+
+    Inside a git work tree this uses ``git ls-files`` (honouring
+    .gitignore); otherwise it walks the directory, skipping VCS, virtualenv
+    and dependency directories. Files matching exclude patterns or
+    .semgrepignore entries are dropped.
+
+    Args:
+        target: Directory or file to scan.
+        exclude: Exclude globs (as passed to --exclude).
+
+    Returns:
+        Sorted file paths under target.
+    """
+    if target.is_file():
+        return [target]
+
+    relatives = _git_files(target)
+    if relatives is None:
+        relatives = _walk_files(target)
+
+    patterns = list(exclude or [])
+    ignore_file = target / ".semgrepignore"
+    if ignore_file.is_file():
+        for line in ignore_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith(("#", "!", ":")):
+                patterns.append(line)
+
+    return [
+        target / relative
+        for relative in sorted(set(relatives))
+        if not _is_excluded(relative, patterns) and (target / relative).is_file()
+    ]
+
+
+def shard_files(files: list[Path], count: int) -> list[list[Path]]:
+    """Split files into shards of balanced size and language mix.
+
+    Files are grouped by language and, largest first, each goes to the
+    shard with the least source so far. Every shard ends up with a similar
+    byte count and a similar share of each language's rules to run.
+
+    Args:
+        files: Files to split.
+        count: Number of shards.
+
+    Returns:
+        Non-empty shards.
+    """
+    by_language: dict[str, list[tuple[int, Path]]] = defaultdict(list)
+    for path in files:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0
+        by_language[file_language(path)].append((size, path))
+
+    shards: list[list[Path]] = [[] for _ in range(max(1, count))]
+    loads = [(0, index) for index in range(len(shards))]
+    for language in sorted(by_language):
+        for size, path in sorted(by_language[language], key=lambda item: -item[0]):
+            load, index = heapq.heappop(loads)
+            shards[index].append(path)
+            heapq.heappush(loads, (load + size + SHARD_FILE_OVERHEAD, index))
+    return [shard for shard in shards if shard]
 
 
 class SemgrepAdapter(ScannerAdapter):
@@ -31,7 +213,11 @@ class SemgrepAdapter(ScannerAdapter):
         - rules: List of rule configs (default: ["auto"] for OWASP + community)
         - exclude: List of paths to exclude (globs supported)
         - timeout: Scan timeout in seconds (default: 600)
-        - max_memory: Max memory in MB (default: unlimited)
+        - max_memory: Max memory in MB (default: unlimited); shared by all
+          workers when sharding
+        - jobs: Concurrent Semgrep workers (default: 1; "auto" for one per
+          CPU). With more than one, files are split into balanced shards,
+          each scanned by its own single-threaded Semgrep process
 
     Example:
         >>> adapter = SemgrepAdapter()
@@ -40,6 +226,9 @@ class SemgrepAdapter(ScannerAdapter):
         ...     print(f"Found {len(findings)} issues")
     """
 
+    # Explicit file targets per Semgrep run (see scan_files())
+    MAX_TARGETS_PER_RUN = 500
+
     def __init__(self, discovery: ToolDiscovery | None = None):
         """Initialize Semgrep adapter.
 
@@ -111,6 +300,7 @@ class SemgrepAdapter(ScannerAdapter):
                 - exclude: List of paths to exclude
                 - timeout: Scan timeout in seconds (default: 600)
                 - max_memory: Max memory in MB
+                - jobs: Concurrent Semgrep workers (default: 1)
 
         Returns:
             List of security findings in UFFormat.
@@ -136,26 +326,150 @@ class SemgrepAdapter(ScannerAdapter):
             raise ValueError(msg)
 
         config = config or {}
-        rules = config.get("rules", ["auto"])
-        exclude = config.get("exclude", [])
-        timeout = config.get("timeout", 600)
+        if self._worker_count(config) > 1:
+            files = list_target_files(target, config.get("exclude"))
+            return self._run_sharded(files, config)
+        return self._run([target], config)
 
-        # Build command
-        tool_path = self._discovery.find_tool("semgrep")
-        cmd = [
-            str(tool_path),
-            "--config",
-            ",".join(rules),
-            "--json",
-            "--quiet",  # Suppress progress output
-        ]
+    def iter_scan(self, target: Path, config: dict | None = None) -> Iterator[Finding]:
+        """Run Semgrep and yield findings as its output is parsed.
 
-        # Add exclude patterns
-        for pattern in exclude:
-            cmd.extend(["--exclude", pattern])
+        Same options and errors as scan(), but results are converted one
+        at a time from Semgrep's output stream (or, when sharding, as each
+        shard completes). Errors are raised when iteration reaches them.
+
+        Setting config["cancel_event"] (a threading.Event) kills the
+        running Semgrep process; sharded scans stop starting new chunks
+        and stop at the next completed shard.
+
+        Example:
+            >>> for finding in adapter.iter_scan(Path("/path/to/code")):
+            ...     writer.write(finding)
+        """
+        if not self.is_available():
+            msg = "Semgrep is not available"
+            raise RuntimeError(msg)
+
+        if not target.exists():
+            msg = f"Target path does not exist: {target}"
+            raise ValueError(msg)
+
+        config = config or {}
+        if self._worker_count(config) > 1:
+            files = list_target_files(target, config.get("exclude"))
+            yield from self._iter_sharded(files, config)
+        else:
+            yield from self._iter_run([target], config)
+
+    def scan_files(
+        self, files: list[Path], config: dict | None = None
+    ) -> list[Finding]:
+        """Run Semgrep on specific files.
+
+        Files are passed to Semgrep as explicit targets, in chunks of
+        MAX_TARGETS_PER_RUN to stay under command-line length limits.
+        Missing files are skipped.
+
+        Args:
+            files: Files to scan.
+            config: Same options as scan().
+
+        Returns:
+            List of security findings in UFFormat.
+
+        Raises:
+            RuntimeError: If Semgrep is not available or a scan fails.
+        """
+        if not self.is_available():
+            msg = "Semgrep is not available"
+            raise RuntimeError(msg)
+
+        config = config or {}
+        files = [f for f in files if f.is_file()]
+        if self._worker_count(config) > 1:
+            return self._run_sharded(files, config)
+        return self._run_chunked(files, config)
+
+    def _worker_count(self, config: dict) -> int:
+        """Get the number of concurrent workers allowed by the config."""
+        jobs = config.get("jobs", 1)
+        if jobs == "auto" or not jobs:
+            jobs = os.cpu_count() or 1
+        max_memory = config.get("max_memory")
+        if max_memory:
+            jobs = min(jobs, max(1, max_memory // MIN_WORKER_MEMORY_MB))
+        return max(1, int(jobs))
+
+    def _run_chunked(self, files: list[Path], config: dict) -> list[Finding]:
+        """Run Semgrep over files, MAX_TARGETS_PER_RUN at a time."""
+        findings = []
+        for start in range(0, len(files), self.MAX_TARGETS_PER_RUN):
+            self._check_cancelled(config)
+            chunk = files[start : start + self.MAX_TARGETS_PER_RUN]
+            findings.extend(self._run(chunk, config))
+        return findings
+
+    def _check_cancelled(self, config: dict) -> None:
+        """Raise if the scan's cancel event is set."""
+        cancel = config.get(CANCEL_EVENT)
+        if cancel is not None and cancel.is_set():
+            msg = "Semgrep scan cancelled"
+            raise RuntimeError(msg)
+
+    def _run_sharded(self, files: list[Path], config: dict) -> list[Finding]:
+        """Scan files with concurrent Semgrep workers (see _iter_sharded())."""
+        return list(self._iter_sharded(files, config))
 
-        # Add target
-        cmd.append(str(target))
+    def _iter_sharded(self, files: list[Path], config: dict) -> Iterator[Finding]:
+        """Scan files with concurrent Semgrep workers, one per shard.
+
+        The CPU and memory budget is split evenly: each worker runs with
+        --jobs 1 and an equal share of max_memory. Shard outputs are
+        parsed as they complete, and findings reported by more than one
+        shard are dropped.
+
+        Raises:
+            RuntimeError: If any shard fails.
+        """
+        shards = shard_files(files, self._worker_count(config))
+        if not shards:
+            return
+        worker_config = {**config, "jobs": 1}
+        if config.get("max_memory"):
+            worker_config["max_memory"] = config["max_memory"] // len(shards)
+
+        seen: set[tuple[str, str]] = set()
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(self._run_chunked, shard, worker_config)
+                for shard in shards
+            ]
+            try:
+                for future in as_completed(futures):
+                    self._check_cancelled(config)
+                    for finding in future.result():
+                        key = (finding.id, finding.fingerprint())
+                        if key not in seen:
+                            seen.add(key)
+                            yield finding
+            except BaseException:
+                # Includes GeneratorExit when the consumer stops early
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _run(self, targets: list[Path], config: dict) -> list[Finding]:
+        """Run Semgrep on targets and convert its output.
+
+        Args:
+            targets: Files or directories to scan.
+            config: Scan configuration (see scan()).
+
+        Returns:
+            List of security findings in UFFormat.
+        """
+        timeout = config.get("timeout", 600)
+        cmd = self._build_command(targets, config)
 
         # Execute scan
         try:
@@ -185,6 +499,108 @@ class SemgrepAdapter(ScannerAdapter):
             msg = f"Failed to parse Semgrep output: {e}"
             raise RuntimeError(msg) from e
 
+    def _iter_run(self, targets: list[Path], config: dict) -> Iterator[Finding]:
+        """Run Semgrep on targets, parsing its output as it streams in.
+
+        Semgrep's stdout is read from a pipe and each result is converted
+        as soon as it is decoded, so neither the raw output nor the parsed
+        document is held in memory.
+
+        Raises:
+            RuntimeError: If Semgrep fails, times out, or its output is invalid.
+        """
+        timeout = config.get("timeout", 600)
+        cancel = config.get(CANCEL_EVENT)
+        cmd = self._build_command(targets, config)
+        timed_out = threading.Event()
+        cancelled = threading.Event()
+        finished = threading.Event()
+
+        with tempfile.TemporaryFile(mode="w+") as stderr:
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=stderr, text=True
+            )
+
+            def watch() -> None:
+                # Kill Semgrep on timeout or cancellation; this also
+                # unblocks the pipe read below
+                deadline = time.monotonic() + timeout
+                while not finished.wait(WATCH_INTERVAL):
+                    if cancel is not None and cancel.is_set():
+                        cancelled.set()
+                    elif time.monotonic() >= deadline:
+                        timed_out.set()
+                    else:
+                        continue
+                    process.kill()
+                    return
+
+            watcher = threading.Thread(target=watch, daemon=True)
+            watcher.start()
+            parse_error = None
+            try:
+                try:
+                    for result in iter_json_array(process.stdout, "results"):
+                        yield self._to_finding(result)
+                except ValueError as e:
+                    parse_error = e
+                    # Nobody reads stdout any more; Semgrep would block on
+                    # the full pipe until the timeout
+                    process.kill()
+                returncode = process.wait()
+            finally:
+                finished.set()
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+            if cancelled.is_set():
+                msg = "Semgrep scan cancelled"
+                raise RuntimeError(msg)
+            if timed_out.is_set():
+                msg = f"Semgrep scan timed out after {timeout}s"
+                raise RuntimeError(msg)
+            # Exit codes: 0 = clean, 1 = findings, 2+ = error
+            if returncode >= 2:
+                stderr.seek(0)
+                msg = f"Semgrep scan failed: {stderr.read()}"
+                raise RuntimeError(msg)
+            if parse_error is not None:
+                msg = f"Failed to parse Semgrep output: {parse_error}"
+                raise RuntimeError(msg) from parse_error
+
+    def _build_command(self, targets: list[Path], config: dict) -> list[str]:
+        """Build the Semgrep command line for targets."""
+        rules = config.get("rules", ["auto"])
+        exclude = config.get("exclude", [])
+        max_memory = config.get("max_memory")
+        jobs = config.get("jobs")
+
+        # Build command
+        tool_path = self._discovery.find_tool("semgrep")
+        cmd = [
+            str(tool_path),
+            "--config",
+            ",".join(rules),
+            "--json",
+            "--quiet",  # Suppress progress output
+        ]
+
+        # Add exclude patterns
+        for pattern in exclude:
+            cmd.extend(["--exclude", pattern])
+
+        # Add resource limits
+        if max_memory:
+            cmd.extend(["--max-memory", str(max_memory)])
+        if isinstance(jobs, int) and jobs > 0:
+            cmd.extend(["--jobs", str(jobs)])
+
+        # Add targets
+        cmd.extend(str(target) for target in targets)
+        return cmd
+
     def _to_finding(self, semgrep_finding: dict) -> Finding:
         """Convert Semgrep result to Unified Finding Format.
 
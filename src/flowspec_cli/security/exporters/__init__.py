@@ -6,18 +6,20 @@ output formats for different use cases:
     - SARIFExporter: Industry-standard SARIF 2.1.0 for tool integration
     - MarkdownExporter: Human-readable reports for documentation
     - JSONExporter: Simple JSON export for APIs and data processing
+    - JSONLinesExporter: One finding per line for streaming consumers
 
 See ADR-007 for design rationale.
 """
 
 from flowspec_cli.security.exporters.base import BaseExporter
-from flowspec_cli.security.exporters.json import JSONExporter
+from flowspec_cli.security.exporters.json import JSONExporter, JSONLinesExporter
 from flowspec_cli.security.exporters.markdown import MarkdownExporter
 from flowspec_cli.security.exporters.sarif import SARIFExporter
 
 __all__ = [
     "BaseExporter",
     "JSONExporter",
+    "JSONLinesExporter",
     "MarkdownExporter",
     "SARIFExporter",
 ]
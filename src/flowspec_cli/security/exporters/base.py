@@ -3,8 +3,10 @@
 This module defines the abstract base class that all exporters must implement.
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, TextIO
 
 from flowspec_cli.security.models import Finding
 
@@ -13,7 +15,9 @@ class BaseExporter(ABC):
     """Abstract base class for security finding exporters.
 
     All exporters must implement the export() method to convert
-    findings to their target format.
+    findings to their target format. Exporters that can write output
+    incrementally override write() so large scans are never held in
+    memory as one document.
     """
 
     @abstractmethod
@@ -27,3 +31,37 @@ class BaseExporter(ABC):
             Exported data in target format (type varies by implementation)
         """
         ...
+
+    def write(self, findings: Iterable[Finding], fp: TextIO) -> int:
+        """Write exported findings to a text stream.
+
+        The default implementation materializes the findings and writes
+        the result of export() (dicts are serialized as indented JSON).
+
+        Args:
+            findings: Security findings (any iterable, e.g., a stream from
+                ScannerOrchestrator.iter_scan())
+            fp: Text stream to write to
+
+        Returns:
+            Number of findings written
+        """
+        findings = list(findings)
+        result = self.export(findings)
+        if not isinstance(result, str):
+            result = json.dumps(result, indent=2)
+        fp.write(result)
+        return len(findings)
+
+
+def dumps_nested(value: Any, depth: int) -> str:
+    """Serialize a value as it appears nested in an indent=2 JSON document.
+
+    Args:
+        value: JSON-serializable value
+        depth: Nesting level of the value within the document
+
+    Returns:
+        JSON text whose continuation lines are indented for the depth
+    """
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
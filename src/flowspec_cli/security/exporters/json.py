@@ -4,9 +4,10 @@ Simple JSON export format for APIs, data processing, and storage.
 """
 
 import json
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, TextIO
 
-from flowspec_cli.security.exporters.base import BaseExporter
+from flowspec_cli.security.exporters.base import BaseExporter, dumps_nested
 from flowspec_cli.security.models import Finding
 
 
@@ -62,6 +63,36 @@ class JSONExporter(BaseExporter):
             return json.dumps(data, indent=2)
         return json.dumps(data)
 
+    def write(self, findings: Iterable[Finding], fp: TextIO) -> int:
+        """Stream findings to a JSON document, one finding at a time.
+
+        The output is identical to export().
+
+        Args:
+            findings: Security findings (any iterable)
+            fp: Text stream to write to
+
+        Returns:
+            Number of findings written
+        """
+        count = 0
+        if self.pretty:
+            fp.write('{\n  "findings": [')
+            for finding in findings:
+                fp.write(",\n    " if count else "\n    ")
+                fp.write(dumps_nested(finding.to_dict(), 2))
+                count += 1
+            fp.write("\n  ]\n}" if count else "]\n}")
+        else:
+            fp.write('{"findings": [')
+            for finding in findings:
+                if count:
+                    fp.write(", ")
+                fp.write(json.dumps(finding.to_dict()))
+                count += 1
+            fp.write("]}")
+        return count
+
     def export_dict(self, findings: list[Finding]) -> dict[str, Any]:
         """Export findings to dictionary (for in-memory use).
 
@@ -74,3 +105,39 @@ class JSONExporter(BaseExporter):
         return {
             "findings": [f.to_dict() for f in findings],
         }
+
+
+class JSONLinesExporter(BaseExporter):
+    """Export findings to JSON Lines format.
+
+    Each finding is one compact JSON object per line, so output can be
+    written and consumed incrementally (e.g., with jq or line-by-line
+    readers) without parsing a single large document.
+    """
+
+    def export(self, findings: list[Finding]) -> str:
+        """Export findings to a JSON Lines string.
+
+        Args:
+            findings: List of security findings
+
+        Returns:
+            One JSON object per line, each terminated by a newline
+        """
+        return "".join(json.dumps(f.to_dict()) + "\n" for f in findings)
+
+    def write(self, findings: Iterable[Finding], fp: TextIO) -> int:
+        """Stream findings as JSON Lines.
+
+        Args:
+            findings: Security findings (any iterable)
+            fp: Text stream to write to
+
+        Returns:
+            Number of findings written
+        """
+        count = 0
+        for finding in findings:
+            fp.write(json.dumps(finding.to_dict()) + "\n")
+            count += 1
+        return count
@@ -4,8 +4,12 @@ Human-readable Markdown reports for documentation, code reviews, and
 security reviews.
 """
 
-from collections import defaultdict
+import io
+import shutil
+import tempfile
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from typing import TextIO
 
 from flowspec_cli.security.exporters.base import BaseExporter
 from flowspec_cli.security.models import Finding, Severity
@@ -41,43 +45,69 @@ class MarkdownExporter(BaseExporter):
             >>> with open("security-report.md", "w") as f:
             ...     f.write(markdown)
         """
-        lines = [
-            "# Security Scan Results",
-            "",
-            f"**Date:** {datetime.now(tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
-            f"**Total Findings:** {len(findings)}",
-            "",
-        ]
+        buffer = io.StringIO()
+        self.write(findings, buffer)
+        return buffer.getvalue()
 
-        # Summary by severity
-        by_severity: dict[Severity, list[Finding]] = defaultdict(list)
-        for finding in findings:
-            by_severity[finding.severity].append(finding)
+    def write(self, findings: Iterable[Finding], fp: TextIO) -> int:
+        """Stream a Markdown report to a text stream.
 
-        lines.append("## Summary")
-        lines.append("")
-        lines.append("| Severity | Count |")
-        lines.append("|----------|-------|")
-        for severity in Severity:
-            count = len(by_severity[severity])
-            if count > 0:
-                emoji = self._severity_emoji(severity)
-                lines.append(f"| {emoji} {severity.value.title()} | {count} |")
-        lines.append("")
+        The summary needs the totals before any finding is written, so
+        formatted findings are spooled to one temporary file per severity
+        and copied out once counts are known.
 
-        # Findings by severity (critical to info)
-        for severity in Severity:
-            findings_at_severity = by_severity[severity]
-            if not findings_at_severity:
-                continue
+        Args:
+            findings: Security findings (any iterable)
+            fp: Text stream to write to
 
-            lines.append(f"## {severity.value.title()} Severity Findings")
+        Returns:
+            Number of findings written
+        """
+        spools: dict[Severity, TextIO] = {}
+        counts: dict[Severity, int] = dict.fromkeys(Severity, 0)
+        try:
+            for finding in findings:
+                severity = finding.severity
+                if severity not in spools:
+                    spools[severity] = tempfile.TemporaryFile("w+", encoding="utf-8")
+                counts[severity] += 1
+                lines = self._format_finding(counts[severity], finding)
+                spools[severity].write("".join("\n" + line for line in lines))
+
+            total = sum(counts.values())
+            lines = [
+                "# Security Scan Results",
+                "",
+                f"**Date:** {datetime.now(tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
+                f"**Total Findings:** {total}",
+                "",
+            ]
+
+            # Summary by severity
+            lines.append("## Summary")
             lines.append("")
-
-            for i, finding in enumerate(findings_at_severity, 1):
-                lines.extend(self._format_finding(i, finding))
-
-        return "\n".join(lines)
+            lines.append("| Severity | Count |")
+            lines.append("|----------|-------|")
+            for severity in Severity:
+                count = counts[severity]
+                if count > 0:
+                    emoji = self._severity_emoji(severity)
+                    lines.append(f"| {emoji} {severity.value.title()} | {count} |")
+            lines.append("")
+            fp.write("\n".join(lines))
+
+            # Findings by severity (critical to info)
+            for severity in Severity:
+                if severity not in spools:
+                    continue
+
+                fp.write(f"\n## {severity.value.title()} Severity Findings\n")
+                spools[severity].seek(0)
+                shutil.copyfileobj(spools[severity], fp)
+        finally:
+            for spool in spools.values():
+                spool.close()
+        return total
 
     def _format_finding(self, number: int, finding: Finding) -> list[str]:
         """Format a single finding as Markdown.
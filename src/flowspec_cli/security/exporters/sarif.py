@@ -11,12 +11,18 @@ that can be consumed by:
 Reference: https://docs.oasis-open.org/sarif/sarif/v2.1.0/
 """
 
+import json
+import shutil
+import tempfile
 from collections import defaultdict
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, TextIO
 
-from flowspec_cli.security.exporters.base import BaseExporter
+from flowspec_cli.security.exporters.base import BaseExporter, dumps_nested
 from flowspec_cli.security.models import Finding
 
+SARIF_SCHEMA = "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json"
+
 
 class SARIFExporter(BaseExporter):
     """Export findings to SARIF 2.1.0 format.
@@ -78,11 +84,63 @@ class SARIFExporter(BaseExporter):
             runs.append(run)
 
         return {
-            "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+            "$schema": SARIF_SCHEMA,
             "version": "2.1.0",
             "runs": runs,
         }
 
+    def write(self, findings: Iterable[Finding], fp: TextIO) -> int:
+        """Stream findings to a SARIF 2.1.0 document.
+
+        Results arrive interleaved across scanners but each run must be
+        written contiguously, so serialized results are spooled to one
+        temporary file per scanner; only the (small) rule tables are kept
+        in memory. The output is identical to json.dumps(export(), indent=2).
+
+        Args:
+            findings: Security findings (any iterable)
+            fp: Text stream to write to
+
+        Returns:
+            Number of findings written
+        """
+        spools: dict[str, TextIO] = {}
+        rules: dict[str, dict[str, dict[str, Any]]] = {}
+        count = 0
+        try:
+            for finding in findings:
+                scanner = finding.scanner
+                if scanner not in spools:
+                    spools[scanner] = tempfile.TemporaryFile("w+", encoding="utf-8")
+                    rules[scanner] = {}
+                    separator = "\n        "
+                else:
+                    separator = ",\n        "
+                rule_id = finding.cwe_id or finding.id
+                if rule_id not in rules[scanner]:
+                    rules[scanner][rule_id] = self._create_rule(finding)
+                spools[scanner].write(separator)
+                spools[scanner].write(dumps_nested(finding.to_sarif(), 4))
+                count += 1
+
+            fp.write("{\n")
+            fp.write(f'  "$schema": {json.dumps(SARIF_SCHEMA)},\n')
+            fp.write('  "version": "2.1.0",\n')
+            fp.write('  "runs": [')
+            for i, (scanner, spool) in enumerate(spools.items()):
+                fp.write(",\n    {\n" if i else "\n    {\n")
+                tool = self._create_tool(scanner, list(rules[scanner].values()))
+                fp.write(f'      "tool": {dumps_nested(tool, 3)},\n')
+                fp.write('      "results": [')
+                spool.seek(0)
+                shutil.copyfileobj(spool, fp)
+                fp.write("\n      ]\n    }")
+            fp.write("\n  ]\n}" if spools else "]\n}")
+        finally:
+            for spool in spools.values():
+                spool.close()
+        return count
+
     def _create_run(self, scanner: str, findings: list[Finding]) -> dict[str, Any]:
         """Create a SARIF run object for one scanner.
 
@@ -107,17 +165,29 @@ class SARIFExporter(BaseExporter):
                 rules[rule_id] = self._create_rule(finding)
 
         return {
-            "tool": {
-                "driver": {
-                    "name": scanner,
-                    "version": self.tool_version,
-                    "informationUri": f"https://flowspec-cli.dev/security/{scanner}",
-                    "rules": list(rules.values()),
-                }
-            },
+            "tool": self._create_tool(scanner, list(rules.values())),
             "results": [f.to_sarif() for f in findings],
         }
 
+    def _create_tool(self, scanner: str, rules: list[dict[str, Any]]) -> dict[str, Any]:
+        """Create a SARIF tool object for one scanner.
+
+        Args:
+            scanner: Name of the scanner
+            rules: SARIF rule objects for the scanner's findings
+
+        Returns:
+            SARIF tool object
+        """
+        return {
+            "driver": {
+                "name": scanner,
+                "version": self.tool_version,
+                "informationUri": f"https://flowspec-cli.dev/security/{scanner}",
+                "rules": rules,
+            }
+        }
+
     def _create_rule(self, finding: Finding) -> dict[str, Any]:
         """Create a SARIF rule object from a finding.
 
@@ -0,0 +1,516 @@
+"""Persistent findings database for security scan results.
+
+The MCP server and the triage/fix/audit commands used to re-read and
+json.load the whole scan-results.json on every request, rebuild every
+Finding and search for ids linearly. FindingsDB keeps scan results in a
+SQLite database (stdlib sqlite3) beside scan-results.json, with:
+
+- Indexed lookups by finding id
+- Paginated queries filtered by severity, CWE and file
+- Scan history, so consecutive scans can be diffed into new, fixed and
+  persisting findings (matched by Finding.fingerprint())
+
+scan-results.json remains the interchange format. FindingsDB.sync_json()
+imports it only when the file changed (by size and mtime), so readers pay
+for one stat() per request instead of a full parse.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from flowspec_cli.security.models import Finding, Severity
+
+# Default findings directory, relative to the project root
+FINDINGS_DIR = Path("docs") / "security"
+
+DB_FILENAME = "findings.db"
+SCAN_RESULTS_FILENAME = "scan-results.json"
+
+# Bump when the table layout changes; older databases are rebuilt
+SCHEMA_VERSION = 1
+
+# Scans kept for history diffs; older scans are pruned on insert
+MAX_SCANS = 50
+
+DEFAULT_PAGE_SIZE = 100
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    source TEXT,
+    source_stamp TEXT,
+    total INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scans_stamp ON scans (source_stamp);
+CREATE TABLE IF NOT EXISTS findings (
+    scan_id INTEGER NOT NULL REFERENCES scans (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    scanner TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    cwe_id TEXT,
+    file TEXT NOT NULL,
+    line_start INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scan_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_findings_id ON findings (scan_id, id);
+CREATE INDEX IF NOT EXISTS idx_findings_fingerprint ON findings (scan_id, fingerprint);
+CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings (scan_id, severity);
+CREATE INDEX IF NOT EXISTS idx_findings_cwe ON findings (scan_id, cwe_id);
+CREATE INDEX IF NOT EXISTS idx_findings_file ON findings (scan_id, file);
+"""
+
+
+@dataclass
+class ScanRecord:
+    """A scan stored in the findings database."""
+
+    id: int
+    created_at: str
+    source: str | None
+    total: int
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "source": self.source,
+            "total": self.total,
+            "metadata": self.metadata,
+        }
+
+
+@dataclass
+class FindingsPage:
+    """One page of query results.
+
+    Attributes:
+        findings: Findings on this page, as Finding.to_dict() dictionaries.
+        total: Number of findings matching the query across all pages.
+        offset: Index of the first finding on this page.
+        limit: Page size (None for no limit).
+    """
+
+    findings: list[dict[str, Any]]
+    total: int
+    offset: int
+    limit: int | None
+
+    @property
+    def has_more(self) -> bool:
+        """Whether more findings follow this page."""
+        return self.offset + len(self.findings) < self.total
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "findings": self.findings,
+            "total": self.total,
+            "offset": self.offset,
+            "limit": self.limit,
+            "has_more": self.has_more,
+        }
+
+
+@dataclass
+class ScanDiff:
+    """Changes between two scans, matched by finding fingerprint.
+
+    Attributes:
+        base_scan: Earlier scan id (None if there is no earlier scan, in
+            which case every finding is new).
+        head_scan: Later scan id.
+        new: Findings in head but not base.
+        fixed: Findings in base but not head.
+        persisting: Findings in both (as reported by head).
+    """
+
+    base_scan: int | None
+    head_scan: int
+    new: list[dict[str, Any]]
+    fixed: list[dict[str, Any]]
+    persisting: list[dict[str, Any]]
+
+    def summary(self) -> dict[str, Any]:
+        """Get counts of new, fixed and persisting findings."""
+        return {
+            "base_scan": self.base_scan,
+            "head_scan": self.head_scan,
+            "new": len(self.new),
+            "fixed": len(self.fixed),
+            "persisting": len(self.persisting),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            **self.summary(),
+            "new_findings": self.new,
+            "fixed_findings": self.fixed,
+            "persisting_findings": self.persisting,
+        }
+
+
+def file_stamp(path: Path) -> str:
+    """Get a change stamp for a file from its path, size and mtime."""
+    stat = path.stat()
+    return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class FindingsDB:
+    """SQLite-backed store of security scan results.
+
+    Findings are stored as Finding.to_dict() JSON alongside indexed
+    columns for filtering. Each recorded scan is kept (up to MAX_SCANS)
+    so results can be compared across runs.
+
+    The connection is shared across threads and guarded by a lock; the
+    database uses WAL mode so separate processes can read while a scan
+    is being recorded.
+
+    Example:
+        >>> with FindingsDB(Path("docs/security/findings.db")) as db:
+        ...     db.sync_json(Path("docs/security/scan-results.json"))
+        ...     page = db.query(severities=["critical", "high"], limit=20)
+        ...     print(page.total, db.diff().summary())
+    """
+
+    def __init__(self, path: Path):
+        """Open (or create) the database.
+
+        Args:
+            path: Database file. Created with owner-only permissions.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            # Findings describe vulnerabilities; create owner-only, as
+            # scan-results.json is
+            os.close(os.open(str(path), os.O_CREAT | os.O_WRONLY, 0o600))
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        """Create tables, rebuilding them if the schema version changed."""
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS findings")
+                self._conn.execute("DROP TABLE IF EXISTS scans")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "FindingsDB":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def record_scan(
+        self,
+        findings: Iterable[Finding],
+        metadata: dict[str, Any] | None = None,
+        source: str | None = None,
+        source_stamp: str | None = None,
+    ) -> int:
+        """Store the results of a scan.
+
+        Args:
+            findings: Findings reported by the scan.
+            metadata: Scan metadata (e.g., scanners used).
+            source: File the results were read from or written to.
+            source_stamp: Change stamp of source (see file_stamp()).
+
+        Returns:
+            The new scan's id.
+        """
+        rows = []
+        for position, finding in enumerate(findings):
+            rows.append(
+                (
+                    position,
+                    finding.id,
+                    finding.fingerprint(),
+                    finding.scanner,
+                    finding.severity.value,
+                    finding.cwe_id,
+                    str(finding.location.file),
+                    finding.location.line_start,
+                    json.dumps(finding.to_dict()),
+                )
+            )
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO scans (created_at, source, source_stamp, total, metadata)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(),
+                    source,
+                    source_stamp,
+                    len(rows),
+                    json.dumps(metadata or {}),
+                ),
+            )
+            scan_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO findings (scan_id, position, id, fingerprint, scanner,"
+                " severity, cwe_id, file, line_start, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(scan_id, *row) for row in rows],
+            )
+            self._conn.execute(
+                "DELETE FROM scans WHERE id NOT IN"
+                " (SELECT id FROM scans ORDER BY id DESC LIMIT ?)",
+                (MAX_SCANS,),
+            )
+        return scan_id
+
+    def sync_json(self, path: Path) -> int:
+        """Import a findings JSON file unless it is already stored.
+
+        Accepts the scan-results.json layout ({"findings": [...],
+        "metadata": {...}}) or a bare list of findings.
+
+        Args:
+            path: Findings JSON file.
+
+        Returns:
+            Id of the scan holding the file's findings.
+
+        Raises:
+            ValueError: If the file is not a valid findings document.
+        """
+        stamp = file_stamp(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM scans WHERE source_stamp = ? ORDER BY id DESC LIMIT 1",
+                (stamp,),
+            ).fetchone()
+        if row:
+            return row[0]
+
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            items, metadata = data, {}
+        elif isinstance(data, dict):
+            items, metadata = data.get("findings", []), data.get("metadata", {})
+        else:
+            msg = f"Not a findings document: {path}"
+            raise ValueError(msg)
+        try:
+            findings = [Finding.from_dict(item) for item in items]
+        except (KeyError, TypeError, AttributeError) as e:
+            msg = f"Invalid finding in {path}: {e}"
+            raise ValueError(msg) from e
+
+        return self.record_scan(findings, metadata, str(path), stamp)
+
+    def latest_scan_id(self) -> int | None:
+        """Get the id of the most recent scan (None if empty)."""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(id) FROM scans").fetchone()
+        return row[0]
+
+    def scans(self, limit: int = 20) -> list[ScanRecord]:
+        """Get recent scans, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, created_at, source, total, metadata FROM scans"
+                " ORDER BY id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            ScanRecord(id, created_at, source, total, json.loads(metadata))
+            for id, created_at, source, total, metadata in rows
+        ]
+
+    def get(self, finding_id: str, scan_id: int | None = None) -> dict[str, Any] | None:
+        """Get a finding by id.
+
+        Args:
+            finding_id: Finding id (e.g., "SEMGREP-CWE-89-001").
+            scan_id: Scan to look in (default: latest).
+
+        Returns:
+            The finding as a dictionary, or None if not found.
+        """
+        scan_id = scan_id or self.latest_scan_id()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM findings WHERE scan_id = ? AND id = ?"
+                " ORDER BY position LIMIT 1",
+                (scan_id, finding_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        scan_id: int | None = None,
+        severities: list[str] | None = None,
+        cwe_ids: list[str] | None = None,
+        file: str | None = None,
+        limit: int | None = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> FindingsPage:
+        """Query findings with filters and pagination.
+
+        Findings are returned in scan order.
+
+        Args:
+            scan_id: Scan to query (default: latest).
+            severities: Only these severity levels (e.g., ["critical", "high"]).
+            cwe_ids: Only these CWEs (e.g., ["CWE-89"]).
+            file: Only findings in this file, or under this directory.
+            limit: Page size (None for all matching findings).
+            offset: Number of matching findings to skip.
+
+        Returns:
+            The requested page and the total number of matches.
+        """
+        scan_id = scan_id or self.latest_scan_id()
+        where, params = self._filters(scan_id, severities, cwe_ids, file)
+
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM findings WHERE {where}", params
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT data FROM findings WHERE {where}"
+                " ORDER BY position LIMIT ? OFFSET ?",
+                [*params, -1 if limit is None else limit, offset],
+            ).fetchall()
+        return FindingsPage([json.loads(row[0]) for row in rows], total, offset, limit)
+
+    def _filters(
+        self,
+        scan_id: int | None,
+        severities: list[str] | None,
+        cwe_ids: list[str] | None,
+        file: str | None,
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause for query()."""
+        clauses = ["scan_id = ?"]
+        params: list[Any] = [scan_id]
+        if severities is not None:
+            clauses.append(f"severity IN ({','.join('?' * len(severities))})")
+            params.extend(s.lower() for s in severities)
+        if cwe_ids is not None:
+            clauses.append(f"cwe_id IN ({','.join('?' * len(cwe_ids))})")
+            params.extend(cwe_ids)
+        if file:
+            prefix = file.rstrip("/")
+            escaped = prefix.replace("\\", "\\\\").replace("%", "\\%")
+            escaped = escaped.replace("_", "\\_")
+            clauses.append("(file = ? OR file LIKE ? ESCAPE '\\')")
+            params.extend([prefix, f"{escaped}/%"])
+        return " AND ".join(clauses), params
+
+    def counts_by_severity(self, scan_id: int | None = None) -> dict[str, int]:
+        """Count findings per severity level (critical to info)."""
+        scan_id = scan_id or self.latest_scan_id()
+        counts = {severity.value: 0 for severity in Severity}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT severity, COUNT(*) FROM findings WHERE scan_id = ?"
+                " GROUP BY severity",
+                (scan_id,),
+            ).fetchall()
+        counts.update(dict(rows))
+        return counts
+
+    def diff(
+        self, base_scan: int | None = None, head_scan: int | None = None
+    ) -> ScanDiff:
+        """Compare two scans by finding fingerprint.
+
+        Args:
+            base_scan: Earlier scan (default: the scan before head_scan).
+            head_scan: Later scan (default: latest).
+
+        Returns:
+            New, fixed and persisting findings.
+
+        Raises:
+            ValueError: If there are no scans.
+        """
+        head_scan = head_scan or self.latest_scan_id()
+        if head_scan is None:
+            msg = "No scans recorded"
+            raise ValueError(msg)
+
+        with self._lock:
+            if base_scan is None:
+                row = self._conn.execute(
+                    "SELECT MAX(id) FROM scans WHERE id < ?", (head_scan,)
+                ).fetchone()
+                base_scan = row[0]
+
+            def select(scan: int | None, other: int | None, present: bool) -> list:
+                operator = "IN" if present else "NOT IN"
+                rows = self._conn.execute(
+                    "SELECT data FROM findings WHERE scan_id = ? AND fingerprint"
+                    f" {operator} (SELECT fingerprint FROM findings WHERE scan_id = ?)"
+                    " ORDER BY position",
+                    (scan, other),
+                ).fetchall()
+                return [json.loads(row[0]) for row in rows]
+
+            new = select(head_scan, base_scan, present=False)
+            persisting = select(head_scan, base_scan, present=True)
+            fixed = select(base_scan, head_scan, present=False)
+
+        return ScanDiff(base_scan, head_scan, new, fixed, persisting)
+
+
+def open_findings_db(findings_dir: Path) -> FindingsDB | None:
+    """Open the findings database for a findings directory.
+
+    The database is synced from scan-results.json when that file exists.
+    Nothing is created when there are no scan results and no database.
+
+    Args:
+        findings_dir: Directory holding scan-results.json (e.g., docs/security).
+
+    Returns:
+        The open database, or None if there is nothing to read.
+
+    Raises:
+        ValueError: If scan-results.json is not a valid findings document.
+    """
+    results_file = findings_dir / SCAN_RESULTS_FILENAME
+    db_file = findings_dir / DB_FILENAME
+    if not results_file.exists() and not db_file.exists():
+        return None
+
+    db = FindingsDB(db_file)
+    if results_file.exists():
+        try:
+            db.sync_json(results_file)
+        except Exception:
+            db.close()
+            raise
+    return db
@@ -13,6 +13,7 @@ from enum import Enum
 from pathlib import Path
 
 from flowspec_cli.security.fixer.models import Patch, FixResult
+from flowspec_cli.security.source_cache import get_source_cache
 
 
 class ApplyStatus(Enum):
@@ -331,6 +332,7 @@ class PatchApplicator:
             )
 
             if result.returncode == 0:
+                get_source_cache().invalidate(patch.file_path)
                 return ApplyResult(
                     patch=patch,
                     status=ApplyStatus.SUCCESS,
@@ -379,6 +381,7 @@ class PatchApplicator:
             )
 
             patch.file_path.write_text(new_content, encoding="utf-8")
+            get_source_cache().invalidate(patch.file_path)
 
             return ApplyResult(
                 patch=patch,
@@ -13,7 +13,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
+from flowspec_cli.security.llm_cache import (
+    LLMResponseCache,
+    is_json_response,
+    model_id,
+    response_key,
+)
 from flowspec_cli.security.models import Finding
+from flowspec_cli.security.source_cache import get_source_cache
 from flowspec_cli.security.fixer.models import (
     FixResult,
     FixStatus,
@@ -39,6 +46,7 @@ class FixGeneratorConfig:
 
     context_lines: int = 10  # Lines of context around vulnerability
     validate_syntax: bool = True  # Validate generated code syntax
+    llm_cache: LLMResponseCache | None = None  # Persistent LLM response cache
 
 
 class FixGenerator:
@@ -56,6 +64,9 @@ class FixGenerator:
         ...     print(result.patch.unified_diff)
     """
 
+    # Bump when the fix prompt changes, to invalidate cached responses
+    PROMPT_VERSION = "1"
+
     def __init__(
         self,
         llm_client: LLMClient | None = None,
@@ -115,20 +126,12 @@ class FixGenerator:
 
     def _get_code_context(self, finding: Finding) -> str | None:
         """Get code context around the vulnerability."""
-        file_path = Path(finding.location.file)
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
-
-            start = max(0, finding.location.line_start - self.config.context_lines - 1)
-            end = min(len(lines), finding.location.line_end + self.config.context_lines)
-
-            return "".join(lines[start:end])
-        except OSError:
-            return None
+        return get_source_cache().get_context(
+            Path(finding.location.file),
+            finding.location.line_start,
+            finding.location.line_end,
+            self.config.context_lines,
+        )
 
     def _generate_ai_fix(self, finding: Finding, original_code: str) -> FixResult:
         """Generate fix using LLM."""
@@ -179,8 +182,26 @@ Respond in JSON format:
     "warnings": ["any warnings about the fix"]
 }}
 """
+        cache = self.config.llm_cache
+        key = None
+        if cache is not None:
+            key = response_key(
+                "fix",
+                self.PROMPT_VERSION,
+                finding.cwe_id,
+                original_code,
+                model_id(self.llm),
+                finding.title,
+                finding.description,
+            )
+            response = cache.get(key)
+            if response is not None:
+                return self._parse_ai_response(finding, original_code, response)
+
         try:
             response = self.llm.complete(prompt)
+            if key is not None and is_json_response(response):
+                cache.put(key, response)
             return self._parse_ai_response(finding, original_code, response)
         except Exception as e:
             return FixResult(
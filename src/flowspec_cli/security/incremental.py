@@ -0,0 +1,346 @@
+"""Incremental security scanning support.
+
+A full Semgrep scan of a large repository takes minutes, while a commit or
+pull request usually touches a handful of files. Incremental scans only
+pass changed files to the scanner adapters and reuse stored findings for
+everything else:
+
+- FindingsStore persists findings from previous scans, keyed by
+  Finding.fingerprint() and indexed by file
+- Changed files come from ``git diff`` against a baseline ref (by default
+  the commit of the last full scan), or, outside git, from a content-hash
+  manifest of the scanned tree
+
+See ScannerOrchestrator.scan_incremental() for the scan flow.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flowspec_cli.security.models import Finding
+
+logger = logging.getLogger(__name__)
+
+# Default store location relative to the scan target
+DEFAULT_STORE_PATH = Path(".flowspec") / "security" / "findings-store.json"
+
+STORE_FORMAT_VERSION = 1
+
+GIT_TIMEOUT = 30
+
+# Directories never scanned and never treated as changed
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".flowspec",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+    }
+)
+
+
+@dataclass
+class ChangeSet:
+    """Files changed since the baseline, relative to the scan target."""
+
+    changed: set[str] = field(default_factory=set)  # Added or modified
+    deleted: set[str] = field(default_factory=set)
+
+    @property
+    def files(self) -> set[str]:
+        """All files whose stored findings are stale."""
+        return self.changed | self.deleted
+
+    def include(self, root: Path, files: Iterable[str]) -> None:
+        """Mark more files as stale, by whether they still exist under root."""
+        for relative in files:
+            if relative in self.changed or relative in self.deleted:
+                continue
+            if (root / relative).is_file():
+                self.changed.add(relative)
+            else:
+                self.deleted.add(relative)
+
+
+@dataclass
+class IncrementalScanResult:
+    """Outcome of ScannerOrchestrator.scan_incremental()."""
+
+    findings: list[Finding]
+    full_scan: bool  # True if no usable baseline existed
+    changed_files: list[str] = field(default_factory=list)
+    deleted_files: list[str] = field(default_factory=list)
+    reused_findings: int = 0  # Stored findings merged in for untouched files
+
+
+# Scanner options that affect resource use but not results
+RESOURCE_OPTIONS = frozenset({"jobs", "max_memory", "timeout", "cancel_event"})
+
+
+def config_key(scanners: list[str], config: dict) -> str:
+    """Hash the scanner selection and configuration.
+
+    Stored findings are only reused by scans with the same key.
+    """
+    config = {
+        name: (
+            {k: v for k, v in options.items() if k not in RESOURCE_OPTIONS}
+            if isinstance(options, dict)
+            else options
+        )
+        for name, options in config.items()
+    }
+    material = json.dumps(
+        {"scanners": sorted(scanners), "config": config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def relative_path(file: Path | str, root: Path) -> str:
+    """Get a finding's file path relative to the scan root (POSIX style).
+
+    Args:
+        file: Path as reported by a scanner (absolute or relative to cwd).
+        root: Resolved scan root.
+    """
+    path = Path(file)
+    if not path.is_absolute():
+        path = Path.cwd() / path
+    try:
+        return path.resolve().relative_to(root).as_posix()
+    except ValueError:
+        return Path(file).as_posix()
+
+
+def _is_skipped(relative: str) -> bool:
+    return any(part in SKIP_DIRS for part in relative.split("/")[:-1])
+
+
+def _git(root: Path, *args: str) -> str | None:
+    """Run a git command in root; returns stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), *args],
+            capture_output=True,
+            text=True,
+            timeout=GIT_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"git {args[0]} failed: {e}")
+        return None
+    if result.returncode != 0:
+        logger.debug(f"git {args[0]} failed: {result.stderr.strip()}")
+        return None
+    return result.stdout
+
+
+def git_head(root: Path) -> str | None:
+    """Get the commit checked out in root, or None outside a git repository."""
+    output = _git(root, "rev-parse", "--verify", "HEAD")
+    return output.strip() if output else None
+
+
+def git_changes(root: Path, baseline_ref: str) -> ChangeSet | None:
+    """Get files under root that differ from baseline_ref.
+
+    Covers committed, staged and unstaged changes plus untracked files
+    (respecting .gitignore).
+
+    Returns:
+        Changes, or None if git cannot diff against the ref.
+    """
+    diff = _git(
+        root, "diff", "--name-only", "--relative", "--no-renames", "-z", baseline_ref
+    )
+    if diff is None:
+        return None
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard", "-z")
+    if untracked is None:
+        return None
+
+    changes = ChangeSet()
+    for relative in set(diff.split("\0")) | set(untracked.split("\0")):
+        if not relative or _is_skipped(relative):
+            continue
+        if (root / relative).is_file():
+            changes.changed.add(relative)
+        else:
+            changes.deleted.add(relative)
+    return changes
+
+
+def build_manifest(
+    root: Path, previous: dict[str, list] | None = None
+) -> dict[str, list]:
+    """Build a content-hash manifest of the files under root.
+
+    Files whose mtime and size match the previous manifest keep their
+    stored hash instead of being re-read.
+
+    Returns:
+        Mapping of relative path to [mtime_ns, size, sha256].
+    """
+    previous = previous or {}
+    manifest = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        directory = Path(dirpath)
+        for name in filenames:
+            path = directory / name
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            relative = path.relative_to(root).as_posix()
+            entry = previous.get(relative)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                manifest[relative] = entry
+                continue
+            try:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                continue
+            manifest[relative] = [stat.st_mtime_ns, stat.st_size, digest]
+    return manifest
+
+
+def manifest_changes(old: dict[str, list], new: dict[str, list]) -> ChangeSet:
+    """Compare two manifests from build_manifest()."""
+    return ChangeSet(
+        changed={
+            relative
+            for relative, entry in new.items()
+            if relative not in old or old[relative][2] != entry[2]
+        },
+        deleted=set(old) - set(new),
+    )
+
+
+class FindingsStore:
+    """Findings from previous scans, persisted as JSON.
+
+    Entries are keyed by Finding.fingerprint() and hold every scanner's
+    finding for that fingerprint before deduplication, so merged results
+    match a full scan. The store also records the baseline the findings
+    reflect: the git commit of the last full scan (plus files rescanned
+    since) or a content-hash manifest.
+
+    Example:
+        >>> store = FindingsStore.load(Path(".flowspec/security/findings-store.json"))
+        >>> store.replace({"src/app.py"}, new_findings, root)
+        >>> store.save()
+    """
+
+    def __init__(self, path: Path):
+        """Initialize an empty store.
+
+        Args:
+            path: JSON file backing the store.
+        """
+        self.path = Path(path)
+        self.config_key: str | None = None
+        self.commit: str | None = None
+        self.pending: set[str] = set()  # Files rescanned since the commit
+        self.manifest: dict[str, list] = {}
+        self._entries: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "FindingsStore":
+        """Load a store, starting empty if the file is missing or invalid."""
+        store = cls(path)
+        try:
+            data = json.loads(store.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return store
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable findings store {path}: {e}")
+            return store
+
+        if not isinstance(data, dict) or data.get("version") != STORE_FORMAT_VERSION:
+            return store
+        store.config_key = data.get("config_key")
+        store.commit = data.get("commit")
+        store.pending = set(data.get("pending", []))
+        store.manifest = data.get("manifest", {})
+        store._entries = data.get("findings", {})
+        return store
+
+    def save(self) -> None:
+        """Write the store atomically."""
+        data = {
+            "version": STORE_FORMAT_VERSION,
+            "config_key": self.config_key,
+            "commit": self.commit,
+            "pending": sorted(self.pending),
+            "manifest": self.manifest,
+            "findings": self._entries,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    @property
+    def has_baseline(self) -> bool:
+        """True if the store holds a completed scan to build on."""
+        return self.config_key is not None and (
+            self.commit is not None or bool(self.manifest)
+        )
+
+    def __len__(self) -> int:
+        return sum(len(entry["results"]) for entry in self._entries.values())
+
+    def findings(self, exclude: set[str] | None = None) -> list[Finding]:
+        """Get stored findings (not deduplicated).
+
+        Args:
+            exclude: Relative paths whose findings to skip.
+        """
+        exclude = exclude or set()
+        return [
+            Finding.from_dict(dict(result))
+            for entry in self._entries.values()
+            if entry["file"] not in exclude
+            for result in entry["results"]
+        ]
+
+    def replace(
+        self, files: set[str] | None, findings: list[Finding], root: Path
+    ) -> None:
+        """Replace stored findings for rescanned files.
+
+        Args:
+            files: Relative paths that were rescanned (None for all files).
+            findings: New findings from scanning those files.
+            root: Resolved scan root, for relativizing finding paths.
+        """
+        if files is None:
+            self._entries = {}
+        else:
+            self._entries = {
+                fp: entry
+                for fp, entry in self._entries.items()
+                if entry["file"] not in files
+            }
+
+        for finding in findings:
+            entry = self._entries.setdefault(
+                finding.fingerprint(),
+                {"file": relative_path(finding.location.file, root), "results": []},
+            )
+            # Copy: deduplication later merges into the live Finding objects
+            entry["results"].append(copy.deepcopy(finding.to_dict()))
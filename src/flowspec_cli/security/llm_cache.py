@@ -0,0 +1,320 @@
+"""Persistent, content-addressed cache of LLM responses.
+
+Nightly scans report mostly the same findings every night, and triage
+and fix generation would otherwise send the same prompts again each time.
+LLMResponseCache stores responses on disk keyed by a hash of:
+
+- The kind of request and its prompt template version
+- The finding's CWE
+- The normalized code context (line endings and trailing whitespace
+  ignored; line numbers and file paths are not part of the key, so a
+  finding that merely moved still hits)
+- The model identifier
+
+Entries expire after a TTL, and the least recently used entries are
+evicted when the store exceeds its size limit. Incremental CI triage then
+only pays for findings that are new or whose code changed.
+
+Set FLOWSPEC_LLM_CACHE=0 (or pass --no-cache) to bypass the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Default location relative to the project root
+DEFAULT_CACHE_DIR = Path(".flowspec") / "cache" / "llm"
+
+# Default bounds: 100 MiB, 30 days
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Bump to invalidate every entry when the key or entry format changes
+CACHE_FORMAT_VERSION = 1
+
+
+def normalize_code(code: str) -> str:
+    """Normalize code context for cache keys.
+
+    Ignores line ending style, trailing whitespace and surrounding blank
+    lines, which do not change what the model is asked about.
+    """
+    lines = [line.rstrip() for line in code.replace("\r\n", "\n").split("\n")]
+    return "\n".join(lines).strip("\n")
+
+
+def model_id(llm_client: object) -> str:
+    """Get an identifier for the model behind an LLM client."""
+    for attr in ("model_id", "model"):
+        value = getattr(llm_client, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(llm_client).__name__
+
+
+def response_key(
+    kind: str,
+    template_version: str,
+    cwe_id: str | None,
+    code_context: str,
+    model: str,
+    *extra: str,
+) -> str:
+    """Compute the cache key for an LLM request.
+
+    Args:
+        kind: Request kind (e.g., "classify:SQLInjectionClassifier").
+        template_version: Version of the prompt template.
+        cwe_id: CWE of the finding.
+        code_context: Code shown to the model (normalized here).
+        model: Model identifier (see model_id()).
+        *extra: Other prompt inputs that affect the response.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    material = [
+        CACHE_FORMAT_VERSION,
+        kind,
+        template_version,
+        cwe_id or "",
+        normalize_code(code_context),
+        model,
+        *extra,
+    ]
+    return hashlib.sha256(json.dumps(material).encode("utf-8")).hexdigest()
+
+
+def is_json_response(response: str) -> bool:
+    """Check whether a response holds parseable JSON (worth caching)."""
+    response = response.strip()
+    if "```json" in response:
+        start = response.find("```json") + 7
+        end = response.find("```", start)
+        response = response[start:end].strip()
+    elif "```" in response:
+        start = response.find("```") + 3
+        end = response.find("```", start)
+        response = response[start:end].strip()
+    try:
+        json.loads(response)
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss metrics for an LLMResponseCache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    expired: int = 0
+    evicted: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LLMResponseCache:
+    """On-disk LLM response store with TTL and size-based LRU eviction.
+
+    Entries are JSON files named by their key under two-character shard
+    directories. Reads refresh an entry's mtime, which drives LRU eviction.
+    Thread-safe, and safe for concurrent processes (writes are atomic).
+
+    Example:
+        >>> cache = LLMResponseCache(Path(".flowspec/cache/llm"))
+        >>> key = response_key("fix", "1", "CWE-89", code, model_id(llm))
+        >>> response = cache.get(key)
+        >>> if response is None:
+        ...     response = llm.complete(prompt)
+        ...     cache.put(key, response)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries.
+            max_bytes: Size limit for all entries.
+            ttl_seconds: Age after which entries expire.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+        self._lock = threading.Lock()
+        self._size: int | None = None  # Computed lazily by the first put()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Args:
+            key: Key from response_key().
+
+        Returns:
+            Cached response, or None on a miss or expired entry.
+        """
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            response = entry["response"]
+            created = float(entry["created"])
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            self._remove(path)
+            self._count("misses")
+            return None
+
+        if time.time() - created > self.ttl_seconds:
+            self._remove(path)
+            self._count("expired")
+            self._count("misses")
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        self._count("hits")
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Key from response_key().
+            response: Raw LLM response.
+        """
+        path = self._path(key)
+        data = json.dumps({"created": time.time(), "response": response})
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                previous = path.stat().st_size
+            except OSError:
+                previous = 0
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self._count("writes")
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data) - previous
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.prune()
+
+    def prune(self) -> int:
+        """Remove expired entries, then least recently used ones until the
+        cache is under 90% of max_bytes.
+
+        Returns:
+            Number of entries removed.
+        """
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for mtime, size, path in entries:
+            # mtime is refreshed on reads; entries untouched for a TTL are stale
+            if now - mtime <= self.ttl_seconds and total <= target:
+                break
+            if self._remove(path):
+                removed += 1
+                total -= size
+
+        with self._lock:
+            self._size = total
+            self.stats.evicted += removed
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self._entries():
+            self._remove(path)
+        with self._lock:
+            self._size = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob("??/*.json"))
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self._entries():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _remove(self, path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+
+def default_llm_cache(
+    project_root: Path | None = None, enabled: bool = True
+) -> LLMResponseCache | None:
+    """Get the project's LLM response cache.
+
+    Args:
+        project_root: Project root (default: current directory).
+        enabled: False to disable caching (e.g., --no-cache).
+
+    Returns:
+        Cache under .flowspec/cache/llm, or None if caching is disabled by
+        the argument or by FLOWSPEC_LLM_CACHE=0.
+    """
+    if not enabled or os.environ.get("FLOWSPEC_LLM_CACHE") == "0":
+        return None
+    root = Path(project_root) if project_root else Path.cwd()
+    return LLMResponseCache(root / DEFAULT_CACHE_DIR)
@@ -9,8 +9,13 @@ It does NOT make LLM API calls. Skills are invoked by AI tools consuming
 the MCP server.
 
 Architecture:
-    - Tools: Actions that can be invoked (scan, triage, fix)
-    - Resources: Queryable data (findings, status, config)
+    - Tools: Actions that can be invoked (scan, cancel, triage, fix, query)
+    - Resources: Queryable data (findings, status, config, scan history,
+      scan jobs)
+    - Scans run as background jobs on a worker pool, so the event loop
+      keeps serving requests while scanners run
+    - Findings are served from an indexed FindingsDB synced from
+      scan-results.json (see security/findings_db.py)
     - NO LLM CALLS: Server returns data and skill invocation instructions
 
 Security:
@@ -23,6 +28,7 @@ Reference: ADR-008 Security Scanner MCP Server Architecture
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -33,8 +39,18 @@ try:
 except ImportError:
     MCP_AVAILABLE = False
 
+from flowspec_cli.security.findings_db import (
+    DB_FILENAME,
+    DEFAULT_PAGE_SIZE,
+    FINDINGS_DIR,
+    SCAN_RESULTS_FILENAME,
+    FindingsDB,
+    file_stamp,
+)
 from flowspec_cli.security.models import Finding, Severity
 from flowspec_cli.security.orchestrator import ScannerOrchestrator
+from flowspec_cli.security.scan_jobs import JobStatus, ScanJob, ScanJobManager
+from flowspec_cli.security.adapters.base import CANCEL_EVENT
 from flowspec_cli.security.adapters.semgrep import SemgrepAdapter
 from flowspec_cli.security.adapters.discovery import ToolDiscovery
 
@@ -47,6 +63,11 @@ PROJECT_ROOT = Path(os.environ.get("PROJECT_ROOT", str(Path.cwd())))
 # See module docstring ("Resource limits") and ADR-008 for architecture details.
 MAX_FINDINGS = 10000
 
+# Scans run in the background: at most MAX_CONCURRENT_SCANS at once, with up
+# to MAX_PENDING_SCANS more queued; further scan requests are rejected.
+MAX_CONCURRENT_SCANS = 2
+MAX_PENDING_SCANS = 10
+
 # Valid values for input validation (whitelist)
 VALID_SCANNERS = frozenset({"semgrep", "codeql", "trivy", "bandit", "safety"})
 VALID_SEVERITIES = frozenset({"critical", "high", "medium", "low", "info"})
@@ -57,31 +78,85 @@ mcp = FastMCP("flowspec-security") if MCP_AVAILABLE else None
 # Initialize scanner orchestrator
 _orchestrator = None
 
+# Findings database (reopened if PROJECT_ROOT changes)
+_findings_db: FindingsDB | None = None
+
+# Background scan jobs
+_job_manager: ScanJobManager | None = None
+
+# Serializes scan jobs writing scan-results.json and recording the scan
+_results_lock = threading.Lock()
+
+
+def _create_orchestrator() -> ScannerOrchestrator:
+    """Create a scanner orchestrator with the available scanner adapters."""
+    discovery = ToolDiscovery()
+    adapters = []
+
+    # Add available scanner adapters
+    semgrep_adapter = SemgrepAdapter(discovery)
+    if semgrep_adapter.is_available():
+        adapters.append(semgrep_adapter)
+
+    return ScannerOrchestrator(adapters)
+
 
 def _get_orchestrator() -> ScannerOrchestrator:
-    """Get or create the scanner orchestrator (lazy initialization)."""
+    """Get or create the shared scanner orchestrator (lazy initialization).
+
+    Only used to list scanners; scan jobs each create their own
+    orchestrator, since it records per-scan state (failed_scanners).
+    """
     global _orchestrator
     if _orchestrator is None:
-        discovery = ToolDiscovery()
-        adapters = []
+        _orchestrator = _create_orchestrator()
 
-        # Add available scanner adapters
-        semgrep_adapter = SemgrepAdapter(discovery)
-        if semgrep_adapter.is_available():
-            adapters.append(semgrep_adapter)
+    return _orchestrator
 
-        _orchestrator = ScannerOrchestrator(adapters)
 
-    return _orchestrator
+def _get_job_manager() -> ScanJobManager:
+    """Get or create the scan job manager (lazy initialization)."""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = ScanJobManager(
+            max_concurrent=MAX_CONCURRENT_SCANS, max_pending=MAX_PENDING_SCANS
+        )
+    return _job_manager
 
 
 def _get_findings_dir() -> Path:
     """Get the findings directory, creating it if necessary."""
-    findings_dir = PROJECT_ROOT / "docs" / "security"
+    findings_dir = PROJECT_ROOT / FINDINGS_DIR
     findings_dir.mkdir(parents=True, exist_ok=True)
     return findings_dir
 
 
+def _get_findings_db() -> FindingsDB:
+    """Get the findings database for the current findings directory."""
+    global _findings_db
+    db_path = _get_findings_dir() / DB_FILENAME
+    if _findings_db is None or _findings_db.path != db_path:
+        if _findings_db is not None:
+            _findings_db.close()
+        _findings_db = FindingsDB(db_path)
+    return _findings_db
+
+
+def _load_findings_db() -> FindingsDB | None:
+    """Get the findings database, synced with scan-results.json.
+
+    Returns:
+        The database, or None if no scan results exist.
+    """
+    findings_file = _get_findings_dir() / SCAN_RESULTS_FILENAME
+    if not findings_file.exists():
+        return None
+
+    db = _get_findings_db()
+    db.sync_json(findings_file)
+    return db
+
+
 def _validate_path(user_path: str, base_dir: Path) -> Path:
     """Validate and resolve path within base directory.
 
@@ -171,6 +246,137 @@ def _validate_severities(severities: list[str] | None) -> list[str]:
     return severities
 
 
+def _run_scan(
+    job: ScanJob,
+    target: str,
+    target_path: Path,
+    validated_scanners: list[str],
+    validated_fail_on: list[str],
+) -> dict[str, Any]:
+    """Run a scan job on a worker thread (see security_scan).
+
+    Args:
+        job: Job to report progress to; stops when it is cancelled.
+        target: Target as given by the client.
+        target_path: Validated target path.
+        validated_scanners: Scanners to run.
+        validated_fail_on: Severity levels that cause failure.
+
+    Returns:
+        Scan results with findings count and output file location.
+
+    Raises:
+        JobCancelled: If the job was cancelled.
+        RuntimeError: If any scanner failed; the results are not saved.
+    """
+    # Run scan via orchestrator (subprocess execution). Duplicates are
+    # merged (highest severity wins), so findings arrive once every
+    # scanner has finished. Each job gets its own orchestrator: concurrent
+    # jobs would otherwise race on its failed_scanners.
+    orchestrator = _create_orchestrator()
+    config = {name: {CANCEL_EVENT: job.cancel_event} for name in validated_scanners}
+    stream = orchestrator.iter_scan(
+        target=target_path,
+        scanners=validated_scanners,
+        parallel=True,
+        deduplicate=True,
+        config=config,
+    )
+    findings: list[Finding] = []
+    truncated = False
+    try:
+        for finding in stream:
+            job.check_cancelled()
+            # Apply resource limit
+            if len(findings) >= MAX_FINDINGS:
+                truncated = True
+                break
+            findings.append(finding)
+            job.findings_count = len(findings)
+    finally:
+        getattr(stream, "close", lambda: None)()
+    job.check_cancelled()
+
+    # An incomplete scan must not replace the last results: recorded in
+    # the findings database, it would report every missing finding as fixed
+    if orchestrator.failed_scanners:
+        raise RuntimeError(
+            f"Scanners failed: {', '.join(orchestrator.failed_scanners)}"
+        )
+
+    findings_dir = _get_findings_dir()
+    findings_file = findings_dir / SCAN_RESULTS_FILENAME
+    findings_data = [f.to_dict() for f in findings]
+    metadata = {
+        "scanners_used": validated_scanners,
+        "total_count": len(findings),
+        "truncated": truncated,
+    }
+
+    with _results_lock:
+        # Save findings to JSON with secure permissions from creation:
+        # the temporary file is created with mode 0o600 (no chmod race)
+        # and atomically replaces the results, so readers never see a
+        # partial file
+        tmp_file = findings_dir / f".{SCAN_RESULTS_FILENAME}.{job.id}"
+        fd = os.open(
+            str(tmp_file),
+            os.O_CREAT | os.O_WRONLY | os.O_TRUNC,
+            0o600,
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "findings": findings_data,
+                        "metadata": metadata,
+                    },
+                    f,
+                    indent=2,
+                )
+            os.replace(tmp_file, findings_file)
+        except Exception:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+        # Record in the findings database (stamped so it is not re-imported)
+        db = _get_findings_db()
+        db.record_scan(
+            findings, metadata, str(findings_file), file_stamp(findings_file)
+        )
+        changes = db.diff().summary()
+
+    # Count by severity
+    by_severity = {
+        "critical": sum(1 for f in findings if f.severity == Severity.CRITICAL),
+        "high": sum(1 for f in findings if f.severity == Severity.HIGH),
+        "medium": sum(1 for f in findings if f.severity == Severity.MEDIUM),
+        "low": sum(1 for f in findings if f.severity == Severity.LOW),
+        "info": sum(1 for f in findings if f.severity == Severity.INFO),
+    }
+
+    # Determine if scan should fail based on fail_on severities
+    should_fail = any(by_severity.get(sev, 0) > 0 for sev in validated_fail_on)
+
+    return {
+        "findings_count": len(findings),
+        "by_severity": by_severity,
+        "should_fail": should_fail,
+        "fail_on": validated_fail_on,
+        "findings_file": str(findings_file.relative_to(PROJECT_ROOT)),
+        "truncated": truncated,
+        "changes": {
+            "new": changes["new"],
+            "fixed": changes["fixed"],
+            "persisting": changes["persisting"],
+        },
+        "metadata": {
+            "scanners_used": validated_scanners,
+            "target": target,
+        },
+    }
+
+
 # ============================================================================
 # TOOLS (Actions that can be invoked)
 # ============================================================================
@@ -183,19 +389,26 @@ if MCP_AVAILABLE:
         target: str = ".",
         scanners: list[str] | None = None,
         fail_on: list[str] | None = None,
+        wait: bool = False,
     ) -> dict[str, Any]:
-        """Run security scan on target directory.
+        """Start a security scan of a target directory.
 
         This tool orchestrates scanner execution via subprocess.
         NO LLM API CALLS.
 
+        The scan runs in the background: the tool returns a job id right
+        away, and progress and results are read from the
+        security://scans/jobs/{job_id} resource.
+
         Args:
             target: Directory to scan (default: current directory, relative paths only)
             scanners: List of scanners to run (default: all available)
             fail_on: Severity levels that cause failure (default: ["critical", "high"])
+            wait: Wait for the scan and return its results (default: False)
 
         Returns:
-            Scan results with findings count and output file location.
+            The scan job (or, with wait, scan results with findings count and
+            output file location).
         """
         # Validate target path (prevents path traversal)
         try:
@@ -238,75 +451,65 @@ if MCP_AVAILABLE:
                 "findings_count": 0,
             }
 
-        # Run scan via orchestrator (subprocess execution)
-        findings = orchestrator.scan(
-            target=target_path,
-            scanners=validated_scanners,
-            parallel=True,
-            deduplicate=True,
-        )
+        # Run the scan on a worker thread so other requests (including
+        # status polls) are served while it runs
+        manager = _get_job_manager()
+        try:
+            job = manager.submit(
+                lambda job: _run_scan(
+                    job, target, target_path, validated_scanners, validated_fail_on
+                ),
+                params={
+                    "target": target,
+                    "scanners": validated_scanners,
+                    "fail_on": validated_fail_on,
+                },
+            )
+        except RuntimeError as e:
+            return {
+                "error": "Scan limit reached",
+                "detail": str(e),
+                "findings_count": 0,
+            }
 
-        # Apply resource limit
-        truncated = False
-        if len(findings) > MAX_FINDINGS:
-            truncated = True
-            findings = findings[:MAX_FINDINGS]
+        if not wait:
+            return {
+                "job_id": job.id,
+                "status": job.status.value,
+                "status_resource": f"security://scans/jobs/{job.id}",
+                "instruction": (
+                    "Poll the status resource until status is completed, "
+                    "failed or cancelled; cancel with security_cancel_scan."
+                ),
+            }
 
-        # Save findings to JSON with secure permissions from creation
-        # Using os.open with O_CREAT|O_WRONLY|O_TRUNC and mode 0o600 ensures
-        # file is created with restrictive permissions atomically, avoiding
-        # race condition if chmod is called after file creation.
-        findings_dir = _get_findings_dir()
-        findings_file = findings_dir / "scan-results.json"
-        findings_data = [f.to_dict() for f in findings]
+        job = await manager.wait(job.id)
+        if job.status is not JobStatus.COMPLETED:
+            return {
+                "error": f"Scan {job.status.value}",
+                "detail": job.error,
+                "job_id": job.id,
+                "findings_count": 0,
+            }
+        return {"job_id": job.id, **job.result}
 
-        fd = os.open(
-            str(findings_file),
-            os.O_CREAT | os.O_WRONLY | os.O_TRUNC,
-            0o600,
-        )
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(
-                    {
-                        "findings": findings_data,
-                        "metadata": {
-                            "scanners_used": validated_scanners,
-                            "total_count": len(findings),
-                            "truncated": truncated,
-                        },
-                    },
-                    f,
-                    indent=2,
-                )
-        except Exception:
-            # fd is closed by os.fdopen even on error, but re-raise
-            raise
+    @mcp.tool()
+    async def security_cancel_scan(job_id: str) -> dict[str, Any]:
+        """Cancel a queued or running scan.
 
-        # Count by severity
-        by_severity = {
-            "critical": sum(1 for f in findings if f.severity == Severity.CRITICAL),
-            "high": sum(1 for f in findings if f.severity == Severity.HIGH),
-            "medium": sum(1 for f in findings if f.severity == Severity.MEDIUM),
-            "low": sum(1 for f in findings if f.severity == Severity.LOW),
-            "info": sum(1 for f in findings if f.severity == Severity.INFO),
-        }
+        Running scans stop once their scanner processes are killed; poll
+        the job's status resource to see when it is cancelled.
 
-        # Determine if scan should fail based on fail_on severities
-        should_fail = any(by_severity.get(sev, 0) > 0 for sev in validated_fail_on)
+        Args:
+            job_id: Job id returned by security_scan
 
-        return {
-            "findings_count": len(findings),
-            "by_severity": by_severity,
-            "should_fail": should_fail,
-            "fail_on": validated_fail_on,
-            "findings_file": str(findings_file.relative_to(PROJECT_ROOT)),
-            "truncated": truncated,
-            "metadata": {
-                "scanners_used": validated_scanners,
-                "target": target,
-            },
-        }
+        Returns:
+            The job's status.
+        """
+        job = _get_job_manager().cancel(job_id)
+        if job is None:
+            return {"error": f"Scan job {job_id} not found"}
+        return job.to_dict()
 
     @mcp.tool()
     async def security_triage(
@@ -326,7 +529,7 @@ if MCP_AVAILABLE:
         findings_dir = _get_findings_dir()
 
         if findings_file is None:
-            validated_path = findings_dir / "scan-results.json"
+            validated_path = findings_dir / SCAN_RESULTS_FILENAME
         else:
             # Validate user-provided path (prevents path traversal)
             try:
@@ -397,6 +600,56 @@ if MCP_AVAILABLE:
 
         return result
 
+    @mcp.tool()
+    async def security_query_findings(
+        severities: list[str] | None = None,
+        cwe_ids: list[str] | None = None,
+        file: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        scan_id: int | None = None,
+    ) -> dict[str, Any]:
+        """Query findings with filters and pagination.
+
+        Args:
+            severities: Only these severity levels (e.g., ["critical", "high"])
+            cwe_ids: Only these CWEs (e.g., ["CWE-89"])
+            file: Only findings in this file or directory (relative path)
+            limit: Page size (1 to MAX_FINDINGS, default: 100)
+            offset: Number of matching findings to skip
+            scan_id: Scan to query (default: latest, see security://scans)
+
+        Returns:
+            One page of findings with the total match count.
+        """
+        if severities is not None:
+            try:
+                _validate_severities(severities)
+            except ValueError as e:
+                return {"error": "Invalid severity levels", "detail": str(e)}
+        if not 1 <= limit <= MAX_FINDINGS or offset < 0:
+            return {
+                "error": "Invalid pagination",
+                "detail": f"limit must be 1-{MAX_FINDINGS} and offset >= 0",
+            }
+
+        db = _load_findings_db()
+        if db is None:
+            return {
+                "error": "Findings file not found",
+                "suggestion": "Run security_scan first to generate findings",
+            }
+
+        page = db.query(
+            scan_id=scan_id,
+            severities=severities,
+            cwe_ids=cwe_ids,
+            file=file,
+            limit=limit,
+            offset=offset,
+        )
+        return page.to_dict()
+
 
 # ============================================================================
 # RESOURCES (Queryable data)
@@ -412,21 +665,20 @@ if MCP_AVAILABLE:
         Returns:
             JSON string with list of findings.
 
-        Note: Filtering and limiting should be done by the client
-        after fetching all findings.
+        Note: Use the security_query_findings tool for filtered,
+        paginated queries.
         """
-        findings_dir = _get_findings_dir()
-        findings_file = findings_dir / "scan-results.json"
-
-        if not findings_file.exists():
+        db = _load_findings_db()
+        if db is None:
             return json.dumps([])
 
-        with findings_file.open() as f:
-            data = json.load(f)
-
-        findings = [Finding.from_dict(f) for f in data.get("findings", [])]
-
-        return json.dumps([f.to_dict() for f in findings], indent=2)
+        findings: list[dict] = []
+        while True:
+            page = db.query(limit=MAX_FINDINGS, offset=len(findings))
+            findings.extend(page.findings)
+            if not page.has_more or not page.findings:
+                break
+        return json.dumps(findings, indent=2)
 
     @mcp.resource("security://findings/{id}")
     async def get_finding(id: str) -> str:
@@ -438,22 +690,67 @@ if MCP_AVAILABLE:
         Returns:
             JSON string with finding details.
         """
-        findings_dir = _get_findings_dir()
-        findings_file = findings_dir / "scan-results.json"
-
-        if not findings_file.exists():
+        db = _load_findings_db()
+        if db is None:
             return json.dumps({"error": "Findings file not found"})
 
-        with findings_file.open() as f:
-            data = json.load(f)
-
-        # Find matching finding
-        for finding_data in data.get("findings", []):
-            if finding_data["id"] == id:
-                return json.dumps(finding_data, indent=2)
+        finding_data = db.get(id)
+        if finding_data is not None:
+            return json.dumps(finding_data, indent=2)
 
         return json.dumps({"error": f"Finding {id} not found"})
 
+    @mcp.resource("security://scans")
+    async def list_scans() -> str:
+        """List recent scans (newest first) for history queries.
+
+        Returns:
+            JSON string with scan ids, dates and finding counts.
+        """
+        db = _load_findings_db()
+        if db is None:
+            return json.dumps([])
+
+        return json.dumps([scan.to_dict() for scan in db.scans()], indent=2)
+
+    @mcp.resource("security://scans/jobs")
+    async def list_scan_jobs() -> str:
+        """List scan jobs (newest first) with their status and progress.
+
+        Returns:
+            JSON string with scan jobs.
+        """
+        jobs = _get_job_manager().list()
+        return json.dumps([job.to_dict() for job in jobs], indent=2)
+
+    @mcp.resource("security://scans/jobs/{job_id}")
+    async def get_scan_job(job_id: str) -> str:
+        """Get a scan job's status, progress and (once completed) results.
+
+        Args:
+            job_id: Job id returned by security_scan
+
+        Returns:
+            JSON string with job status.
+        """
+        job = _get_job_manager().get(job_id)
+        if job is None:
+            return json.dumps({"error": f"Scan job {job_id} not found"})
+        return json.dumps(job.to_dict(), indent=2)
+
+    @mcp.resource("security://scans/diff")
+    async def get_scan_diff() -> str:
+        """Compare the latest scan with the previous one.
+
+        Returns:
+            JSON string with new, fixed and persisting findings.
+        """
+        db = _load_findings_db()
+        if db is None:
+            return json.dumps({"error": "Findings file not found"})
+
+        return json.dumps(db.diff().to_dict(), indent=2)
+
     @mcp.resource("security://status")
     async def get_status() -> str:
         """Get overall security posture.
@@ -462,7 +759,6 @@ if MCP_AVAILABLE:
             JSON string with security status summary.
         """
         findings_dir = _get_findings_dir()
-        findings_file = findings_dir / "scan-results.json"
         triage_file = findings_dir / "triage-results.json"
 
         status = {
@@ -478,15 +774,10 @@ if MCP_AVAILABLE:
             "security_posture": "unknown",
         }
 
-        if findings_file.exists():
-            with findings_file.open() as f:
-                data = json.load(f)
-
-            findings = [Finding.from_dict(f) for f in data.get("findings", [])]
-            status["total_findings"] = len(findings)
-
-            for finding in findings:
-                status["by_severity"][finding.severity.value] += 1
+        db = _load_findings_db()
+        if db is not None:
+            status["by_severity"] = db.counts_by_severity()
+            status["total_findings"] = sum(status["by_severity"].values())
 
             # Calculate posture
             critical_count = status["by_severity"]["critical"]
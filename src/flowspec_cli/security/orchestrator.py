@@ -7,11 +7,28 @@ fingerprint-based deduplication.
 See ADR-005 for architectural decisions.
 """
 
+import queue
+import threading
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from flowspec_cli.security.adapters.base import ScannerAdapter
+from flowspec_cli.security.incremental import (
+    DEFAULT_STORE_PATH,
+    FindingsStore,
+    IncrementalScanResult,
+    build_manifest,
+    config_key,
+    git_changes,
+    git_head,
+    manifest_changes,
+)
 from flowspec_cli.security.models import Finding
+from flowspec_cli.security.streaming import deduplicate_stream
+
+# Findings buffered between scanner threads and the consumer in iter_scan()
+STREAM_QUEUE_SIZE = 1000
 
 
 class ScannerOrchestrator:
@@ -45,6 +62,7 @@ class ScannerOrchestrator:
             adapters: Optional list of pre-configured adapters.
         """
         self._adapters: dict[str, ScannerAdapter] = {}
+        self.failed_scanners: list[str] = []  # Scanners that failed last scan
 
         if adapters:
             for adapter in adapters:
@@ -76,6 +94,7 @@ class ScannerOrchestrator:
         parallel: bool = True,
         deduplicate: bool = True,
         config: dict | None = None,
+        files: list[Path] | None = None,
     ) -> list[Finding]:
         """Run scans and return aggregated findings.
 
@@ -91,6 +110,7 @@ class ScannerOrchestrator:
             parallel: Run scanners in parallel when safe (default: True).
             deduplicate: Remove duplicate findings by fingerprint (default: True).
             config: Scanner-specific configuration dict (optional).
+            files: Only scan these files under target (optional).
 
         Returns:
             List of findings, optionally deduplicated.
@@ -108,6 +128,86 @@ class ScannerOrchestrator:
             ...     config={"semgrep": {"rules": ["auto"]}}
             ... )
         """
+        active_adapters = self._active_adapters(target, scanners)
+
+        # Get scanner-specific configs
+        config = config or {}
+
+        # Execute scanners
+        self.failed_scanners = []
+        if files is not None and not files:
+            findings = []
+        elif parallel and len(active_adapters) > 1:
+            findings = self._scan_parallel(target, active_adapters, config, files)
+        else:
+            findings = self._scan_sequential(target, active_adapters, config, files)
+
+        # Deduplicate if requested
+        if deduplicate:
+            findings = self.deduplicate(findings)
+
+        return findings
+
+    def iter_scan(
+        self,
+        target: Path,
+        scanners: list[str] | None = None,
+        parallel: bool = True,
+        deduplicate: bool = True,
+        config: dict | None = None,
+    ) -> Iterator[Finding]:
+        """Run scans and yield findings as scanners produce them.
+
+        Streaming counterpart of scan() for large result sets: adapters
+        yield findings through ScannerAdapter.iter_scan(). Deduplication
+        merges duplicates like scan() does, so when it is enabled findings
+        are yielded once all scanners have finished (see
+        deduplicate_stream()).
+
+        Scanners are validated before this returns; scan failures are
+        reported as warnings and recorded in failed_scanners once the
+        iterator is exhausted.
+
+        Args:
+            target: Directory or file to scan.
+            scanners: List of scanner names to use (default: all registered).
+            parallel: Run scanners in parallel when safe (default: True).
+            deduplicate: Merge duplicate findings by fingerprint (default: True).
+            config: Scanner-specific configuration dict (optional).
+
+        Returns:
+            Iterator over findings.
+
+        Raises:
+            ValueError: If target does not exist or no scanners available.
+            RuntimeError: If required scanner is not registered or available.
+
+        Example:
+            >>> with open("findings.jsonl", "w") as f:
+            ...     JSONLinesExporter().write(orchestrator.iter_scan(target), f)
+        """
+        active_adapters = self._active_adapters(target, scanners)
+        config = config or {}
+        self.failed_scanners = []
+
+        if parallel and len(active_adapters) > 1:
+            findings = self._iter_parallel(target, active_adapters, config)
+        else:
+            findings = self._iter_sequential(target, active_adapters, config)
+
+        if deduplicate:
+            findings = deduplicate_stream(findings)
+        return findings
+
+    def _active_adapters(
+        self, target: Path, scanners: list[str] | None
+    ) -> list[ScannerAdapter]:
+        """Validate the target and get the adapters to run.
+
+        Raises:
+            ValueError: If target does not exist or no scanners available.
+            RuntimeError: If required scanner is not registered or available.
+        """
         if not target.exists():
             msg = f"Target path does not exist: {target}"
             raise ValueError(msg)
@@ -137,26 +237,92 @@ class ScannerOrchestrator:
             msg = "No available scanners found"
             raise ValueError(msg)
 
-        # Get scanner-specific configs
-        config = config or {}
+        return active_adapters
 
-        # Execute scanners
-        if parallel and len(active_adapters) > 1:
-            findings = self._scan_parallel(target, active_adapters, config)
-        else:
-            findings = self._scan_sequential(target, active_adapters, config)
+    def _iter_sequential(
+        self,
+        target: Path,
+        adapters: list[ScannerAdapter],
+        config: dict,
+    ) -> Iterator[Finding]:
+        """Stream findings from each scanner in turn."""
+        for adapter in adapters:
+            scanner_config = config.get(adapter.name, {})
+            try:
+                yield from adapter.iter_scan(target, scanner_config)
+            except Exception as e:
+                # Log error but continue with other scanners
+                self.failed_scanners.append(adapter.name)
+                print(f"Warning: {adapter.name} scan failed: {e}")
 
-        # Deduplicate if requested
-        if deduplicate:
-            findings = self.deduplicate(findings)
+    def _iter_parallel(
+        self,
+        target: Path,
+        adapters: list[ScannerAdapter],
+        config: dict,
+    ) -> Iterator[Finding]:
+        """Stream findings from all scanners running concurrently.
 
-        return findings
+        Each scanner runs on its own thread and feeds a bounded queue, so
+        a slow consumer (e.g., an exporter writing to disk) applies
+        backpressure instead of letting findings pile up in memory.
+        """
+        results: queue.Queue = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        done = object()
+
+        def put(item: object) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(adapter: ScannerAdapter) -> None:
+            scanner_config = config.get(adapter.name, {})
+            findings = None
+            try:
+                findings = adapter.iter_scan(target, scanner_config)
+                for finding in findings:
+                    if not put(finding):
+                        return
+            except Exception as e:
+                # Log error but continue with other scanners
+                self.failed_scanners.append(adapter.name)
+                print(f"Warning: {adapter.name} scan failed: {e}")
+            finally:
+                # Close early-stopped scans so scanners clean up (e.g., kill
+                # their subprocess)
+                getattr(findings, "close", lambda: None)()
+                put(done)
+
+        threads = [
+            threading.Thread(target=produce, args=(adapter,), daemon=True)
+            for adapter in adapters
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            remaining = len(threads)
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            # Unblock producers if the consumer stopped early
+            stop.set()
 
     def _scan_sequential(
         self,
         target: Path,
         adapters: list[ScannerAdapter],
         config: dict,
+        files: list[Path] | None = None,
     ) -> list[Finding]:
         """Run scanners sequentially.
 
@@ -164,6 +330,7 @@ class ScannerOrchestrator:
             target: Directory or file to scan.
             adapters: List of scanner adapters to execute.
             config: Scanner-specific configuration.
+            files: Only scan these files (optional).
 
         Returns:
             Aggregated list of findings from all scanners.
@@ -173,10 +340,14 @@ class ScannerOrchestrator:
         for adapter in adapters:
             scanner_config = config.get(adapter.name, {})
             try:
-                results = adapter.scan(target, scanner_config)
+                if files is None:
+                    results = adapter.scan(target, scanner_config)
+                else:
+                    results = adapter.scan_files(files, scanner_config)
                 findings.extend(results)
             except Exception as e:
                 # Log error but continue with other scanners
+                self.failed_scanners.append(adapter.name)
                 print(f"Warning: {adapter.name} scan failed: {e}")
 
         return findings
@@ -186,6 +357,7 @@ class ScannerOrchestrator:
         target: Path,
         adapters: list[ScannerAdapter],
         config: dict,
+        files: list[Path] | None = None,
     ) -> list[Finding]:
         """Run scanners in parallel.
 
@@ -196,6 +368,7 @@ class ScannerOrchestrator:
             target: Directory or file to scan.
             adapters: List of scanner adapters to execute.
             config: Scanner-specific configuration.
+            files: Only scan these files (optional).
 
         Returns:
             Aggregated list of findings from all scanners.
@@ -207,7 +380,10 @@ class ScannerOrchestrator:
             futures = {}
             for adapter in adapters:
                 scanner_config = config.get(adapter.name, {})
-                future = executor.submit(adapter.scan, target, scanner_config)
+                if files is None:
+                    future = executor.submit(adapter.scan, target, scanner_config)
+                else:
+                    future = executor.submit(adapter.scan_files, files, scanner_config)
                 futures[future] = adapter
 
             # Collect results as they complete
@@ -218,10 +394,125 @@ class ScannerOrchestrator:
                     findings.extend(results)
                 except Exception as e:
                     # Log error but continue with other scanners
+                    self.failed_scanners.append(adapter.name)
                     print(f"Warning: {adapter.name} scan failed: {e}")
 
         return findings
 
+    def scan_incremental(
+        self,
+        target: Path,
+        scanners: list[str] | None = None,
+        parallel: bool = True,
+        config: dict | None = None,
+        baseline_ref: str | None = None,
+        store_path: Path | None = None,
+    ) -> IncrementalScanResult:
+        """Scan only files changed since the last scan.
+
+        Changed files are found with ``git diff`` against the commit of the
+        last full scan, or, outside git, by comparing a content-hash
+        manifest. Files that differ from baseline_ref are rescanned as well.
+        Only those files are passed to the adapters; stored findings for
+        untouched files are merged in. Without a usable baseline (first run,
+        the scanners or config changed, or baseline_ref cannot be resolved),
+        a full scan runs and becomes the baseline.
+
+        Args:
+            target: Directory to scan.
+            scanners: List of scanner names to use (default: all registered).
+            parallel: Run scanners in parallel when safe (default: True).
+            config: Scanner-specific configuration dict (optional).
+            baseline_ref: Git ref whose differences are rescanned in addition
+                to changes since the last scan (optional).
+            store_path: Findings store file
+                (default: <target>/.flowspec/security/findings-store.json).
+
+        Returns:
+            Deduplicated findings for the whole tree, plus change details.
+
+        Raises:
+            ValueError: If target is not a directory or no scanners available.
+            RuntimeError: If required scanner is not registered or available.
+
+        Example:
+            >>> result = orchestrator.scan_incremental(
+            ...     Path("."), scanners=["semgrep"], baseline_ref="origin/main"
+            ... )
+            >>> print(f"Rescanned {len(result.changed_files)} files")
+        """
+        if not target.is_dir():
+            msg = f"Incremental scan target must be a directory: {target}"
+            raise ValueError(msg)
+
+        root = target.resolve()
+        scanner_names = scanners or list(self._adapters.keys())
+        config = config or {}
+        store = FindingsStore.load(store_path or root / DEFAULT_STORE_PATH)
+        key = config_key(scanner_names, config)
+
+        head = git_head(root)
+        manifest = None
+        changes = None
+        if store.has_baseline and store.config_key == key:
+            if head is not None and store.commit is not None:
+                # Stored findings describe store.commit plus pending files
+                changes = git_changes(root, store.commit)
+                if changes is not None:
+                    # Files rescanned since the baseline may have been reverted
+                    changes.include(root, store.pending)
+            if changes is None and store.manifest:
+                manifest = build_manifest(root, store.manifest)
+                changes = manifest_changes(store.manifest, manifest)
+            if changes is not None and baseline_ref is not None:
+                # Also rescan everything that differs from the requested ref
+                ref_changes = git_changes(root, baseline_ref) if head else None
+                if ref_changes is None:
+                    changes = manifest = None
+                else:
+                    changes.include(root, ref_changes.files)
+
+        if changes is None:
+            findings = self.scan(
+                target, scanners, parallel, deduplicate=False, config=config
+            )
+            if not self.failed_scanners:
+                store.replace(None, findings, root)
+                store.config_key = key
+                store.commit = head
+                store.pending = set()
+                store.manifest = build_manifest(root) if head is None else {}
+                store.save()
+            return IncrementalScanResult(
+                findings=self.deduplicate(findings), full_scan=True
+            )
+
+        changed = sorted(changes.changed)
+        findings = self.scan(
+            target,
+            scanners,
+            parallel,
+            deduplicate=False,
+            config=config,
+            files=[target / relative for relative in changed],
+        )
+        reused = store.findings(exclude=changes.files)
+        if not self.failed_scanners:
+            store.replace(changes.files, findings, root)
+            if manifest is not None:
+                store.manifest = manifest
+            else:
+                store.pending = changes.files
+            store.save()
+
+        return IncrementalScanResult(
+            findings=self.deduplicate(reused + findings),
+            full_scan=False,
+            changed_files=changed,
+            deleted_files=sorted(changes.deleted),
+            reused_findings=len(reused),
+        )
+
     def deduplicate(self, findings: list[Finding]) -> list[Finding]:
         """Remove duplicate findings using fingerprint-based matching.
 
@@ -0,0 +1,135 @@
+"""Single-pass aggregation of findings for audit reports.
+
+Report generation used to walk the findings once per question: once per
+severity for the summary, once per OWASP category for compliance, and
+again (after a full sort) for remediations. aggregate_findings() makes a
+single pass and collects everything the report needs:
+
+- Severity, triage, CWE and file histograms
+- Per-OWASP-category finding and critical counts via the CWE_TO_OWASP index
+- The highest-severity remediation candidates, bucketed by severity so no
+  sort over all findings is needed
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flowspec_cli.security.reporter.models import FindingSummary, OWASPCategory
+from flowspec_cli.security.reporter.owasp import CWE_TO_OWASP, compliance_from_counts
+
+# Remediation order (critical first); unknown severities sort last
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+UNKNOWN_SEVERITY_RANK = len(SEVERITY_ORDER)
+
+
+@dataclass
+class FindingAggregates:
+    """Histograms and remediation candidates collected from findings.
+
+    Attributes:
+        total: Number of findings.
+        by_severity: Findings per severity value.
+        by_triage: Findings per triage outcome (true_positive,
+            false_positive, needs_investigation).
+        by_cwe: Findings per CWE id.
+        by_file: Findings per file path.
+        owasp_findings: Non-FP findings per OWASP category id.
+        owasp_critical: Non-FP critical findings per OWASP category id.
+        remediation_candidates: Findings to remediate, highest severity
+            first, at most max_remediations of them.
+    """
+
+    total: int = 0
+    by_severity: Counter[str] = field(default_factory=Counter)
+    by_triage: Counter[str] = field(default_factory=Counter)
+    by_cwe: Counter[str] = field(default_factory=Counter)
+    by_file: Counter[str] = field(default_factory=Counter)
+    owasp_findings: Counter[str] = field(default_factory=Counter)
+    owasp_critical: Counter[str] = field(default_factory=Counter)
+    remediation_candidates: list = field(default_factory=list)
+
+    def summary(self) -> FindingSummary:
+        """Build the report's findings summary."""
+        return FindingSummary(
+            total=self.total,
+            critical=self.by_severity["critical"],
+            high=self.by_severity["high"],
+            medium=self.by_severity["medium"],
+            low=self.by_severity["low"],
+            info=self.by_severity["info"],
+            true_positives=self.by_triage["true_positive"],
+            false_positives=self.by_triage["false_positive"],
+            needs_investigation=self.by_triage["needs_investigation"],
+        )
+
+    def owasp_compliance(self) -> list[OWASPCategory]:
+        """Build OWASP Top 10 compliance from the category counts."""
+        return compliance_from_counts(self.owasp_findings, self.owasp_critical)
+
+
+def aggregate_findings(
+    findings: list,
+    triage_map: dict | None = None,
+    include_false_positives: bool = False,
+    max_remediations: int = 10,
+) -> FindingAggregates:
+    """Aggregate findings in a single pass.
+
+    Args:
+        findings: List of security findings.
+        triage_map: Triage results keyed by finding id.
+        include_false_positives: Keep FPs as remediation candidates.
+        max_remediations: Maximum remediation candidates to keep.
+
+    Returns:
+        FindingAggregates for the findings.
+    """
+    triage_map = triage_map or {}
+    aggregates = FindingAggregates()
+
+    # One bucket per severity rank; each only needs max_remediations entries
+    buckets: list[list] = [[] for _ in range(UNKNOWN_SEVERITY_RANK + 1)]
+
+    for finding in findings:
+        aggregates.total += 1
+        severity = finding.severity.value
+        aggregates.by_severity[severity] += 1
+
+        if finding.cwe_id:
+            aggregates.by_cwe[finding.cwe_id] += 1
+
+        location = getattr(finding, "location", None)
+        if location is not None:
+            aggregates.by_file[Path(location.file).as_posix()] += 1
+
+        triage = triage_map.get(finding.id)
+        if triage is None:
+            outcome = "needs_investigation"  # Untriaged = needs investigation
+        elif triage.classification.value == "TP":
+            outcome = "true_positive"
+        elif triage.classification.value == "FP":
+            outcome = "false_positive"
+        else:
+            outcome = "needs_investigation"
+        aggregates.by_triage[outcome] += 1
+
+        is_false_positive = outcome == "false_positive"
+        if not is_false_positive:
+            definition = CWE_TO_OWASP.get(finding.cwe_id)
+            if definition is not None:
+                aggregates.owasp_findings[definition.id] += 1
+                if severity == "critical":
+                    aggregates.owasp_critical[definition.id] += 1
+
+        if is_false_positive and not include_false_positives:
+            continue
+        bucket = buckets[SEVERITY_ORDER.get(severity, UNKNOWN_SEVERITY_RANK)]
+        if len(bucket) < max_remediations:
+            bucket.append(finding)
+
+    for bucket in buckets:
+        aggregates.remediation_candidates.extend(bucket)
+    del aggregates.remediation_candidates[max_remediations:]
+
+    return aggregates
@@ -6,7 +6,6 @@ scan and triage results in multiple output formats.
 
 import html
 import json
-import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,7 +17,32 @@ from flowspec_cli.security.reporter.models import (
     Remediation,
     SecurityPosture,
 )
-from flowspec_cli.security.reporter.owasp import check_owasp_compliance
+from flowspec_cli.security.reporter.aggregation import aggregate_findings
+
+
+# Estimated remediation effort by severity
+EFFORT_MAP = {
+    "critical": "4-8 hours",
+    "high": "2-4 hours",
+    "medium": "1-2 hours",
+    "low": "30 min - 1 hour",
+    "info": "15-30 min",
+}
+
+# Rows shown in the CWE and file breakdown tables
+MAX_BREAKDOWN_ROWS = 10
+
+POSTURE_EMOJI = {
+    SecurityPosture.SECURE: "🟢",
+    SecurityPosture.CONDITIONAL: "🟡",
+    SecurityPosture.AT_RISK: "🔴",
+}
+
+STATUS_ICON = {
+    "compliant": "✅",
+    "partial": "⚠️",
+    "non_compliant": "❌",
+}
 
 
 @dataclass
@@ -69,14 +93,16 @@ class ReportGenerator:
             for result in triage_results:
                 triage_map[result.finding_id] = result
 
-        # Calculate summary
-        summary = self._calculate_summary(findings, triage_map)
-
-        # Check OWASP compliance
-        owasp_compliance = check_owasp_compliance(findings, triage_results)
-
-        # Generate remediations
-        remediations = self._generate_remediations(findings, triage_map)
+        # Collect everything the report needs in one pass over the findings
+        aggregates = aggregate_findings(
+            findings,
+            triage_map,
+            include_false_positives=self.config.include_false_positives,
+            max_remediations=self.config.max_remediations,
+        )
+        summary = aggregates.summary()
+        owasp_compliance = aggregates.owasp_compliance()
+        remediations = self._generate_remediations(aggregates.remediation_candidates)
 
         # Determine security posture
         posture = self._determine_posture(summary, owasp_compliance)
@@ -90,48 +116,8 @@ class ReportGenerator:
             remediations=remediations,
             scanners_used=scanners or [],
             files_scanned=files_scanned,
-        )
-
-    def _calculate_summary(
-        self, findings: list[Finding], triage_map: dict
-    ) -> FindingSummary:
-        """Calculate findings summary."""
-        total = len(findings)
-
-        # Count by severity
-        critical = sum(1 for f in findings if f.severity.value == "critical")
-        high = sum(1 for f in findings if f.severity.value == "high")
-        medium = sum(1 for f in findings if f.severity.value == "medium")
-        low = sum(1 for f in findings if f.severity.value == "low")
-        info = sum(1 for f in findings if f.severity.value == "info")
-
-        # Count by triage status
-        true_positives = 0
-        false_positives = 0
-        needs_investigation = 0
-
-        for finding in findings:
-            triage = triage_map.get(finding.id)
-            if triage:
-                if triage.classification.value == "TP":
-                    true_positives += 1
-                elif triage.classification.value == "FP":
-                    false_positives += 1
-                else:
-                    needs_investigation += 1
-            else:
-                needs_investigation += 1  # Untriaged = needs investigation
-
-        return FindingSummary(
-            total=total,
-            critical=critical,
-            high=high,
-            medium=medium,
-            low=low,
-            info=info,
-            true_positives=true_positives,
-            false_positives=false_positives,
-            needs_investigation=needs_investigation,
+            cwe_counts=dict(aggregates.by_cwe.most_common()),
+            file_counts=dict(aggregates.by_file.most_common()),
         )
 
     def _determine_posture(
@@ -158,66 +144,28 @@ class ReportGenerator:
 
         return SecurityPosture.CONDITIONAL
 
-    def _generate_remediations(
-        self, findings: list[Finding], triage_map: dict
-    ) -> list[Remediation]:
-        """Generate prioritized remediation recommendations."""
-        remediations = []
-        priority = 1
-
-        # Sort findings by severity (critical first)
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
-        sorted_findings = sorted(
-            findings, key=lambda f: severity_order.get(f.severity.value, 5)
-        )
-
-        for finding in sorted_findings:
-            # Skip false positives unless explicitly included via config
-            triage = triage_map.get(finding.id)
-            if triage and triage.classification.value == "FP":
-                if not self.config.include_false_positives:
-                    continue
-
-            # Estimate effort based on severity
-            effort_map = {
-                "critical": "4-8 hours",
-                "high": "2-4 hours",
-                "medium": "1-2 hours",
-                "low": "30 min - 1 hour",
-                "info": "15-30 min",
-            }
-
-            remediation = Remediation(
+    def _generate_remediations(self, candidates: list[Finding]) -> list[Remediation]:
+        """Generate remediation recommendations from prioritized findings."""
+        return [
+            Remediation(
                 finding_id=finding.id,
                 priority=priority,
                 title=finding.title,
                 description=finding.description,
                 fix_guidance=finding.remediation or "Review and fix the vulnerability",
-                estimated_effort=effort_map.get(finding.severity.value, "1 hour"),
+                estimated_effort=EFFORT_MAP.get(finding.severity.value, "1 hour"),
                 cwe_id=finding.cwe_id,
             )
-
-            remediations.append(remediation)
-            priority += 1
-
-            if len(remediations) >= self.config.max_remediations:
-                break
-
-        return remediations
+            for priority, finding in enumerate(candidates, 1)
+        ]
 
     def to_markdown(self, report: AuditReport) -> str:
         """Generate markdown report."""
-        posture_emoji = {
-            SecurityPosture.SECURE: "🟢",
-            SecurityPosture.CONDITIONAL: "🟡",
-            SecurityPosture.AT_RISK: "🔴",
-        }
-
         md = f"""# Security Audit Report
 
 **Project:** {report.project_name}
 **Date:** {report.scan_date.strftime("%Y-%m-%d %H:%M")}
-**Posture:** {posture_emoji.get(report.posture, "")} {report.posture.value.replace("_", " ").title()}
+**Posture:** {POSTURE_EMOJI.get(report.posture, "")} {report.posture.value.replace("_", " ").title()}
 **Compliance Score:** {report.compliance_score}%
 
 ## Executive Summary
@@ -239,12 +187,7 @@ class ReportGenerator:
 |----------|--------|----------|----------|
 """
         for cat in report.owasp_compliance:
-            status_icon = {
-                "compliant": "✅",
-                "partial": "⚠️",
-                "non_compliant": "❌",
-            }
-            md += f"| {cat.id} - {cat.name} | {status_icon.get(cat.status.value, '')} | {cat.finding_count} | {cat.critical_count} |\n"
+            md += f"| {cat.id} - {cat.name} | {STATUS_ICON.get(cat.status.value, '')} | {cat.finding_count} | {cat.critical_count} |\n"
 
         md += """
 ## Top Remediation Priorities
@@ -263,6 +206,16 @@ class ReportGenerator:
 
 """
 
+        for title, label, counts in self._breakdowns(report):
+            md += f"""
+## {title}
+
+| {label} | Findings |
+|{"-" * (len(label) + 2)}|----------|
+"""
+            for key, count in counts:
+                md += f"| {key} | {count} |\n"
+
         md += f"""
 ## Scanners Used
 
@@ -275,12 +228,26 @@ class ReportGenerator:
 
         return md
 
+    def _breakdowns(self, report: AuditReport) -> list[tuple[str, str, list]]:
+        """Get the non-empty CWE and file breakdown tables."""
+        breakdowns = [
+            ("Findings by CWE", "CWE", report.cwe_counts),
+            ("Most Affected Files", "File", report.file_counts),
+        ]
+        return [
+            (title, label, list(counts.items())[:MAX_BREAKDOWN_ROWS])
+            for title, label, counts in breakdowns
+            if counts
+        ]
+
     def to_html(self, report: AuditReport) -> str:
-        """Generate HTML report with proper markdown conversion."""
-        markdown_content = self.to_markdown(report)
+        """Generate HTML report.
 
-        # Convert markdown to HTML
-        html_content = self._markdown_to_html(markdown_content)
+        The body is rendered from the report directly rather than by
+        converting the markdown report.
+        """
+        html_content = self._html_body(report)
+        project_name = html.escape(report.project_name)
 
         # HTML wrapper with styling
         html_output = f"""<!DOCTYPE html>
@@ -288,7 +255,7 @@ class ReportGenerator:
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Security Audit Report - {report.project_name}</title>
+    <title>Security Audit Report - {project_name}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
@@ -330,71 +297,90 @@ class ReportGenerator:
 """
         return html_output
 
-    def _markdown_to_html(self, md: str) -> str:
-        """Convert markdown to HTML.
+    def _html_body(self, report: AuditReport) -> str:
+        """Render the report body as HTML."""
+        esc = html.escape
+        posture = report.posture.value
+        posture_label = posture.replace("_", " ").title()
+        summary = report.summary
+
+        lines = [
+            "<h1>Security Audit Report</h1>",
+            f"<p><strong>Project:</strong> {esc(report.project_name)}</p>",
+            f"<p><strong>Date:</strong> {report.scan_date.strftime('%Y-%m-%d %H:%M')}</p>",
+            f'<p><strong>Posture:</strong> <span class="posture-{posture.replace("_", "-")}">'
+            f"{POSTURE_EMOJI.get(report.posture, '')} {posture_label}</span></p>",
+            f"<p><strong>Compliance Score:</strong> {report.compliance_score}%</p>",
+            "<h2>Executive Summary</h2>",
+            self._html_table(
+                ["Metric", "Value"],
+                [
+                    ["Total Findings", summary.total],
+                    ["Critical", summary.critical],
+                    ["High", summary.high],
+                    ["Medium", summary.medium],
+                    ["Low", summary.low],
+                    ["True Positives", summary.true_positives],
+                    ["False Positives", summary.false_positives],
+                    ["Files Scanned", report.files_scanned],
+                ],
+            ),
+            "<h2>OWASP Top 10 Compliance</h2>",
+            self._html_table(
+                ["Category", "Status", "Findings", "Critical"],
+                [
+                    [
+                        f"{cat.id} - {cat.name}",
+                        STATUS_ICON.get(cat.status.value, ""),
+                        cat.finding_count,
+                        cat.critical_count,
+                    ]
+                    for cat in report.owasp_compliance
+                ],
+            ),
+            "<h2>Top Remediation Priorities</h2>",
+        ]
 
-        Handles the specific markdown patterns used in security reports:
-        - Headers (h1, h2, h3)
-        - Tables
-        - Bold text
-        - Horizontal rules
-        - Paragraphs
-        """
-        lines = md.split("\n")
-        html_lines = []
-        in_table = False
-        in_table_header = False
-
-        for line in lines:
-            # Escape HTML entities first (except for our formatting)
-            escaped = html.escape(line)
-
-            # Headers
-            if escaped.startswith("### "):
-                html_lines.append(f"<h3>{escaped[4:]}</h3>")
-            elif escaped.startswith("## "):
-                html_lines.append(f"<h2>{escaped[3:]}</h2>")
-            elif escaped.startswith("# "):
-                html_lines.append(f"<h1>{escaped[2:]}</h1>")
-            # Horizontal rule
-            elif escaped.strip() == "---":
-                html_lines.append("<hr>")
-            # Table rows
-            elif escaped.startswith("|"):
-                if not in_table:
-                    html_lines.append("<table>")
-                    in_table = True
-                    in_table_header = True
-
-                # Skip separator rows (|---|---|)
-                if re.match(r"^\|[\s\-:|]+\|$", escaped):
-                    continue
-
-                cells = [c.strip() for c in escaped.split("|")[1:-1]]
-                if in_table_header:
-                    row = "<tr>" + "".join(f"<th>{c}</th>" for c in cells) + "</tr>"
-                    in_table_header = False
-                else:
-                    row = "<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>"
-                html_lines.append(row)
-            else:
-                # Close table if we were in one
-                if in_table:
-                    html_lines.append("</table>")
-                    in_table = False
-
-                # Bold text (**text**)
-                escaped = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", escaped)
-
-                # Non-empty paragraph
-                if escaped.strip():
-                    html_lines.append(f"<p>{escaped}</p>")
-
-        # Close any open table
-        if in_table:
-            html_lines.append("</table>")
-
-        return "\n".join(html_lines)
+        for i, rem in enumerate(report.top_remediations, 1):
+            lines += [
+                f"<h3>{i}. {esc(rem.title)}</h3>",
+                f"<p><strong>Priority:</strong> P{rem.priority} | "
+                f"<strong>CWE:</strong> {esc(rem.cwe_id or 'N/A')} | "
+                f"<strong>Effort:</strong> {esc(rem.estimated_effort)}</p>",
+                f"<p>{esc(rem.description)}</p>",
+                f"<p><strong>Fix Guidance:</strong> {esc(rem.fix_guidance)}</p>",
+                "<hr>",
+            ]
+
+        for title, label, counts in self._breakdowns(report):
+            lines += [
+                f"<h2>{title}</h2>",
+                self._html_table([label, "Findings"], counts),
+            ]
+
+        scanners = ", ".join(report.scanners_used) or "None specified"
+        lines += [
+            "<h2>Scanners Used</h2>",
+            f"<p>{esc(scanners)}</p>",
+            "<hr>",
+            "<p><em>Report generated by Flowspec Security Audit</em></p>",
+        ]
+        return "\n".join(lines)
+
+    def _html_table(self, headers: list[str], rows: list) -> str:
+        """Render an HTML table, escaping every cell."""
+        lines = ["<table>"]
+        lines.append(
+            "<tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in headers) + "</tr>"
+        )
+        for row in rows:
+            lines.append(
+                "<tr>"
+                + "".join(f"<td>{html.escape(str(c))}</td>" for c in row)
+                + "</tr>"
+            )
+        lines.append("</table>")
+        return "\n".join(lines)
 
     def to_json(self, report: AuditReport) -> str:
         """Generate JSON report."""
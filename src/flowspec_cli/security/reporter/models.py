@@ -125,6 +125,8 @@ class AuditReport:
     scanners_used: list[str]
     files_scanned: int
     metadata: dict = field(default_factory=dict)
+    cwe_counts: dict[str, int] = field(default_factory=dict)
+    file_counts: dict[str, int] = field(default_factory=dict)
 
     @property
     def compliance_score(self) -> float:
@@ -161,4 +163,6 @@ class AuditReport:
             "scanners_used": self.scanners_used,
             "files_scanned": self.files_scanned,
             "metadata": self.metadata,
+            "cwe_counts": self.cwe_counts,
+            "file_counts": self.file_counts,
         }
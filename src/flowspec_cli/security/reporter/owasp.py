@@ -4,6 +4,8 @@ This module provides the OWASP Top 10 categories with their
 associated CWEs for compliance checking.
 """
 
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from flowspec_cli.security.reporter.models import (
@@ -291,49 +293,34 @@ OWASP_TOP_10: list[OWASPDefinition] = [
 ]
 
 
+# Inverted index: CWE -> OWASP category (first listed category wins)
+CWE_TO_OWASP: dict[str, OWASPDefinition] = {
+    cwe: definition for definition in reversed(OWASP_TOP_10) for cwe in definition.cwes
+}
+
+
 def get_owasp_category(cwe_id: str) -> OWASPDefinition | None:
     """Get OWASP category for a CWE."""
-    for category in OWASP_TOP_10:
-        if cwe_id in category.cwes:
-            return category
-    return None
+    return CWE_TO_OWASP.get(cwe_id)
 
 
-def check_owasp_compliance(
-    findings: list, triage_results: list | None = None
+def compliance_from_counts(
+    finding_counts: Mapping[str, int], critical_counts: Mapping[str, int]
 ) -> list[OWASPCategory]:
-    """Check OWASP Top 10 compliance based on findings.
+    """Build OWASP Top 10 compliance from per-category counts.
 
     Args:
-        findings: List of security findings.
-        triage_results: Optional triage results for filtering FPs.
+        finding_counts: Findings per OWASP category id (FPs excluded).
+        critical_counts: Critical findings per OWASP category id.
 
     Returns:
-        List of OWASPCategory with compliance status.
+        List of OWASPCategory with compliance status, in Top 10 order.
     """
-    # Build triage lookup
-    triage_map = {}
-    if triage_results:
-        for result in triage_results:
-            triage_map[result.finding_id] = result
-
     results = []
 
     for definition in OWASP_TOP_10:
-        # Count findings for this OWASP category
-        category_findings = []
-        for finding in findings:
-            if finding.cwe_id in definition.cwes:
-                # Skip false positives if triage available
-                triage = triage_map.get(finding.id)
-                if triage and triage.classification.value == "FP":
-                    continue
-                category_findings.append(finding)
-
-        finding_count = len(category_findings)
-        critical_count = sum(
-            1 for f in category_findings if f.severity.value == "critical"
-        )
+        finding_count = finding_counts.get(definition.id, 0)
+        critical_count = critical_counts.get(definition.id, 0)
 
         # Determine compliance status
         if finding_count == 0:
@@ -355,3 +342,41 @@ def check_owasp_compliance(
         )
 
     return results
+
+
+def check_owasp_compliance(
+    findings: list, triage_results: list | None = None
+) -> list[OWASPCategory]:
+    """Check OWASP Top 10 compliance based on findings.
+
+    Args:
+        findings: List of security findings.
+        triage_results: Optional triage results for filtering FPs.
+
+    Returns:
+        List of OWASPCategory with compliance status.
+    """
+    # Build triage lookup
+    triage_map = {}
+    if triage_results:
+        for result in triage_results:
+            triage_map[result.finding_id] = result
+
+    # Count findings per category in one pass over the findings
+    finding_counts: Counter[str] = Counter()
+    critical_counts: Counter[str] = Counter()
+    for finding in findings:
+        definition = CWE_TO_OWASP.get(finding.cwe_id)
+        if definition is None:
+            continue
+
+        # Skip false positives if triage available
+        triage = triage_map.get(finding.id)
+        if triage and triage.classification.value == "FP":
+            continue
+
+        finding_counts[definition.id] += 1
+        if finding.severity.value == "critical":
+            critical_counts[definition.id] += 1
+
+    return compliance_from_counts(finding_counts, critical_counts)
@@ -0,0 +1,257 @@
+"""Background scan jobs for the security MCP server.
+
+Scans take minutes, and running them on the MCP server's event loop
+stalled every other request (including status polls) until they
+finished. ScanJobManager runs scans on a small thread pool instead:
+
+- submit() returns a ScanJob immediately; its status, progress and result
+  can be polled while the scan runs
+- At most max_concurrent scans run at once; up to max_pending more wait
+  in the queue, and further submissions are rejected
+- cancel() drops queued jobs and asks running ones to stop through a
+  cancel event passed to the scanners (see CANCEL_EVENT)
+
+The work itself is a callable run on the worker thread, so the manager
+does not depend on how scan results are stored.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+# Default limits
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_MAX_PENDING = 10
+
+# Finished jobs kept for status queries
+DEFAULT_MAX_HISTORY = 50
+
+
+class JobStatus(Enum):
+    """Lifecycle state of a scan job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised by job work to stop early after cancellation."""
+
+
+@dataclass
+class ScanJob:
+    """A scan submitted to ScanJobManager.
+
+    Attributes:
+        id: Job identifier.
+        params: Parameters the scan was submitted with (for reporting).
+        status: Current lifecycle state.
+        findings_count: Findings collected so far (progress).
+        result: Result returned by the job's work once completed.
+        error: Error message if the job failed.
+    """
+
+    id: str
+    params: dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    findings_count: int = 0
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    future: Future | None = field(default=None, repr=False)
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether cancellation was requested."""
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """Raise JobCancelled if cancellation was requested."""
+        if self.cancel_requested:
+            raise JobCancelled
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.id,
+            "status": self.status.value,
+            "params": self.params,
+            "findings_count": self.findings_count,
+            "elapsed_seconds": round(end - (self.started_at or end), 3),
+            "created_at": self.created_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class ScanJobManager:
+    """Runs scan jobs on a bounded thread pool.
+
+    Example:
+        >>> manager = ScanJobManager(max_concurrent=2)
+        >>> job = manager.submit(run_scan, {"target": "."})
+        >>> manager.get(job.id).status
+        <JobStatus.RUNNING: 'running'>
+        >>> result = await manager.wait(job.id)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_history: int = DEFAULT_MAX_HISTORY,
+    ):
+        """Initialize the manager.
+
+        Args:
+            max_concurrent: Scans run at the same time.
+            max_pending: Scans allowed to wait for a free worker.
+            max_history: Finished jobs kept for status queries.
+        """
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="security-scan"
+        )
+        self._jobs: dict[str, ScanJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        work: Callable[[ScanJob], dict[str, Any]],
+        params: dict[str, Any] | None = None,
+    ) -> ScanJob:
+        """Queue a scan.
+
+        Args:
+            work: Runs the scan on a worker thread and returns its result.
+                It should update job.findings_count as it goes and stop
+                (raising JobCancelled) once job.cancel_requested is set.
+            params: Scan parameters to report with the job.
+
+        Returns:
+            The queued job.
+
+        Raises:
+            RuntimeError: If the concurrent-scan limit is reached.
+        """
+        with self._lock:
+            active = [job for job in self._jobs.values() if not job.status.finished]
+            if len(active) >= self.max_concurrent + self.max_pending:
+                msg = (
+                    f"Too many scans in progress ({len(active)}); "
+                    "wait for one to finish or cancel one"
+                )
+                raise RuntimeError(msg)
+
+            job = ScanJob(id=uuid.uuid4().hex[:12], params=params or {})
+            self._jobs[job.id] = job
+            self._prune()
+            job.future = self._executor.submit(self._run, job, work)
+        return job
+
+    def _run(self, job: ScanJob, work: Callable[[ScanJob], dict[str, Any]]) -> None:
+        """Run a job's work and record the outcome."""
+        if job.cancel_requested:
+            self._finish(job, JobStatus.CANCELLED)
+            return
+
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        try:
+            result = work(job)
+        except JobCancelled:
+            self._finish(job, JobStatus.CANCELLED)
+        except Exception as e:
+            if job.cancel_requested:
+                # Scanners report cancellation as a failure
+                self._finish(job, JobStatus.CANCELLED)
+            else:
+                job.error = str(e)
+                self._finish(job, JobStatus.FAILED)
+        else:
+            if job.cancel_requested:
+                self._finish(job, JobStatus.CANCELLED)
+            else:
+                job.result = result
+                self._finish(job, JobStatus.COMPLETED)
+
+    def _finish(self, job: ScanJob, status: JobStatus) -> None:
+        job.finished_at = time.time()
+        job.status = status
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond max_history."""
+        finished = [job for job in self._jobs.values() if job.status.finished]
+        for job in finished[: max(0, len(finished) - self.max_history)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id: str) -> ScanJob | None:
+        """Get a job by id."""
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[ScanJob]:
+        """Get all known jobs, newest first."""
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> ScanJob | None:
+        """Cancel a job.
+
+        Queued jobs are cancelled immediately. Running jobs are asked to
+        stop and become CANCELLED once their scanners have stopped.
+
+        Returns:
+            The job, or None if no such job exists.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.status.finished:
+            return job
+
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, JobStatus.CANCELLED)
+        return job
+
+    async def wait(self, job_id: str) -> ScanJob:
+        """Wait for a job to finish without blocking the event loop.
+
+        Raises:
+            KeyError: If no such job exists.
+        """
+        job = self._jobs[job_id]
+        if job.future is not None and not job.future.cancelled():
+            try:
+                await asyncio.wrap_future(job.future)
+            except (CancelledError, asyncio.CancelledError):
+                # A cancelled queued job cancels the wrapper with asyncio's
+                # CancelledError; only swallow it for that, not when the
+                # waiting task itself is cancelled
+                if not job.future.cancelled():
+                    raise
+        return job
+
+    def shutdown(self, cancel: bool = True) -> None:
+        """Stop the worker pool, cancelling outstanding jobs by default."""
+        if cancel:
+            for job in list(self._jobs.values()):
+                self.cancel(job.id)
+        self._executor.shutdown(wait=False, cancel_futures=cancel)
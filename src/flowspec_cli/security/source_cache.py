@@ -0,0 +1,262 @@
+"""Shared cache of source files for security analysis.
+
+Triage classifiers and the fix generator both read code context around
+findings. Scans often report many findings in the same file, so reading
+the file once per finding is wasteful. SourceCache keeps recently used
+files line-indexed in a size-bounded LRU:
+
+- Small files are decoded once and kept as a list of lines
+- Large files are memory-mapped with a line offset index, so only the
+  requested lines are decoded
+- Entries are invalidated when the file's mtime or size changes
+
+Use get_source_cache() for the process-wide instance.
+"""
+
+import io
+import logging
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Files at least this large are memory-mapped instead of read (1 MiB)
+MMAP_THRESHOLD = 1024 * 1024
+
+# Default bounds for the process-wide cache
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_FILES = 512
+
+
+@dataclass
+class _CachedFile:
+    """A cached, line-indexed source file."""
+
+    key: tuple[int, int]  # (mtime_ns, size) when cached
+    cost: int  # Bytes charged against the cache budget
+    lines: list[str] | None = None  # Decoded lines (small files)
+    mapped: mmap.mmap | None = None  # Mapped contents (large files)
+    offsets: array | None = None  # Start offset of each line in mapped
+
+    @property
+    def line_count(self) -> int:
+        if self.lines is not None:
+            return len(self.lines)
+        return len(self.offsets) - 1
+
+    def slice(self, start: int, end: int) -> list[str]:
+        """Get lines[start:end] (0-based, end exclusive)."""
+        if self.lines is not None:
+            return self.lines[start:end]
+        end = min(end, self.line_count)
+        if start >= end:
+            return []
+        data = self.mapped[self.offsets[start] : self.offsets[end]]
+        parts = data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+        lines = [part + "\n" for part in parts.split("\n")]
+        if lines[-1] == "\n":
+            lines.pop()  # Data ended with a newline
+        else:
+            lines[-1] = lines[-1][:-1]  # Last line has no newline
+        return lines
+
+    def close(self) -> None:
+        if self.mapped is not None:
+            self.mapped.close()
+
+
+class SourceCache:
+    """Size-bounded LRU cache of line-indexed source files.
+
+    Thread-safe; a single instance is shared by triage and fix generation.
+
+    Example:
+        >>> cache = get_source_cache()
+        >>> cache.get_context(Path("app.py"), 42, 42, context_lines=5)
+        'def login(user):\\n    ...'
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_files: int = DEFAULT_MAX_FILES,
+        mmap_threshold: int = MMAP_THRESHOLD,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of cached files.
+            max_files: Maximum number of cached files.
+            mmap_threshold: Size at which files are memory-mapped.
+        """
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.mmap_threshold = mmap_threshold
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._files: OrderedDict[Path, _CachedFile] = OrderedDict()
+        self._bytes = 0
+
+    def get_lines(self, file_path: Path | str) -> list[str] | None:
+        """Get all lines of a file, as readlines() would return them.
+
+        Args:
+            file_path: Source file path.
+
+        Returns:
+            Lines with line endings, or None if the file cannot be read.
+        """
+        with self._lock:
+            entry = self._get(Path(file_path))
+            if entry is None:
+                return None
+            return entry.slice(0, entry.line_count)
+
+    def get_context(
+        self,
+        file_path: Path | str,
+        line_start: int,
+        line_end: int,
+        context_lines: int = 5,
+    ) -> str | None:
+        """Get the lines around a finding.
+
+        Args:
+            file_path: Source file path.
+            line_start: First line of the finding (1-based).
+            line_end: Last line of the finding (1-based).
+            context_lines: Number of lines before/after to include.
+
+        Returns:
+            Code snippet with surrounding context, or None if the file
+            cannot be read.
+        """
+        with self._lock:
+            entry = self._get(Path(file_path))
+            if entry is None:
+                return None
+            start = max(0, line_start - context_lines - 1)
+            end = min(entry.line_count, line_end + context_lines)
+            return "".join(entry.slice(start, end))
+
+    def invalidate(self, file_path: Path | str) -> None:
+        """Drop a file from the cache (e.g., after writing to it)."""
+        with self._lock:
+            try:
+                path = Path(file_path).resolve()
+            except OSError:
+                return
+            self._evict(path)
+
+    def clear(self) -> None:
+        """Drop all cached files."""
+        with self._lock:
+            for path in list(self._files):
+                self._evict(path)
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def cached_bytes(self) -> int:
+        """Total bytes currently charged against the cache budget."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _get(self, file_path: Path) -> _CachedFile | None:
+        """Get a fresh cache entry, loading the file if needed.
+
+        Caller holds the lock.
+        """
+        try:
+            path = file_path.resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._files.get(path)
+        if entry is not None:
+            if entry.key == key:
+                self._files.move_to_end(path)
+                self.hits += 1
+                return entry
+            self._evict(path)
+
+        self.misses += 1
+        try:
+            entry = self._load(path, key)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cannot read {path}: {e}")
+            return None
+
+        self._files[path] = entry
+        self._bytes += entry.cost
+        while self._files and (
+            self._bytes > self.max_bytes or len(self._files) > self.max_files
+        ):
+            oldest = next(iter(self._files))
+            if oldest == path:
+                break  # Keep the file being read even if it exceeds the budget
+            self._evict(oldest)
+        return entry
+
+    def _load(self, path: Path, key: tuple[int, int]) -> _CachedFile:
+        """Read and line-index a file."""
+        size = key[1]
+        if size < self.mmap_threshold:
+            with open(path, "rb") as f:
+                data = f.read()
+            with io.TextIOWrapper(
+                io.BytesIO(data), encoding="utf-8", errors="replace"
+            ) as reader:
+                lines = reader.readlines()
+            return _CachedFile(key=key, cost=len(data), lines=lines)
+
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        offsets = array("Q", [0])
+        position = mapped.find(b"\n")
+        while position != -1:
+            offsets.append(position + 1)
+            position = mapped.find(b"\n", position + 1)
+        if offsets[-1] != len(mapped):
+            offsets.append(len(mapped))
+        # Mapped pages are owned by the OS page cache; charge the index only
+        cost = offsets.itemsize * len(offsets)
+        return _CachedFile(key=key, cost=cost, mapped=mapped, offsets=offsets)
+
+    def _evict(self, path: Path) -> None:
+        """Remove one entry (caller holds the lock)."""
+        entry = self._files.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry.cost
+            entry.close()
+
+
+_source_cache: SourceCache | None = None
+_source_cache_lock = threading.Lock()
+
+
+def get_source_cache() -> SourceCache:
+    """Get the process-wide source cache.
+
+    Bounds can be tuned with FLOWSPEC_SOURCE_CACHE_MB before first use.
+    """
+    global _source_cache
+    with _source_cache_lock:
+        if _source_cache is None:
+            max_mb = os.environ.get("FLOWSPEC_SOURCE_CACHE_MB")
+            max_bytes = DEFAULT_MAX_BYTES
+            if max_mb and max_mb.isdigit():
+                max_bytes = int(max_mb) * 1024 * 1024
+            _source_cache = SourceCache(max_bytes=max_bytes)
+        return _source_cache
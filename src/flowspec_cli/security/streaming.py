@@ -0,0 +1,159 @@
+"""Streaming helpers for the findings pipeline.
+
+Scans of large repositories can report 100k+ findings. Materializing every
+stage (scanner JSON, finding lists, export dicts, one big output string)
+holds several copies of the results at once. These helpers let each stage
+consume and produce findings one at a time:
+
+- iter_json_array() reads the items of a scanner's JSON results array
+  without loading the whole document
+- deduplicate_stream() merges duplicate findings by fingerprint, holding
+  one finding per fingerprint rather than every duplicate
+
+Exporters write incrementally via BaseExporter.write().
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
+
+from flowspec_cli.security.models import Finding
+
+READ_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JSONReader:
+    """Buffered reader that decodes JSON values from a text stream."""
+
+    def __init__(self, fp: TextIO, read_size: int):
+        self._fp = fp
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Read more input; returns False at end of stream."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop consumed input so the buffer only holds the current value
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end)."""
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._fill(self._read_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of input"
+            raise ValueError(f"Expected one of {chars!r}, found {found}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next JSON value."""
+        self.peek()
+        size = self._read_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Possibly truncated; read more (doubling to bound re-parsing)
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number at the end of the buffer may continue in the next read
+            if end == len(self._buffer) and not self._eof:
+                if self._fill(size):
+                    continue
+            self._pos = end
+            return value
+
+
+def iter_json_array(fp: TextIO, key: str, read_size: int = READ_SIZE) -> Iterator[Any]:
+    """Yield the items of a top-level array from a JSON object stream.
+
+    Other top-level values are decoded and discarded one at a time; only
+    the current item is held in memory.
+
+    Args:
+        fp: Text stream containing a JSON object.
+        key: Top-level key whose array to read (e.g., "results").
+        read_size: Characters read per chunk.
+
+    Yields:
+        Decoded array items, in order.
+
+    Raises:
+        ValueError: If the stream is not valid JSON (json.JSONDecodeError
+            is a ValueError).
+
+    Example:
+        >>> with open("semgrep.json") as f:
+        ...     for result in iter_json_array(f, "results"):
+        ...         print(result["check_id"])
+    """
+    reader = _JSONReader(fp, read_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() != "]":
+                while True:
+                    yield reader.value()
+                    if reader.expect(",]") == "]":
+                        break
+            else:
+                reader.expect("]")
+        else:
+            reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+def deduplicate_stream(findings: Iterable[Finding]) -> Iterator[Finding]:
+    """Merge findings that share a fingerprint.
+
+    Like ScannerOrchestrator.deduplicate(), later duplicates are merged
+    into the first finding (see Finding.merge(): highest severity,
+    combined references, merged_scanners). Any later duplicate can raise
+    a finding's severity, so findings are yielded once the input is
+    exhausted; duplicates are merged as they arrive and not kept.
+
+    Args:
+        findings: Findings in scan order.
+
+    Yields:
+        One merged finding per fingerprint, in first-seen order.
+    """
+    by_fingerprint: dict[str, Finding] = {}
+    for finding in findings:
+        fp = finding.fingerprint()
+        first = by_fingerprint.get(fp)
+        if first is None:
+            by_fingerprint[fp] = finding
+        else:
+            first.merge(finding)
+    yield from by_fingerprint.values()
@@ -11,6 +11,7 @@ from flowspec_cli.security.triage.models import (
     TriageResult,
     ClusterType,
 )
+from flowspec_cli.security.triage.blame import BlameService
 from flowspec_cli.security.triage.engine import TriageEngine
 from flowspec_cli.security.triage.risk_scorer import RiskScorer
 
@@ -20,4 +21,5 @@ __all__ = [
     "ClusterType",
     "TriageEngine",
     "RiskScorer",
+    "BlameService",
 ]
@@ -11,7 +11,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
+from flowspec_cli.security.llm_cache import (
+    LLMResponseCache,
+    is_json_response,
+    model_id,
+    response_key,
+)
 from flowspec_cli.security.models import Finding
+from flowspec_cli.security.source_cache import get_source_cache
 from flowspec_cli.security.triage.models import Classification
 
 logger = logging.getLogger(__name__)
@@ -42,14 +49,24 @@ class FindingClassifier(ABC):
     false positive, or needs investigation.
     """
 
-    def __init__(self, llm_client: LLMClient | None = None):
+    # Bump when build_prompt() changes, to invalidate cached responses
+    PROMPT_VERSION = "1"
+
+    def __init__(
+        self,
+        llm_client: LLMClient | None = None,
+        llm_cache: LLMResponseCache | None = None,
+    ):
         """Initialize classifier with optional LLM client.
 
         Args:
             llm_client: LLM client for AI-powered classification.
                        If None, uses heuristic-based classification.
+            llm_cache: Persistent cache of LLM responses. If None,
+                       every classification calls the LLM.
         """
         self.llm = llm_client
+        self.llm_cache = llm_cache
 
     @abstractmethod
     def classify(self, finding: Finding) -> ClassificationResult:
@@ -69,6 +86,56 @@ class FindingClassifier(ABC):
         """Return list of CWE IDs this classifier handles."""
         pass
 
+    def build_prompt(self, finding: Finding) -> str:
+        """Build the LLM classification prompt for a finding.
+
+        The response is parsed by parse_response(). TriageEngine uses this
+        to batch prompts for many findings into one LLM request.
+
+        Args:
+            finding: Finding to classify.
+
+        Returns:
+            Prompt requesting a JSON classification.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support AI classification"
+        )
+
+    def parse_response(self, response: str) -> ClassificationResult:
+        """Parse an LLM response to a build_prompt() prompt."""
+        return self._parse_llm_response(response)
+
+    def cache_key(self, finding: Finding) -> str:
+        """Get the LLM response cache key for classifying a finding.
+
+        Covers the widest code context any classifier prompt shows, so an
+        edit near the finding invalidates the cached classification.
+        """
+        return response_key(
+            f"classify:{type(self).__name__}",
+            self.PROMPT_VERSION,
+            finding.cwe_id,
+            self.get_code_context(finding, context_lines=10),
+            model_id(self.llm),
+            finding.title,
+            finding.description,
+        )
+
+    def _ai_classify(self, finding: Finding) -> ClassificationResult:
+        """AI-powered classification using LLM."""
+        if self.llm_cache is None:
+            response = self.llm.complete(self.build_prompt(finding))
+            return self.parse_response(response)
+
+        key = self.cache_key(finding)
+        response = self.llm_cache.get(key)
+        if response is None:
+            response = self.llm.complete(self.build_prompt(finding))
+            if is_json_response(response):
+                self.llm_cache.put(key, response)
+        return self.parse_response(response)
+
     def get_code_context(self, finding: Finding, context_lines: int = 5) -> str:
         """Extract code context around finding.
 
@@ -79,22 +146,15 @@ class FindingClassifier(ABC):
         Returns:
             Code snippet with surrounding context.
         """
-        file_path = Path(finding.location.file)
-
-        if not file_path.exists():
-            return finding.location.code_snippet or ""
-
-        try:
-            with open(file_path) as f:
-                lines = f.readlines()
-
-            line_start = max(0, finding.location.line_start - context_lines - 1)
-            line_end = min(len(lines), finding.location.line_end + context_lines)
-
-            context = lines[line_start:line_end]
-            return "".join(context)
-        except OSError:
+        context = get_source_cache().get_context(
+            Path(finding.location.file),
+            finding.location.line_start,
+            finding.location.line_end,
+            context_lines,
+        )
+        if context is None:
             return finding.location.code_snippet or ""
+        return context
 
     def _parse_llm_response(self, response: str) -> ClassificationResult:
         """Parse LLM JSON response into ClassificationResult.
@@ -63,8 +63,8 @@ class DefaultClassifier(FindingClassifier):
             reasoning="Medium severity finding requires human review.",
         )
 
-    def _ai_classify(self, finding: Finding) -> ClassificationResult:
-        """AI-powered classification using LLM."""
+    def build_prompt(self, finding: Finding) -> str:
+        """Build the LLM prompt for generic classification."""
         context = self.get_code_context(finding)
 
         prompt = f"""Analyze this security finding and classify it:
@@ -102,5 +102,4 @@ Respond in JSON format:
     "reasoning": "explanation of your decision"
 }}
 """
-        response = self.llm.complete(prompt)
-        return self._parse_llm_response(response)
+        return prompt
@@ -166,8 +166,8 @@ class HardcodedSecretsClassifier(FindingClassifier):
 
         return entropy
 
-    def _ai_classify(self, finding: Finding) -> ClassificationResult:
-        """AI-powered secret classification."""
+    def build_prompt(self, finding: Finding) -> str:
+        """Build the LLM prompt for secret classification."""
         context = self.get_code_context(finding, context_lines=5)
 
         prompt = f"""Analyze this potential hardcoded secret:
@@ -207,5 +207,4 @@ Respond in JSON format:
     "reasoning": "explanation of why this is or isn't a real secret"
 }}
 """
-        response = self.llm.complete(prompt)
-        return self._parse_llm_response(response)
+        return prompt
@@ -105,8 +105,8 @@ class PathTraversalClassifier(FindingClassifier):
             reasoning="Could not determine path validation status.",
         )
 
-    def _ai_classify(self, finding: Finding) -> ClassificationResult:
-        """AI-powered path traversal classification."""
+    def build_prompt(self, finding: Finding) -> str:
+        """Build the LLM prompt for path traversal classification."""
         context = self.get_code_context(finding, context_lines=10)
 
         prompt = f"""Analyze this potential path traversal vulnerability:
@@ -140,5 +140,4 @@ Respond in JSON format:
     "reasoning": "explanation including what files could be accessed if TP"
 }}
 """
-        response = self.llm.complete(prompt)
-        return self._parse_llm_response(response)
+        return prompt
@@ -100,8 +100,8 @@ class SQLInjectionClassifier(FindingClassifier):
             reasoning="Could not determine query construction method.",
         )
 
-    def _ai_classify(self, finding: Finding) -> ClassificationResult:
-        """AI-powered SQL injection classification."""
+    def build_prompt(self, finding: Finding) -> str:
+        """Build the LLM prompt for SQL injection classification."""
         context = self.get_code_context(finding, context_lines=10)
 
         prompt = f"""Analyze this potential SQL injection vulnerability:
@@ -135,5 +135,4 @@ Respond in JSON format:
     "reasoning": "explanation including which checklist items apply"
 }}
 """
-        response = self.llm.complete(prompt)
-        return self._parse_llm_response(response)
+        return prompt
@@ -167,8 +167,8 @@ class WeakCryptoClassifier(FindingClassifier):
 
         return False
 
-    def _ai_classify(self, finding: Finding) -> ClassificationResult:
-        """AI-powered weak crypto classification."""
+    def build_prompt(self, finding: Finding) -> str:
+        """Build the LLM prompt for weak crypto classification."""
         context = self.get_code_context(finding, context_lines=10)
 
         prompt = f"""Analyze this potential weak cryptography vulnerability:
@@ -213,5 +213,4 @@ Respond in JSON format:
     "reasoning": "explanation including what algorithm is used and for what purpose"
 }}
 """
-        response = self.llm.complete(prompt)
-        return self._parse_llm_response(response)
+        return prompt
@@ -105,8 +105,8 @@ class XSSClassifier(FindingClassifier):
             reasoning="Could not determine if output is properly encoded.",
         )
 
-    def _ai_classify(self, finding: Finding) -> ClassificationResult:
-        """AI-powered XSS classification."""
+    def build_prompt(self, finding: Finding) -> str:
+        """Build the LLM prompt for XSS classification."""
         context = self.get_code_context(finding, context_lines=10)
 
         prompt = f"""Analyze this potential Cross-Site Scripting (XSS) vulnerability:
@@ -140,5 +140,4 @@ Respond in JSON format:
     "reasoning": "explanation including attack vector if TP"
 }}
 """
-        response = self.llm.complete(prompt)
-        return self._parse_llm_response(response)
+        return prompt
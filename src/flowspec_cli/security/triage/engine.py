@@ -12,16 +12,27 @@ See ADR-006 for architectural design.
 import json
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from flowspec_cli.security.llm_cache import (
+    LLMResponseCache,
+    is_json_response,
+    model_id,
+    response_key,
+)
 from flowspec_cli.security.models import Finding
+from flowspec_cli.security.source_cache import get_source_cache
 from flowspec_cli.security.triage.models import (
     Classification,
     ClusterType,
     Explanation,
+    RiskComponents,
     TriageResult,
 )
+from flowspec_cli.security.triage.blame import BlameService
+from flowspec_cli.security.triage.llm import LLMDispatcher, RateLimiter, RetryPolicy
 from flowspec_cli.security.triage.risk_scorer import RiskScorer
 from flowspec_cli.security.triage.classifiers.base import (
     FindingClassifier,
@@ -51,6 +62,16 @@ class TriageConfig:
     min_cluster_size: int = 3  # Minimum findings to form a CWE cluster
     min_file_cluster_size: int = 2  # Minimum findings to form a file cluster
     explanation_max_length: int = 500  # Max chars for explanation sections
+    blame_cache_path: Path | None = None  # Persist git blame results here
+
+    # Concurrent LLM triage (used when max_workers > 1 or llm_batch_size > 1)
+    max_workers: int = 1  # Concurrent LLM requests
+    llm_batch_size: int = 1  # Findings per LLM request (same classifier only)
+    requests_per_second: float | None = None  # LLM rate limit (None = unlimited)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+
+    # Persistent LLM response cache (None = always call the LLM)
+    llm_cache: LLMResponseCache | None = None
 
 
 class TriageEngine:
@@ -66,6 +87,9 @@ class TriageEngine:
         ...     print(f"{result.finding_id}: {result.classification.value}")
     """
 
+    # Bump when _build_explanation_prompt() changes, to invalidate cached responses
+    EXPLANATION_PROMPT_VERSION = "1"
+
     # CWE to classifier mapping
     CWE_CLASSIFIER_MAP = {
         "CWE-89": "sql_injection",
@@ -100,16 +124,18 @@ class TriageEngine:
         """
         self.llm = llm_client
         self.config = config or TriageConfig()
-        self.risk_scorer = RiskScorer()
+        self.blame = BlameService(cache_path=self.config.blame_cache_path)
+        self.risk_scorer = RiskScorer(blame=self.blame)
 
         # Initialize classifiers
+        cache = self.config.llm_cache
         self.classifiers: dict[str, FindingClassifier] = {
-            "sql_injection": SQLInjectionClassifier(llm_client),
-            "xss": XSSClassifier(llm_client),
-            "path_traversal": PathTraversalClassifier(llm_client),
-            "hardcoded_secrets": HardcodedSecretsClassifier(llm_client),
-            "weak_crypto": WeakCryptoClassifier(llm_client),
-            "default": DefaultClassifier(llm_client),
+            "sql_injection": SQLInjectionClassifier(llm_client, cache),
+            "xss": XSSClassifier(llm_client, cache),
+            "path_traversal": PathTraversalClassifier(llm_client, cache),
+            "hardcoded_secrets": HardcodedSecretsClassifier(llm_client, cache),
+            "weak_crypto": WeakCryptoClassifier(llm_client, cache),
+            "default": DefaultClassifier(llm_client, cache),
         }
 
     def triage(self, findings: list[Finding]) -> list[TriageResult]:
@@ -123,9 +149,20 @@ class TriageEngine:
         """
         results = []
 
-        for finding in findings:
-            result = self._triage_single(finding)
-            results.append(result)
+        # One git blame per file up front instead of one per finding
+        self.blame.prefetch(findings)
+
+        if self.llm is not None and (
+            self.config.max_workers > 1 or self.config.llm_batch_size > 1
+        ):
+            results = self._triage_concurrent(findings)
+        else:
+            for finding in findings:
+                result = self._triage_single(finding)
+                results.append(result)
+
+        # Persist files blamed during scoring that prefetch did not cover
+        self.blame.save()
 
         # Cluster findings by root cause
         results = self._cluster(results, findings)
@@ -158,6 +195,18 @@ class TriageEngine:
         # 3. Generate explanation
         explanation = self._generate_explanation(finding, classification_result)
 
+        return self._build_result(
+            finding, classification_result, risk_components, explanation
+        )
+
+    def _build_result(
+        self,
+        finding: Finding,
+        classification_result: ClassificationResult,
+        risk_components: RiskComponents,
+        explanation: Explanation,
+    ) -> TriageResult:
+        """Assemble the triage result for a finding."""
         return TriageResult(
             finding_id=finding.id,
             classification=classification_result.classification,
@@ -172,6 +221,185 @@ class TriageEngine:
             },
         )
 
+    def _triage_concurrent(self, findings: list[Finding]) -> list[TriageResult]:
+        """Triage findings with concurrent, batched LLM requests.
+
+        Findings at the same location handled by the same classifier share
+        one classification. Classification prompts are batched per
+        classifier (i.e., per CWE family) and explanation prompts per CWE,
+        up to llm_batch_size prompts per request, and batches run on a
+        pool of max_workers threads.
+
+        Args:
+            findings: Findings to triage.
+
+        Returns:
+            Triage results in input order.
+        """
+        config = self.config
+        rate_limiter = (
+            RateLimiter(config.requests_per_second)
+            if config.requests_per_second
+            else None
+        )
+        dispatcher = LLMDispatcher(self.llm, rate_limiter, config.retry)
+
+        # 1. Classify: one prompt per (classifier, location), batched per classifier
+        by_classifier: dict[str, dict[tuple, list[Finding]]] = defaultdict(dict)
+        for finding in findings:
+            key = self.CWE_CLASSIFIER_MAP.get(finding.cwe_id or "", "default")
+            location = (
+                str(finding.location.file),
+                finding.location.line_start,
+                finding.location.line_end,
+            )
+            by_classifier[key].setdefault(location, []).append(finding)
+
+        classifications: dict[str, ClassificationResult] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, config.max_workers), thread_name_prefix="triage"
+        ) as pool:
+            jobs = []
+            for key, locations in by_classifier.items():
+                classifier = self.classifiers.get(key, self.classifiers["default"])
+                groups = list(locations.values())
+                for batch in self._chunks(groups, config.llm_batch_size):
+                    future = pool.submit(
+                        self._classify_batch,
+                        dispatcher,
+                        classifier,
+                        [group[0] for group in batch],
+                    )
+                    jobs.append((batch, future))
+            for batch, future in jobs:
+                for group, result in zip(batch, future.result()):
+                    for finding in group:
+                        classifications[finding.id] = result
+
+            # 2. Explain: batched per CWE
+            by_cwe: dict[str, list[Finding]] = defaultdict(list)
+            for finding in findings:
+                by_cwe[finding.cwe_id or ""].append(finding)
+
+            explanations: dict[str, Explanation] = {}
+            jobs = [
+                (
+                    batch,
+                    pool.submit(
+                        self._explain_batch, dispatcher, batch, classifications
+                    ),
+                )
+                for group in by_cwe.values()
+                for batch in self._chunks(group, config.llm_batch_size)
+            ]
+            for batch, future in jobs:
+                for finding, explanation in zip(batch, future.result()):
+                    explanations[finding.id] = explanation
+
+        logger.info(
+            f"Triaged {len(findings)} findings with {dispatcher.requests} LLM "
+            f"requests ({dispatcher.deduplicated} duplicate prompts skipped)"
+        )
+
+        # 3. Score risk (no LLM calls) and assemble results
+        return [
+            self._build_result(
+                finding,
+                classifications[finding.id],
+                self.risk_scorer.score(finding, self.llm),
+                explanations[finding.id],
+            )
+            for finding in findings
+        ]
+
+    def _classify_batch(
+        self,
+        dispatcher: LLMDispatcher,
+        classifier: FindingClassifier,
+        findings: list[Finding],
+    ) -> list[ClassificationResult]:
+        """Classify findings with one (batched) LLM request."""
+        try:
+            prompts = [classifier.build_prompt(finding) for finding in findings]
+            keys = None
+            if classifier.llm_cache is not None:
+                keys = [classifier.cache_key(finding) for finding in findings]
+            responses = self._complete_cached(dispatcher, prompts, keys)
+        except NotImplementedError:
+            return [classifier.classify(finding) for finding in findings]
+        except Exception as e:
+            logger.warning(
+                f"LLM classification failed for {len(findings)} findings: {e}"
+            )
+            return [
+                ClassificationResult(
+                    classification=Classification.NEEDS_INVESTIGATION,
+                    confidence=0.3,
+                    reasoning=f"LLM request failed: {e}",
+                )
+                for _ in findings
+            ]
+        return [classifier.parse_response(response) for response in responses]
+
+    def _explain_batch(
+        self,
+        dispatcher: LLMDispatcher,
+        findings: list[Finding],
+        classifications: dict[str, ClassificationResult],
+    ) -> list[Explanation]:
+        """Explain findings with one (batched) LLM request."""
+        prompts = [
+            self._build_explanation_prompt(finding, classifications[finding.id])
+            for finding in findings
+        ]
+        keys = None
+        if self.config.llm_cache is not None:
+            keys = [
+                self._explanation_cache_key(finding, classifications[finding.id])
+                for finding in findings
+            ]
+        try:
+            responses = self._complete_cached(dispatcher, prompts, keys)
+        except Exception:
+            # Fallback to heuristic
+            return [
+                self._generate_heuristic_explanation(
+                    finding, classifications[finding.id]
+                )
+                for finding in findings
+            ]
+        return [
+            self._parse_explanation(response, finding, classifications[finding.id])
+            for response, finding in zip(responses, findings)
+        ]
+
+    def _complete_cached(
+        self,
+        dispatcher: LLMDispatcher,
+        prompts: list[str],
+        keys: list[str] | None,
+    ) -> list[str]:
+        """Get responses from the LLM cache, sending only missing prompts."""
+        cache = self.config.llm_cache
+        if cache is None or keys is None:
+            return dispatcher.complete_batch(prompts)
+
+        responses = [cache.get(key) for key in keys]
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if missing:
+            fetched = dispatcher.complete_batch([prompts[i] for i in missing])
+            for i, response in zip(missing, fetched):
+                responses[i] = response
+                if is_json_response(response):
+                    cache.put(keys[i], response)
+        return responses
+
+    @staticmethod
+    def _chunks(items: list, size: int) -> list[list]:
+        """Split items into lists of at most size items."""
+        size = max(1, size)
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
     def _classify(self, finding: Finding) -> ClassificationResult:
         """Classify finding using appropriate specialized classifier.
 
@@ -235,7 +463,56 @@ class TriageEngine:
         classification: ClassificationResult,
     ) -> Explanation:
         """Generate explanation using AI."""
-        prompt = f"""Generate a plain-English explanation for this security finding:
+        cache = self.config.llm_cache
+        key = None
+        response = None
+        if cache is not None:
+            key = self._explanation_cache_key(finding, classification)
+            response = cache.get(key)
+
+        if response is None:
+            try:
+                response = self.llm.complete(
+                    self._build_explanation_prompt(finding, classification)
+                )
+            except Exception:
+                # Fallback to heuristic
+                return self._generate_heuristic_explanation(finding, classification)
+            if key is not None and is_json_response(response):
+                cache.put(key, response)
+        return self._parse_explanation(response, finding, classification)
+
+    def _explanation_cache_key(
+        self,
+        finding: Finding,
+        classification: ClassificationResult,
+    ) -> str:
+        """Get the LLM response cache key for a finding's explanation."""
+        context = get_source_cache().get_context(
+            Path(finding.location.file),
+            finding.location.line_start,
+            finding.location.line_end,
+            context_lines=10,
+        )
+        return response_key(
+            "explain",
+            self.EXPLANATION_PROMPT_VERSION,
+            finding.cwe_id,
+            context if context is not None else finding.location.code_snippet or "",
+            model_id(self.llm),
+            finding.title,
+            finding.description,
+            classification.classification.value,
+            f"{classification.confidence:.0%}",
+        )
+
+    def _build_explanation_prompt(
+        self,
+        finding: Finding,
+        classification: ClassificationResult,
+    ) -> str:
+        """Build the LLM prompt for a finding's explanation."""
+        return f"""Generate a plain-English explanation for this security finding:
 
 **Finding:**
 - Title: {finding.title}
@@ -259,9 +536,15 @@ Generate a developer-friendly explanation in JSON format:
 
 Keep each section under 200 characters. Use simple language.
 """
-        try:
-            response = self.llm.complete(prompt)
 
+    def _parse_explanation(
+        self,
+        response: str,
+        finding: Finding,
+        classification: ClassificationResult,
+    ) -> Explanation:
+        """Parse an explanation response, falling back to the heuristic."""
+        try:
             # Parse JSON response
             response = response.strip()
             if "```json" in response:
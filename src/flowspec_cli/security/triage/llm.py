@@ -0,0 +1,350 @@
+"""LLM request handling for concurrent triage.
+
+Triage makes one classification and one explanation request per finding.
+Against a remote model endpoint that is slow and easy to rate-limit, so
+concurrent triage sends requests through an LLMDispatcher, which:
+
+- Deduplicates identical prompts (including ones already in flight)
+- Batches several prompts into one multi-task request
+- Limits the request rate across worker threads
+- Retries failed requests with exponential backoff
+
+FakeLLMClient is a deterministic local stand-in for tests and benchmarks.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from flowspec_cli.security.triage.classifiers.base import LLMClient
+
+logger = logging.getLogger(__name__)
+
+BATCH_TASK_MARKER = "=== TASK {index} ==="
+
+BATCH_HEADER = """You will receive {count} independent tasks. Answer each task on its own.
+
+Respond with a JSON array of exactly {count} objects, one per task, in task
+order. Each object must follow the JSON response format requested by its task.
+Do not include any text outside the JSON array.
+"""
+
+
+def build_batch_prompt(prompts: list[str]) -> str:
+    """Combine several prompts into one multi-task prompt."""
+    parts = [BATCH_HEADER.format(count=len(prompts))]
+    for index, prompt in enumerate(prompts, 1):
+        parts.append(f"{BATCH_TASK_MARKER.format(index=index)}\n{prompt}")
+    return "\n".join(parts)
+
+
+def split_batch_prompt(prompt: str) -> list[str] | None:
+    """Split a multi-task prompt back into its tasks.
+
+    Returns:
+        Task prompts, or None if the prompt is not a batch prompt.
+    """
+    first = BATCH_TASK_MARKER.format(index=1)
+    if first not in prompt:
+        return None
+
+    tasks = []
+    rest = prompt.split(first, 1)[1]
+    index = 2
+    while True:
+        marker = BATCH_TASK_MARKER.format(index=index)
+        if marker not in rest:
+            tasks.append(rest.strip("\n"))
+            return tasks
+        task, rest = rest.split(marker, 1)
+        tasks.append(task.strip("\n"))
+        index += 1
+
+
+def parse_batch_response(response: str, count: int) -> list[str] | None:
+    """Split a multi-task response into per-task JSON responses.
+
+    Returns:
+        One JSON string per task, or None if the response is malformed.
+    """
+    response = response.strip()
+    if "```json" in response:
+        start = response.find("```json") + 7
+        end = response.find("```", start)
+        response = response[start:end].strip()
+    elif "```" in response:
+        start = response.find("```") + 3
+        end = response.find("```", start)
+        response = response[start:end].strip()
+
+    try:
+        items = json.loads(response)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(items, list) or len(items) != count:
+        return None
+    return [item if isinstance(item, str) else json.dumps(item) for item in items]
+
+
+class RateLimiter:
+    """Token bucket limiting requests per second across threads."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Requests allowed per second.
+            burst: Requests allowed back-to-back before limiting.
+            clock: Monotonic clock (for tests).
+            sleep: Sleep function (for tests).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy for failed LLM requests."""
+
+    max_attempts: int = 3  # Total attempts per request
+    initial_delay: float = 1.0  # Seconds before the first retry
+    max_delay: float = 30.0  # Cap on the delay between retries
+    backoff: float = 2.0  # Delay multiplier per retry
+
+    def delay(self, attempt: int) -> float:
+        """Get the delay before retrying after a failed attempt (1-based)."""
+        return min(self.max_delay, self.initial_delay * self.backoff ** (attempt - 1))
+
+
+class LLMDispatcher:
+    """Sends prompts to an LLM client with dedup, batching, rate limiting
+    and retries.
+
+    Thread-safe. Responses are memoized for the dispatcher's lifetime, so
+    create one dispatcher per triage run.
+
+    Example:
+        >>> dispatcher = LLMDispatcher(llm, RateLimiter(rate=5))
+        >>> responses = dispatcher.complete_batch(prompts)
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            client: Underlying LLM client.
+            rate_limiter: Optional limit on requests per second.
+            retry: Retry policy (default: RetryPolicy()).
+            sleep: Sleep function used between retries (for tests).
+        """
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.requests = 0
+        self.deduplicated = 0
+
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._responses: dict[str, Future] = {}
+
+    def complete(self, prompt: str) -> str:
+        """Get the response to a prompt.
+
+        Raises:
+            Exception: The client's last error if all attempts fail.
+        """
+        future, owner = self._claim(prompt)
+        if owner:
+            self._resolve(prompt, future, lambda: self._request(prompt))
+        return future.result()
+
+    def complete_batch(self, prompts: list[str]) -> list[str]:
+        """Get responses to several prompts using one request where possible.
+
+        Falls back to one request per prompt if the batched response cannot
+        be split.
+
+        Raises:
+            Exception: The client's last error if all attempts fail.
+        """
+        futures: dict[str, Future] = {}
+        owned: list[str] = []
+        for prompt in prompts:
+            if prompt in futures:
+                with self._lock:
+                    self.deduplicated += 1
+                continue
+            futures[prompt], owner = self._claim(prompt)
+            if owner:
+                owned.append(prompt)
+
+        if len(owned) == 1:
+            prompt = owned[0]
+            self._resolve(prompt, futures[prompt], lambda: self._request(prompt))
+        elif owned:
+            try:
+                response = self._request(build_batch_prompt(owned))
+                parts = parse_batch_response(response, len(owned))
+            except Exception as e:
+                logger.warning(f"Batched LLM request failed, retrying singly: {e}")
+                parts = None
+            if parts is None:
+                for prompt in owned:
+                    self._resolve(
+                        prompt, futures[prompt], lambda p=prompt: self._request(p)
+                    )
+            else:
+                for prompt, part in zip(owned, parts):
+                    futures[prompt].set_result(part)
+
+        return [futures[prompt].result() for prompt in prompts]
+
+    def _claim(self, prompt: str) -> tuple[Future, bool]:
+        """Get the future for a prompt; owner=True if the caller must send it."""
+        with self._lock:
+            future = self._responses.get(prompt)
+            if future is not None:
+                self.deduplicated += 1
+                return future, False
+            future = Future()
+            self._responses[prompt] = future
+            return future, True
+
+    def _resolve(self, prompt: str, future: Future, send: Callable[[], str]) -> None:
+        """Send a claimed prompt and publish the outcome to waiters."""
+        try:
+            future.set_result(send())
+        except Exception as e:
+            # Let a later call try again instead of caching the failure
+            with self._lock:
+                self._responses.pop(prompt, None)
+            future.set_exception(e)
+
+    def _request(self, prompt: str) -> str:
+        """Send one request, retrying per the retry policy."""
+        attempts = max(1, self.retry.max_attempts)
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            with self._lock:
+                self.requests += 1
+            try:
+                return self.client.complete(prompt)
+            except Exception as e:
+                if attempt >= attempts:
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning(
+                    f"LLM request failed (attempt {attempt}/{attempts}), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                self._sleep(delay)
+                attempt += 1
+
+
+class FakeLLMClient:
+    """Deterministic local LLM stand-in for tests and benchmarks.
+
+    Answers classification prompts with a fixed classification, explanation
+    prompts with a canned explanation, and batch prompts with a JSON array.
+
+    Example:
+        >>> llm = FakeLLMClient(classification="FP", latency=0.05)
+        >>> engine = TriageEngine(llm, TriageConfig(max_workers=8))
+    """
+
+    def __init__(
+        self,
+        classification: str = "TP",
+        confidence: float = 0.8,
+        latency: float = 0.0,
+        failures: int = 0,
+    ):
+        """Initialize the fake client.
+
+        Args:
+            classification: Classification to return ("TP", "FP" or "NI").
+            confidence: Confidence to return.
+            latency: Seconds to sleep per request (simulates a remote model).
+            failures: Number of initial requests that raise RuntimeError.
+        """
+        self.classification = classification
+        self.confidence = confidence
+        self.latency = latency
+        self.failures = failures
+        self.prompts: list[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        """Number of requests received."""
+        return len(self.prompts)
+
+    def complete(self, prompt: str) -> str:
+        """Return a canned JSON response for a prompt."""
+        with self._lock:
+            self.prompts.append(prompt)
+            fail = self.failures > 0
+            if fail:
+                self.failures -= 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise RuntimeError("Fake LLM failure")
+
+        tasks = split_batch_prompt(prompt)
+        if tasks is None:
+            return json.dumps(self._answer(prompt))
+        return json.dumps([self._answer(task) for task in tasks])
+
+    def _answer(self, prompt: str) -> dict:
+        if "plain-English explanation" in prompt:
+            return {
+                "what": "Fake explanation of the finding",
+                "why_it_matters": "Fake security impact",
+                "how_to_exploit": None,
+                "how_to_fix": "Fake remediation",
+            }
+        return {
+            "classification": self.classification,
+            "confidence": self.confidence,
+            "reasoning": "Fake LLM classification",
+        }
@@ -14,6 +14,7 @@ from datetime import datetime
 from pathlib import Path
 
 from flowspec_cli.security.models import Finding
+from flowspec_cli.security.triage.blame import BlameService
 from flowspec_cli.security.triage.models import RiskComponents
 
 
@@ -25,8 +26,13 @@ class RiskScorer:
     - High impact (if exploited)
     - Easy to exploit
     - Recently introduced (less time for detection)
+
+    Set ``blame`` to a BlameService to look up detection times from cached
+    per-file blames instead of one git blame per finding.
     """
 
+    blame: BlameService | None = None
+
     def score(self, finding: Finding, llm_client=None) -> RiskComponents:
         """Calculate risk components for a finding.
 
@@ -126,6 +132,9 @@ class RiskScorer:
         file_path = finding.location.file
         line_start = finding.location.line_start
 
+        if self.blame is not None:
+            return self.blame.detection_time(file_path, line_start)
+
         if not file_path or not line_start:
             return 30  # Default
 
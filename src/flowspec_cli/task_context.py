@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
+from .backlog.backend import get_file_backend
+
 
 class TaskContextError(Exception):
     """Base exception for task context loading errors."""
@@ -113,6 +115,35 @@ def load_task_context(task_id: Optional[str] = None) -> TaskContext:
     return _parse_task_output(raw_output, task_id)
 
 
+def _run_backlog(args: List[str]) -> str:
+    """Run a backlog command and return its stdout.
+
+    Runs in-process against the task files when the file backend is enabled
+    (FLOWSPEC_BACKLOG_BACKEND=files), otherwise via the backlog CLI.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails
+        subprocess.TimeoutExpired: If the CLI times out
+    """
+    backend = get_file_backend()
+    result = backend.run(args) if backend is not None else None
+    if result is None:
+        return subprocess.run(
+            ["backlog", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30,
+        ).stdout
+
+    exit_code, stdout, stderr = result
+    if exit_code != 0:
+        raise subprocess.CalledProcessError(
+            exit_code, ["backlog", *args], output=stdout, stderr=stderr
+        )
+    return stdout
+
+
 def _find_in_progress_task() -> str:
     """Find the current in-progress task.
 
@@ -123,18 +154,12 @@ def _find_in_progress_task() -> str:
         NoInProgressTaskError: If no in-progress task found
     """
     try:
-        result = subprocess.run(
-            ["backlog", "task", "list", "-s", "In Progress", "--plain"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30,
-        )
+        stdout = _run_backlog(["task", "list", "-s", "In Progress", "--plain"])
 
         # Parse the output to find first task ID
         # Format: "  [HIGH] task-88 - Task Title"
         pattern = r"task-(\d+)"
-        match = re.search(pattern, result.stdout)
+        match = re.search(pattern, stdout)
 
         if not match:
             raise NoInProgressTaskError("No in-progress task found")
@@ -195,15 +220,7 @@ def _get_task_output(task_id: str) -> str:
         # Extract just the number for the CLI command
         task_num = task_id.split("-")[1]
 
-        result = subprocess.run(
-            ["backlog", "task", task_num, "--plain"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30,
-        )
-
-        return result.stdout
+        return _run_backlog(["task", task_num, "--plain"])
 
     except subprocess.TimeoutExpired:
         raise TaskContextError(f"Timeout while retrieving task {task_id}")
@@ -3,7 +3,8 @@
 This module provides telemetry collection with PII protection:
 - RoleEvent enum for event types
 - track_role_event() for logging events
-- JSONL writer for persistent storage
+- Buffered JSONL writer for persistent storage
+- Day-indexed store with precomputed rollups for stats
 - Configuration with opt-in consent
 
 All PII (project names, paths, usernames) is automatically hashed.
@@ -49,14 +50,16 @@ from .integration import (
     track_role_selection,
     track_workflow,
 )
+from .store import DayRollup, TelemetryStore, open_store
 from .tracker import (
+    flush_writer,
     hash_pii,
     reset_writer,
     sanitize_path,
     sanitize_value,
     track_role_event,
 )
-from .writer import TelemetryWriter
+from .writer import BufferedTelemetryWriter, TelemetryWriter
 
 __all__ = [
     # Events
@@ -74,6 +77,7 @@ __all__ = [
     "hash_pii",
     "sanitize_path",
     "sanitize_value",
+    "flush_writer",
     "reset_writer",
     # Integration helpers
     "track_role_selection",
@@ -85,4 +89,9 @@ __all__ = [
     "track_workflow",
     # Writer
     "TelemetryWriter",
+    "BufferedTelemetryWriter",
+    # Store
+    "DayRollup",
+    "TelemetryStore",
+    "open_store",
 ]
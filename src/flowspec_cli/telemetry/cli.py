@@ -11,7 +11,6 @@ This module provides user-facing commands for:
 from __future__ import annotations
 
 import json
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import typer
@@ -31,6 +30,7 @@ from .integration import (
     track_role_selection as _track_role,
 )
 from .events import RoleEvent
+from .store import open_store
 from .tracker import DEFAULT_TELEMETRY_DIR, DEFAULT_TELEMETRY_FILE, track_role_event
 from .writer import TelemetryWriter
 
@@ -83,33 +83,9 @@ def _read_telemetry_events(
         filter_days: If provided, only return events from the last N days.
 
     Returns:
-        List of parsed event dictionaries.
+        List of parsed event dictionaries, oldest first.
     """
-    # Use TelemetryWriter for reading events (limit=0 means read all)
-    writer = TelemetryWriter(telemetry_path)
-    try:
-        # Read all events - TelemetryWriter returns most recent first, reverse to get chronological
-        events = writer.read_events(limit=10000)
-        events.reverse()
-    except OSError:
-        return []
-
-    if filter_days is not None:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=filter_days)
-        filtered_events = []
-        for event in events:
-            timestamp_str = event.get("timestamp", "")
-            if timestamp_str:
-                try:
-                    ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    if ts < cutoff:
-                        continue
-                except ValueError:
-                    continue
-            filtered_events.append(event)
-        return filtered_events
-
-    return events
+    return list(open_store(telemetry_path).iter_events(days=filter_days))
 
 
 @telemetry_app.command("enable")
@@ -207,8 +183,7 @@ def status_command(
     config_path = get_config_path(root)
     telemetry_path = root / DEFAULT_TELEMETRY_DIR / DEFAULT_TELEMETRY_FILE
 
-    # Count events using helper function
-    event_count = TelemetryWriter(telemetry_path).count_events()
+    event_count = open_store(telemetry_path).total
 
     # Build status table
     table = Table(title="Telemetry Status", show_header=False, box=None)
@@ -254,32 +229,13 @@ def stats_command(
         console.print("[yellow]No telemetry data found.[/yellow]")
         return
 
-    # Read and parse events using helper function
-    events = _read_telemetry_events(telemetry_path, filter_days=days)
+    # Combine the precomputed per-day counts
+    rollup = open_store(telemetry_path).rollup(days=days)
 
-    if not events:
+    if not rollup.count:
         console.print(f"[yellow]No events in the last {days} days.[/yellow]")
         return
 
-    # Compute statistics
-    event_types: dict[str, int] = {}
-    roles: dict[str, int] = {}
-    agents: dict[str, int] = {}
-    commands: dict[str, int] = {}
-
-    for event in events:
-        event_type = event.get("event_type", "unknown")
-        event_types[event_type] = event_types.get(event_type, 0) + 1
-
-        if role := event.get("role"):
-            roles[role] = roles.get(role, 0) + 1
-
-        if agent := event.get("agent"):
-            agents[agent] = agents.get(agent, 0) + 1
-
-        if command := event.get("command"):
-            commands[command] = commands.get(command, 0) + 1
-
     # Display statistics
     console.print(f"\n[bold]Telemetry Statistics (last {days} days)[/bold]\n")
 
@@ -287,41 +243,41 @@ def stats_command(
     table = Table(title="Event Types")
     table.add_column("Type", style="cyan")
     table.add_column("Count", justify="right")
-    for event_type, count in sorted(event_types.items(), key=lambda x: -x[1]):
+    for event_type, count in rollup.event_types.most_common():
         table.add_row(event_type, str(count))
     console.print(table)
 
     # Roles
-    if roles:
+    if rollup.roles:
         console.print()
         table = Table(title="Roles Used")
         table.add_column("Role", style="green")
         table.add_column("Count", justify="right")
-        for role, count in sorted(roles.items(), key=lambda x: -x[1]):
+        for role, count in rollup.roles.most_common():
             table.add_row(role, str(count))
         console.print(table)
 
     # Agents
-    if agents:
+    if rollup.agents:
         console.print()
         table = Table(title="Agents Invoked")
         table.add_column("Agent", style="blue")
         table.add_column("Count", justify="right")
-        for agent, count in sorted(agents.items(), key=lambda x: -x[1]):
+        for agent, count in rollup.agents.most_common():
             table.add_row(agent, str(count))
         console.print(table)
 
     # Commands
-    if commands:
+    if rollup.commands:
         console.print()
         table = Table(title="Commands Used")
         table.add_column("Command", style="magenta")
         table.add_column("Count", justify="right")
-        for command, count in sorted(commands.items(), key=lambda x: -x[1])[:10]:
+        for command, count in rollup.commands.most_common(10):
             table.add_row(command, str(count))
         console.print(table)
 
-    console.print(f"\n[dim]Total events: {len(events)}[/dim]")
+    console.print(f"\n[dim]Total events: {rollup.count}[/dim]")
 
 
 @telemetry_app.command("view")
@@ -347,18 +303,15 @@ def view_command(
         console.print("[yellow]No telemetry data found.[/yellow]")
         return
 
-    # Read all events using helper function
-    events = _read_telemetry_events(telemetry_path)
+    # Seek from the end of the file for the most recent events
+    total = open_store(telemetry_path).total
+    recent = TelemetryWriter(telemetry_path).read_events(limit=limit)
 
-    if not events:
+    if not recent:
         console.print("[yellow]No events recorded.[/yellow]")
         return
 
-    # Show most recent events
-    recent = events[-limit:] if len(events) > limit else events
-    recent.reverse()  # Most recent first
-
-    table = Table(title=f"Recent Events (showing {len(recent)} of {len(events)})")
+    table = Table(title=f"Recent Events (showing {len(recent)} of {total})")
     table.add_column("Time", style="dim")
     table.add_column("Type", style="cyan")
     table.add_column("Role", style="green")
@@ -403,8 +356,8 @@ def clear_command(
         console.print("[yellow]No telemetry data to clear.[/yellow]")
         return
 
-    # Count events using helper function
-    event_count = TelemetryWriter(telemetry_path).count_events()
+    store = open_store(telemetry_path)
+    event_count = store.total
 
     if not yes:
         console.print(
@@ -417,6 +370,7 @@ def clear_command(
 
     try:
         telemetry_path.unlink()
+        store.clear()
         console.print(f"[green]✓ Cleared {event_count} telemetry events.[/green]")
     except OSError as e:
         console.print(f"[red]Failed to clear telemetry data: {e}[/red]")
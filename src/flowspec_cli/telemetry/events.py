@@ -44,6 +44,9 @@ class RoleEvent(str, Enum):
     WORKFLOW_COMPLETED = "workflow.completed"
     WORKFLOW_FAILED = "workflow.failed"
 
+    # Telemetry events
+    EVENTS_DROPPED = "telemetry.events_dropped"
+
     def __str__(self) -> str:
         """Return the event type string value."""
         return self.value
@@ -0,0 +1,346 @@
+"""Indexed telemetry store with per-day rollups.
+
+Reading telemetry used to parse the whole JSONL file (capped at the
+last 10,000 events) and every event's timestamp on each command. The
+store keeps a sidecar index next to the JSONL file instead:
+
+- Events are partitioned by UTC day; each day records the byte range
+  of its events, so time-bounded reads seek past older days
+- Each day has precomputed counts by event type, role, agent and command
+- The index remembers how far into the JSONL file it has read, so a
+  refresh only parses events appended since the last one
+
+A window of the last N days covers the last N*24 hours: whole days are
+taken from the rollups, and only the events of its oldest, partly
+covered day are read back to compare their timestamps. Events without a
+parseable timestamp count towards the total but fall outside every
+window.
+
+The JSONL file stays the source of truth; the index is rebuilt if it is
+missing, unreadable or the file was cleared.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .writer import _debug
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".index.json"
+
+# Leading bytes hashed to notice the JSONL file being replaced
+HEAD_BYTES = 256
+
+DAY_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+
+def event_day(event: dict) -> str | None:
+    """Get the UTC day (YYYY-MM-DD) of an event, or None if it has none."""
+    day = str(event.get("timestamp", ""))[:10]
+    return day if DAY_PATTERN.match(day) else None
+
+
+def event_time(event: dict) -> datetime | None:
+    """Get the timestamp of an event (UTC if naive), or None if unparseable."""
+    try:
+        ts = datetime.fromisoformat(str(event.get("timestamp", "")))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def window_start(days: int) -> datetime:
+    """Get the start of a window covering the last N days."""
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def in_window(event: dict, start: datetime) -> bool:
+    """Check whether an event happened at or after the start of a window."""
+    day = event_day(event)
+    start_day = start.date().isoformat()
+    if day is None or day < start_day:
+        return False
+    if day > start_day:
+        return True
+    ts = event_time(event)
+    return ts is None or ts >= start
+
+
+@dataclass
+class DayRollup:
+    """Event counts for one UTC day (or a merged range of days).
+
+    Attributes:
+        offset: Byte offset of the day's first event in the JSONL file.
+        end: Byte offset just past the day's last event.
+        count: Number of events.
+        event_types: Events per event type.
+        roles: Events per role.
+        agents: Events per agent.
+        commands: Events per command.
+    """
+
+    offset: int = 0
+    end: int = 0
+    count: int = 0
+    event_types: Counter[str] = field(default_factory=Counter)
+    roles: Counter[str] = field(default_factory=Counter)
+    agents: Counter[str] = field(default_factory=Counter)
+    commands: Counter[str] = field(default_factory=Counter)
+
+    def add(self, event: dict) -> None:
+        """Count an event."""
+        self.count += 1
+        self.event_types[event.get("event_type", "unknown")] += 1
+        if role := event.get("role"):
+            self.roles[role] += 1
+        if agent := event.get("agent"):
+            self.agents[agent] += 1
+        if command := event.get("command"):
+            self.commands[command] += 1
+
+    def merge(self, other: DayRollup) -> None:
+        """Add another rollup's counts to this one."""
+        self.count += other.count
+        self.event_types.update(other.event_types)
+        self.roles.update(other.roles)
+        self.agents.update(other.agents)
+        self.commands.update(other.commands)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "offset": self.offset,
+            "end": self.end,
+            "count": self.count,
+            "event_types": dict(self.event_types),
+            "roles": dict(self.roles),
+            "agents": dict(self.agents),
+            "commands": dict(self.commands),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DayRollup:
+        """Create from dictionary."""
+        return cls(
+            offset=data["offset"],
+            end=data["end"],
+            count=data["count"],
+            event_types=Counter(data["event_types"]),
+            roles=Counter(data["roles"]),
+            agents=Counter(data["agents"]),
+            commands=Counter(data["commands"]),
+        )
+
+
+class TelemetryStore:
+    """Day-indexed view of a telemetry JSONL file.
+
+    Example:
+        >>> store = TelemetryStore(Path(".flowspec/telemetry.jsonl"))
+        >>> store.refresh()
+        >>> store.rollup(days=7).event_types.most_common(3)
+    """
+
+    def __init__(self, telemetry_path: Path | str) -> None:
+        """Initialize the store.
+
+        Args:
+            telemetry_path: Path to the telemetry JSONL file
+        """
+        self.telemetry_path = Path(telemetry_path)
+        self.index_path = self.telemetry_path.with_name(
+            self.telemetry_path.stem + INDEX_SUFFIX
+        )
+        self._reset()
+        self._load()
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.head = ""
+        self.total = 0
+        self.days: dict[str, DayRollup] = {}
+
+    def _load(self) -> None:
+        """Load the index, starting empty if it is missing or invalid."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return
+            days = {day: DayRollup.from_dict(d) for day, d in data["days"].items()}
+            self.offset = data["offset"]
+            self.head = data["head"]
+            self.total = data["total"]
+            self.days = days
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            _debug(f"Ignoring unreadable telemetry index: {e}")
+            self._reset()
+
+    def _save(self) -> None:
+        """Write the index atomically (best effort)."""
+        data = {
+            "version": INDEX_VERSION,
+            "offset": self.offset,
+            "head": self.head,
+            "total": self.total,
+            "days": {day: rollup.to_dict() for day, rollup in self.days.items()},
+        }
+        tmp_path = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}")
+        try:
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            _debug(f"Telemetry index write error: {e}")
+
+    def _head_hash(self, f: BinaryIO, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+    def refresh(self) -> None:
+        """Index events appended to the JSONL file since the last refresh."""
+        try:
+            f = self.telemetry_path.open("rb")
+        except FileNotFoundError:
+            if self.offset:
+                self.clear()
+            return
+        except OSError as e:
+            _debug(f"Telemetry read error: {e}")
+            return
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            head_length = min(self.offset, HEAD_BYTES)
+            if self.offset and (
+                size < self.offset or self._head_hash(f, head_length) != self.head
+            ):
+                # File was cleared or replaced; start over
+                self._reset()
+            if size == self.offset:
+                return
+
+            f.seek(self.offset)
+            position = self.offset
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partially written line; pick it up next time
+                self._index_line(line, position)
+                position += len(line)
+
+            if position == self.offset:
+                return
+            self.offset = position
+            self.head = self._head_hash(f, min(position, HEAD_BYTES))
+
+        self._save()
+
+    def _index_line(self, line: bytes, position: int) -> None:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return
+        if not isinstance(event, dict):
+            return
+
+        self.total += 1
+        day = event_day(event)
+        if day is None:
+            return
+        rollup = self.days.get(day)
+        if rollup is None:
+            rollup = self.days[day] = DayRollup(offset=position)
+        rollup.end = position + len(line)
+        rollup.add(event)
+
+    def rollup(self, days: int | None = None) -> DayRollup:
+        """Get combined counts for the last N days (all days if None)."""
+        combined = DayRollup()
+        if days is None:
+            for rollup in self.days.values():
+                combined.merge(rollup)
+            return combined
+
+        start = window_start(days)
+        start_day = start.date().isoformat()
+        for day, rollup in self.days.items():
+            if day > start_day:
+                combined.merge(rollup)
+
+        # The oldest day is only partly in the window; count its events
+        # from the file. Its byte range may hold out-of-order events of
+        # later days, which are already counted in their own rollups.
+        oldest = self.days.get(start_day)
+        if oldest is not None:
+            for event in self._read(oldest.offset, oldest.end):
+                if event_day(event) == start_day and in_window(event, start):
+                    combined.add(event)
+        return combined
+
+    def iter_events(self, days: int | None = None) -> Iterator[dict]:
+        """Iterate over indexed events in file order.
+
+        Args:
+            days: If provided, only events from the last N days. Reading
+                starts at the first of those days instead of the file start.
+        """
+        if days is None:
+            yield from self._read(0, self.offset)
+            return
+
+        start = window_start(days)
+        start_day = start.date().isoformat()
+        offsets = [r.offset for day, r in self.days.items() if day >= start_day]
+        if not offsets:
+            return
+        for event in self._read(min(offsets), self.offset):
+            if in_window(event, start):
+                yield event
+
+    def _read(self, offset: int, end: int) -> Iterator[dict]:
+        """Iterate over the events between two byte offsets of the file."""
+        try:
+            with self.telemetry_path.open("rb") as f:
+                f.seek(offset)
+                position = offset
+                for line in f:
+                    position += len(line)
+                    if position > end:
+                        break
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(event, dict):
+                        yield event
+        except OSError as e:
+            _debug(f"Telemetry read error: {e}")
+
+    def clear(self) -> None:
+        """Forget all indexed data and remove the index file."""
+        self._reset()
+        try:
+            self.index_path.unlink(missing_ok=True)
+        except OSError as e:
+            _debug(f"Telemetry index delete error: {e}")
+
+
+def open_store(telemetry_path: Path | str) -> TelemetryStore:
+    """Open a telemetry store and index any new events."""
+    store = TelemetryStore(telemetry_path)
+    store.refresh()
+    return store
+
+
+__all__ = ["DayRollup", "TelemetryStore", "open_store"]
@@ -13,7 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from .events import RoleEvent, TelemetryEvent
-from .writer import TelemetryWriter
+from .writer import BufferedTelemetryWriter
 
 # Default telemetry file location
 DEFAULT_TELEMETRY_DIR = ".flowspec"
@@ -27,17 +27,17 @@ PII_PATTERNS = {
 }
 
 # Singleton writer instance
-_writer: TelemetryWriter | None = None
+_writer: BufferedTelemetryWriter | None = None
 
 
-def _get_writer(project_root: Path | None = None) -> TelemetryWriter:
+def _get_writer(project_root: Path | None = None) -> BufferedTelemetryWriter:
     """Get or create the telemetry writer singleton."""
     global _writer
     if _writer is None:
         if project_root is None:
             project_root = Path.cwd()
         telemetry_path = project_root / DEFAULT_TELEMETRY_DIR / DEFAULT_TELEMETRY_FILE
-        _writer = TelemetryWriter(telemetry_path)
+        _writer = BufferedTelemetryWriter(telemetry_path)
     return _writer
 
 
@@ -207,9 +207,20 @@ def track_role_event(
     return event
 
 
+def flush_writer() -> None:
+    """Write any buffered telemetry events to disk now."""
+    if _writer is not None:
+        _writer.flush()
+
+
 def reset_writer() -> None:
-    """Reset the telemetry writer singleton (useful for testing)."""
+    """Reset the telemetry writer singleton (useful for testing).
+
+    Pending events are written before the writer is discarded.
+    """
     global _writer
+    if _writer is not None:
+        _writer.close()
     _writer = None
 
 
@@ -218,5 +229,6 @@ __all__ = [
     "hash_pii",
     "sanitize_path",
     "sanitize_value",
+    "flush_writer",
     "reset_writer",
 ]
@@ -1,18 +1,81 @@
 """JSONL telemetry writer for flowspec.
 
 This module provides a writer that appends telemetry events
-to a JSONL (JSON Lines) file format.
+to a JSONL (JSON Lines) file format, and a buffered variant that
+writes batches from a background thread so tracking never waits
+on the filesystem.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
+import sys
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TextIO
 
-if TYPE_CHECKING:
-    from .events import TelemetryEvent
+from .events import RoleEvent, TelemetryEvent
+
+if sys.platform != "win32":
+    import fcntl
+else:
+    fcntl = None
+
+# Buffered writer defaults
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+
+# Bytes read per step when reading events from the end of the file
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _debug(message: str) -> None:
+    """Print a telemetry error when FLOWSPEC_TELEMETRY_DEBUG is set."""
+    if os.environ.get("FLOWSPEC_TELEMETRY_DEBUG"):
+        print(message)
+
+
+def _lock(f: TextIO) -> None:
+    """Take an advisory exclusive lock on an open file (no-op on Windows)."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _tail_lines(path: Path, limit: int) -> list[bytes]:
+    """Read the last non-empty lines of a file by seeking from its end.
+
+    Only the blocks holding the requested lines are read. A limit of 0
+    or less reads every line.
+    """
+    with path.open("rb") as f:
+        if limit <= 0:
+            return [line for line in f.read().split(b"\n") if line.strip()]
+
+        position = f.seek(0, os.SEEK_END)
+        blocks: list[bytes] = []
+        newlines = 0
+        # limit + 1 newlines guarantee limit complete lines (plus a trailing one)
+        while position > 0 and newlines <= limit + 1:
+            size = min(TAIL_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    lines = b"".join(reversed(blocks)).split(b"\n")
+    if position > 0:
+        lines = lines[1:]  # First line may start before the data read
+    return [line for line in lines if line.strip()][-limit:]
+
+
+def _serialize(event: TelemetryEvent) -> str:
+    """Convert an event to a JSON line."""
+    return json.dumps(event.to_dict(), separators=(",", ":")) + "\n"
 
 
 class TelemetryWriter:
@@ -33,6 +96,25 @@ class TelemetryWriter:
         """
         self.telemetry_path = Path(telemetry_path)
 
+    def _append(self, lines: list[str], fsync: bool = False) -> None:
+        """Append JSON lines to the telemetry file in a single write.
+
+        The write happens under an advisory lock so concurrent processes
+        cannot interleave partial lines.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        # Ensure parent directory exists
+        self.telemetry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.telemetry_path.open("a", encoding="utf-8") as f:
+            _lock(f)
+            f.write("".join(lines))
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+
     def write_event(self, event: TelemetryEvent) -> bool:
         """Write a single event to the telemetry file.
 
@@ -42,24 +124,7 @@ class TelemetryWriter:
         Returns:
             True if the event was written successfully, False otherwise
         """
-        try:
-            # Ensure parent directory exists
-            self.telemetry_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Convert event to JSON line
-            event_dict = event.to_dict()
-            json_line = json.dumps(event_dict, separators=(",", ":"))
-
-            # Append to file (atomic append on most systems)
-            with self.telemetry_path.open("a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-
-            return True
-        except OSError as e:
-            # Log error but don't fail - telemetry should be non-blocking
-            if os.environ.get("FLOWSPEC_TELEMETRY_DEBUG"):
-                print(f"Telemetry write error: {e}")
-            return False
+        return self._write_now([event]) == 1
 
     def write_events(self, events: list[TelemetryEvent]) -> int:
         """Write multiple events to the telemetry file.
@@ -70,11 +135,19 @@ class TelemetryWriter:
         Returns:
             Number of events successfully written
         """
-        written = 0
-        for event in events:
-            if self.write_event(event):
-                written += 1
-        return written
+        return self._write_now(events)
+
+    def _write_now(self, events: list[TelemetryEvent]) -> int:
+        """Append events to the file in one locked write."""
+        if not events:
+            return 0
+        try:
+            self._append([_serialize(event) for event in events])
+            return len(events)
+        except OSError as e:
+            # Log error but don't fail - telemetry should be non-blocking
+            _debug(f"Telemetry write error: {e}")
+            return 0
 
     def read_events(self, limit: int = 100) -> list[dict]:
         """Read recent events from the telemetry file.
@@ -89,23 +162,20 @@ class TelemetryWriter:
             return []
 
         try:
-            with self.telemetry_path.open("r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            # Parse JSON lines from end
-            events = []
-            for line in reversed(lines[-limit:]):
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-
-            return events
+            lines = _tail_lines(self.telemetry_path, limit)
         except OSError:
             return []
 
+        # Parse JSON lines from end
+        events = []
+        for line in reversed(lines):
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+        return events
+
     def clear(self) -> bool:
         """Clear all telemetry data.
 
@@ -135,4 +205,181 @@ class TelemetryWriter:
             return 0
 
 
-__all__ = ["TelemetryWriter"]
+class BufferedTelemetryWriter(TelemetryWriter):
+    """TelemetryWriter that batches writes on a background thread.
+
+    write_event() only serializes the event and puts it on a bounded
+    in-memory queue. A daemon thread appends queued events in batches
+    (with one fsync per batch) once batch_size events are waiting or
+    flush_interval seconds have passed, and pending events are flushed
+    (without an fsync) at interpreter exit. When the queue is full,
+    events are dropped rather than blocking the caller. Dropped events,
+    and those of batches that could not be written, are counted in
+    dropped_events, and the next batch records the count in a
+    telemetry.events_dropped event.
+
+    Attributes:
+        telemetry_path: Path to the telemetry JSONL file
+        dropped_events: Events discarded because the queue was full or
+            their batch could not be written
+    """
+
+    def __init__(
+        self,
+        telemetry_path: Path | str,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize the buffered writer.
+
+        Args:
+            telemetry_path: Path to the telemetry JSONL file
+            max_queue: Maximum events buffered in memory
+            batch_size: Pending events that trigger a flush
+            flush_interval: Seconds between periodic flushes
+        """
+        super().__init__(telemetry_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped_events = 0
+        self._reported_drops = 0
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=max_queue)
+        self._flush_lock = threading.Lock()
+        # Guards dropped_events; callers must not wait on a flush
+        self._drop_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def write_event(self, event: TelemetryEvent) -> bool:
+        """Queue an event for writing.
+
+        Args:
+            event: The telemetry event to write
+
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        if self._stop.is_set():
+            # Closed (e.g. at exit): write synchronously
+            return self._write_now([event]) == 1
+
+        try:
+            self._queue.put_nowait(_serialize(event))
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped_events += 1
+            _debug("Telemetry queue full; event dropped")
+            return False
+
+        self._ensure_thread()
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def write_events(self, events: list[TelemetryEvent]) -> int:
+        """Queue multiple events for writing.
+
+        Args:
+            events: List of telemetry events to write
+
+        Returns:
+            Number of events queued
+        """
+        return sum(1 for event in events if self.write_event(event))
+
+    def _ensure_thread(self) -> None:
+        """Start the flush thread on first use."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                atexit.register(self.close, fsync=False)
+                self._thread = threading.Thread(
+                    target=self._run, name="telemetry-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Flush on size or time thresholds until closed."""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self, fsync: bool = True) -> int:
+        """Write all queued events now.
+
+        Args:
+            fsync: Sync the write to disk
+
+        Returns:
+            Number of events written
+        """
+        with self._flush_lock:
+            lines = []
+            while True:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            written = len(lines)
+
+            with self._drop_lock:
+                dropped = self.dropped_events - self._reported_drops
+            if dropped:
+                marker = TelemetryEvent.create(
+                    RoleEvent.EVENTS_DROPPED, context={"dropped": dropped}
+                )
+                lines.append(_serialize(marker))
+            if not lines:
+                return 0
+            try:
+                self._append(lines, fsync=fsync)
+            except OSError as e:
+                _debug(f"Telemetry write error: {e}")
+                with self._drop_lock:
+                    self.dropped_events += written
+                return 0
+            self._reported_drops += dropped
+            return written
+
+    def close(self, fsync: bool = True) -> None:
+        """Stop the flush thread and write any pending events.
+
+        The flush thread is not joined: a batch it is writing holds the
+        flush lock, so the final flush runs after it.
+
+        Args:
+            fsync: Sync the final write to disk (skipped at exit)
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            atexit.unregister(self.close)
+        self.flush(fsync=fsync)
+
+    def read_events(self, limit: int = 100) -> list[dict]:
+        """Flush pending events, then read recent events."""
+        self.flush()
+        return super().read_events(limit)
+
+    def count_events(self) -> int:
+        """Flush pending events, then count events in the file."""
+        self.flush()
+        return super().count_events()
+
+    def clear(self) -> bool:
+        """Discard pending events and clear all telemetry data."""
+        with self._flush_lock:
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            return super().clear()
+
+
+__all__ = ["TelemetryWriter", "BufferedTelemetryWriter"]
@@ -10,6 +10,9 @@ Event Mapping:
     /flow:plan      → plan.created
     /flow:implement → implement.completed
     /flow:validate  → validate.completed
+Events go to the flowspec emit daemon when it is running (see emit_client.py),
+falling back to `flowspec hooks emit` when the daemon or the client is
+unavailable.
 The hook operates in a fail-open mode - errors are logged but don't block workflow.
 
 NOTE: /flow:operate and /flow:research were removed.
@@ -19,6 +22,15 @@ import json
 import re
 import subprocess
 import sys
+from pathlib import Path
+
+# Add hooks directory to Python path for emit_client import
+sys.path.insert(0, str(Path(__file__).parent))
+
+try:
+    from emit_client import emit
+except ImportError:  # Client not installed next to the hook; use the CLI
+    emit = None
 
 # Event type mapping for /flowspec commands
 COMMAND_EVENT_MAP = {
@@ -90,7 +102,7 @@ def extract_task_id(text: str) -> str | None:
     return None
 
 
-def emit_event(
+def emit_with_cli(
     event_type: str, feature_id: str | None, task_id: str | None
 ) -> tuple[bool, str]:
     """Call flowspec hooks emit to trigger user-configured hooks.
@@ -98,7 +110,7 @@ def emit_event(
     Returns:
         Tuple of (success, message)
     """
-    cmd = ["specify", "hooks", "emit", event_type]
+    cmd = ["flowspec", "hooks", "emit", event_type]
 
     if feature_id:
         cmd.extend(["--spec-id", feature_id])
@@ -127,6 +139,22 @@ def emit_event(
         return False, f"Unexpected error: {e}"
 
 
+def emit_event(
+    event_type: str, feature_id: str | None, task_id: str | None
+) -> tuple[bool, str]:
+    """Emit a flowspec event to trigger user-configured hooks.
+
+    Waits for the hooks to finish so failures are reported back in the
+    hook context rather than dropped by a fire-and-forget send.
+
+    Returns:
+        Tuple of (success, message)
+    """
+    if emit is None:
+        return emit_with_cli(event_type, feature_id, task_id)
+    return emit(event_type, spec_id=feature_id, task_id=task_id, wait=True)
+
+
 def main():
     """Main entry point for the hook."""
     try:
@@ -0,0 +1,159 @@
+"""Thin client for the flowspec emit daemon.
+
+Hook scripts call emit() to publish flowspec events. The event is sent to
+the project's emit daemon (`flowspec hooks daemon`) over a Unix socket,
+which avoids starting the flowspec CLI and reloading hooks.yaml on every
+tool call. If the daemon is not running, the client starts it in the
+background for later calls and falls back to `flowspec hooks emit` for
+this one.
+
+Set FLOWSPEC_EMIT_DAEMON=0 to always use the CLI.
+
+Uses only the standard library so importing it stays cheap.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Timeout for daemon round trips and CLI fallback (seconds)
+EMIT_TIMEOUT = 30
+
+
+def socket_path(project_root: Path) -> Path:
+    """Get the daemon socket path for a project.
+
+    Must match flowspec_cli.hooks.daemon.default_socket_path().
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    digest = hashlib.sha256(str(Path(project_root).resolve()).encode()).hexdigest()
+    return Path(runtime_dir) / f"flowspec-{os.getuid()}" / f"emit-{digest[:16]}.sock"
+
+
+def is_private_dir(path: Path) -> bool:
+    """Check that the socket directory is owned by us with mode 0700.
+
+    Must match flowspec_cli.hooks.daemon.is_private_dir().
+    """
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and stat.S_IMODE(st.st_mode) == 0o700
+    )
+
+
+def daemon_request(path: Path, request: dict, timeout: float) -> dict | None:
+    """Send one request to the daemon; return None if it is unreachable."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                return json.loads(reader.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def start_daemon(project_root: Path) -> None:
+    """Start the emit daemon in the background (fail-open)."""
+    try:
+        subprocess.Popen(
+            ["flowspec", "hooks", "daemon", "--project-root", str(project_root)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def emit_with_cli(
+    event_type: str, spec_id: str | None, task_id: str | None
+) -> tuple[bool, str]:
+    """Emit an event by running `flowspec hooks emit`."""
+    cmd = ["flowspec", "hooks", "emit", event_type]
+    if spec_id:
+        cmd.extend(["--spec-id", spec_id])
+    if task_id:
+        cmd.extend(["--task-id", task_id])
+
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=EMIT_TIMEOUT,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return False, "Event emission timed out"
+    except FileNotFoundError:
+        return False, "flowspec CLI not found"
+    except Exception as e:
+        return False, f"Unexpected error: {e}"
+
+    if result.returncode == 0:
+        return True, f"Emitted {event_type} event"
+    return False, f"Failed to emit event: {result.stderr}"
+
+
+def emit(
+    event_type: str,
+    spec_id: str | None = None,
+    task_id: str | None = None,
+    project_root: Path | None = None,
+    wait: bool = False,
+) -> tuple[bool, str]:
+    """Emit a flowspec event, preferring the emit daemon.
+
+    Args:
+        event_type: Event type (e.g., "spec.created").
+        spec_id: Spec/feature ID.
+        task_id: Task ID.
+        project_root: Project root (default: current directory).
+        wait: Wait for hooks to finish and report failed hooks (default:
+            return once queued, so hook failures are not seen).
+
+    Returns:
+        Tuple of (success, message)
+    """
+    root = Path(project_root) if project_root else Path.cwd()
+
+    if os.environ.get("FLOWSPEC_EMIT_DAEMON") != "0" and hasattr(socket, "AF_UNIX"):
+        request = {
+            "command": "emit",
+            "event_type": event_type,
+            "spec_id": spec_id,
+            "task_id": task_id,
+            "wait": wait,
+        }
+        path = socket_path(root)
+        parent = path.parent
+        # A directory we do not own may hide a spoofed daemon; use the CLI
+        if is_private_dir(parent) or not parent.exists():
+            response = daemon_request(path, request, EMIT_TIMEOUT)
+            if response is not None:
+                if not response.get("ok"):
+                    return False, f"Failed to emit event: {response.get('error')}"
+                failed = [
+                    result.get("hook_name", "?")
+                    for result in response.get("results", [])
+                    if not result.get("success")
+                ]
+                if failed:
+                    return False, f"Hook(s) failed: {', '.join(failed)}"
+                return True, f"Emitted {event_type} event"
+            start_daemon(root)
+
+    return emit_with_cli(event_type, spec_id, task_id)
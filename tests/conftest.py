@@ -10,6 +10,19 @@ from pathlib import Path
 from textwrap import dedent
 
 
+@pytest.fixture(autouse=True)
+def isolated_hook_event_log(monkeypatch, tmp_path_factory):
+    """Send hook runner events to a temp dir instead of the repo's .flowspec/logs."""
+    from flowspec_cli.hooks import runner
+    from flowspec_cli.logging import EventLogger, LoggingConfig
+
+    config = LoggingConfig(
+        project_root=tmp_path_factory.getbasetemp() / "event-log",
+        is_internal_dev=False,
+    )
+    monkeypatch.setattr(runner, "_event_logger", EventLogger(config))
+
+
 @pytest.fixture
 def mock_github_releases(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     """Mock the download_and_extract functions to avoid GitHub API calls.
@@ -18,6 +18,7 @@ from unittest.mock import MagicMock
 
 from flowspec_cli.memory import TaskMemoryStore
 from flowspec_cli.memory.injector import ContextInjector
+from flowspec_cli.memory.truncation import CharRatioTokenizer
 from flowspec_cli.memory.mcp import register_memory_resources, MCP_AVAILABLE
 
 
@@ -627,9 +628,19 @@ class TestTokenAwareTruncation:
 
         estimated = injector.estimate_tokens(test_text)
 
-        # Should estimate around 1000-1500 tokens (using 4 chars/token)
+        # Default BPE-style estimator: one token per short word (" word"),
+        # plus the trailing space
+        assert estimated == 1001
+
+    def test_truncation_legacy_char_ratio_estimation(self, injection_project):
+        """Test the legacy 4 chars/token estimate via CharRatioTokenizer."""
+        injector = ContextInjector(
+            base_path=injection_project,
+            tokenizer=CharRatioTokenizer(ContextInjector.CHARS_PER_TOKEN),
+        )
+
         # "word " is 5 chars, so 5000 chars / 4 = 1250 tokens
-        assert estimated == 1250
+        assert injector.estimate_tokens("word " * 1000) == 1250
 
     def test_truncation_with_nonexistent_task(self, injection_project):
         """Test truncation when task memory doesn't exist yet."""
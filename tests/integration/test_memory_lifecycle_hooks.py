@@ -6,6 +6,7 @@ Task Memory lifecycle management via Claude Code PostToolUse hooks.
 
 import json
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -215,11 +216,15 @@ class TestBashHook:
         This test verifies that shell metacharacters in inputs don't execute
         arbitrary commands due to the environment variable + quoted heredoc design.
         """
-        hook_path = (
+        # Run a copy inside the project: the hook works on the project
+        # root it is installed in, not on its working directory
+        hook_path = integration_project / ".backlog" / "hooks" / "post-task-update.sh"
+        shutil.copy(
             Path(__file__).parent.parent.parent
             / ".backlog"
             / "hooks"
-            / "post-task-update.sh"
+            / "post-task-update.sh",
+            hook_path,
         )
 
         # Malicious payloads that would execute commands if shell injection existed
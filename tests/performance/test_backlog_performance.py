@@ -0,0 +1,280 @@
+"""Performance Tests for backlog task parsing and dependency graphs.
+
+This module benchmarks the tasks.md → Backlog.md pipeline at scale:
+- Parsing generated 50k-task tasks.md files
+- Dependency inference and validation
+- Execution order, parallel batches and critical path on 50k tasks
+- Deep dependency chains (no recursion limit)
+- Streaming parse memory on large files
+- Bulk writes and stats for 20k Backlog.md task files
+- Batched task creation through the file backend
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from flowspec_cli.backlog.backend import FileBacklogBackend
+from flowspec_cli.backlog.dependency_graph import DependencyGraphBuilder
+from flowspec_cli.backlog.mapper import TaskMapper
+from flowspec_cli.backlog.parser import Task, TaskParser
+from flowspec_cli.backlog.writer import BacklogWriter
+
+TASK_COUNT = 50_000
+STORY_COUNT = 500
+
+
+def generate_tasks_md(
+    task_count: int = TASK_COUNT, stories: int = STORY_COUNT, padding: int = 0
+) -> str:
+    """Generate a tasks.md with setup, foundational, user story and polish phases."""
+    lines = ["# Tasks: Generated Plan", ""]
+    task_num = 1
+    suffix = " - " + "detail " * (padding // 7) if padding else ""
+
+    def add(line: str) -> None:
+        nonlocal task_num
+        lines.append(f"- [ ] T{task_num:05d} {line}{suffix}")
+        task_num += 1
+
+    lines.append("## Phase 1: Setup")
+    for i in range(10):
+        add(f"Configure tooling step {i} in config/setup_{i}.toml")
+
+    lines.append("## Phase 2: Foundational")
+    for i in range(100):
+        add(f"[P] Build shared module {i} in src/core/module_{i}.py")
+
+    story_tasks = (task_count - 120) // stories
+    for story in range(1, stories + 1):
+        lines.append(f"## Phase {story + 2}: User Story {story}")
+        for i in range(story_tasks):
+            add(f"[US{story}] Implement part {i} in src/us{story}/part_{i}.py")
+
+    lines.append(f"## Phase {stories + 3}: Polish")
+    while task_num <= task_count:
+        add("Polish documentation in docs/README.md")
+
+    return "\n".join(lines) + "\n"
+
+
+def timed(operation):
+    """Run operation and return (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = operation()
+    return result, (time.perf_counter() - start) * 1000
+
+
+@pytest.fixture(scope="module")
+def tasks_file(tmp_path_factory):
+    """Write a generated 50k-task tasks.md file."""
+    path = tmp_path_factory.mktemp("backlog_perf") / "tasks.md"
+    path.write_text(generate_tasks_md())
+    return path
+
+
+@pytest.fixture(scope="module")
+def parsed_tasks(tasks_file):
+    """Parse the generated tasks file once for graph benchmarks."""
+    return TaskParser().parse_tasks_file(tasks_file)
+
+
+@pytest.mark.slow
+class TestLargePlanPerformance:
+    """Benchmarks on a generated 50k-task plan."""
+
+    def test_parse_50k_tasks(self, tasks_file):
+        """Parse and infer dependencies for 50k tasks (<3s target)."""
+        tasks, duration = timed(lambda: TaskParser().parse_tasks_file(tasks_file))
+
+        assert len(tasks) == TASK_COUNT
+        first_story_task = next(t for t in tasks if t.user_story == "US1")
+        assert first_story_task.dependencies == ["T00110"]
+        assert duration < 3000, f"Parsing took {duration:.0f}ms"
+
+        print(f"\nParse 50k tasks: {duration:.0f}ms")
+
+    def test_graph_operations_50k_tasks(self, parsed_tasks):
+        """Validate, order, batch and find critical path (<2s target)."""
+
+        def run():
+            graph = DependencyGraphBuilder(parsed_tasks)
+            is_valid, errors = graph.validate()
+            return (
+                is_valid,
+                graph.get_execution_order(),
+                graph.get_parallel_batches(),
+                graph.get_critical_path(),
+            )
+
+        (is_valid, order, batches, critical_path), duration = timed(run)
+
+        assert is_valid
+        assert len(order) == TASK_COUNT
+        assert sum(len(batch) for batch in batches) == TASK_COUNT
+        assert critical_path
+        assert duration < 2000, f"Graph operations took {duration:.0f}ms"
+
+        print(f"\nGraph operations 50k tasks: {duration:.0f}ms")
+
+    def test_migration_dry_run_50k_tasks(self, tasks_file, tmp_path):
+        """Full dry-run migration of a 50k-task plan (<5s target)."""
+        mapper = TaskMapper(tmp_path / "backlog")
+
+        result, duration = timed(
+            lambda: mapper.generate_from_tasks_file(tasks_file, dry_run=True)
+        )
+
+        assert result["success"]
+        assert result["tasks_parsed"] == TASK_COUNT
+        assert duration < 5000, f"Dry-run migration took {duration:.0f}ms"
+
+        print(f"\nDry-run migration 50k tasks: {duration:.0f}ms")
+
+
+class TestDeepChainPerformance:
+    """Long dependency chains must not recurse or degrade quadratically."""
+
+    CHAIN_LENGTH = 20_000
+
+    @pytest.fixture
+    def chain(self):
+        tasks = [Task(task_id="T00000", description="Root")]
+        for i in range(1, self.CHAIN_LENGTH):
+            tasks.append(
+                Task(
+                    task_id=f"T{i:05d}",
+                    description=f"Step {i}",
+                    dependencies=[f"T{i - 1:05d}"],
+                )
+            )
+        return tasks
+
+    def test_critical_path_deep_chain(self, chain):
+        graph = DependencyGraphBuilder(chain)
+
+        path, duration = timed(graph.get_critical_path)
+
+        assert len(path) == self.CHAIN_LENGTH
+        assert path[0] == "T00000"
+        assert duration < 1000, f"Critical path took {duration:.0f}ms"
+
+    def test_all_dependencies_deep_chain(self, chain):
+        graph = DependencyGraphBuilder(chain)
+
+        deps, duration = timed(
+            lambda: graph.get_all_dependencies(f"T{self.CHAIN_LENGTH - 1:05d}")
+        )
+
+        assert len(deps) == self.CHAIN_LENGTH - 1
+        assert deps[0] == f"T{self.CHAIN_LENGTH - 2:05d}"
+        assert duration < 1000, f"Transitive dependencies took {duration:.0f}ms"
+
+    def test_parallel_batches_deep_chain(self, chain):
+        graph = DependencyGraphBuilder(chain)
+
+        batches, duration = timed(graph.get_parallel_batches)
+
+        assert len(batches) == self.CHAIN_LENGTH
+        assert duration < 1000, f"Parallel batches took {duration:.0f}ms"
+
+
+@pytest.mark.slow
+class TestStreamingMemory:
+    """Streaming parse memory grows with task count, not file size."""
+
+    def test_stream_peak_memory_below_file_size(self, tmp_path):
+        """Scan and stream a ~25MB plan with peak memory below the file size."""
+        path = tmp_path / "tasks.md"
+        path.write_text(generate_tasks_md(padding=400))
+        file_size = path.stat().st_size
+
+        tracemalloc.start()
+        try:
+            parser = TaskParser()
+            records = parser.scan_tasks_file(path)
+            streamed = sum(1 for _ in parser.stream_tasks_file(path, records))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert streamed == TASK_COUNT
+        assert peak < file_size, f"Peak {peak} bytes for {file_size} byte file"
+
+        print(f"\nStream {file_size / 1e6:.0f}MB plan: peak {peak / 1e6:.1f}MB")
+
+
+@pytest.mark.slow
+class TestBulkWritePerformance:
+    """Bulk writes and single-scan statistics for 20k task files."""
+
+    WRITE_COUNT = 20_000
+
+    def test_migrate_and_stats_20k_tasks(self, tmp_path):
+        """Migrate 20k tasks (<10s target) and compute stats (<3s target)."""
+        tasks_file = tmp_path / "tasks.md"
+        tasks_file.write_text(generate_tasks_md(self.WRITE_COUNT, stories=100))
+        mapper = TaskMapper(tmp_path / "backlog")
+
+        result, write_duration = timed(
+            lambda: mapper.generate_from_tasks_file(tasks_file)
+        )
+
+        assert result["success"]
+        assert result["tasks_created"] == self.WRITE_COUNT
+
+        stats, stats_duration = timed(mapper.get_stats)
+
+        assert stats["total"] == self.WRITE_COUNT
+        assert stats["by_status"] == {"To Do": self.WRITE_COUNT}
+        assert stats["by_label"]["implementation"] == 19_800  # 100 stories x 198
+        assert write_duration < 10000, f"Migration took {write_duration:.0f}ms"
+        assert stats_duration < 3000, f"Stats took {stats_duration:.0f}ms"
+
+        print(
+            f"\nMigrate 20k tasks: {write_duration:.0f}ms, "
+            f"stats: {stats_duration:.0f}ms"
+        )
+
+    def test_rerun_skips_existing_20k_tasks(self, tmp_path):
+        """Re-running without overwrite lists the directory once (<3s target)."""
+        writer = BacklogWriter(tmp_path / "backlog")
+        tasks = [
+            Task(task_id=f"T{i:05d}", description=f"Task {i}")
+            for i in range(self.WRITE_COUNT)
+        ]
+        writer.write_tasks(tasks)
+
+        created, duration = timed(lambda: writer.write_tasks(tasks))
+
+        assert created == []
+        assert duration < 3000, f"Skip pass took {duration:.0f}ms"
+
+
+class TestBatchCreatePerformance:
+    """Batched creation allocates IDs once and starts no processes."""
+
+    def test_create_500_tasks(self, tmp_path):
+        """Create 500 tasks in one batch (<2s target)."""
+        backlog = tmp_path / "backlog"
+        (backlog / "tasks").mkdir(parents=True)
+        (backlog / "config.yml").write_text("zero_padded_ids: 3\n")
+        backend = FileBacklogBackend(tmp_path)
+        specs = [
+            {
+                "title": f"Fix finding {i}",
+                "description": f"Finding {i} in src/module_{i}.py",
+                "labels": ["security"],
+                "acceptance_criteria": ["Fixed", "Tested"],
+            }
+            for i in range(500)
+        ]
+
+        task_ids, duration = timed(lambda: backend.create_tasks(specs))
+
+        assert task_ids[0] == "task-001"
+        assert task_ids[-1] == "task-500"
+        assert duration < 2000, f"Batch create took {duration:.0f}ms"
+
+        print(f"\nBatch create 500 tasks: {duration:.0f}ms")
@@ -0,0 +1,125 @@
+"""Performance Tests for hook event matching.
+
+This module benchmarks HooksConfig.get_matching_hooks at scale:
+- 1k hooks across many event namespaces, with wildcards and filters
+- 100k events dominated by high-rate agent.progress events
+- Compiled index compared against a per-hook fnmatch scan
+"""
+
+import time
+
+import pytest
+
+from flowspec_cli.hooks.events import Event
+from flowspec_cli.hooks.schema import EventMatcher, HookDefinition, HooksConfig
+
+NAMESPACES = ["spec", "plan", "task", "implement", "validate", "deploy", "agent"]
+ACTIONS = ["created", "updated", "completed", "started", "progress", "error"]
+
+
+def generate_hooks(count: int) -> list[HookDefinition]:
+    """Generate hooks mixing exact types, namespace and unscoped wildcards."""
+    hooks = []
+    for i in range(count):
+        namespace = NAMESPACES[i % len(NAMESPACES)]
+        action = ACTIONS[(i // len(NAMESPACES)) % len(ACTIONS)]
+        if i % 10 == 0:
+            matcher = EventMatcher(type=f"{namespace}.*")
+        elif i % 50 == 1:
+            matcher = EventMatcher(type=f"*.{action}")
+        elif i % 3 == 0:
+            matcher = EventMatcher(
+                type=f"{namespace}.{action}",
+                filter={"agent": [f"agent-{i % 20}", f"agent-{i % 7}"]},
+            )
+        else:
+            matcher = EventMatcher(
+                type=f"{namespace}.{action}",
+                filter={"labels_any": [f"label-{i % 30}", "backend"]},
+            )
+        hooks.append(HookDefinition(name=f"hook-{i}", events=[matcher], command="x"))
+    return hooks
+
+
+def generate_events(count: int) -> list[Event]:
+    """Generate events; 90% are agent.progress from a fleet of agents."""
+    events = []
+    for i in range(count):
+        if i % 10:
+            event_type = "agent.progress"
+        else:
+            event_type = f"{NAMESPACES[i % 7]}.{ACTIONS[i % 6]}"
+        events.append(
+            Event(
+                event_type=event_type,
+                project_root="/tmp",
+                context={"agent": f"agent-{i % 20}", "labels": [f"label-{i % 30}"]},
+            )
+        )
+    return events
+
+
+def scan_matching_hooks(config: HooksConfig, event: Event) -> list[HookDefinition]:
+    """Reference matcher: fnmatch every matcher of every hook."""
+    return [
+        hook for hook in config.hooks if hook.is_enabled() and hook.matches_event(event)
+    ]
+
+
+@pytest.fixture(scope="module")
+def config():
+    return HooksConfig(version="1.0", hooks=generate_hooks(1_000))
+
+
+class TestEventMatchingPerformance:
+    """Benchmark compiled event matching against a full scan."""
+
+    def test_compiled_matches_scan(self, config):
+        """Test the index returns the same hooks as the scan."""
+        for event in generate_events(2_000):
+            assert config.get_matching_hooks(event) == scan_matching_hooks(
+                config, event
+            )
+
+    def test_checks_fewer_hooks_than_scan(self, config):
+        """Test the index only checks hooks whose event types can match."""
+        events = generate_events(1_000)
+        config.compile()
+
+        checked = sum(len(config._index.candidates(e.event_type)) for e in events)
+        scanned = len(config.hooks) * len(events)
+
+        print(f"\n1k hooks x 1k events: scan {scanned} checks, index {checked}")
+        assert checked * 10 < scanned
+
+    @pytest.mark.slow
+    def test_faster_than_scan(self, config):
+        """Test the index beats the per-hook scan by at least 10x."""
+        events = generate_events(1_000)
+
+        start = time.perf_counter()
+        for event in events:
+            scan_matching_hooks(config, event)
+        scan_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for event in events:
+            config.get_matching_hooks(event)
+        compiled_s = time.perf_counter() - start
+
+        speedup = scan_s / compiled_s
+        print(f"\n1k hooks x 1k events: scan {scan_s:.3f}s, index {compiled_s:.3f}s")
+        assert speedup > 10, f"Index only {speedup:.1f}x faster than scan"
+
+    @pytest.mark.slow
+    def test_100k_events(self, config):
+        """Test matching 100k events against 1k hooks."""
+        events = generate_events(100_000)
+
+        start = time.perf_counter()
+        matched = sum(len(config.get_matching_hooks(event)) for event in events)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n1k hooks x 100k events: {elapsed:.2f}s, {matched} matches")
+        assert matched > 0
+        assert elapsed < 10, f"Matching 100k events took {elapsed:.2f}s"
@@ -2,6 +2,7 @@
 
 This module benchmarks task memory operations at scale:
 - Create/read/list operations with 100, 1000, 10000 memory files
+- Catalog-backed listing, stats and cleanup with 100k memory files
 - Operation time targets: <50ms for most operations
 - Search performance across large memory sets
 - Memory footprint and resource usage
@@ -9,7 +10,7 @@ This module benchmarks task memory operations at scale:
 
 import pytest
 import time
-from flowspec_cli.memory import TaskMemoryStore, LifecycleManager
+from flowspec_cli.memory import CleanupManager, TaskMemoryStore, LifecycleManager
 from flowspec_cli.memory.injector import ContextInjector
 import statistics
 
@@ -289,7 +290,6 @@ class TestListPerformance:
         )
 
 
-@pytest.mark.skip(reason="TaskMemoryStore has no search method - search is CLI-only")
 class TestSearchPerformance:
     """Performance tests for searching memory content."""
 
@@ -679,3 +679,85 @@ class TestMemoryFootprint:
         print(
             f"\nArchive Size (100 files): {total_size} bytes ({total_size / 1024 / 1024:.2f} MB)"
         )
+
+
+@pytest.mark.slow
+class TestCatalogScale:
+    """Listing, stats and cleanup over 100k memories via the metadata catalog."""
+
+    MEMORY_COUNT = 100_000
+    ARCHIVED_COUNT = 20_000
+
+    @pytest.fixture(scope="class")
+    def catalog_store(self, tmp_path_factory):
+        """Store with 100k memory files written directly to disk."""
+        root = tmp_path_factory.mktemp("catalog_scale")
+        store = TaskMemoryStore(base_path=root)
+
+        for i in range(self.MEMORY_COUNT):
+            task_id = f"task-{i:06d}"
+            directory = (
+                store.archive_dir if i < self.ARCHIVED_COUNT else store.memory_dir
+            )
+            (directory / f"{task_id}.md").write_text(
+                f"---\ntask_id: {task_id}\ncreated: 2025-01-01 00:00:00\n---\n"
+                f"# Task Memory: {task_id}\n\n## Notes\n"
+            )
+
+        # Build the catalog once; later calls only re-stat files
+        start = time.perf_counter()
+        store.catalog.records()
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"\nCatalog build (100k): {build_ms:.0f}ms")
+
+        return store
+
+    def test_catalog_records_100k(self, catalog_store):
+        """Warm catalog refresh over 100k memories (<5s target)."""
+        start = time.perf_counter()
+        records = catalog_store.catalog.records()
+        duration = (time.perf_counter() - start) * 1000
+
+        assert len(records) == self.MEMORY_COUNT
+        assert records[0].metadata["task_id"] == records[0].task_id
+        assert duration < 5000, f"Catalog refresh took {duration:.0f}ms"
+
+        print(f"\nCatalog refresh (100k): {duration:.0f}ms")
+
+    def test_list_active_100k(self, catalog_store):
+        """List 80k active IDs without per-file stat (<2s target)."""
+        start = time.perf_counter()
+        active = catalog_store.list_active()
+        duration = (time.perf_counter() - start) * 1000
+
+        assert len(active) == self.MEMORY_COUNT - self.ARCHIVED_COUNT
+        assert duration < 2000, f"list_active took {duration:.0f}ms"
+
+        print(f"\nlist_active (80k): {duration:.0f}ms")
+
+    def test_stats_100k(self, catalog_store):
+        """CleanupManager.get_stats over 100k memories (<5s target)."""
+        manager = CleanupManager(store=catalog_store)
+
+        start = time.perf_counter()
+        stats = manager.get_stats()
+        duration = (time.perf_counter() - start) * 1000
+
+        assert stats["active_count"] == self.MEMORY_COUNT - self.ARCHIVED_COUNT
+        assert stats["archived_count"] == self.ARCHIVED_COUNT
+        assert duration < 5000, f"get_stats took {duration:.0f}ms"
+
+        print(f"\nget_stats (100k): {duration:.0f}ms")
+
+    def test_archive_older_than_dry_run_100k(self, catalog_store):
+        """Age-based cleanup preview over 100k memories (<5s target)."""
+        manager = CleanupManager(store=catalog_store)
+
+        start = time.perf_counter()
+        candidates = manager.archive_older_than(days=30, dry_run=True)
+        duration = (time.perf_counter() - start) * 1000
+
+        assert candidates == []
+        assert duration < 5000, f"archive_older_than took {duration:.0f}ms"
+
+        print(f"\narchive_older_than dry run (100k): {duration:.0f}ms")
@@ -9,13 +9,20 @@ Tests cover:
 - Error handling
 """
 
+import io
 import json
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from flowspec_cli.security.adapters.semgrep import SemgrepAdapter
+from flowspec_cli.security.adapters.base import CANCEL_EVENT
+from flowspec_cli.security.adapters.semgrep import (
+    SemgrepAdapter,
+    list_target_files,
+    shard_files,
+)
 from flowspec_cli.security.models import Confidence, Severity
 
 
@@ -296,6 +303,96 @@ class TestSemgrepAdapterScanning:
         # Check timeout passed to subprocess
         assert call_args[1]["timeout"] == 300
 
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.run")
+    def test_scan_files_chunks_targets(self, mock_run, mock_adapter, temp_dir):
+        """Test scan_files passes explicit targets in chunks."""
+        mock_run.return_value = Mock(
+            stdout=json.dumps(SAMPLE_SEMGREP_OUTPUT),
+            stderr="",
+            returncode=1,
+        )
+        files = []
+        for i in range(5):
+            path = temp_dir / f"f{i}.py"
+            path.write_text("x = 1")
+            files.append(path)
+        mock_adapter.MAX_TARGETS_PER_RUN = 2
+
+        findings = mock_adapter.scan_files([*files, temp_dir / "deleted.py"])
+
+        assert mock_run.call_count == 3
+        assert len(findings) == 9
+        first_cmd = mock_run.call_args_list[0][0][0]
+        assert first_cmd[-2:] == [str(files[0]), str(files[1])]
+        assert str(temp_dir / "deleted.py") not in mock_run.call_args_list[2][0][0]
+
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.Popen")
+    def test_iter_scan_streams_results(self, mock_popen, mock_adapter, temp_dir):
+        """Test iter_scan converts results from Semgrep's output stream."""
+        mock_popen.return_value = Mock(
+            stdout=io.StringIO(json.dumps(SAMPLE_SEMGREP_OUTPUT)),
+            wait=Mock(return_value=1),
+            poll=Mock(return_value=1),
+        )
+
+        findings = mock_adapter.iter_scan(temp_dir)
+        first = next(findings)
+
+        assert first.location.file == Path("src/app.py")
+        assert [f.severity for f in findings] == [Severity.MEDIUM, Severity.LOW]
+        assert mock_popen.call_args[0][0][-1] == str(temp_dir)
+
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.Popen")
+    def test_iter_scan_cancel_kills_process(self, mock_popen, mock_adapter, temp_dir):
+        """Test setting the cancel event kills a running Semgrep process."""
+        killed = threading.Event()
+
+        class BlockingStdout(io.StringIO):
+            def read(self, size=-1):
+                # Semgrep writes its JSON only when done
+                killed.wait(5)
+                return ""
+
+        process = Mock(
+            stdout=BlockingStdout(),
+            wait=Mock(return_value=-9),
+            poll=Mock(return_value=-9),
+            kill=Mock(side_effect=killed.set),
+        )
+        mock_popen.return_value = process
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            list(mock_adapter.iter_scan(temp_dir, {CANCEL_EVENT: cancel}))
+        process.kill.assert_called()
+
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.Popen")
+    def test_iter_scan_error_exit_code(self, mock_popen, mock_adapter, temp_dir):
+        """Test iter_scan raises when Semgrep fails."""
+        mock_popen.return_value = Mock(
+            stdout=io.StringIO(""),
+            wait=Mock(return_value=2),
+            poll=Mock(return_value=2),
+        )
+
+        with pytest.raises(RuntimeError, match="Semgrep scan failed"):
+            list(mock_adapter.iter_scan(temp_dir))
+
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.Popen")
+    def test_iter_scan_invalid_json(self, mock_popen, mock_adapter, temp_dir):
+        """Test iter_scan kills Semgrep and raises on truncated output."""
+        process = Mock(
+            stdout=io.StringIO(json.dumps(SAMPLE_SEMGREP_OUTPUT)[:500]),
+            wait=Mock(return_value=-9),
+            poll=Mock(return_value=-9),
+        )
+        mock_popen.return_value = process
+
+        with pytest.raises(RuntimeError, match="Failed to parse"):
+            list(mock_adapter.iter_scan(temp_dir))
+        process.kill.assert_called_once()
+
 
 class TestSeverityMapping:
     """Tests for Semgrep severity to UFFormat mapping."""
@@ -507,3 +604,97 @@ class TestFindingConversion:
         assert finding.cwe_id is None
         assert finding.remediation is None
         assert finding.references == []
+
+
+class TestSharding:
+    """Tests for sharded Semgrep execution."""
+
+    @pytest.fixture
+    def mock_adapter(self):
+        with patch(
+            "flowspec_cli.security.adapters.semgrep.ToolDiscovery"
+        ) as mock_class:
+            mock_discovery = MagicMock()
+            mock_discovery.is_available.return_value = True
+            mock_discovery.find_tool.return_value = Path("/usr/bin/semgrep")
+            mock_class.return_value = mock_discovery
+            yield SemgrepAdapter()
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        for i in range(6):
+            (tmp_path / f"mod{i}.py").write_text("x = 1\n" * (i + 1) * 100)
+        for i in range(3):
+            (tmp_path / f"app{i}.js").write_text("let x = 1;\n" * 50)
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("eval(x)")
+        return tmp_path
+
+    def test_shards_are_balanced(self, project):
+        files = list_target_files(project)
+        shards = shard_files(files, 3)
+
+        sizes = [sum(f.stat().st_size for f in shard) for shard in shards]
+        assert len(shards) == 3
+        assert sorted(f for shard in shards for f in shard) == files
+        assert max(sizes) - min(sizes) <= max(f.stat().st_size for f in files)
+        assert all(any(f.suffix == ".js" for f in shard) for shard in shards)
+        assert shard_files(files[:2], 8) == [[files[0]], [files[1]]]
+
+    def test_list_target_files_excludes(self, project):
+        (project / ".semgrepignore").write_text("# comment\napp1.js\n")
+
+        files = list_target_files(project, exclude=["mod0.py"])
+
+        names = [f.name for f in files]
+        assert "dep.js" not in names
+        assert "mod0.py" not in names
+        assert "app1.js" not in names
+        assert "mod1.py" in names
+
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.run")
+    def test_scan_runs_shards_concurrently(self, mock_run, mock_adapter, project):
+        def run(cmd, **kwargs):
+            if cmd[0] == "git":
+                return Mock(stdout="", stderr="not a repo", returncode=128)
+            return Mock(
+                stdout=json.dumps(SAMPLE_SEMGREP_OUTPUT), stderr="", returncode=1
+            )
+
+        mock_run.side_effect = run
+
+        findings = mock_adapter.scan(project, {"jobs": 4, "max_memory": 8192})
+
+        semgrep_calls = [
+            c[0][0] for c in mock_run.call_args_list if c[0][0][0] != "git"
+        ]
+        assert len(semgrep_calls) == 4
+        for cmd in semgrep_calls:
+            assert cmd[cmd.index("--jobs") + 1] == "1"
+            assert cmd[cmd.index("--max-memory") + 1] == "2048"
+            assert str(project) not in cmd  # Explicit file targets only
+        scanned = [
+            arg for cmd in semgrep_calls for arg in cmd if arg.endswith((".py", ".js"))
+        ]
+        assert len(scanned) == 9
+        # Identical results from every shard are merged
+        assert len(findings) == 3
+
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.run")
+    def test_memory_budget_limits_workers(self, mock_run, mock_adapter, project):
+        mock_run.return_value = Mock(
+            stdout=json.dumps(EMPTY_SEMGREP_OUTPUT), stderr="", returncode=0
+        )
+
+        mock_adapter.scan_files(
+            sorted(project.glob("*.*")), {"jobs": 8, "max_memory": 2048}
+        )
+
+        assert mock_run.call_count == 2
+
+    @patch("flowspec_cli.security.adapters.semgrep.subprocess.run")
+    def test_shard_failure_raises(self, mock_run, mock_adapter, project):
+        mock_run.return_value = Mock(stdout="", stderr="boom", returncode=2)
+
+        with pytest.raises(RuntimeError, match="scan failed"):
+            mock_adapter.scan_files(sorted(project.glob("*.*")), {"jobs": 3})
@@ -405,7 +405,9 @@ class TestPatchApplicatorGitApply:
 
     def test_validate_with_git_success(self, tmp_path):
         """Test git apply --check validation."""
-        config = PatchApplicatorConfig(use_git_apply=True)
+        config = PatchApplicatorConfig(
+            use_git_apply=True, backup_dir=tmp_path / "backups"
+        )
         applicator = PatchApplicator(config=config)
 
         target_file = tmp_path / "test.py"
@@ -434,7 +436,9 @@ class TestPatchApplicatorGitApply:
 
     def test_fallback_to_manual_when_git_unavailable(self, tmp_path):
         """Test fallback to manual application when git is not available."""
-        config = PatchApplicatorConfig(use_git_apply=True)
+        config = PatchApplicatorConfig(
+            use_git_apply=True, backup_dir=tmp_path / "backups"
+        )
         applicator = PatchApplicator(config=config)
 
         target_file = tmp_path / "test.py"
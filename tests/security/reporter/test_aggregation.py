@@ -0,0 +1,120 @@
+"""Tests for single-pass findings aggregation."""
+
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+from flowspec_cli.security.reporter.aggregation import aggregate_findings
+from flowspec_cli.security.reporter.models import ComplianceStatus
+from flowspec_cli.security.reporter.owasp import check_owasp_compliance
+
+
+class MockSeverity(Enum):
+    """Mock severity for testing."""
+
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+    INFO = "info"
+
+
+@dataclass
+class MockLocation:
+    """Mock location for testing."""
+
+    file: Path
+
+
+@dataclass
+class MockFinding:
+    """Mock finding for testing."""
+
+    id: str
+    severity: MockSeverity
+    cwe_id: str | None
+    location: MockLocation | None = None
+
+
+class MockClassification(Enum):
+    """Mock classification for testing."""
+
+    TRUE_POSITIVE = "TP"
+    FALSE_POSITIVE = "FP"
+    NEEDS_INVESTIGATION = "NI"
+
+
+@dataclass
+class MockTriageResult:
+    """Mock triage result for testing."""
+
+    finding_id: str
+    classification: MockClassification
+
+
+def make_findings() -> list[MockFinding]:
+    return [
+        MockFinding("F1", MockSeverity.LOW, "CWE-79", MockLocation(Path("a.py"))),
+        MockFinding("F2", MockSeverity.CRITICAL, "CWE-89", MockLocation(Path("a.py"))),
+        MockFinding("F3", MockSeverity.HIGH, "CWE-89", MockLocation(Path("b.py"))),
+        MockFinding("F4", MockSeverity.CRITICAL, "CWE-22"),
+        MockFinding("F5", MockSeverity.INFO, None),
+    ]
+
+
+class TestAggregateFindings:
+    """Tests for aggregate_findings."""
+
+    def test_histograms(self):
+        aggregates = aggregate_findings(make_findings())
+
+        assert aggregates.total == 5
+        assert aggregates.by_severity == {"critical": 2, "high": 1, "low": 1, "info": 1}
+        assert aggregates.by_cwe == {"CWE-89": 2, "CWE-79": 1, "CWE-22": 1}
+        assert aggregates.by_file == {"a.py": 2, "b.py": 1}
+        assert aggregates.by_triage == {"needs_investigation": 5}
+
+    def test_summary_counts_triage(self):
+        triage_map = {
+            "F1": MockTriageResult("F1", MockClassification.TRUE_POSITIVE),
+            "F2": MockTriageResult("F2", MockClassification.FALSE_POSITIVE),
+            "F3": MockTriageResult("F3", MockClassification.NEEDS_INVESTIGATION),
+        }
+
+        summary = aggregate_findings(make_findings(), triage_map).summary()
+
+        assert summary.total == 5
+        assert summary.critical == 2
+        assert summary.true_positives == 1
+        assert summary.false_positives == 1
+        assert summary.needs_investigation == 3
+
+    def test_compliance_matches_check_owasp_compliance(self):
+        findings = make_findings()
+        triage = [MockTriageResult("F2", MockClassification.FALSE_POSITIVE)]
+        triage_map = {t.finding_id: t for t in triage}
+
+        aggregated = aggregate_findings(findings, triage_map).owasp_compliance()
+
+        assert aggregated == check_owasp_compliance(findings, triage)
+        injection = next(c for c in aggregated if c.id == "A03:2021")
+        assert injection.finding_count == 2
+        assert injection.status == ComplianceStatus.PARTIAL
+
+    def test_remediation_candidates_by_severity(self):
+        aggregates = aggregate_findings(make_findings(), max_remediations=3)
+
+        assert [f.id for f in aggregates.remediation_candidates] == ["F2", "F4", "F3"]
+
+    def test_remediation_candidates_skip_false_positives(self):
+        triage_map = {
+            "F2": MockTriageResult("F2", MockClassification.FALSE_POSITIVE),
+        }
+
+        skipped = aggregate_findings(make_findings(), triage_map)
+        included = aggregate_findings(
+            make_findings(), triage_map, include_false_positives=True
+        )
+
+        assert "F2" not in [f.id for f in skipped.remediation_candidates]
+        assert included.remediation_candidates[0].id == "F2"
@@ -351,6 +351,44 @@ class TestReportOutput:
         assert "<style>" in html
         assert "Security Audit Report" in html
 
+    def test_to_html_escapes_content(self, generator):
+        """Test HTML output escapes finding text."""
+        findings = [
+            MockFinding(
+                id="F1",
+                title="<script>alert(1)</script>",
+                description="Unsafe & unescaped",
+                severity=MockSeverity.HIGH,
+                cwe_id="CWE-79",
+            )
+        ]
+
+        html = generator.to_html(generator.generate(findings))
+
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+        assert "<script>" not in html
+        assert "Unsafe &amp; unescaped" in html
+        assert 'class="posture-conditional"' in html
+
+    def test_cwe_breakdown(self, generator):
+        """Test reports include the findings-per-CWE breakdown."""
+        findings = [
+            MockFinding(
+                id=f"F{i}",
+                title="Issue",
+                description="Issue",
+                severity=MockSeverity.MEDIUM,
+                cwe_id=cwe_id,
+            )
+            for i, cwe_id in enumerate(["CWE-79", "CWE-89", "CWE-89"])
+        ]
+        report = generator.generate(findings)
+
+        assert report.cwe_counts["CWE-89"] == 2
+        assert list(report.cwe_counts)[0] == "CWE-89"
+        assert "## Findings by CWE" in generator.to_markdown(report)
+        assert "<h2>Findings by CWE</h2>" in generator.to_html(report)
+
     def test_to_json(self, generator, sample_report):
         """Test JSON output."""
         json_str = generator.to_json(sample_report)
@@ -6,6 +6,7 @@ from enum import Enum
 
 from flowspec_cli.security.reporter.models import ComplianceStatus
 from flowspec_cli.security.reporter.owasp import (
+    CWE_TO_OWASP,
     OWASP_TOP_10,
     get_owasp_category,
     check_owasp_compliance,
@@ -139,6 +140,12 @@ class TestGetOwaspCategory:
         category = get_owasp_category("CWE-99999")
         assert category is None
 
+    def test_index_covers_every_mapped_cwe(self):
+        """Test the CWE index agrees with the category definitions."""
+        for definition in OWASP_TOP_10:
+            for cwe in definition.cwes:
+                assert CWE_TO_OWASP[cwe] is definition
+
 
 class TestCheckOwaspCompliance:
     """Tests for check_owasp_compliance function."""
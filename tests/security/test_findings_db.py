@@ -0,0 +1,199 @@
+"""Tests for the persistent findings database."""
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from flowspec_cli.security.findings_db import (
+    FindingsDB,
+    open_findings_db,
+)
+from flowspec_cli.security.models import Finding, Location, Severity
+
+
+def make_finding(
+    number: int,
+    severity: Severity = Severity.HIGH,
+    file: str = "src/app.py",
+    cwe_id: str | None = "CWE-89",
+) -> Finding:
+    return Finding(
+        id=f"SEMGREP-{number:03d}",
+        scanner="semgrep",
+        severity=severity,
+        title=f"Issue {number}",
+        description="Potential vulnerability",
+        location=Location(Path(file), number, number),
+        cwe_id=cwe_id,
+    )
+
+
+def ids(findings: list[dict]) -> list[str]:
+    return [f["id"] for f in findings]
+
+
+@pytest.fixture
+def db(tmp_path: Path):
+    with FindingsDB(tmp_path / "findings.db") as db:
+        yield db
+
+
+@pytest.fixture
+def findings() -> list[Finding]:
+    return [
+        make_finding(1, Severity.CRITICAL, "src/app.py", "CWE-89"),
+        make_finding(2, Severity.HIGH, "src/app.py", "CWE-79"),
+        make_finding(3, Severity.HIGH, "src/api/views.py", "CWE-89"),
+        make_finding(4, Severity.LOW, "src/api_old.py", None),
+        make_finding(5, Severity.INFO, "tests/test_app.py", "CWE-798"),
+    ]
+
+
+class TestQueries:
+    """Tests for lookups, filters and pagination."""
+
+    def test_get_by_id(self, db, findings):
+        db.record_scan(findings)
+
+        assert db.get("SEMGREP-003")["location"]["file"] == "src/api/views.py"
+        assert db.get("MISSING") is None
+
+    def test_filters(self, db, findings):
+        db.record_scan(findings)
+
+        assert ids(db.query(severities=["HIGH"]).findings) == [
+            "SEMGREP-002",
+            "SEMGREP-003",
+        ]
+        assert ids(db.query(cwe_ids=["CWE-89"]).findings) == [
+            "SEMGREP-001",
+            "SEMGREP-003",
+        ]
+        assert ids(db.query(file="src/api").findings) == ["SEMGREP-003"]
+        assert ids(db.query(file="src/app.py", severities=["high"]).findings) == [
+            "SEMGREP-002"
+        ]
+
+    def test_pagination(self, db, findings):
+        db.record_scan(findings)
+
+        first = db.query(limit=2)
+        last = db.query(limit=2, offset=4)
+
+        assert ids(first.findings) == ["SEMGREP-001", "SEMGREP-002"]
+        assert first.total == 5
+        assert first.has_more
+        assert ids(last.findings) == ["SEMGREP-005"]
+        assert not last.has_more
+        assert len(db.query(limit=None).findings) == 5
+
+    def test_counts_by_severity(self, db, findings):
+        db.record_scan(findings)
+
+        assert db.counts_by_severity() == {
+            "critical": 1,
+            "high": 2,
+            "medium": 0,
+            "low": 1,
+            "info": 1,
+        }
+
+    def test_queries_use_latest_scan(self, db, findings):
+        first = db.record_scan(findings)
+        db.record_scan(findings[:1])
+
+        assert db.query().total == 1
+        assert db.query(scan_id=first).total == 5
+
+
+class TestHistory:
+    """Tests for scan history and diffs."""
+
+    def test_diff(self, db, findings):
+        db.record_scan(findings[:3])
+        rescanned = make_finding(2, Severity.HIGH, "src/app.py", "CWE-79")
+        db.record_scan([findings[0], rescanned, findings[3]])
+
+        diff = db.diff()
+
+        assert ids(diff.new) == ["SEMGREP-004"]
+        assert ids(diff.fixed) == ["SEMGREP-003"]
+        assert ids(diff.persisting) == ["SEMGREP-001", "SEMGREP-002"]
+        assert diff.summary()["head_scan"] == diff.base_scan + 1
+
+    def test_first_scan_is_all_new(self, db, findings):
+        db.record_scan(findings)
+
+        diff = db.diff()
+
+        assert diff.base_scan is None
+        assert len(diff.new) == 5
+        assert diff.fixed == diff.persisting == []
+
+    def test_diff_without_scans_raises(self, db):
+        with pytest.raises(ValueError, match="No scans"):
+            db.diff()
+
+    def test_old_scans_are_pruned(self, db, findings, monkeypatch):
+        monkeypatch.setattr("flowspec_cli.security.findings_db.MAX_SCANS", 3)
+        for _ in range(5):
+            db.record_scan(findings)
+
+        assert [scan.id for scan in db.scans()] == [5, 4, 3]
+
+
+class TestJsonSync:
+    """Tests for importing scan-results.json."""
+
+    def write_results(self, path: Path, findings: list[Finding]) -> None:
+        path.write_text(
+            json.dumps(
+                {
+                    "findings": [f.to_dict() for f in findings],
+                    "metadata": {"scanners_used": ["semgrep"]},
+                }
+            )
+        )
+
+    def test_imports_only_when_changed(self, tmp_path, db, findings):
+        results = tmp_path / "scan-results.json"
+        self.write_results(results, findings)
+
+        first = db.sync_json(results)
+        assert db.sync_json(results) == first
+
+        self.write_results(results, findings[:2])
+        os.utime(results, ns=(0, 0))
+        second = db.sync_json(results)
+
+        assert second != first
+        assert db.query().total == 2
+        assert db.scans()[0].metadata == {"scanners_used": ["semgrep"]}
+
+    def test_invalid_file_raises(self, tmp_path, db):
+        results = tmp_path / "scan-results.json"
+        results.write_text('{"findings": [{"id": "X"}]}')
+
+        with pytest.raises(ValueError):
+            db.sync_json(results)
+
+    def test_open_findings_db(self, tmp_path, findings):
+        assert open_findings_db(tmp_path) is None
+        assert not (tmp_path / "findings.db").exists()
+
+        self.write_results(tmp_path / "scan-results.json", findings)
+        with open_findings_db(tmp_path) as db:
+            assert db.query().total == 5
+
+        mode = stat.S_IMODE((tmp_path / "findings.db").stat().st_mode)
+        assert mode == 0o600
+
+    def test_persists_across_connections(self, tmp_path, findings):
+        with FindingsDB(tmp_path / "findings.db") as db:
+            db.record_scan(findings)
+
+        with FindingsDB(tmp_path / "findings.db") as db:
+            assert db.get("SEMGREP-001")["title"] == "Issue 1"
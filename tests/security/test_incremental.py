@@ -0,0 +1,280 @@
+"""Tests for incremental scanning."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from flowspec_cli.security.adapters.base import ScannerAdapter
+from flowspec_cli.security.incremental import (
+    FindingsStore,
+    build_manifest,
+    git_changes,
+    manifest_changes,
+)
+from flowspec_cli.security.models import Finding, Location, Severity
+from flowspec_cli.security.orchestrator import ScannerOrchestrator
+
+
+class EvalScanner(ScannerAdapter):
+    """Reports every line containing eval( and records what it scanned."""
+
+    def __init__(self):
+        self.scanned: list[list[str]] = []
+        self.fail = False
+
+    @property
+    def name(self) -> str:
+        return "eval"
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    def is_available(self) -> bool:
+        return True
+
+    def scan(self, target: Path, config: dict | None = None) -> list[Finding]:
+        files = sorted(p for p in target.rglob("*.py") if ".flowspec" not in p.parts)
+        return self.scan_files(files, config)
+
+    def scan_files(
+        self, files: list[Path], config: dict | None = None
+    ) -> list[Finding]:
+        if self.fail:
+            raise RuntimeError("scanner crashed")
+        self.scanned.append(sorted(p.name for p in files))
+        findings = []
+        for path in files:
+            for number, line in enumerate(path.read_text().splitlines(), 1):
+                if "eval(" in line:
+                    findings.append(
+                        Finding(
+                            id="EVAL-001",
+                            scanner="eval",
+                            severity=Severity.HIGH,
+                            title="Use of eval",
+                            description="eval() on untrusted input",
+                            location=Location(path, number, number, code_snippet=line),
+                            cwe_id="CWE-95",
+                        )
+                    )
+        return findings
+
+    def get_install_instructions(self) -> str:
+        return "Built in"
+
+
+def git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(root), *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def locations(findings: list[Finding]) -> list[tuple[str, int]]:
+    return sorted((f.location.file.name, f.location.line_start) for f in findings)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "a.py").write_text("x = eval(data)\n")
+    (tmp_path / "b.py").write_text("y = 1\n")
+    (tmp_path / "c.py").write_text("z = eval(other)\n")
+    return tmp_path
+
+
+@pytest.fixture
+def git_project(project: Path) -> Path:
+    git(project, "init", "-q")
+    git(project, "config", "user.email", "dev@example.com")
+    git(project, "config", "user.name", "Dev")
+    git(project, "add", ".")
+    git(project, "commit", "-q", "-m", "initial")
+    return project
+
+
+@pytest.fixture
+def scanner() -> EvalScanner:
+    return EvalScanner()
+
+
+@pytest.fixture
+def orchestrator(scanner: EvalScanner) -> ScannerOrchestrator:
+    return ScannerOrchestrator([scanner])
+
+
+class TestGitIncremental:
+    """Tests for git-based change detection."""
+
+    def test_first_run_is_full_scan(self, git_project, orchestrator, scanner):
+        result = orchestrator.scan_incremental(git_project)
+
+        assert result.full_scan
+        assert scanner.scanned == [["a.py", "b.py", "c.py"]]
+        assert locations(result.findings) == [("a.py", 1), ("c.py", 1)]
+
+    def test_only_changed_files_are_scanned(self, git_project, orchestrator, scanner):
+        orchestrator.scan_incremental(git_project)
+
+        (git_project / "b.py").write_text("y = eval(more)\n")
+        (git_project / "d.py").write_text("w = 2\n")
+        (git_project / "c.py").unlink()
+        result = orchestrator.scan_incremental(git_project)
+
+        assert not result.full_scan
+        assert scanner.scanned[-1] == ["b.py", "d.py"]
+        assert result.changed_files == ["b.py", "d.py"]
+        assert result.deleted_files == ["c.py"]
+        assert result.reused_findings == 1
+        assert locations(result.findings) == [("a.py", 1), ("b.py", 1)]
+
+    def test_matches_full_scan(self, git_project, orchestrator):
+        orchestrator.scan_incremental(git_project)
+        (git_project / "a.py").write_text("x = 1\nx = eval(data)\n")
+
+        incremental = orchestrator.scan_incremental(git_project).findings
+        full = orchestrator.scan(git_project)
+
+        assert locations(incremental) == locations(full)
+
+    def test_reverted_file_is_rescanned(self, git_project, orchestrator, scanner):
+        orchestrator.scan_incremental(git_project)
+        (git_project / "a.py").write_text("x = 1\n")
+        assert locations(orchestrator.scan_incremental(git_project).findings) == [
+            ("c.py", 1)
+        ]
+
+        git(git_project, "checkout", "--", "a.py")
+        result = orchestrator.scan_incremental(git_project)
+
+        assert scanner.scanned[-1] == ["a.py"]
+        assert locations(result.findings) == [("a.py", 1), ("c.py", 1)]
+
+    def test_baseline_ref(self, git_project, orchestrator, scanner):
+        orchestrator.scan_incremental(git_project)
+        git(git_project, "checkout", "-q", "-b", "feature")
+        (git_project / "b.py").write_text("y = eval(more)\n")
+        git(git_project, "commit", "-q", "-am", "change b")
+
+        result = orchestrator.scan_incremental(git_project, baseline_ref="master")
+        if result.full_scan:  # Default branch may be named main
+            result = orchestrator.scan_incremental(git_project, baseline_ref="HEAD~1")
+
+        assert result.changed_files == ["b.py"]
+        assert scanner.scanned[-1] == ["b.py"]
+
+    def test_baseline_ref_ahead_of_stored_commit(
+        self, git_project, orchestrator, scanner
+    ):
+        orchestrator.scan_incremental(git_project)
+        (git_project / "a.py").write_text("x = 1\n")
+        git(git_project, "commit", "-q", "-am", "fix a")
+
+        # Nothing differs from HEAD, but the stored a.py finding is stale
+        result = orchestrator.scan_incremental(git_project, baseline_ref="HEAD")
+
+        assert result.changed_files == ["a.py"]
+        assert locations(result.findings) == [("c.py", 1)]
+
+    def test_unknown_baseline_ref_forces_full_scan(self, git_project, orchestrator):
+        orchestrator.scan_incremental(git_project)
+
+        result = orchestrator.scan_incremental(git_project, baseline_ref="no-such-ref")
+
+        assert result.full_scan
+
+    def test_config_change_forces_full_scan(self, git_project, orchestrator):
+        orchestrator.scan_incremental(git_project)
+
+        result = orchestrator.scan_incremental(
+            git_project, config={"eval": {"rules": ["strict"]}}
+        )
+
+        assert result.full_scan
+        # Resource limits do not change results
+        result = orchestrator.scan_incremental(
+            git_project, config={"eval": {"rules": ["strict"], "jobs": 8}}
+        )
+        assert not result.full_scan
+
+    def test_failed_scan_keeps_store(self, git_project, orchestrator, scanner):
+        orchestrator.scan_incremental(git_project)
+        (git_project / "a.py").write_text("x = 1\n")
+
+        scanner.fail = True
+        orchestrator.scan_incremental(git_project)
+        scanner.fail = False
+        result = orchestrator.scan_incremental(git_project)
+
+        assert scanner.scanned[-1] == ["a.py"]
+        assert locations(result.findings) == [("c.py", 1)]
+
+    def test_git_changes_ignores_store(self, git_project, orchestrator):
+        orchestrator.scan_incremental(git_project)
+
+        changes = git_changes(git_project, "HEAD")
+
+        assert changes.files == set()
+
+
+class TestManifestIncremental:
+    """Tests for content-hash manifest change detection outside git."""
+
+    def test_only_changed_files_are_scanned(self, project, orchestrator, scanner):
+        assert orchestrator.scan_incremental(project).full_scan
+
+        (project / "b.py").write_text("y = eval(more)\n")
+        (project / "a.py").unlink()
+        result = orchestrator.scan_incremental(project)
+
+        assert not result.full_scan
+        assert scanner.scanned[-1] == ["b.py"]
+        assert result.deleted_files == ["a.py"]
+        assert locations(result.findings) == [("b.py", 1), ("c.py", 1)]
+
+    def test_unchanged_tree_scans_nothing(self, project, orchestrator, scanner):
+        orchestrator.scan_incremental(project)
+
+        result = orchestrator.scan_incremental(project)
+
+        assert len(scanner.scanned) == 1
+        assert result.changed_files == []
+        assert result.reused_findings == 2
+
+    def test_manifest_reuses_hashes(self, project):
+        manifest = build_manifest(project)
+        (project / "b.py").write_text("y = 2\n")
+
+        changes = manifest_changes(manifest, build_manifest(project, manifest))
+
+        assert changes.changed == {"b.py"}
+        assert changes.deleted == set()
+
+
+class TestFindingsStore:
+    """Tests for FindingsStore persistence."""
+
+    def test_round_trip(self, project, scanner):
+        root = project.resolve()
+        store = FindingsStore(project / "store.json")
+        store.config_key = "key"
+        store.commit = "abc"
+        store.replace(None, scanner.scan(project), root)
+        store.save()
+
+        loaded = FindingsStore.load(project / "store.json")
+
+        assert loaded.has_baseline
+        assert len(loaded) == 2
+        assert locations(loaded.findings(exclude={"a.py"})) == [("c.py", 1)]
+
+    def test_corrupt_store_is_empty(self, tmp_path):
+        path = tmp_path / "store.json"
+        path.write_text("{not json")
+
+        store = FindingsStore.load(path)
+
+        assert not store.has_baseline
+        assert len(store) == 0
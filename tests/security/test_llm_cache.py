@@ -0,0 +1,226 @@
+"""Tests for the persistent LLM response cache."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from flowspec_cli.security.fixer.generator import FixGenerator, FixGeneratorConfig
+from flowspec_cli.security.llm_cache import (
+    LLMResponseCache,
+    default_llm_cache,
+    model_id,
+    response_key,
+)
+from flowspec_cli.security.models import Finding, Location, Severity
+from flowspec_cli.security.triage.engine import TriageConfig, TriageEngine
+from flowspec_cli.security.triage.llm import FakeLLMClient
+
+SOURCE = """import sqlite3
+
+def get_user(conn, user_id):
+    query = "SELECT * FROM users WHERE id = " + user_id
+    return conn.execute(query)
+"""
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LLMResponseCache:
+    return LLMResponseCache(tmp_path / "llm-cache")
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> Path:
+    path = tmp_path / "app.py"
+    path.write_text(SOURCE)
+    return path
+
+
+def make_finding(path: Path, line: int = 4, finding_id: str = "F-1") -> Finding:
+    return Finding(
+        id=finding_id,
+        scanner="semgrep",
+        severity=Severity.HIGH,
+        title="SQL injection",
+        description="User input concatenated into SQL",
+        location=Location(
+            file=path,
+            line_start=line,
+            line_end=line,
+            code_snippet='query = "SELECT * FROM users WHERE id = " + user_id',
+        ),
+        cwe_id="CWE-89",
+    )
+
+
+class TestResponseKey:
+    """Tests for cache keys."""
+
+    def test_ignores_whitespace_noise(self):
+        key = response_key("classify", "1", "CWE-89", "a = 1\nb = 2\n", "m")
+
+        assert key == response_key("classify", "1", "CWE-89", "a = 1  \r\nb = 2", "m")
+        assert key != response_key("classify", "1", "CWE-89", "a = 1\nb = 3", "m")
+        assert key != response_key("classify", "2", "CWE-89", "a = 1\nb = 2", "m")
+        assert key != response_key("classify", "1", "CWE-79", "a = 1\nb = 2", "m")
+        assert key != response_key("classify", "1", "CWE-89", "a = 1\nb = 2", "m2")
+
+    def test_model_id(self):
+        class Client:
+            model = "claude-sonnet"
+
+        assert model_id(Client()) == "claude-sonnet"
+        assert model_id(FakeLLMClient()) == "FakeLLMClient"
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    def test_get_and_put(self, cache: LLMResponseCache):
+        assert cache.get("ab" * 32) is None
+
+        cache.put("ab" * 32, '{"ok": true}')
+
+        assert cache.get("ab" * 32) == '{"ok": true}'
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.writes) == (1, 1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_ttl_expiry(self, tmp_path: Path):
+        cache = LLMResponseCache(tmp_path, ttl_seconds=60)
+        cache.put("cd" * 32, "old")
+        entry = tmp_path / "cd" / f"{'cd' * 32}.json"
+        data = json.loads(entry.read_text())
+        data["created"] -= 120
+        entry.write_text(json.dumps(data))
+
+        assert cache.get("cd" * 32) is None
+        assert cache.stats.expired == 1
+        assert not entry.exists()
+
+    def test_size_eviction_is_lru(self, tmp_path: Path):
+        cache = LLMResponseCache(tmp_path, max_bytes=1000)
+        keys = [f"{i:02d}" * 32 for i in range(5)]
+        for i, key in enumerate(keys[:4]):
+            cache.put(key, "x" * 150)
+            path = tmp_path / key[:2] / f"{key}.json"
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+        cache.get(keys[0])  # Refresh the oldest entry
+
+        cache.put(keys[4], "x" * 300)
+
+        assert cache.stats.evicted >= 1
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache: LLMResponseCache):
+        path = cache.cache_dir / "ef" / f"{'ef' * 32}.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("not json")
+
+        assert cache.get("ef" * 32) is None
+        assert not path.exists()
+
+    def test_default_cache_respects_env(self, tmp_path: Path, monkeypatch):
+        cache = default_llm_cache(tmp_path)
+        assert cache.cache_dir == tmp_path / ".flowspec" / "cache" / "llm"
+        assert default_llm_cache(tmp_path, enabled=False) is None
+
+        monkeypatch.setenv("FLOWSPEC_LLM_CACHE", "0")
+        assert default_llm_cache(tmp_path) is None
+
+
+class TestCachedTriage:
+    """Tests for triage and fix generation through the cache."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [{}, {"max_workers": 4, "llm_batch_size": 5}],
+        ids=["serial", "concurrent"],
+    )
+    def test_second_run_is_free(self, cache, source_file, config):
+        llm = FakeLLMClient()
+        findings = [make_finding(source_file)]
+
+        first = TriageEngine(llm, TriageConfig(llm_cache=cache, **config))
+        first.triage(findings)
+        calls = llm.calls
+
+        second = TriageEngine(llm, TriageConfig(llm_cache=cache, **config))
+        results = second.triage(findings)
+
+        assert calls == 2
+        assert llm.calls == calls
+        assert results[0].explanation.what == "Fake explanation of the finding"
+
+    def test_moved_finding_still_hits(self, cache, source_file):
+        llm = FakeLLMClient()
+        padding = "".join(f"LIMIT_{i} = {i}\n" for i in range(12))
+        source_file.write_text(padding + SOURCE)
+        TriageEngine(llm, TriageConfig(llm_cache=cache)).triage(
+            [make_finding(source_file, line=16)]
+        )
+
+        # Lines added outside the context window only shift the finding
+        source_file.write_text("# header\n\n" + padding + SOURCE)
+        TriageEngine(llm, TriageConfig(llm_cache=cache)).triage(
+            [make_finding(source_file, line=18)]
+        )
+
+        assert llm.calls == 2
+
+    def test_changed_code_misses(self, cache, source_file):
+        llm = FakeLLMClient()
+        TriageEngine(llm, TriageConfig(llm_cache=cache)).triage(
+            [make_finding(source_file)]
+        )
+
+        source_file.write_text(SOURCE.replace("user_id\n", "str(user_id)\n"))
+        TriageEngine(llm, TriageConfig(llm_cache=cache)).triage(
+            [make_finding(source_file)]
+        )
+
+        assert llm.calls == 4
+
+    def test_unparseable_responses_are_not_cached(self, cache, source_file):
+        class ChattyLLM(FakeLLMClient):
+            def complete(self, prompt):
+                super().complete(prompt)
+                return "I think this is fine."
+
+        llm = ChattyLLM()
+        for _ in range(2):
+            TriageEngine(llm, TriageConfig(llm_cache=cache)).triage(
+                [make_finding(source_file)]
+            )
+
+        assert llm.calls == 4
+        assert cache.stats.writes == 0
+
+    def test_fix_generation_is_cached(self, cache, source_file):
+        class FixLLM(FakeLLMClient):
+            def complete(self, prompt):
+                super().complete(prompt)
+                return json.dumps(
+                    {
+                        "fixed_code": SOURCE.replace(
+                            '" + user_id',
+                            '?"\n    return conn.execute(query, (user_id,))',
+                        ),
+                        "explanation": "Use parameters",
+                        "confidence": 0.9,
+                        "warnings": [],
+                    }
+                )
+
+        llm = FixLLM()
+        config = FixGeneratorConfig(validate_syntax=False, llm_cache=cache)
+
+        first = FixGenerator(llm, config=config).generate_fix(make_finding(source_file))
+        second = FixGenerator(llm, config=config).generate_fix(
+            make_finding(source_file)
+        )
+
+        assert llm.calls == 1
+        assert second.patch.fixed_code == first.patch.fixed_code
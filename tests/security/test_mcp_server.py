@@ -10,12 +10,16 @@ See ADR-008 for architectural context.
 """
 
 import json
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from flowspec_cli.security.adapters.base import ScannerAdapter
 from flowspec_cli.security.models import Confidence, Finding, Location, Severity
+from flowspec_cli.security.orchestrator import ScannerOrchestrator
+from flowspec_cli.security.scan_jobs import ScanJob
 
 
 # Import MCP server module
@@ -82,8 +86,12 @@ def temp_project_dir(tmp_path: Path) -> Path:
 @pytest.fixture
 def mock_orchestrator():
     """Mock scanner orchestrator to avoid subprocess calls."""
-    with patch.object(mcp_server, "_get_orchestrator") as mock:
+    with (
+        patch.object(mcp_server, "_get_orchestrator") as mock,
+        patch.object(mcp_server, "_create_orchestrator") as create,
+    ):
         orchestrator = Mock()
+        orchestrator.failed_scanners = []
         orchestrator.list_scanners.return_value = ["semgrep"]
         orchestrator.scan.return_value = [
             Finding(
@@ -102,7 +110,11 @@ def mock_orchestrator():
                 confidence=Confidence.HIGH,
             )
         ]
+        orchestrator.iter_scan.side_effect = lambda **kwargs: iter(
+            orchestrator.scan.return_value
+        )
         mock.return_value = orchestrator
+        create.return_value = orchestrator
         yield orchestrator
 
 
@@ -112,9 +124,13 @@ def set_project_root(temp_project_dir: Path):
     original_root = mcp_server.PROJECT_ROOT
     mcp_server.PROJECT_ROOT = temp_project_dir
     mcp_server._orchestrator = None  # Reset orchestrator
+    mcp_server._job_manager = None
     yield
     mcp_server.PROJECT_ROOT = original_root
     mcp_server._orchestrator = None
+    if mcp_server._job_manager is not None:
+        mcp_server._job_manager.shutdown()
+        mcp_server._job_manager = None
 
 
 class TestSecurityScanTool:
@@ -123,7 +139,9 @@ class TestSecurityScanTool:
     @pytest.mark.asyncio
     async def test_security_scan_success(self, mock_orchestrator):
         """Test successful security scan."""
-        result = await mcp_server.security_scan(target=".", scanners=["semgrep"])
+        result = await mcp_server.security_scan(
+            target=".", wait=True, scanners=["semgrep"]
+        )
 
         # Verify result structure
         assert "findings_count" in result
@@ -134,7 +152,7 @@ class TestSecurityScanTool:
     @pytest.mark.asyncio
     async def test_security_scan_counts_by_severity(self, mock_orchestrator):
         """Test that scan results include severity counts."""
-        result = await mcp_server.security_scan(target=".")
+        result = await mcp_server.security_scan(target=".", wait=True)
 
         # Verify severity breakdown
         assert "by_severity" in result
@@ -158,7 +176,7 @@ class TestSecurityScanTool:
         mock_orchestrator.list_scanners.return_value = ["semgrep", "trivy"]
 
         result = await mcp_server.security_scan(
-            target=".", scanners=["semgrep", "trivy"]
+            target=".", scanners=["semgrep", "trivy"], wait=True
         )
 
         assert result["metadata"]["scanners_used"] == ["semgrep", "trivy"]
@@ -167,7 +185,7 @@ class TestSecurityScanTool:
     async def test_security_scan_includes_fail_on_result(self, mock_orchestrator):
         """Test that scan includes should_fail and fail_on in result."""
         result = await mcp_server.security_scan(
-            target=".", fail_on=["high", "critical"]
+            target=".", fail_on=["high", "critical"], wait=True
         )
 
         # Verify fail_on fields are included
@@ -203,13 +221,156 @@ class TestSecurityScanTool:
         ]
 
         result = await mcp_server.security_scan(
-            target=".", fail_on=["high", "critical"]
+            target=".", fail_on=["high", "critical"], wait=True
         )
 
         # With only LOW severity finding, should_fail should be False
         assert result["should_fail"] is False
 
 
+class TestScanJobs:
+    """Tests for background scan jobs."""
+
+    @pytest.mark.asyncio
+    async def test_scan_returns_job_immediately(self, mock_orchestrator):
+        """Test security_scan returns a job id and status resource."""
+        result = await mcp_server.security_scan(target=".")
+
+        assert result["status"] in ("queued", "running", "completed")
+        assert result["status_resource"] == f"security://scans/jobs/{result['job_id']}"
+
+        await mcp_server._get_job_manager().wait(result["job_id"])
+        job = json.loads(await mcp_server.get_scan_job(job_id=result["job_id"]))
+        assert job["status"] == "completed"
+        assert job["result"]["findings_count"] == 1
+        assert job["findings_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_scan_jobs(self, mock_orchestrator):
+        """Test scan jobs are listed newest first."""
+        first = await mcp_server.security_scan(target=".", wait=True)
+        second = await mcp_server.security_scan(target=".", wait=True)
+
+        jobs = json.loads(await mcp_server.list_scan_jobs())
+
+        assert [job["job_id"] for job in jobs][:2] == [
+            second["job_id"],
+            first["job_id"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_scan(self, mock_orchestrator):
+        """Test a running scan can be cancelled."""
+        started = threading.Event()
+
+        def slow_scan(**kwargs):
+            started.set()
+            cancel = kwargs["config"]["semgrep"]["cancel_event"]
+            cancel.wait(5)
+            raise RuntimeError("Semgrep scan cancelled")
+            yield  # pragma: no cover
+
+        mock_orchestrator.iter_scan.side_effect = slow_scan
+        result = await mcp_server.security_scan(target=".")
+        assert started.wait(5)
+
+        cancelled = await mcp_server.security_cancel_scan(job_id=result["job_id"])
+        job = await mcp_server._get_job_manager().wait(result["job_id"])
+
+        assert cancelled["job_id"] == result["job_id"]
+        assert job.status.value == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_failed_scanner_fails_job(self, mock_orchestrator, temp_project_dir):
+        """Test a scanner failure fails the job without replacing results."""
+        await mcp_server.security_scan(target=".", wait=True)
+        results_file = temp_project_dir / "docs" / "security" / "scan-results.json"
+        previous = results_file.read_text()
+
+        def failing_scan(**kwargs):
+            mock_orchestrator.failed_scanners = ["semgrep"]
+            return iter([])
+
+        mock_orchestrator.iter_scan.side_effect = failing_scan
+        result = await mcp_server.security_scan(target=".")
+        job = await mcp_server._get_job_manager().wait(result["job_id"])
+
+        assert job.status.value == "failed"
+        assert "semgrep" in job.error
+        assert results_file.read_text() == previous
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self):
+        """Test unknown job ids return errors."""
+        assert "error" in json.loads(await mcp_server.get_scan_job(job_id="nope"))
+        assert "error" in await mcp_server.security_cancel_scan(job_id="nope")
+
+
+class FixedScanner(ScannerAdapter):
+    """Scanner adapter that reports a fixed list of findings."""
+
+    def __init__(self, name: str, findings: list[Finding]):
+        self._name = name
+        self._findings = findings
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    def is_available(self) -> bool:
+        return True
+
+    def scan(self, target: Path, config: dict | None = None) -> list[Finding]:
+        return list(self._findings)
+
+    def get_install_instructions(self) -> str:
+        return "Built in"
+
+
+class TestRunScan:
+    """Tests for the scan job body."""
+
+    def test_duplicates_count_at_highest_severity(self, temp_project_dir: Path):
+        """Test merged duplicates drive by_severity and should_fail."""
+
+        def finding(scanner: str, severity: Severity) -> Finding:
+            return Finding(
+                id=f"{scanner.upper()}-001",
+                scanner=scanner,
+                severity=severity,
+                title="SQL Injection",
+                description="Potential SQL injection",
+                location=Location(file=Path("app.py"), line_start=42, line_end=42),
+                cwe_id="CWE-89",
+            )
+
+        orchestrator = ScannerOrchestrator(
+            [
+                FixedScanner("semgrep", [finding("semgrep", Severity.MEDIUM)]),
+                FixedScanner("codeql", [finding("codeql", Severity.CRITICAL)]),
+            ]
+        )
+        with patch.object(
+            mcp_server, "_create_orchestrator", return_value=orchestrator
+        ):
+            result = mcp_server._run_scan(
+                ScanJob(id="job"),
+                ".",
+                temp_project_dir,
+                ["semgrep", "codeql"],
+                ["critical"],
+            )
+
+        assert result["findings_count"] == 1
+        assert result["by_severity"]["critical"] == 1
+        assert result["by_severity"]["medium"] == 0
+        assert result["should_fail"] is True
+
+
 class TestSecurityTriageTool:
     """Tests for security_triage tool."""
 
@@ -312,6 +473,15 @@ class TestListFindingsResource:
         assert "SEMGREP-001" in ids
         assert "SEMGREP-002" in ids
 
+    @pytest.mark.asyncio
+    async def test_list_findings_is_not_truncated(self, monkeypatch):
+        """Test that list_findings pages past MAX_FINDINGS."""
+        monkeypatch.setattr(mcp_server, "MAX_FINDINGS", 1)
+
+        results = json.loads(await mcp_server.list_findings())
+
+        assert sorted(f["id"] for f in results) == ["SEMGREP-001", "SEMGREP-002"]
+
     @pytest.mark.asyncio
     async def test_list_findings_empty(self, temp_project_dir: Path):
         """Test listing findings when no scan results exist."""
@@ -346,6 +516,71 @@ class TestGetFindingResource:
         assert "error" in result
 
 
+class TestQueryFindingsTool:
+    """Tests for security_query_findings tool."""
+
+    @pytest.mark.asyncio
+    async def test_query_filters_and_paginates(self):
+        """Test filtered, paginated queries against the findings database."""
+        result = await mcp_server.security_query_findings(
+            severities=["critical", "high"], limit=1
+        )
+
+        assert result["total"] == 2
+        assert result["has_more"] is True
+        assert [f["id"] for f in result["findings"]] == ["SEMGREP-001"]
+
+        result = await mcp_server.security_query_findings(cwe_ids=["CWE-798"])
+        assert [f["id"] for f in result["findings"]] == ["SEMGREP-002"]
+
+    @pytest.mark.asyncio
+    async def test_query_rejects_invalid_input(self):
+        """Test invalid severities and pagination are rejected."""
+        result = await mcp_server.security_query_findings(severities=["urgent"])
+        assert "error" in result
+
+        result = await mcp_server.security_query_findings(limit=0)
+        assert "error" in result
+
+    @pytest.mark.asyncio
+    async def test_findings_db_tracks_file_changes(self, temp_project_dir: Path):
+        """Test resources reflect scan-results.json after it is rewritten."""
+        await mcp_server.list_findings()
+        findings_file = temp_project_dir / "docs" / "security" / "scan-results.json"
+        data = json.loads(findings_file.read_text())
+        data["findings"] = data["findings"][:1]
+        findings_file.write_text(json.dumps(data))
+
+        results = json.loads(await mcp_server.list_findings())
+
+        assert [f["id"] for f in results] == ["SEMGREP-001"]
+
+
+class TestScanHistory:
+    """Tests for scan history resources."""
+
+    @pytest.mark.asyncio
+    async def test_scan_reports_changes(self, mock_orchestrator):
+        """Test a scan reports new, fixed and persisting findings."""
+        await mcp_server.list_findings()  # Import the fixture's results
+
+        result = await mcp_server.security_scan(target=".", wait=True)
+
+        assert result["changes"] == {"new": 0, "fixed": 1, "persisting": 1}
+
+    @pytest.mark.asyncio
+    async def test_scan_diff_resource(self, mock_orchestrator):
+        """Test the diff resource compares the last two scans."""
+        await mcp_server.list_findings()
+        await mcp_server.security_scan(target=".", wait=True)
+
+        diff = json.loads(await mcp_server.get_scan_diff())
+        scans = json.loads(await mcp_server.list_scans())
+
+        assert [f["id"] for f in diff["fixed_findings"]] == ["SEMGREP-002"]
+        assert [scan["total"] for scan in scans] == [1, 2]
+
+
 class TestStatusResource:
     """Tests for security://status resource."""
 
@@ -424,7 +659,7 @@ class TestNoLLMCalls:
             "flowspec_cli.security.triage.classifiers.base.LLMClient"
         ) as mock_llm:
             # Test scan tool
-            await mcp_server.security_scan(target=".")
+            await mcp_server.security_scan(target=".", wait=True)
 
             # Test triage tool
             await mcp_server.security_triage()
@@ -0,0 +1,154 @@
+"""Tests for background scan jobs."""
+
+import asyncio
+import threading
+
+import pytest
+
+from flowspec_cli.security.scan_jobs import (
+    JobStatus,
+    ScanJob,
+    ScanJobManager,
+)
+
+
+@pytest.fixture
+def manager():
+    manager = ScanJobManager(max_concurrent=1, max_pending=1)
+    yield manager
+    manager.shutdown()
+
+
+def blocking_work(release: threading.Event, started: threading.Event | None = None):
+    """Work that runs until released or cancelled."""
+
+    def work(job: ScanJob) -> dict:
+        if started is not None:
+            started.set()
+        while not release.wait(0.01):
+            job.check_cancelled()
+        job.findings_count = 3
+        return {"findings_count": 3}
+
+    return work
+
+
+class TestScanJobManager:
+    """Tests for ScanJobManager."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately(self, manager):
+        release = threading.Event()
+        started = threading.Event()
+
+        job = manager.submit(blocking_work(release, started), {"target": "."})
+        assert started.wait(5)
+
+        assert manager.get(job.id).status is JobStatus.RUNNING
+        release.set()
+        job = await manager.wait(job.id)
+
+        assert job.status is JobStatus.COMPLETED
+        assert job.result == {"findings_count": 3}
+        assert job.to_dict()["params"] == {"target": "."}
+
+    @pytest.mark.asyncio
+    async def test_wait_does_not_block_event_loop(self, manager):
+        release = threading.Event()
+        job = manager.submit(blocking_work(release))
+
+        waiter = asyncio.create_task(manager.wait(job.id))
+        await asyncio.sleep(0.05)
+
+        # The loop kept running while the scan was in progress
+        assert not waiter.done()
+        release.set()
+        assert (await waiter).status is JobStatus.COMPLETED
+
+    def test_concurrency_limit(self, manager):
+        release = threading.Event()
+        manager.submit(blocking_work(release))
+        queued = manager.submit(blocking_work(release))
+
+        with pytest.raises(RuntimeError, match="Too many scans"):
+            manager.submit(blocking_work(release))
+
+        assert queued.status is JobStatus.QUEUED
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_job(self, manager):
+        release = threading.Event()
+        running = manager.submit(blocking_work(release))
+        queued = manager.submit(blocking_work(release))
+
+        manager.cancel(queued.id)
+
+        assert queued.status is JobStatus.CANCELLED
+        release.set()
+        assert (await manager.wait(running.id)).status is JobStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_when_queued_job_is_cancelled(self, manager):
+        release = threading.Event()
+        running = manager.submit(blocking_work(release))
+        queued = manager.submit(blocking_work(release))
+
+        waiter = asyncio.create_task(manager.wait(queued.id))
+        await asyncio.sleep(0.05)
+        manager.cancel(queued.id)
+
+        assert (await waiter).status is JobStatus.CANCELLED
+        release.set()
+        await manager.wait(running.id)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_waiter_propagates(self, manager):
+        release = threading.Event()
+        job = manager.submit(blocking_work(release))
+
+        waiter = asyncio.create_task(manager.wait(job.id))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job(self, manager):
+        started = threading.Event()
+        job = manager.submit(blocking_work(threading.Event(), started))
+        assert started.wait(5)
+
+        manager.cancel(job.id)
+        job = await manager.wait(job.id)
+
+        assert job.status is JobStatus.CANCELLED
+        assert job.result is None
+
+    @pytest.mark.asyncio
+    async def test_failed_job(self, manager):
+        def work(job: ScanJob) -> dict:
+            raise RuntimeError("scanner crashed")
+
+        job = await manager.wait(manager.submit(work).id)
+
+        assert job.status is JobStatus.FAILED
+        assert job.error == "scanner crashed"
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_are_pruned(self):
+        manager = ScanJobManager(max_concurrent=1, max_history=2)
+        try:
+            jobs = []
+            for _ in range(4):
+                # Wait before the next submit, which may prune this job
+                jobs.append(manager.submit(lambda job: {}))
+                await manager.wait(jobs[-1].id)
+            manager.submit(lambda job: {})
+
+            assert manager.get(jobs[0].id) is None
+            assert manager.get(jobs[3].id) is not None
+        finally:
+            manager.shutdown()
@@ -0,0 +1,137 @@
+"""Tests for the shared source file cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from flowspec_cli.security.models import Finding, Location, Severity
+from flowspec_cli.security.source_cache import SourceCache, get_source_cache
+from flowspec_cli.security.triage.classifiers.default import DefaultClassifier
+
+SOURCE = "".join(f"line {i}\n" for i in range(1, 21))
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> Path:
+    path = tmp_path / "app.py"
+    path.write_text(SOURCE)
+    return path
+
+
+class TestSourceCache:
+    """Tests for SourceCache."""
+
+    def test_get_context_matches_readlines(self, source_file: Path):
+        cache = SourceCache()
+
+        context = cache.get_context(source_file, 10, 11, context_lines=2)
+
+        lines = SOURCE.splitlines(keepends=True)
+        assert context == "".join(lines[7:13])
+        assert cache.get_context(source_file, 1, 1, context_lines=5) == "".join(
+            lines[:6]
+        )
+        assert cache.get_lines(source_file) == lines
+
+    def test_reads_file_once(self, source_file: Path):
+        cache = SourceCache()
+
+        for line in range(1, 21):
+            cache.get_context(source_file, line, line)
+
+        assert cache.misses == 1
+        assert cache.hits == 19
+
+    def test_invalidates_on_change(self, source_file: Path):
+        cache = SourceCache()
+        cache.get_context(source_file, 1, 1)
+
+        source_file.write_text("changed\n")
+        stat = source_file.stat()
+        os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.get_lines(source_file) == ["changed\n"]
+        assert cache.misses == 2
+
+    def test_missing_file(self, tmp_path: Path):
+        cache = SourceCache()
+
+        assert cache.get_context(tmp_path / "missing.py", 1, 1) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"f{i}.py"
+            path.write_text("x" * 100 + "\n")
+            paths.append(path)
+        cache = SourceCache(max_bytes=250)
+
+        cache.get_lines(paths[0])
+        cache.get_lines(paths[1])
+        cache.get_lines(paths[0])  # f1 is now least recently used
+        cache.get_lines(paths[2])
+
+        assert len(cache) == 2
+        assert cache.cached_bytes <= 250
+        cache.get_lines(paths[0])
+        assert cache.misses == 3
+
+    def test_max_files(self, tmp_path: Path):
+        cache = SourceCache(max_files=2)
+        for i in range(5):
+            path = tmp_path / f"f{i}.py"
+            path.write_text("x\n")
+            cache.get_lines(path)
+
+        assert len(cache) == 2
+
+    def test_large_files_are_mapped(self, tmp_path: Path):
+        path = tmp_path / "big.py"
+        path.write_bytes(b"".join(b"row %d\r\n" % i for i in range(1, 1001)) + b"end")
+        cache = SourceCache(mmap_threshold=1024)
+
+        context = cache.get_context(path, 500, 500, context_lines=1)
+        lines = cache.get_lines(path)
+
+        assert context == "row 499\nrow 500\nrow 501\n"
+        assert len(lines) == 1001
+        assert lines[-1] == "end"
+        assert cache.get_context(path, 1001, 1001, context_lines=0) == "end"
+        assert cache.cached_bytes < path.stat().st_size
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_utf8_is_replaced(self, tmp_path: Path):
+        path = tmp_path / "latin1.py"
+        path.write_bytes(b"caf\xe9\n")
+
+        assert SourceCache().get_lines(path) == ["caf�\n"]
+
+    def test_process_wide_instance(self):
+        assert get_source_cache() is get_source_cache()
+
+
+class TestClassifierContext:
+    """Test classifiers read context through the shared cache."""
+
+    def test_get_code_context_uses_cache(self, source_file: Path):
+        cache = get_source_cache()
+        cache.invalidate(source_file)
+        misses = cache.misses
+        classifier = DefaultClassifier()
+        finding = Finding(
+            id="F-1",
+            scanner="test",
+            severity=Severity.HIGH,
+            title="Test",
+            description="Test",
+            location=Location(file=source_file, line_start=5, line_end=5),
+        )
+
+        first = classifier.get_code_context(finding, context_lines=1)
+        second = classifier.get_code_context(finding, context_lines=1)
+
+        assert first == second == "line 4\nline 5\nline 6\n"
+        assert cache.misses == misses + 1
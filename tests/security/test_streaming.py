@@ -0,0 +1,280 @@
+"""Tests for the streaming findings pipeline."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from flowspec_cli.security.adapters.base import ScannerAdapter
+from flowspec_cli.security.exporters import (
+    JSONExporter,
+    JSONLinesExporter,
+    MarkdownExporter,
+    SARIFExporter,
+)
+from flowspec_cli.security.models import Finding, Location, Severity
+from flowspec_cli.security.orchestrator import ScannerOrchestrator
+from flowspec_cli.security.streaming import deduplicate_stream, iter_json_array
+
+
+def make_finding(
+    number: int,
+    scanner: str = "semgrep",
+    severity: Severity = Severity.HIGH,
+    file: str | None = None,
+) -> Finding:
+    return Finding(
+        id=f"RULE-{number % 3}",
+        scanner=scanner,
+        severity=severity,
+        title=f"Issue {number}",
+        description="Line one\nline two",
+        location=Location(
+            Path(file or f"src/file{number}.py"),
+            number + 1,
+            number + 2,
+            code_snippet="x = eval(data)" if number % 2 else None,
+        ),
+        cwe_id="CWE-95" if number % 3 else None,
+        remediation="Avoid eval" if number % 2 else None,
+        references=["https://cwe.mitre.org/data/definitions/95.html"],
+    )
+
+
+@pytest.fixture
+def findings() -> list[Finding]:
+    severities = list(Severity)
+    return [
+        make_finding(
+            i,
+            scanner=("semgrep", "codeql")[i % 2],
+            severity=severities[i % len(severities)],
+        )
+        for i in range(12)
+    ]
+
+
+class StreamScanner(ScannerAdapter):
+    """Yields a fixed list of findings, optionally failing part way."""
+
+    def __init__(self, name: str, findings: list[Finding], fail: bool = False):
+        self._name = name
+        self._findings = findings
+        self.fail = fail
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    def is_available(self) -> bool:
+        return True
+
+    def scan(self, target: Path, config: dict | None = None) -> list[Finding]:
+        return list(self.iter_scan(target, config))
+
+    def iter_scan(self, target: Path, config: dict | None = None):
+        for i, finding in enumerate(self._findings):
+            if self.fail and i == 1:
+                raise RuntimeError("scanner crashed")
+            yield finding
+
+    def get_install_instructions(self) -> str:
+        return "Built in"
+
+
+class TestIterJsonArray:
+    """Tests for incremental JSON array parsing."""
+
+    DOCUMENT = {
+        "version": "1.50.0",
+        "paths": {"scanned": ["a.py", "b.py"]},
+        "results": [
+            {"check_id": "a", "extra": {"lines": 'x = "]},{"'}},
+            {"check_id": "b", "start": {"line": 12345}},
+            123456789,
+            [],
+        ],
+        "errors": [],
+    }
+
+    @pytest.mark.parametrize("read_size", [1, 7, 64, 65536])
+    def test_yields_items(self, read_size):
+        text = json.dumps(self.DOCUMENT, indent=2)
+
+        items = list(iter_json_array(io.StringIO(text), "results", read_size))
+
+        assert items == self.DOCUMENT["results"]
+
+    def test_missing_key(self):
+        stream = io.StringIO('{"errors": [1, 2]}')
+
+        assert list(iter_json_array(stream, "results")) == []
+
+    def test_empty_array_and_object(self):
+        assert list(iter_json_array(io.StringIO('{"results": []}'), "results")) == []
+        assert list(iter_json_array(io.StringIO("{}"), "results")) == []
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "[]", '{"results": [1, 2', '{"results": [1 2]}', "{'results': []}"],
+    )
+    def test_invalid_input_raises(self, text):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(text), "results", read_size=4))
+
+
+class TestDeduplicateStream:
+    """Tests for streaming deduplication."""
+
+    def test_merges_duplicates(self):
+        first = make_finding(1, scanner="semgrep", severity=Severity.MEDIUM)
+        duplicate = make_finding(1, scanner="codeql", severity=Severity.CRITICAL)
+        duplicate.references = ["https://owasp.org/Top10/A03_2021-Injection/"]
+        other = make_finding(2, file="app.py")
+
+        result = list(deduplicate_stream(iter([first, duplicate, other])))
+
+        assert result == [first, other]
+        assert first.severity == Severity.CRITICAL
+        assert first.metadata["merged_scanners"] == ["semgrep", "codeql"]
+        assert duplicate.references[0] in first.references
+
+
+class TestOrchestratorIterScan:
+    """Tests for ScannerOrchestrator.iter_scan()."""
+
+    def test_sequential_streams_and_deduplicates(self, tmp_path):
+        shared = make_finding(0, file="shared.py")
+        scanners = [
+            StreamScanner("one", [shared, make_finding(1)]),
+            StreamScanner("two", [make_finding(0, file="shared.py"), make_finding(2)]),
+        ]
+        orchestrator = ScannerOrchestrator(scanners)
+
+        result = list(orchestrator.iter_scan(tmp_path, parallel=False))
+
+        assert [f.title for f in result] == ["Issue 0", "Issue 1", "Issue 2"]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_duplicates_keep_highest_severity(self, tmp_path, parallel):
+        scanners = [
+            StreamScanner("one", [make_finding(0, "one", Severity.MEDIUM)]),
+            StreamScanner("two", [make_finding(0, "two", Severity.CRITICAL)]),
+        ]
+        orchestrator = ScannerOrchestrator(scanners)
+
+        result = list(orchestrator.iter_scan(tmp_path, parallel=parallel))
+
+        assert [f.severity for f in result] == [Severity.CRITICAL]
+        assert sorted(result[0].metadata["merged_scanners"]) == ["one", "two"]
+
+    def test_parallel_yields_all_findings(self, tmp_path):
+        one = [make_finding(i, file=f"one{i}.py") for i in range(50)]
+        two = [make_finding(i, file=f"two{i}.py") for i in range(50)]
+        orchestrator = ScannerOrchestrator(
+            [StreamScanner("one", one), StreamScanner("two", two)]
+        )
+
+        result = list(orchestrator.iter_scan(tmp_path))
+
+        assert len(result) == 100
+        assert {f.location.file.name for f in result} == {
+            f.location.file.name for f in one + two
+        }
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_failed_scanner_is_reported(self, tmp_path, capsys, parallel):
+        orchestrator = ScannerOrchestrator(
+            [
+                StreamScanner("ok", [make_finding(1)]),
+                StreamScanner("broken", [make_finding(2), make_finding(3)], fail=True),
+            ]
+        )
+
+        result = list(orchestrator.iter_scan(tmp_path, parallel=parallel))
+
+        assert {f.title for f in result} == {"Issue 1", "Issue 2"}
+        assert orchestrator.failed_scanners == ["broken"]
+        assert "broken scan failed" in capsys.readouterr().out
+
+    def test_validates_before_iterating(self, tmp_path):
+        orchestrator = ScannerOrchestrator([StreamScanner("one", [])])
+
+        with pytest.raises(RuntimeError, match="not registered"):
+            orchestrator.iter_scan(tmp_path, scanners=["missing"])
+        with pytest.raises(ValueError, match="does not exist"):
+            orchestrator.iter_scan(tmp_path / "missing")
+
+    def test_early_stop_releases_producers(self, tmp_path):
+        many = [make_finding(i, file=f"f{i}.py") for i in range(3000)]
+        orchestrator = ScannerOrchestrator(
+            [StreamScanner("one", many), StreamScanner("two", many[:10])]
+        )
+
+        stream = orchestrator.iter_scan(tmp_path, deduplicate=False)
+        first = next(stream)
+        stream.close()
+
+        assert first is not None
+
+
+class TestExporterWrite:
+    """Tests that streaming writes match the in-memory exports."""
+
+    @pytest.mark.parametrize("count", [0, 1, 12])
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_json(self, findings, count, pretty):
+        exporter = JSONExporter(pretty=pretty)
+        buffer = io.StringIO()
+
+        written = exporter.write(iter(findings[:count]), buffer)
+
+        assert written == count
+        assert buffer.getvalue() == exporter.export(findings[:count])
+
+    @pytest.mark.parametrize("count", [0, 1, 12])
+    def test_sarif(self, findings, count):
+        exporter = SARIFExporter()
+        buffer = io.StringIO()
+
+        written = exporter.write(iter(findings[:count]), buffer)
+
+        assert written == count
+        assert buffer.getvalue() == json.dumps(
+            exporter.export(findings[:count]), indent=2
+        )
+
+    def test_markdown_groups_by_severity(self, findings):
+        buffer = io.StringIO()
+
+        written = MarkdownExporter().write(iter(findings), buffer)
+        report = buffer.getvalue()
+
+        assert written == 12
+        assert "**Total Findings:** 12" in report
+        headings = [
+            line for line in report.splitlines() if line.endswith("Severity Findings")
+        ]
+        assert headings == [
+            f"## {severity.value.title()} Severity Findings" for severity in Severity
+        ]
+        # Numbering restarts within each severity group
+        critical = report.split("## Critical Severity Findings")[1].split("## High")[0]
+        assert "### 1. Issue 0" in critical
+        assert "### 2. Issue 5" in critical
+
+    def test_jsonl(self, findings):
+        exporter = JSONLinesExporter()
+        buffer = io.StringIO()
+
+        written = exporter.write(iter(findings), buffer)
+
+        assert written == 12
+        assert buffer.getvalue() == exporter.export(findings)
+        lines = buffer.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == [f.to_dict() for f in findings]
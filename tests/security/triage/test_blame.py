@@ -0,0 +1,177 @@
+"""Tests for batched git blame lookups."""
+
+import os
+import shutil
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from flowspec_cli.security.models import Finding, Location, Severity
+from flowspec_cli.security.triage.blame import BlameService, blob_sha, parse_blame
+from flowspec_cli.security.triage.engine import TriageConfig, TriageEngine
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git required")
+
+TEN_DAYS_AGO = int((datetime.now() - timedelta(days=10)).timestamp())
+
+
+def make_finding(file_path: Path, line: int, finding_id: str = "F-1") -> Finding:
+    """Create a test finding at a file location."""
+    return Finding(
+        id=finding_id,
+        scanner="test",
+        severity=Severity.HIGH,
+        title="Test Finding",
+        description="Test description",
+        location=Location(file=file_path, line_start=line, line_end=line),
+    )
+
+
+def git(repo: Path, *args: str, timestamp: int = TEN_DAYS_AGO) -> None:
+    """Run git in a repo with a fixed identity and commit date."""
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+        "GIT_AUTHOR_DATE": f"{timestamp} +0000",
+        "GIT_COMMITTER_DATE": f"{timestamp} +0000",
+    }
+    subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a git repo with two committed files."""
+    git(tmp_path, "init", "-q")
+    (tmp_path / "a.py").write_text("".join(f"a = {i}\n" for i in range(20)))
+    (tmp_path / "b.py").write_text("b = 1\nb = 2\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+class TestParseBlame:
+    """Tests for parse_blame."""
+
+    def test_parse_incremental_output(self):
+        output = (
+            f"{'a' * 40} 1 1 2\ncommitter-time 100\nfilename x.py\n"
+            f"{'b' * 40} 5 3 1\ncommitter-time 200\nfilename x.py\n"
+            f"{'a' * 40} 9 4 1\nfilename x.py\n"
+        )
+
+        ranges, uncommitted = parse_blame(output)
+
+        assert ranges == [(1, 2, 100), (3, 1, 200), (4, 1, 100)]
+        assert uncommitted is False
+
+    def test_parse_flags_uncommitted_lines(self):
+        output = f"{'0' * 40} 1 1 1\ncommitter-time 100\nfilename x.py\n"
+
+        assert parse_blame(output)[1] is True
+
+    def test_blob_sha_matches_git(self, repo: Path):
+        result = subprocess.run(
+            ["git", "hash-object", "a.py"], cwd=repo, capture_output=True, text=True
+        )
+
+        assert blob_sha((repo / "a.py").read_bytes()) == result.stdout.strip()
+
+
+class TestBlameService:
+    """Tests for BlameService."""
+
+    def test_detection_time_from_blame(self, repo: Path):
+        blame = BlameService()
+
+        assert blame.detection_time(repo / "a.py", 5) == 10
+        assert blame.detection_time(repo / "a.py", 500) == 30
+        assert blame.detection_time(repo / "missing.py", 1) == 30
+        assert blame.detection_time(None, 1) == 30
+
+    def test_prefetch_blames_each_file_once(self, repo: Path):
+        findings = [make_finding(repo / "a.py", line) for line in range(1, 21)]
+        findings.append(make_finding(repo / "b.py", 2))
+        blame = BlameService()
+
+        assert blame.prefetch(findings) == 2
+        times = [
+            blame.detection_time(f.location.file, f.location.line_start)
+            for f in findings
+        ]
+
+        assert times == [10] * 21
+        assert blame.blames_run == 2
+
+    def test_persistent_cache_skips_unchanged_files(self, repo: Path, tmp_path_factory):
+        cache_path = tmp_path_factory.mktemp("cache") / "blame.json"
+        findings = [make_finding(repo / "a.py", 1), make_finding(repo / "b.py", 1)]
+        BlameService(cache_path=cache_path).prefetch(findings)
+
+        warm = BlameService(cache_path=cache_path)
+        with patch("subprocess.run") as mock_run:
+            assert warm.prefetch(findings) == 0
+            assert warm.detection_time(repo / "b.py", 2) == 10
+        mock_run.assert_not_called()
+
+    def test_lookups_are_saved_once(self, repo: Path, tmp_path_factory):
+        cache_path = tmp_path_factory.mktemp("cache") / "blame.json"
+        blame = BlameService(cache_path=cache_path)
+
+        assert blame.detection_time(repo / "a.py", 1) == 10
+        assert blame.detection_time(repo / "b.py", 1) == 10
+        assert not cache_path.exists()
+
+        blame.save()
+        warm = BlameService(cache_path=cache_path)
+        with patch("subprocess.run") as mock_run:
+            assert warm.detection_time(repo / "b.py", 2) == 10
+        mock_run.assert_not_called()
+
+    def test_changed_file_is_reblamed(self, repo: Path, tmp_path_factory):
+        cache_path = tmp_path_factory.mktemp("cache") / "blame.json"
+        BlameService(cache_path=cache_path).prefetch([make_finding(repo / "b.py", 1)])
+
+        (repo / "b.py").write_text("b = 1\nb = 3\n")
+        git(repo, "commit", "-q", "-am", "change", timestamp=TEN_DAYS_AGO + 5 * 86400)
+
+        blame = BlameService(cache_path=cache_path)
+        assert blame.prefetch([make_finding(repo / "b.py", 1)]) == 1
+        assert blame.detection_time(repo / "b.py", 1) == 10
+        assert blame.detection_time(repo / "b.py", 2) == 5
+
+    def test_uncommitted_changes_are_not_cached(self, repo: Path):
+        (repo / "b.py").write_text("b = 1\nb = 2\nb = 3\n")
+        blame = BlameService()
+
+        assert blame.detection_time(repo / "b.py", 3) == 1
+        assert blame.detection_time(repo / "b.py", 1) == 10
+        assert blame.blames_run == 2
+
+    def test_not_a_git_repo(self, tmp_path: Path):
+        source = tmp_path / "x.py"
+        source.write_text("x = 1\n")
+        blame = BlameService()
+
+        assert blame.prefetch([make_finding(source, 1)]) == 0
+        assert blame.detection_time(source, 1) == 30
+
+
+class TestEngineBlame:
+    """Tests for blame prefetching in TriageEngine."""
+
+    def test_triage_prefetches_blame(self, repo: Path):
+        findings = [
+            make_finding(repo / "a.py", line, f"F-{line}") for line in range(1, 11)
+        ]
+        engine = TriageEngine(config=TriageConfig(blame_cache_path=None))
+
+        results = engine.triage(findings)
+
+        assert engine.blame.blames_run == 1
+        assert {r.metadata["detection_time"] for r in results} == {10}
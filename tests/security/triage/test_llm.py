@@ -0,0 +1,199 @@
+"""Tests for LLM dispatching and concurrent triage."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from flowspec_cli.security.models import Finding, Location, Severity
+from flowspec_cli.security.triage.engine import TriageConfig, TriageEngine
+from flowspec_cli.security.triage.llm import (
+    FakeLLMClient,
+    LLMDispatcher,
+    RateLimiter,
+    RetryPolicy,
+    build_batch_prompt,
+    parse_batch_response,
+    split_batch_prompt,
+)
+from flowspec_cli.security.triage.models import Classification
+
+
+def make_finding(
+    index: int, cwe_id: str | None = "CWE-89", line: int | None = None
+) -> Finding:
+    """Create a test finding."""
+    line = line or index + 1
+    return Finding(
+        id=f"F-{index:03d}",
+        scanner="test",
+        severity=Severity.HIGH,
+        title=f"Finding {index}",
+        description="Test description",
+        location=Location(
+            file=Path("app.py"),
+            line_start=line,
+            line_end=line,
+            code_snippet="query = 'SELECT ' + user_input",
+        ),
+        cwe_id=cwe_id,
+    )
+
+
+class TestBatchPrompts:
+    """Tests for batch prompt helpers."""
+
+    def test_round_trip(self):
+        prompts = ["first\nprompt", "second", "third"]
+
+        assert split_batch_prompt(build_batch_prompt(prompts)) == prompts
+        assert split_batch_prompt("plain prompt") is None
+
+    def test_parse_batch_response(self):
+        response = '```json\n[{"a": 1}, "raw"]\n```'
+
+        assert parse_batch_response(response, 2) == ['{"a": 1}', "raw"]
+        assert parse_batch_response(response, 3) is None
+        assert parse_batch_response("not json", 1) is None
+
+
+class TestLLMDispatcher:
+    """Tests for LLMDispatcher."""
+
+    def test_deduplicates_prompts(self):
+        llm = FakeLLMClient()
+        dispatcher = LLMDispatcher(llm)
+
+        dispatcher.complete("a")
+        dispatcher.complete("a")
+        responses = dispatcher.complete_batch(["a", "b", "b", "c"])
+
+        assert len(responses) == 4
+        assert responses[1] == responses[2]
+        assert llm.calls == 2  # "a", then one batch for "b" and "c"
+        assert split_batch_prompt(llm.prompts[1]) == ["b", "c"]
+        assert dispatcher.deduplicated == 3
+
+    def test_malformed_batch_falls_back_to_single_requests(self):
+        class NoBatchLLM(FakeLLMClient):
+            def complete(self, prompt):
+                response = super().complete(prompt)
+                return "sorry" if split_batch_prompt(prompt) else response
+
+        llm = NoBatchLLM()
+        responses = LLMDispatcher(llm).complete_batch(["x", "y"])
+
+        assert [json.loads(r)["classification"] for r in responses] == ["TP", "TP"]
+        assert llm.calls == 3
+
+    def test_retries_with_backoff(self):
+        llm = FakeLLMClient(failures=2)
+        delays = []
+        dispatcher = LLMDispatcher(
+            llm, retry=RetryPolicy(initial_delay=1.0), sleep=delays.append
+        )
+
+        assert json.loads(dispatcher.complete("x"))["classification"] == "TP"
+        assert delays == [1.0, 2.0]
+        assert dispatcher.requests == 3
+
+    def test_gives_up_after_max_attempts(self):
+        llm = FakeLLMClient(failures=5)
+        dispatcher = LLMDispatcher(
+            llm, retry=RetryPolicy(max_attempts=2), sleep=lambda _: None
+        )
+
+        with pytest.raises(RuntimeError):
+            dispatcher.complete("x")
+        # Failures are not cached; the next call tries again
+        with pytest.raises(RuntimeError):
+            dispatcher.complete("x")
+        assert llm.calls == 4
+
+    def test_rate_limiter(self):
+        now = [0.0]
+        waits = []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        limiter = RateLimiter(rate=2, burst=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(4):
+            limiter.acquire()
+
+        assert waits == [0.5, 0.5]
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+class TestConcurrentTriage:
+    """Tests for TriageEngine concurrent mode."""
+
+    def test_matches_serial_triage(self):
+        findings = [
+            make_finding(i, cwe) for i, cwe in enumerate(["CWE-89", "CWE-79"] * 5)
+        ]
+
+        serial = TriageEngine(FakeLLMClient()).triage(findings)
+        concurrent = TriageEngine(
+            FakeLLMClient(), TriageConfig(max_workers=4, llm_batch_size=3)
+        ).triage(findings)
+
+        def summary(results):
+            return sorted(
+                (r.finding_id, r.classification, r.risk_score, r.explanation.what)
+                for r in results
+            )
+
+        assert summary(concurrent) == summary(serial)
+
+    def test_batches_per_classifier(self):
+        llm = FakeLLMClient(classification="FP")
+        findings = [make_finding(i) for i in range(20)]
+        findings += [make_finding(100 + i, "CWE-79") for i in range(5)]
+        engine = TriageEngine(llm, TriageConfig(max_workers=4, llm_batch_size=10))
+
+        results = engine.triage(findings)
+
+        # Classification: 2 SQL batches + 1 XSS batch; explanations the same
+        assert llm.calls == 6
+        assert all(r.classification == Classification.FALSE_POSITIVE for r in results)
+        for prompt in llm.prompts:
+            tasks = split_batch_prompt(prompt)
+            assert len({("CWE-89" in t) for t in tasks}) == 1
+
+    def test_duplicate_locations_share_classification(self):
+        llm = FakeLLMClient()
+        findings = [make_finding(i, line=7) for i in range(4)]
+        engine = TriageEngine(llm, TriageConfig(max_workers=2))
+
+        results = engine.triage(findings)
+
+        assert len(results) == 4
+        classification_prompts = [
+            p for p in llm.prompts if "plain-English explanation" not in p
+        ]
+        assert len(classification_prompts) == 1
+
+    def test_llm_failure_needs_investigation(self):
+        llm = FakeLLMClient(failures=100)
+        config = TriageConfig(
+            max_workers=2, llm_batch_size=5, retry=RetryPolicy(max_attempts=1)
+        )
+
+        results = TriageEngine(llm, config).triage([make_finding(i) for i in range(3)])
+
+        assert all(
+            r.classification == Classification.NEEDS_INVESTIGATION for r in results
+        )
+        assert all("LLM request failed" in r.ai_reasoning for r in results)
+        assert all(r.explanation.what for r in results)
+
+    def test_serial_by_default(self):
+        llm = FakeLLMClient()
+
+        TriageEngine(llm).triage([make_finding(i) for i in range(3)])
+
+        assert llm.calls == 6
+        assert all(split_batch_prompt(p) is None for p in llm.prompts)
@@ -0,0 +1,348 @@
+"""Tests for the in-process backlog file backend.
+
+This module tests FileBacklogBackend, which interprets backlog CLI commands
+against backlog/tasks/*.md files, and the shim and task context integration.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from flowspec_cli.backlog.backend import (
+    BACKEND_ENV,
+    FileBacklogBackend,
+    get_file_backend,
+    get_section,
+    parse_task_file,
+    sanitize_title,
+    set_section,
+)
+from flowspec_cli.backlog.shim import (
+    task_create_batch,
+    task_edit,
+    task_list,
+    task_search,
+    task_view,
+)
+from flowspec_cli.task_context import load_task_context
+
+CONFIG = """\
+project_name: "test"
+default_status: "To Do"
+statuses: ["To Do", "In Progress", "Done"]
+zero_padded_ids: 3
+auto_commit: false
+check_active_branches: false
+"""
+
+EXISTING_TASK = """\
+---
+id: task-007
+title: Existing task
+status: To Do
+assignee: []
+created_date: '2025-11-27 21:53'
+labels:
+  - backend
+dependencies: []
+priority: high
+---
+
+## Description
+
+<!-- SECTION:DESCRIPTION:BEGIN -->
+Update `src/app.py` to do things.
+<!-- SECTION:DESCRIPTION:END -->
+
+## Acceptance Criteria
+<!-- AC:BEGIN -->
+- [ ] #1 First criterion
+- [ ] #2 Second criterion
+<!-- AC:END -->
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """Create a workspace with a backlog and one task."""
+    backlog = tmp_path / "backlog"
+    (backlog / "tasks").mkdir(parents=True)
+    (backlog / "archive" / "tasks").mkdir(parents=True)
+    (backlog / "config.yml").write_text(CONFIG)
+    (backlog / "tasks" / "task-007 - Existing-task.md").write_text(EXISTING_TASK)
+    return tmp_path
+
+
+@pytest.fixture
+def backend(workspace: Path) -> FileBacklogBackend:
+    return FileBacklogBackend(workspace)
+
+
+@pytest.fixture
+def files_backend_env(monkeypatch):
+    monkeypatch.setenv(BACKEND_ENV, "files")
+
+
+class TestHelpers:
+    def test_sanitize_title(self):
+        assert sanitize_title("Fix upgrade-tools: doesn't work") == (
+            "Fix-upgrade-tools-doesnt-work"
+        )
+
+    def test_render_round_trips(self, workspace: Path):
+        path = workspace / "backlog" / "tasks" / "task-007 - Existing-task.md"
+        assert parse_task_file(path).render() == EXISTING_TASK
+
+    def test_set_section_replaces_and_orders(self):
+        body = "\n## Description\n\nText\n\n## Implementation Notes\n\nOld notes\n"
+
+        body = set_section(body, "Implementation Notes", "NOTES", "New notes")
+        body = set_section(body, "Implementation Plan", "PLAN", "1. Do it")
+
+        assert get_section(body, "Implementation Notes") == "New notes"
+        assert get_section(body, "Implementation Plan") == "1. Do it"
+        assert body.index("## Implementation Plan") < body.index(
+            "## Implementation Notes"
+        )
+        assert body.startswith("\n## Description")
+
+
+class TestFileBacklogBackend:
+    def test_create_tasks_allocates_ids_once(self, backend: FileBacklogBackend):
+        task_ids = backend.create_tasks(
+            [
+                {"title": "First", "labels": ["security"], "priority": "HIGH"},
+                {"title": "Second", "acceptance_criteria": ["Works"]},
+            ]
+        )
+
+        assert task_ids == ["task-008", "task-009"]
+        task = parse_task_file(backend.find_task("task-008"))
+        assert task.title == "First"
+        assert task.status == "To Do"
+        assert task.labels == ["security"]
+        assert task.priority == "high"
+        second = parse_task_file(backend.find_task("9"))
+        assert get_section(second.body, "Acceptance Criteria") == "- [ ] #1 Works"
+
+    def test_create_ids_skip_archived_tasks(self, backend: FileBacklogBackend):
+        archive = backend.backlog_dir / "archive" / "tasks"
+        (archive / "task-020 - Old.md").write_text(EXISTING_TASK)
+
+        assert backend.create_tasks([{"title": "New"}]) == ["task-021"]
+
+    def test_create_command_output(self, backend: FileBacklogBackend):
+        exit_code, stdout, _ = backend.run(
+            ["task", "create", "New task", "--description", "Details"]
+        )
+
+        assert exit_code == 0
+        assert stdout.startswith("Created task task-008")
+
+    def test_view_plain(self, backend: FileBacklogBackend):
+        exit_code, stdout, _ = backend.run(["task", "7", "--plain"])
+
+        assert exit_code == 0
+        assert "Task task-007 - Existing task" in stdout
+        assert "Status: ○ To Do" in stdout
+        assert "- [ ] #2 Second criterion" in stdout
+
+    def test_view_missing_task(self, backend: FileBacklogBackend):
+        exit_code, _, stderr = backend.run(["task", "task-99", "--plain"])
+
+        assert exit_code == 1
+        assert "not found" in stderr
+
+    def test_edit_status_and_criteria(self, backend: FileBacklogBackend):
+        exit_code, _, _ = backend.run(
+            ["task", "edit", "task-007", "-s", "in progress", "--check-ac", "2"]
+        )
+
+        task = parse_task_file(backend.find_task("task-007"))
+        assert exit_code == 0
+        assert task.status == "In Progress"
+        assert "- [x] #2 Second criterion" in task.body
+        assert "- [ ] #1 First criterion" in task.body
+        assert task.frontmatter["updated_date"]
+
+    def test_edit_title_renames_file(self, backend: FileBacklogBackend):
+        backend.run(["task", "edit", "task-007", "--title", "Renamed task"])
+
+        path = backend.find_task("task-007")
+        assert path.name == "task-007 - Renamed-task.md"
+        assert len(list(backend.tasks_dir.iterdir())) == 1
+
+    def test_edit_unknown_criterion(self, backend: FileBacklogBackend):
+        exit_code, _, stderr = backend.run(
+            ["task", "edit", "task-007", "--check-ac", "9"]
+        )
+
+        assert exit_code == 1
+        assert "#9" in stderr
+
+    def test_list_groups_by_status(self, backend: FileBacklogBackend):
+        backend.create_tasks([{"title": "Started", "status": "In Progress"}])
+
+        _, stdout, _ = backend.run(["task", "list", "--plain"])
+        _, in_progress, _ = backend.run(
+            ["task", "list", "-s", "In Progress", "--plain"]
+        )
+
+        assert "To Do:\n  [HIGH] task-007 - Existing task" in stdout
+        assert "In Progress:\n  task-008 - Started" in stdout
+        assert "task-007" not in in_progress
+
+    def test_search(self, backend: FileBacklogBackend):
+        _, stdout, _ = backend.run(["task", "search", "src/app.py"])
+        _, none, _ = backend.run(["task", "search", "missing", "--status", "Done"])
+
+        assert "task-007 - Existing task (To Do)" in stdout
+        assert none == "No tasks found.\n"
+
+    def test_archive_moves_file(self, backend: FileBacklogBackend):
+        exit_code, stdout, _ = backend.run(["task", "archive", "task-007"])
+
+        assert exit_code == 0
+        assert backend.find_task("task-007") is None
+        archived = backend.backlog_dir / "archive" / "tasks"
+        assert (archived / "task-007 - Existing-task.md").exists()
+
+    def test_unsupported_commands_fall_back(self, backend: FileBacklogBackend):
+        assert backend.run(["task", "7"]) is None  # interactive view
+        assert backend.run(["task", "create", "Sub", "--parent", "task-7"]) is None
+        assert backend.run(["task", "edit", "task-007", "-s", "Blocked"]) is None
+        assert backend.run(["board"]) is None
+
+    def test_auto_commit_disables_writes(self, workspace: Path):
+        config = workspace / "backlog" / "config.yml"
+        config.write_text(CONFIG.replace("auto_commit: false", "auto_commit: true"))
+        backend = FileBacklogBackend(workspace)
+
+        assert backend.is_available()
+        assert not backend.is_available(write=True)
+        assert backend.create_tasks([{"title": "New"}]) is None
+        assert backend.run(["task", "archive", "task-007"]) is None
+
+    def test_unreadable_branches_disable_creation(self, workspace: Path):
+        config = workspace / "backlog" / "config.yml"
+        config.write_text(
+            CONFIG.replace(
+                "check_active_branches: false", "check_active_branches: true"
+            )
+        )
+        backend = FileBacklogBackend(workspace)  # not a git repository
+
+        assert backend.create_tasks([{"title": "New"}]) is None
+
+
+class TestBackendSelection:
+    def test_cli_is_default(self, workspace: Path, monkeypatch):
+        monkeypatch.delenv(BACKEND_ENV, raising=False)
+
+        assert get_file_backend(workspace) is None
+
+    def test_config_change_is_picked_up(self, workspace: Path, files_backend_env):
+        assert get_file_backend(workspace).is_available(write=True)
+
+        config = workspace / "backlog" / "config.yml"
+        config.write_text(CONFIG.replace("auto_commit: false", "auto_commit: true"))
+        os.utime(config, ns=(0, 1))
+
+        assert not get_file_backend(workspace).is_available(write=True)
+
+    def test_missing_backlog(self, tmp_path: Path, files_backend_env):
+        assert get_file_backend(tmp_path) is None
+
+
+class TestShimIntegration:
+    @patch("flowspec_cli.backlog.shim._emit_event", return_value=True)
+    @patch("flowspec_cli.backlog.shim._run_backlog_command")
+    def test_batch_create_without_subprocess(
+        self, mock_run, mock_emit, workspace: Path, files_backend_env
+    ):
+        results = task_create_batch(
+            [{"title": f"Finding {i}", "labels": ["security"]} for i in range(50)],
+            workspace_root=workspace,
+        )
+
+        mock_run.assert_not_called()
+        assert [r.task_id for r in results[:2]] == ["task-008", "task-009"]
+        assert all(r.success and r.event_emitted for r in results)
+        assert mock_emit.call_count == 50
+        assert len(list((workspace / "backlog" / "tasks").iterdir())) == 51
+
+    @patch("flowspec_cli.backlog.shim._emit_event", return_value=True)
+    @patch("flowspec_cli.backlog.shim._run_backlog_command")
+    def test_batch_create_uses_cli_by_default(
+        self, mock_run, mock_emit, workspace, monkeypatch
+    ):
+        monkeypatch.delenv(BACKEND_ENV, raising=False)
+        mock_run.return_value = (0, "Created task task-100\n", "")
+
+        results = task_create_batch([{"title": "A"}, {"title": "B"}], workspace)
+
+        assert mock_run.call_count == 2
+        assert [r.task_id for r in results] == ["task-100", "task-100"]
+
+    @patch("flowspec_cli.backlog.shim._emit_event", return_value=True)
+    @patch("flowspec_cli.backlog.shim._run_backlog_command")
+    def test_edit_uses_file_backend(
+        self, mock_run, mock_emit, workspace, files_backend_env
+    ):
+        result = task_edit("task-007", status="Done", workspace_root=workspace)
+
+        mock_run.assert_not_called()
+        assert result.success
+        assert result.events_emitted == ["task.completed"]
+
+    @patch("flowspec_cli.backlog.shim._run_backlog_command")
+    def test_view_uses_file_backend(
+        self, mock_run, workspace, files_backend_env, monkeypatch
+    ):
+        monkeypatch.chdir(workspace)
+
+        result = task_view("task-007")
+
+        mock_run.assert_not_called()
+        assert "Existing task" in result.output
+
+    @patch("flowspec_cli.backlog.shim._run_backlog_command")
+    def test_reads_use_workspace_root(self, mock_run, workspace, files_backend_env):
+        view = task_view("task-007", workspace_root=workspace)
+        listing = task_list(workspace_root=workspace)
+        search = task_search("Existing", workspace_root=workspace)
+
+        mock_run.assert_not_called()
+        assert all(r.success for r in (view, listing, search))
+        assert "Existing task" in view.output
+        assert "task-007" in listing.output
+        assert "task-007" in search.output
+
+    @patch("flowspec_cli.backlog.shim._run_backlog_command")
+    def test_unsupported_edit_falls_back(self, mock_run, workspace, files_backend_env):
+        mock_run.return_value = (0, "", "")
+
+        task_edit("task-007", status="Blocked", workspace_root=workspace)
+
+        mock_run.assert_called_once()
+
+
+class TestTaskContextIntegration:
+    @patch("flowspec_cli.task_context.subprocess.run")
+    def test_load_in_progress_task_without_subprocess(
+        self, mock_run, backend, files_backend_env, monkeypatch
+    ):
+        monkeypatch.chdir(backend.workspace_root)
+        backend.run(["task", "edit", "task-007", "-s", "In Progress"])
+
+        context = load_task_context()
+
+        mock_run.assert_not_called()
+        assert context.task_id == "task-007"
+        assert context.title == "Existing task"
+        assert context.status == "In Progress"
+        assert context.labels == ["backend"]
+        assert [ac.index for ac in context.acceptance_criteria] == [1, 2]
+        assert "src/app.py" in context.related_files
@@ -73,6 +73,26 @@ class TestLoadHooksConfig:
         assert config.hooks[0].timeout == 60
         assert config.hooks[0].fail_mode == "stop"
 
+    def test_load_config_with_security(self, tmp_path):
+        """Test the security section configures the hook runner."""
+        hooks_dir = tmp_path / ".flowspec" / "hooks"
+        hooks_dir.mkdir(parents=True)
+
+        config_yaml = dedent(
+            """
+            version: "1.0"
+            security:
+              persist_validation_cache: true
+            hooks: []
+            """
+        )
+        (hooks_dir / "hooks.yaml").write_text(config_yaml)
+
+        config = load_hooks_config(project_root=tmp_path)
+        assert config.security_config().persist_validation_cache is True
+        assert config.to_dict()["security"] == {"persist_validation_cache": True}
+        assert HooksConfig.empty().security_config().persist_validation_cache is False
+
     def test_load_config_with_filters(self, tmp_path):
         """Test loading config with event filters."""
         hooks_dir = tmp_path / ".flowspec" / "hooks"
@@ -336,6 +356,77 @@ class TestValidateHooksConfigFile:
         assert len(warnings) > 0
         assert any("high timeout" in warning for warning in warnings)
 
+    def test_depends_on_loaded_and_validated(self, tmp_path):
+        """Test parallel/depends_on are parsed and references are checked."""
+        hooks_dir = tmp_path / ".flowspec" / "hooks"
+        hooks_dir.mkdir(parents=True)
+
+        config_yaml = dedent(
+            """
+            version: "1.0"
+            defaults:
+              parallel: true
+            hooks:
+              - name: "lint"
+                events:
+                  - type: "task.completed"
+                command: "true"
+              - name: "notify"
+                events:
+                  - type: "task.completed"
+                command: "true"
+                parallel: false
+                depends_on: ["lint", "missing"]
+            """
+        )
+        config_path = hooks_dir / "hooks.yaml"
+        config_path.write_text(config_yaml)
+
+        config = load_hooks_config(config_path, project_root=tmp_path)
+        assert config.hooks[0].parallel is True
+        assert config.hooks[1].parallel is False
+        assert config.hooks[1].depends_on == ["lint", "missing"]
+
+        valid, errors, _ = validate_hooks_config_file(
+            config_path, project_root=tmp_path
+        )
+        assert not valid
+        assert errors == ["Hook 'notify' depends on unknown hook 'missing'"]
+
+    def test_circular_depends_on_detected(self, tmp_path):
+        """Test dependency cycles between hooks are reported."""
+        hooks_dir = tmp_path / ".flowspec" / "hooks"
+        hooks_dir.mkdir(parents=True)
+
+        config_yaml = dedent(
+            """
+            version: "1.0"
+            hooks:
+              - name: "first"
+                events:
+                  - type: "task.completed"
+                command: "true"
+                depends_on: ["second"]
+              - name: "second"
+                events:
+                  - type: "task.completed"
+                command: "true"
+                depends_on: ["first"]
+              - name: "third"
+                events:
+                  - type: "task.completed"
+                command: "true"
+            """
+        )
+        config_path = hooks_dir / "hooks.yaml"
+        config_path.write_text(config_yaml)
+
+        valid, errors, _ = validate_hooks_config_file(
+            config_path, project_root=tmp_path
+        )
+        assert not valid
+        assert errors == ["Circular depends_on between hooks: first, second"]
+
 
 class TestHooksConfig:
     """Test HooksConfig class."""
@@ -378,6 +469,87 @@ class TestHooksConfig:
         matching = config.get_matching_hooks(event)
         assert len(matching) == 0
 
+    def test_get_matching_hooks_index(self):
+        """Test exact, namespaced and unscoped patterns keep config order."""
+        hooks = [
+            HookDefinition(name="any", events=[EventMatcher(type="*")], command="x"),
+            HookDefinition(
+                name="progress",
+                events=[EventMatcher(type="agent.progress")],
+                command="x",
+            ),
+            HookDefinition(
+                name="agent", events=[EventMatcher(type="agent.*")], command="x"
+            ),
+            HookDefinition(
+                name="completed",
+                events=[
+                    EventMatcher(type="*.completed"),
+                    EventMatcher(type="task.complete?"),
+                ],
+                command="x",
+            ),
+        ]
+        config = HooksConfig(version="1.0", hooks=hooks)
+
+        def names(event_type):
+            event = Event(event_type=event_type, project_root="/tmp")
+            return [hook.name for hook in config.get_matching_hooks(event)]
+
+        assert names("agent.progress") == ["any", "progress", "agent"]
+        assert names("agent.completed") == ["any", "agent", "completed"]
+        assert names("task.completed") == ["any", "completed"]
+        assert names("agentx.progress") == ["any"]
+
+    def test_get_matching_hooks_filters(self):
+        """Test compiled filters match like EventMatcher.matches."""
+        matchers = [
+            EventMatcher(type="task.*", filter={"priority": ["high", "critical"]}),
+            EventMatcher(type="task.*", filter={"labels_any": ["backend", "api"]}),
+            EventMatcher(type="task.*", filter={"labels_all": ["backend", "api"]}),
+            EventMatcher(type="task.*", filter={"agent": "pm"}),
+            EventMatcher(type="task.*", filter={"state": [["nested"]]}),
+        ]
+        contexts = [
+            None,
+            {"priority": "high"},
+            {"priority": "low", "agent": "pm"},
+            {"labels": ["api"]},
+            {"labels": ["api", "backend", "ui"]},
+            {"labels": "backend"},
+            {"labels": [["unhashable"]], "priority": ["high"]},
+            {"state": ["nested"]},
+        ]
+
+        for matcher in matchers:
+            hook = HookDefinition(name="hook", events=[matcher], command="x")
+            config = HooksConfig(version="1.0", hooks=[hook])
+            for context in contexts:
+                event = Event(
+                    event_type="task.completed", project_root="/tmp", context=context
+                )
+                expected = [hook] if matcher.matches(event) else []
+                assert config.get_matching_hooks(event) == expected, (
+                    matcher.filter,
+                    context,
+                )
+
+    def test_get_matching_hooks_recompiles(self):
+        """Test the index follows hook list changes and explicit compile()."""
+        hook = HookDefinition(
+            name="hook", events=[EventMatcher(type="spec.created")], command="x"
+        )
+        config = HooksConfig(version="1.0", hooks=[])
+        event = Event(event_type="spec.created", project_root="/tmp")
+        assert config.get_matching_hooks(event) == []
+
+        config.hooks.append(hook)
+        assert config.get_matching_hooks(event) == [hook]
+
+        hook.events[0].type = "spec.updated"
+        config.compile()
+        assert config.get_matching_hooks(event) == []
+
     def test_get_hook_by_name(self):
         """Test getting hook by name."""
         hook = HookDefinition(
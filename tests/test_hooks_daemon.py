@@ -0,0 +1,333 @@
+"""Tests for the hooks emit daemon and the hook-script emit client."""
+
+import importlib.util
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from flowspec_cli.hooks.daemon import (
+    EmitDaemon,
+    EmitDaemonError,
+    default_socket_path,
+    send_request,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Emit daemon requires Unix sockets"
+)
+
+CLIENT_PATH = Path(__file__).parent.parent / "templates" / "hooks" / "emit_client.py"
+HOOK_PATH = CLIENT_PATH.parent / "post-slash-command-emit.py"
+
+HOOKS_YAML = """\
+version: "1.0"
+hooks:
+  - name: record
+    events:
+      - type: "task.completed"
+    command: "echo $HOOK_NAME >> record.txt"
+"""
+
+
+@pytest.fixture
+def emit_client():
+    """Load the stdlib-only emit client template as a module."""
+    spec = importlib.util.spec_from_file_location("emit_client", CLIENT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def workspace_root(tmp_path: Path) -> Path:
+    """Create workspace with a hooks.yaml."""
+    hooks_dir = tmp_path / ".flowspec" / "hooks"
+    hooks_dir.mkdir(parents=True)
+    (hooks_dir / "hooks.yaml").write_text(HOOKS_YAML)
+    return tmp_path
+
+
+@pytest.fixture
+def runtime_dir(monkeypatch):
+    """Use a short runtime directory (Unix socket paths are length-limited)."""
+    path = tempfile.mkdtemp(prefix="fs-", dir="/tmp")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", path)
+    yield Path(path)
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(workspace_root: Path, runtime_dir: Path):
+    """Run an emit daemon in a background thread."""
+    emit_daemon = EmitDaemon(workspace_root=workspace_root, idle_timeout=0)
+    emit_daemon.bind()
+    thread = threading.Thread(target=emit_daemon.serve_forever, daemon=True)
+    thread.start()
+    yield emit_daemon
+    emit_daemon.shutdown()
+    thread.join(timeout=5)
+
+
+class TestEmitDaemon:
+    """Test EmitDaemon request handling."""
+
+    def test_socket_path_is_private_and_per_project(
+        self, workspace_root: Path, runtime_dir: Path, emit_client
+    ):
+        path = default_socket_path(workspace_root)
+
+        assert path.parent == runtime_dir / f"flowspec-{os.getuid()}"
+        assert path != default_socket_path(workspace_root / "other")
+        assert emit_client.socket_path(workspace_root) == path
+
+    def test_emit_waits_for_results(self, daemon: EmitDaemon, workspace_root: Path):
+        response = send_request(
+            daemon.socket_path,
+            {"command": "emit", "event_type": "task.completed", "task_id": "task-1"},
+        )
+
+        assert response["ok"] is True
+        assert [r["hook_name"] for r in response["results"]] == ["record"]
+        assert (workspace_root / "record.txt").read_text() == "record\n"
+        assert os.stat(daemon.socket_path).st_mode & 0o777 == 0o600
+
+    def test_emit_builds_cli_event(self, daemon: EmitDaemon):
+        with patch.object(daemon.emitter, "emit", return_value=[]) as mock_emit:
+            send_request(
+                daemon.socket_path,
+                {
+                    "command": "emit",
+                    "event_type": "agent.progress",
+                    "task_id": "task-9",
+                    "progress": 40,
+                },
+            )
+
+        event = mock_emit.call_args[0][0]
+        assert event.project_root == str(daemon.workspace_root)
+        assert event.context["task_id"] == "task-9"
+        assert event.context["progress_percent"] == 40
+        assert event.context["agent_id"].startswith("claude-code@")
+
+    def test_reloads_changed_config(self, daemon: EmitDaemon, workspace_root: Path):
+        hooks_yaml = workspace_root / ".flowspec" / "hooks" / "hooks.yaml"
+        runner = daemon.emitter._get_runner()
+        hooks_yaml.write_text(HOOKS_YAML.replace("record", "renamed") + "\n")
+
+        response = send_request(
+            daemon.socket_path, {"command": "emit", "event_type": "task.completed"}
+        )
+
+        assert [r["hook_name"] for r in response["results"]] == ["renamed"]
+        assert daemon.emitter._get_runner() is runner
+
+    def test_dry_run_and_invalid_requests(self, daemon: EmitDaemon):
+        dry = send_request(
+            daemon.socket_path,
+            {"command": "emit", "event_type": "task.completed", "dry_run": True},
+        )
+        missing = send_request(daemon.socket_path, {"command": "emit"})
+        unknown = send_request(daemon.socket_path, {"command": "restart"})
+
+        assert dry == {"ok": True, "results": [], "would_run": ["record"]}
+        assert missing["ok"] is False
+        assert unknown["ok"] is False
+
+    def test_ping_and_shutdown(self, daemon: EmitDaemon):
+        ping = send_request(daemon.socket_path, {"command": "ping"})
+        assert ping["ok"] is True
+        assert ping["pid"] == os.getpid()
+        assert ping["hooks"] == 1
+
+        send_request(daemon.socket_path, {"command": "shutdown"})
+        deadline = time.monotonic() + 5
+        while daemon.socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert not daemon.socket_path.exists()
+        with pytest.raises(EmitDaemonError):
+            send_request(daemon.socket_path, {"command": "ping"}, timeout=1.0)
+
+    def test_bind_replaces_stale_socket(self, workspace_root: Path, runtime_dir: Path):
+        stale = EmitDaemon(workspace_root=workspace_root)
+        stale.bind()
+        stale._server.server_close()  # Socket file left behind, nobody listening
+
+        fresh = EmitDaemon(workspace_root=workspace_root)
+        fresh.bind()
+        try:
+            assert fresh.socket_path == stale.socket_path
+        finally:
+            fresh.close()
+
+    def test_bind_refuses_running_daemon(self, daemon: EmitDaemon):
+        with pytest.raises(EmitDaemonError, match="already running"):
+            EmitDaemon(workspace_root=daemon.workspace_root).bind()
+
+    def test_bind_refuses_shared_socket_dir(
+        self, workspace_root: Path, runtime_dir: Path
+    ):
+        socket_dir = default_socket_path(workspace_root).parent
+        socket_dir.mkdir(mode=0o755)
+        socket_dir.chmod(0o755)  # Not affected by the umask
+
+        with pytest.raises(EmitDaemonError, match="Refusing socket directory"):
+            EmitDaemon(workspace_root=workspace_root).bind()
+
+    def test_idle_timeout_exits(self, workspace_root: Path, runtime_dir: Path):
+        emit_daemon = EmitDaemon(workspace_root=workspace_root, idle_timeout=0.2)
+
+        start = time.monotonic()
+        emit_daemon.serve_forever()
+
+        assert time.monotonic() - start < 5
+        assert not emit_daemon.socket_path.exists()
+
+
+class TestEmitClient:
+    """Test the stdlib-only client used by Claude Code hook scripts."""
+
+    def test_emit_through_daemon(
+        self, daemon: EmitDaemon, workspace_root: Path, emit_client
+    ):
+        with patch.object(emit_client, "emit_with_cli") as mock_cli:
+            success, message = emit_client.emit(
+                "task.completed", task_id="task-1", project_root=workspace_root
+            )
+
+        assert success is True
+        assert message == "Emitted task.completed event"
+        mock_cli.assert_not_called()
+
+        deadline = time.monotonic() + 5
+        output = workspace_root / "record.txt"
+        while not output.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert output.read_text() == "record\n"
+
+    def test_falls_back_to_cli_and_starts_daemon(
+        self, workspace_root: Path, runtime_dir: Path, emit_client
+    ):
+        with (
+            patch.object(emit_client.subprocess, "run") as mock_run,
+            patch.object(emit_client.subprocess, "Popen") as mock_popen,
+        ):
+            mock_run.return_value.returncode = 0
+            success, _ = emit_client.emit(
+                "spec.created", spec_id="auth", project_root=workspace_root
+            )
+
+        assert success is True
+        assert mock_run.call_args[0][0] == [
+            "flowspec",
+            "hooks",
+            "emit",
+            "spec.created",
+            "--spec-id",
+            "auth",
+        ]
+        assert mock_popen.call_args[0][0][:3] == ["flowspec", "hooks", "daemon"]
+
+    def test_skips_daemon_in_shared_socket_dir(
+        self, workspace_root: Path, runtime_dir: Path, emit_client
+    ):
+        socket_dir = emit_client.socket_path(workspace_root).parent
+        socket_dir.mkdir()
+        socket_dir.chmod(0o777)
+
+        with (
+            patch.object(emit_client, "daemon_request") as mock_request,
+            patch.object(emit_client.subprocess, "run") as mock_run,
+            patch.object(emit_client.subprocess, "Popen") as mock_popen,
+        ):
+            mock_run.return_value.returncode = 0
+            success, _ = emit_client.emit("spec.created", project_root=workspace_root)
+
+        assert success is True
+        mock_request.assert_not_called()
+        mock_popen.assert_not_called()
+
+    def test_daemon_disabled_by_env(
+        self, workspace_root: Path, runtime_dir: Path, emit_client, monkeypatch
+    ):
+        monkeypatch.setenv("FLOWSPEC_EMIT_DAEMON", "0")
+
+        with (
+            patch.object(emit_client.subprocess, "run") as mock_run,
+            patch.object(emit_client.subprocess, "Popen") as mock_popen,
+        ):
+            mock_run.return_value.returncode = 1
+            mock_run.return_value.stderr = "boom"
+            success, message = emit_client.emit(
+                "spec.created", project_root=workspace_root
+            )
+
+        assert success is False
+        assert "boom" in message
+        mock_popen.assert_not_called()
+
+    def test_wait_reports_failed_hooks(
+        self, daemon: EmitDaemon, workspace_root: Path, emit_client
+    ):
+        (workspace_root / ".flowspec" / "hooks" / "hooks.yaml").write_text(
+            HOOKS_YAML.replace("echo $HOOK_NAME >> record.txt", "exit 3")
+        )
+
+        success, message = emit_client.emit(
+            "task.completed", project_root=workspace_root, wait=True
+        )
+
+        assert success is False
+        assert message == "Hook(s) failed: record"
+
+
+class TestSlashCommandHook:
+    """Test the PostToolUse hook that emits events for /flow commands."""
+
+    @pytest.fixture
+    def hook(self):
+        spec = importlib.util.spec_from_file_location(
+            "post_slash_command_emit", HOOK_PATH
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_waits_for_hooks(self, hook):
+        with patch.object(
+            hook, "emit", return_value=(False, "Hook(s) failed: x")
+        ) as mock_emit:
+            success, message = hook.emit_event("spec.created", "auth", None)
+
+        assert success is False
+        assert message == "Hook(s) failed: x"
+        mock_emit.assert_called_once_with(
+            "spec.created", spec_id="auth", task_id=None, wait=True
+        )
+
+    def test_falls_back_to_cli_without_client(self, hook, monkeypatch):
+        monkeypatch.setattr(hook, "emit", None)
+
+        with patch.object(hook.subprocess, "run") as mock_run:
+            mock_run.return_value.returncode = 0
+            success, message = hook.emit_event("spec.created", "auth", "task-1")
+
+        assert success is True
+        assert message == "Emitted spec.created event"
+        assert mock_run.call_args[0][0] == [
+            "flowspec",
+            "hooks",
+            "emit",
+            "spec.created",
+            "--spec-id",
+            "auth",
+            "--task-id",
+            "task-1",
+        ]
@@ -68,6 +68,16 @@ class TestEventEmitter:
         assert emitter.config == hooks_config
         assert emitter.dry_run is False
 
+    def test_runner_uses_security_config(self, workspace_root: Path):
+        """Test the hook runner gets the config's security settings."""
+        config = HooksConfig(
+            version="1.0", hooks=[], security={"persist_validation_cache": True}
+        )
+        emitter = EventEmitter(workspace_root=workspace_root, config=config)
+
+        cache = emitter._get_runner().security_validator.validation_cache
+        assert cache.path == workspace_root / ".flowspec/hooks/validation-cache.json"
+
     def test_init_without_config(self, workspace_root: Path):
         """Test emitter initialization without config (loads from workspace)."""
         # Create empty hooks.yaml
@@ -277,6 +287,191 @@ class TestEventEmitter:
         assert call_kwargs["daemon"] is True
 
 
+def _command_hook(name: str, command: str, **kwargs) -> HookDefinition:
+    """Create a command hook matching task.completed events."""
+    return HookDefinition(
+        name=name,
+        events=[EventMatcher(type="task.completed")],
+        command=command,
+        **kwargs,
+    )
+
+
+class TestConcurrentExecution:
+    """Test parallel and depends_on hook execution."""
+
+    @pytest.fixture
+    def task_event(self, workspace_root: Path) -> Event:
+        return Event(event_type="task.completed", project_root=str(workspace_root))
+
+    def test_parallel_hooks_run_concurrently(
+        self, workspace_root: Path, task_event: Event
+    ):
+        """Test fan-out takes max(hook) time instead of sum(hook) time."""
+        import time
+
+        hooks_config = HooksConfig(
+            version="1.0",
+            hooks=[
+                _command_hook(name, "sleep 0.4", parallel=True)
+                for name in ("lint", "test", "notify")
+            ],
+        )
+        emitter = EventEmitter(workspace_root=workspace_root, config=hooks_config)
+
+        start = time.monotonic()
+        results = emitter.emit(task_event)
+        elapsed = time.monotonic() - start
+
+        assert [r.hook_name for r in results] == ["lint", "test", "notify"]
+        assert all(r.success for r in results)
+        assert elapsed < 1.0, f"Parallel hooks took {elapsed:.2f}s"
+
+    def test_max_workers_bounds_concurrency(
+        self, workspace_root: Path, task_event: Event
+    ):
+        """Test no more than max_workers hooks run at the same time."""
+        import time
+
+        hooks_config = HooksConfig(
+            version="1.0",
+            hooks=[
+                _command_hook(f"hook{i}", "sleep 0.2", parallel=True) for i in range(3)
+            ],
+        )
+        emitter = EventEmitter(
+            workspace_root=workspace_root, config=hooks_config, max_workers=1
+        )
+
+        start = time.monotonic()
+        results = emitter.emit(task_event)
+
+        assert len(results) == 3
+        assert time.monotonic() - start >= 0.6
+
+    def test_depends_on_orders_hooks(self, workspace_root: Path, task_event: Event):
+        """Test a hook starts only after the hooks it depends on succeed."""
+        hooks_config = HooksConfig(
+            version="1.0",
+            hooks=[
+                _command_hook(
+                    "notify", "cat order.txt", parallel=True, depends_on=["test"]
+                ),
+                _command_hook(
+                    "test", "sleep 0.2; echo test >> order.txt", parallel=True
+                ),
+                _command_hook("lint", "echo lint >> order.txt", parallel=True),
+            ],
+        )
+        emitter = EventEmitter(workspace_root=workspace_root, config=hooks_config)
+
+        results = emitter.emit(task_event)
+
+        assert [r.hook_name for r in results] == ["notify", "test", "lint"]
+        assert results[0].stdout == "lint\ntest\n"
+
+    def test_failed_dependency_skips_dependents(
+        self, workspace_root: Path, task_event: Event
+    ):
+        """Test dependents of a failed hook are skipped, other hooks still run."""
+        hooks_config = HooksConfig(
+            version="1.0",
+            hooks=[
+                _command_hook("lint", "true", parallel=True),
+                _command_hook("test", "exit 1", parallel=True),
+                _command_hook("notify", "true", parallel=True, depends_on=["test"]),
+            ],
+        )
+        emitter = EventEmitter(workspace_root=workspace_root, config=hooks_config)
+
+        results = emitter.emit(task_event)
+
+        assert [(r.hook_name, r.success) for r in results] == [
+            ("lint", True),
+            ("test", False),
+        ]
+
+    def test_fail_mode_stop_blocks_later_hooks(
+        self, workspace_root: Path, task_event: Event
+    ):
+        """Test a stop failure lets running hooks finish but starts no others."""
+        hooks_config = HooksConfig(
+            version="1.0",
+            hooks=[
+                _command_hook("gate", "exit 1", parallel=True, fail_mode="stop"),
+                _command_hook("lint", "sleep 0.2", parallel=True),
+                _command_hook("deploy", "true"),
+            ],
+        )
+        emitter = EventEmitter(workspace_root=workspace_root, config=hooks_config)
+
+        results = emitter.emit(task_event)
+
+        assert [(r.hook_name, r.success) for r in results] == [
+            ("gate", False),
+            ("lint", True),
+        ]
+
+    def test_serial_hook_waits_for_parallel_group(
+        self, workspace_root: Path, task_event: Event
+    ):
+        """Test a serial hook after parallel hooks waits for all of them."""
+        hooks_config = HooksConfig(
+            version="1.0",
+            hooks=[
+                _command_hook(
+                    "slow", "sleep 0.2; echo slow >> order.txt", parallel=True
+                ),
+                _command_hook("fast", "echo fast >> order.txt", parallel=True),
+                _command_hook("report", "cat order.txt"),
+            ],
+        )
+        emitter = EventEmitter(workspace_root=workspace_root, config=hooks_config)
+
+        results = emitter.emit(task_event)
+
+        assert results[-1].hook_name == "report"
+        assert results[-1].stdout == "fast\nslow\n"
+
+    def test_runner_reused_across_events(self, workspace_root: Path, task_event: Event):
+        """Test one HookRunner is created per emitter, not per event."""
+        hooks_config = HooksConfig(version="1.0", hooks=[_command_hook("lint", "true")])
+        emitter = EventEmitter(workspace_root=workspace_root, config=hooks_config)
+
+        with patch("flowspec_cli.hooks.runner.HookRunner") as mock_runner_class:
+            emitter.emit(task_event)
+            emitter.emit(task_event)
+
+        mock_runner_class.assert_called_once()
+        assert mock_runner_class.return_value.run_hook.call_count == 2
+
+    def test_emit_async_uses_single_worker(
+        self, workspace_root: Path, task_event: Event
+    ):
+        """Test queued async events are processed in order by one worker."""
+        import time
+
+        hooks_config = HooksConfig(
+            version="1.0",
+            hooks=[_command_hook("record", "echo $HOOK_NAME >> async.txt")],
+        )
+        emitter = EventEmitter(workspace_root=workspace_root, config=hooks_config)
+
+        for _ in range(3):
+            emitter.emit_async(task_event)
+        worker = emitter._async_worker
+
+        output = workspace_root / "async.txt"
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if output.exists() and output.read_text().count("record") == 3:
+                break
+            time.sleep(0.05)
+
+        assert output.read_text() == "record\n" * 3
+        assert emitter._async_worker is worker
+
+
 class TestConvenienceFunctions:
     """Test convenience functions for common events."""
 
@@ -3,6 +3,7 @@
 Tests security controls including:
 - Dangerous pattern detection
 - Script integrity verification (hashing)
+- Script validation caching
 - Audit log integrity verification
 - Path validation edge cases
 - Security configuration
@@ -11,12 +12,15 @@ Tests security controls including:
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
 from flowspec_cli.hooks.security import (
+    VALIDATION_CACHE_VERSION,
     AuditLogger,
+    ScriptValidationCache,
     SecurityConfig,
     SecurityValidator,
 )
@@ -190,6 +194,19 @@ rm -rf /
         assert len(warnings) == 1
         assert "base64" in warnings[0].lower()
 
+    def test_crlf_line_endings_detected(self, tmp_path):
+        """Detect line-anchored patterns in scripts with CRLF line endings."""
+
+        class AnchoredValidator(SecurityValidator):
+            DANGEROUS_PATTERNS = [(r"^rm -rf \*$", "Wildcard deletion")]
+
+        validator = AnchoredValidator(SecurityConfig(), workspace_root=tmp_path)
+        script = tmp_path / "crlf.sh"
+        script.write_bytes(b"#!/bin/bash\r\nrm -rf *\r\necho done\r\n")
+        warnings = validator.validate_script_content(script)
+        assert len(warnings) == 1
+        assert "wildcard" in warnings[0].lower()
+
     def test_multiple_dangerous_patterns(self, validator, tmp_path):
         """Detect multiple dangerous patterns in one script."""
         script = tmp_path / "multi_danger.sh"
@@ -237,6 +254,114 @@ chmod -R 777 /
             validator.compute_script_hash(script)
 
 
+class TestScriptValidationCache:
+    """Test caching of script validation verdicts."""
+
+    @pytest.fixture
+    def cache(self):
+        return ScriptValidationCache()
+
+    @pytest.fixture
+    def script(self, tmp_path):
+        script = tmp_path / "hook.sh"
+        script.write_text("#!/bin/bash\nrm -rf /\n")
+        # Outside the racy window, so size and mtime are trusted
+        os.utime(script, ns=(0, 1_000_000_000))
+        return script
+
+    def counting_scan(self, calls):
+        def scan(content):
+            calls.append(content)
+            return ["rm -rf /"] if b"rm -rf /" in content else []
+
+        return scan
+
+    def test_unchanged_script_not_rescanned(self, cache, script):
+        calls = []
+        first = cache.get(script, "p1", self.counting_scan(calls))
+        second = cache.get(script, "p1", self.counting_scan(calls))
+
+        assert len(calls) == 1
+        assert second.warnings == first.warnings == ["rm -rf /"]
+
+    def test_touched_script_reuses_verdict(self, cache, script):
+        calls = []
+        cache.get(script, "p1", self.counting_scan(calls))
+        os.utime(script, ns=(0, 2_000_000_000))
+
+        verdict = cache.get(script, "p1", self.counting_scan(calls))
+
+        assert len(calls) == 1
+        assert verdict.mtime_ns == 2_000_000_000
+
+    def test_content_change_invalidates(self, cache, script):
+        calls = []
+        cache.get(script, "p1", self.counting_scan(calls))
+        script.write_text("#!/bin/bash\necho ok\n")
+
+        verdict = cache.get(script, "p1", self.counting_scan(calls))
+
+        assert len(calls) == 2
+        assert verdict.warnings == []
+
+    def test_same_size_rewrite_in_racy_window_invalidates(self, cache, tmp_path):
+        script = tmp_path / "hook.sh"
+        script.write_text("echo a\n")
+        calls = []
+        cache.get(script, "p1", self.counting_scan(calls))
+        stat = script.stat()
+        script.write_text("echo b\n")
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        cache.get(script, "p1", self.counting_scan(calls))
+
+        assert len(calls) == 2
+
+    def test_pattern_change_invalidates(self, cache, script):
+        calls = []
+        cache.get(script, "p1", self.counting_scan(calls))
+        cache.get(script, "p2", self.counting_scan(calls))
+
+        assert len(calls) == 2
+
+    def test_persisted_cache_round_trip(self, tmp_path, script):
+        path = tmp_path / ".flowspec" / "hooks" / "validation-cache.json"
+        calls = []
+        ScriptValidationCache(path).get(script, "p1", self.counting_scan(calls))
+
+        verdict = ScriptValidationCache(path).get(
+            script, "p1", self.counting_scan(calls)
+        )
+
+        assert len(calls) == 1
+        assert verdict.warnings == ["rm -rf /"]
+
+    def test_unreadable_cache_file_ignored(self, tmp_path, script):
+        path = tmp_path / "validation-cache.json"
+        path.write_text("{not json")
+        calls = []
+
+        ScriptValidationCache(path).get(script, "p1", self.counting_scan(calls))
+
+        assert len(calls) == 1
+        assert json.loads(path.read_text())["version"] == VALIDATION_CACHE_VERSION
+
+    def test_validator_uses_blocked_commands_in_key(self, tmp_path, script):
+        config = SecurityConfig(persist_validation_cache=True)
+        validator = SecurityValidator(config, workspace_root=tmp_path)
+        blocked = SecurityValidator(
+            SecurityConfig(blocked_commands=["curl"], persist_validation_cache=True),
+            workspace_root=tmp_path,
+        )
+
+        assert len(validator.validate_script_content(script)) == 1
+        assert validator.compute_script_hash(script) == (
+            validator.validation_cache.get(script, validator._patterns_key, None).sha256
+        )
+        assert validator._patterns_key != blocked._patterns_key
+        assert (tmp_path / ".flowspec" / "hooks" / "validation-cache.json").exists()
+
+
 class TestAuditLogger:
     """Test AuditLogger integrity verification."""
 
@@ -425,3 +550,219 @@ class TestAuditLogger:
         expected_hash = hashlib.sha256(chain_input.encode("utf-8")).hexdigest()
 
         assert entry2["entry_hash"] == expected_hash
+
+
+class TestAuditLoggerCheckpoints:
+    """Test checkpointed, segmented and parallel audit verification."""
+
+    @pytest.fixture(autouse=True)
+    def audit_key(self, monkeypatch):
+        monkeypatch.setenv("FLOWSPEC_AUDIT_KEY", "test-audit-key")
+
+    def log_entries(self, audit_log: AuditLogger, count: int, start: int = 0):
+        for i in range(start, start + count):
+            audit_log.log_execution({"event_id": f"evt_{i}", "success": True})
+
+    def tamper(self, path: Path, line_index: int) -> None:
+        lines = path.read_text().splitlines()
+        entry = json.loads(lines[line_index])
+        entry["success"] = False
+        lines[line_index] = json.dumps(entry)
+        path.write_text("\n".join(lines) + "\n")
+
+    def test_verify_writes_signed_checkpoint(self, tmp_path):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=None)
+        self.log_entries(audit_log, 3)
+
+        assert audit_log.verify_integrity() == (True, [])
+
+        checkpoint = json.loads(audit_log.checkpoint_path.read_text())
+        assert checkpoint["line"] == 3
+        assert len(checkpoint["signature"]) == 64
+
+    def test_no_checkpoints_without_key(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FLOWSPEC_AUDIT_KEY")
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=200)
+        self.log_entries(audit_log, 10)
+
+        assert audit_log.verify_integrity(incremental=True) == (True, [])
+        assert not audit_log.checkpoint_path.exists()
+        assert list(tmp_path.iterdir()) == [audit_log.log_path]
+
+    def test_checkpoint_signed_with_other_key_is_not_trusted(
+        self, tmp_path, monkeypatch
+    ):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=None)
+        self.log_entries(audit_log, 3)
+        audit_log.verify_integrity()
+        self.tamper(audit_log.log_path, 0)
+
+        monkeypatch.setenv("FLOWSPEC_AUDIT_KEY", "other-key")
+        valid, errors = AuditLogger(audit_log.log_path).verify_integrity(
+            incremental=True
+        )
+        assert not valid
+        assert errors[0].startswith("Line 1: Hash mismatch")
+
+    def test_incremental_verifies_after_checkpoint(self, tmp_path):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=None)
+        self.log_entries(audit_log, 3)
+        audit_log.verify_integrity()
+        self.log_entries(audit_log, 2, start=3)
+
+        assert audit_log.verify_integrity(incremental=True) == (True, [])
+
+        self.tamper(audit_log.log_path, 4)
+        valid, errors = audit_log.verify_integrity(incremental=True)
+        assert not valid
+        assert errors[0].startswith("Line 5: Hash mismatch")
+
+    def test_tampered_checkpoint_is_not_trusted(self, tmp_path):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=None)
+        self.log_entries(audit_log, 3)
+        audit_log.verify_integrity()
+        self.tamper(audit_log.log_path, 0)
+
+        # Forge a checkpoint vouching for the tampered entry
+        checkpoint = json.loads(audit_log.checkpoint_path.read_text())
+        checkpoint["line"] = 3
+        checkpoint["signature"] = "0" * 64
+        with open(audit_log.checkpoint_path, "a") as f:
+            f.write(json.dumps(checkpoint) + "\n")
+
+        valid, errors = AuditLogger(audit_log.log_path).verify_integrity(
+            incremental=True
+        )
+        assert not valid
+        assert errors[0].startswith("Line 1: Hash mismatch")
+
+    def test_log_execution_checkpoints_at_interval(self, tmp_path):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=200)
+        self.log_entries(audit_log, 10)
+
+        checkpoints = audit_log.checkpoint_path.read_text().splitlines()
+        assert 1 < len(checkpoints) < 10
+
+    def test_failed_check_is_not_repeated_on_every_append(self, tmp_path, monkeypatch):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=400)
+        self.log_entries(audit_log, 10)
+        self.tamper(audit_log.log_path, 0)
+
+        calls = []
+        original = AuditLogger.verify_integrity
+        monkeypatch.setattr(
+            AuditLogger,
+            "verify_integrity",
+            lambda self, **kw: calls.append(kw) or original(self, **kw),
+        )
+        # A new logger per entry, as each hook runs in a fresh process
+        for i in range(10, 30):
+            AuditLogger(audit_log.log_path, checkpoint_interval=400).log_execution(
+                {"event_id": f"evt_{i}", "success": True}
+            )
+
+        assert 1 <= len(calls) < 10
+        records = audit_log.checkpoint_path.read_text().splitlines()
+        assert json.loads(records[-1])["failed"] is True
+        assert audit_log.verify_integrity(incremental=True)[0] is False
+
+    def test_segments_are_cached_until_rotation(self, tmp_path, monkeypatch):
+        audit_log = AuditLogger(
+            tmp_path / "audit.log", max_bytes=300, checkpoint_interval=None
+        )
+        self.log_entries(audit_log, 10)
+        rotated = len(audit_log.segments())
+
+        globs = []
+        original = Path.glob
+        monkeypatch.setattr(
+            Path,
+            "glob",
+            lambda self, pattern: globs.append(pattern) or original(self, pattern),
+        )
+        audit_log.log_execution({"event_id": "evt_10", "success": True})
+        assert globs == []
+
+        self.log_entries(audit_log, 5, start=11)
+        assert globs
+        assert len(audit_log.segments()) > rotated
+        assert audit_log.verify_integrity() == (True, [])
+
+    def test_rotation_carries_chain(self, tmp_path):
+        audit_log = AuditLogger(
+            tmp_path / "audit.log", max_bytes=300, checkpoint_interval=None
+        )
+        self.log_entries(audit_log, 10)
+
+        segments = audit_log.segments()
+        assert len(segments) > 2
+        assert segments[0][1].name == "audit.log.000001"
+        assert audit_log.verify_integrity() == (True, [])
+
+        # The new segment's first entry chains from the previous segment
+        first = json.loads(segments[1][1].read_text().splitlines()[0])
+        first.pop("entry_hash")
+        first["success"] = False
+        lines = segments[1][1].read_text().splitlines()
+        lines[0] = json.dumps({**first, "entry_hash": "0" * 64})
+        segments[1][1].write_text("\n".join(lines) + "\n")
+
+        valid, errors = audit_log.verify_integrity()
+        assert not valid
+        assert errors[0].startswith("audit.log.000002: Line 1: Hash mismatch")
+
+    def test_parallel_verify(self, tmp_path):
+        audit_log = AuditLogger(
+            tmp_path / "audit.log", max_bytes=300, checkpoint_interval=None
+        )
+        self.log_entries(audit_log, 10)
+
+        assert audit_log.verify_integrity(parallel=True, max_workers=2) == (True, [])
+
+        # Tamper with the first entry of a later segment: only the stitch sees it
+        self.tamper(audit_log.segments()[1][1], 0)
+        sequential = audit_log.verify_integrity()
+        parallel = audit_log.verify_integrity(parallel=True, max_workers=2)
+
+        assert not parallel[0]
+        assert parallel == sequential
+
+
+class TestAuditLoggerTailReads:
+    """Test reading recent audit entries from the end of the log."""
+
+    @pytest.fixture(autouse=True)
+    def small_blocks(self, monkeypatch):
+        monkeypatch.setattr("flowspec_cli.hooks.security.REVERSE_READ_BLOCK_SIZE", 64)
+
+    def test_recent_entries_across_blocks(self, tmp_path):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=None)
+        for i in range(20):
+            audit_log.log_execution({"event_id": f"evt_{i}"})
+
+        entries = audit_log.get_recent_entries(count=3)
+
+        assert [e["event_id"] for e in entries] == ["evt_19", "evt_18", "evt_17"]
+        assert len(audit_log.get_recent_entries(count=0)) == 20
+
+    def test_long_entries_continue_chain(self, tmp_path):
+        audit_log = AuditLogger(tmp_path / "audit.log", checkpoint_interval=None)
+        audit_log.log_execution({"event_id": "evt_0", "error": "x" * 10_000})
+        audit_log.log_execution({"event_id": "evt_1", "error": "y" * 10_000})
+
+        assert audit_log.verify_integrity() == (True, [])
+        assert audit_log.get_recent_entries(count=1)[0]["event_id"] == "evt_1"
+
+    def test_recent_entries_span_segments(self, tmp_path):
+        audit_log = AuditLogger(
+            tmp_path / "audit.log", max_bytes=200, checkpoint_interval=None
+        )
+        for i in range(6):
+            audit_log.log_execution({"event_id": f"evt_{i}"})
+
+        entries = audit_log.get_recent_entries(count=6)
+
+        assert len(audit_log.segments()) > 1
+        assert [e["event_id"] for e in entries] == [
+            f"evt_{i}" for i in range(5, -1, -1)
+        ]
@@ -0,0 +1,94 @@
+"""Tests for MemoryCatalog metadata caching."""
+
+import os
+
+import pytest
+
+from flowspec_cli.memory import TaskMemoryStore
+from flowspec_cli.memory.catalog import MemoryCatalog
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create TaskMemoryStore with a frontmatter template."""
+    template_dir = tmp_path / "templates" / "memory"
+    template_dir.mkdir(parents=True)
+    (template_dir / "default.md").write_text(
+        "---\ntask_id: {task_id}\ncreated: {created_date}\n---\n"
+        "# Task Memory: {task_id}\n\n## Notes\n"
+    )
+    return TaskMemoryStore(base_path=tmp_path)
+
+
+def test_records_include_location_size_and_frontmatter(store):
+    path = store.create("task-1")
+    store.create("task-2")
+    store.archive("task-2")
+
+    records = store.catalog.records()
+
+    assert [(r.task_id, r.status) for r in records] == [
+        ("task-1", "active"),
+        ("task-2", "archived"),
+    ]
+    assert records[0].path == path
+    assert records[0].size == path.stat().st_size
+    assert records[0].mtime == path.stat().st_mtime
+    assert records[0].metadata["task_id"] == "task-1"
+    assert records[1].path == store.archive_dir / "task-2.md"
+
+
+def test_records_filter_by_status(store):
+    store.create("task-1")
+    store.create("task-2")
+    store.archive("task-2")
+
+    assert [r.task_id for r in store.catalog.records(archived=False)] == ["task-1"]
+    assert [r.task_id for r in store.catalog.records(active=False)] == ["task-2"]
+
+
+def test_catalog_persisted_and_reused(store):
+    store.create("task-1")
+    store.catalog.records()
+    assert store.catalog.catalog_path.exists()
+
+    catalog = MemoryCatalog(store.memory_dir, store.archive_dir)
+    records = catalog.records()
+
+    # Frontmatter comes from the persisted catalog, not a fresh parse
+    assert records[0].metadata["task_id"] == "task-1"
+
+
+def test_changed_file_reparsed(store):
+    path = store.create("task-1")
+    store.catalog.records()
+
+    path.write_text("---\ntask_id: task-1\nowner: alice\n---\nbody\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert store.catalog.records()[0].metadata["owner"] == "alice"
+
+
+def test_removed_file_dropped(store):
+    store.create("task-1")
+    store.create("task-2")
+    store.catalog.records()
+
+    store.get_path("task-1").unlink()
+
+    assert [r.task_id for r in store.catalog.records()] == ["task-2"]
+
+
+def test_corrupt_catalog_rebuilt(store):
+    store.create("task-1")
+    store.catalog.records()
+    store.catalog.catalog_path.write_text("not json\n")
+
+    assert [r.task_id for r in store.catalog.records()] == ["task-1"]
+
+
+def test_file_without_frontmatter(store):
+    (store.memory_dir / "task-9.md").write_text("# Plain memory\n")
+
+    assert store.catalog.records()[0].metadata == {}
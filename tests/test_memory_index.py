@@ -0,0 +1,189 @@
+"""Tests for MemorySearchIndex and TaskMemoryStore.search."""
+
+import os
+
+import pytest
+
+from flowspec_cli.memory import TaskMemoryStore
+from flowspec_cli.memory.index import MemorySearchIndex, extract_literals
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create TaskMemoryStore with a minimal template."""
+    template_dir = tmp_path / "templates" / "memory"
+    template_dir.mkdir(parents=True)
+    (template_dir / "default.md").write_text(
+        "# Task Memory: {task_id}\n\n## Context\n\n{task_title}\n\n## Notes\n"
+    )
+    return TaskMemoryStore(base_path=tmp_path)
+
+
+def fresh_index(store):
+    """Open the on-disk index the way a new CLI process would."""
+    return MemorySearchIndex(store.memory_dir, store.archive_dir)
+
+
+class TestExtractLiterals:
+    """Tests for regex literal extraction."""
+
+    def test_plain_literal(self):
+        assert extract_literals("FastAPI") == ["fastapi"]
+
+    def test_regex_runs(self):
+        assert extract_literals("impl.*command") == ["impl", "command"]
+
+    def test_optional_character_dropped(self):
+        assert extract_literals("colou?r") == ["colo", "r"]
+
+    def test_brace_quantifier_dropped(self):
+        assert extract_literals("ab{2}c") == ["a", "c"]
+
+    def test_escaped_metacharacter_is_literal(self):
+        assert extract_literals(r"v1\.2") == ["v1.2"]
+
+    def test_class_escape_breaks_run(self):
+        assert extract_literals(r"task\d+done") == ["task", "done"]
+
+    def test_group_contents_ignored(self):
+        assert extract_literals("(foo)?bar") == ["bar"]
+
+    def test_alternation_disables_filtering(self):
+        assert extract_literals("foo|bar") is None
+
+    def test_inline_flags_disable_filtering(self):
+        assert extract_literals("(?x)foo bar") is None
+
+    def test_numeric_escapes_disable_filtering(self):
+        assert extract_literals(r"caf\xe9") is None
+        assert extract_literals(r"caf\u00e9s") is None
+        assert extract_literals(r"(a)\1b") is None
+
+    def test_no_word_characters(self):
+        assert extract_literals("->") is None
+
+
+class TestMemorySearchIndex:
+    """Tests for index maintenance and candidate selection."""
+
+    def test_create_updates_index(self, store):
+        store.create("task-1", task_title="Use FastAPI")
+        store.create("task-2", task_title="Use Flask")
+
+        index = fresh_index(store)
+        ids = [task_id for task_id, _, _ in index.candidates("fastapi")]
+        assert ids == ["task-1"]
+
+    def test_substring_match_within_token(self, store):
+        store.create("task-1", task_title="Use FastAPI")
+
+        index = fresh_index(store)
+        assert [c[0] for c in index.candidates("stAP")] == ["task-1"]
+
+    def test_multi_token_literal(self, store):
+        store.create("task-1", task_title="database migration plan")
+        store.create("task-2", task_title="database plan")
+
+        index = fresh_index(store)
+        assert [c[0] for c in index.candidates("base migration pl")] == ["task-1"]
+
+    def test_append_updates_index(self, store):
+        store.create("task-1")
+        store.append("task-1", "Chose PostgreSQL")
+
+        index = fresh_index(store)
+        assert [c[0] for c in index.candidates("postgresql")] == ["task-1"]
+
+    def test_archive_and_restore(self, store):
+        store.create("task-1", task_title="archived content")
+        store.archive("task-1")
+
+        index = fresh_index(store)
+        assert index.candidates("archived") == []
+        candidates = index.candidates("archived", include_archived=True)
+        assert [(c[0], c[1]) for c in candidates] == [("task-1", "archived")]
+
+        store.restore("task-1")
+        index = fresh_index(store)
+        assert [(c[0], c[1]) for c in index.candidates("archived")] == [
+            ("task-1", "active")
+        ]
+
+    def test_delete_removes_document(self, store):
+        store.create("task-1", task_title="gone")
+        store.delete("task-1")
+
+        assert fresh_index(store).candidates("gone") == []
+
+    def test_external_edit_detected(self, store):
+        path = store.create("task-1")
+        fresh_index(store).refresh()
+
+        path.write_text(path.read_text() + "\nExternally added Kubernetes note\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert [c[0] for c in fresh_index(store).candidates("kubernetes")] == ["task-1"]
+
+    def test_file_added_outside_cli(self, store):
+        (store.memory_dir / "task-9.md").write_text("# Manual memory\nRedis cache\n")
+
+        assert [c[0] for c in fresh_index(store).candidates("redis")] == ["task-9"]
+
+    def test_refresh_compacts_journal(self, store):
+        store.create("task-1")
+        index = fresh_index(store)
+        assert index.journal_path.exists()
+
+        index.refresh()
+        assert index.snapshot_path.exists()
+        assert not index.journal_path.exists()
+
+    def test_corrupt_snapshot_rebuilt(self, store):
+        store.create("task-1", task_title="recoverable")
+        index = fresh_index(store)
+        index.refresh()
+        index.snapshot_path.write_text("{not json")
+
+        assert [c[0] for c in fresh_index(store).candidates("recoverable")] == [
+            "task-1"
+        ]
+
+
+class TestStoreSearch:
+    """Tests for TaskMemoryStore.search."""
+
+    def test_search_returns_line_context(self, store):
+        store.create("task-1")
+        store.append("task-1", "Decision: use Typer for the CLI")
+
+        results = store.search("typer", context=1)
+
+        assert len(results) == 1
+        assert results[0]["task_id"] == "task-1"
+        assert results[0]["status"] == "active"
+        assert "Typer" in results[0]["line"]
+        assert len(results[0]["context"]) >= 2
+
+    def test_search_regex_verified_per_line(self, store):
+        store.create("task-1")
+        store.append("task-1", "implement the command")
+        store.append("task-1", "command to implement")
+
+        results = store.search("impl.*command")
+
+        assert [r["line"] for r in results] == ["implement the command"]
+
+    def test_search_respects_limit(self, store):
+        for i in range(5):
+            store.create(f"task-{i}", task_title="shared keyword")
+
+        assert len(store.search("shared", limit=3)) == 3
+
+    def test_search_archived(self, store):
+        store.create("task-1", task_title="legacy auth")
+        store.archive("task-1")
+
+        assert store.search("legacy") == []
+        results = store.search("legacy", include_archived=True)
+        assert [r["status"] for r in results] == ["archived"]
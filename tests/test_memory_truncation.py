@@ -0,0 +1,117 @@
+"""Tests for the token-budgeted memory truncation engine."""
+
+import time
+
+from flowspec_cli.memory.truncation import (
+    BPEEstimator,
+    CharRatioTokenizer,
+    TruncationEngine,
+)
+
+
+MEMORY = """---
+task_id: task-1
+---
+# Task Memory: task-1
+
+## Critical Context (NEVER DELETE)
+
+Must always survive truncation.
+
+## Key Decisions
+
+- Use SQLite for the catalog
+
+## Notes
+
+{notes}
+"""
+
+
+def make_memory(note_count: int) -> str:
+    notes = "\n".join(
+        f"- Note {i}: observed behaviour in module {i}" for i in range(note_count)
+    )
+    return MEMORY.format(notes=notes)
+
+
+class TestBPEEstimator:
+    def test_short_words_are_single_tokens(self):
+        assert BPEEstimator().count("the quick brown fox") == 4
+
+    def test_long_words_split(self):
+        assert BPEEstimator().count("internationalization") == 5
+
+    def test_digits_grouped_in_threes(self):
+        assert BPEEstimator().count("1234567") == 3
+
+    def test_non_ascii_costs_per_character(self):
+        assert BPEEstimator().count("日本語") == 3
+
+    def test_empty(self):
+        assert BPEEstimator().count("") == 0
+
+
+class TestTruncationEngine:
+    def test_within_budget_unchanged(self):
+        content = make_memory(3)
+        result = TruncationEngine().truncate(content, 2000)
+
+        assert result.content == content
+        assert not result.truncated
+        assert result.bytes == len(content.encode("utf-8"))
+
+    def test_budget_met(self):
+        engine = TruncationEngine()
+        result = engine.truncate(make_memory(500), 200)
+
+        assert result.truncated
+        assert result.tokens <= 200
+        assert engine.tokenizer.count(result.content) == result.tokens
+        assert "Content truncated" in result.content
+
+    def test_context_and_decisions_kept_before_notes(self):
+        result = TruncationEngine().truncate(make_memory(500), 200)
+
+        assert "Must always survive truncation." in result.content
+        assert "Use SQLite for the catalog" in result.content
+        assert "- Note 0:" in result.content
+        assert "- Note 499:" not in result.content
+
+    def test_document_order_preserved(self):
+        content = TruncationEngine().truncate(make_memory(500), 200).content
+
+        assert content.index("## Critical Context") < content.index("## Key Decisions")
+        assert content.index("## Key Decisions") < content.index("## Notes")
+
+    def test_pluggable_tokenizer(self):
+        engine = TruncationEngine(CharRatioTokenizer(4))
+        result = engine.truncate(make_memory(500), 200)
+
+        assert len(result.content) // 4 <= 200
+
+    def test_results_memoized_by_content_hash(self):
+        calls = []
+
+        class CountingTokenizer(CharRatioTokenizer):
+            def count(self, text):
+                calls.append(text)
+                return super().count(text)
+
+        engine = TruncationEngine(CountingTokenizer())
+        content = make_memory(200)
+        first = engine.truncate(content, 100)
+        calls.clear()
+
+        assert engine.truncate(content, 100) is first
+        assert calls == []
+
+    def test_large_memory_is_fast(self):
+        content = make_memory(50_000)
+
+        start = time.perf_counter()
+        result = TruncationEngine().truncate(content, 2000)
+        duration = time.perf_counter() - start
+
+        assert result.tokens <= 2000
+        assert duration < 2.0, f"Truncation took {duration:.2f}s"
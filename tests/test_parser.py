@@ -398,3 +398,73 @@ class TestTaskParser:
 
         assert len(tasks) == 3
         assert all(t.phase is not None for t in tasks)
+
+
+class TestStreamingParser:
+    """Test suite for streaming parse of large task files."""
+
+    def test_iter_tasks_yields_as_lines_arrive(self):
+        """Test tasks are yielded lazily, without inferred dependencies."""
+        consumed = []
+
+        def lines():
+            for line in [
+                "## Phase 1: Setup\n",
+                "- [ ] T001 Initialize project\n",
+                "## Phase 2: Foundational\n",
+                "- [ ] T002 Build core\n",
+            ]:
+                consumed.append(line)
+                yield line
+
+        parser = TaskParser()
+        stream = parser.iter_tasks(lines())
+
+        first = next(stream)
+        assert first.task_id == "T001"
+        assert first.phase == "Phase 1: Setup"
+        # Remaining lines are not consumed until requested
+        assert len(consumed) == 2
+
+        second = next(stream)
+        assert second.phase == "Phase 2: Foundational"
+        assert second.dependencies == []
+
+    def test_scan_tasks_file_records(self, sample_tasks_file):
+        """Test compact records match fully parsed tasks."""
+        parser = TaskParser()
+        records = parser.scan_tasks_file(sample_tasks_file)
+        tasks = TaskParser().parse_tasks_file(sample_tasks_file)
+
+        assert [r.task_id for r in records] == [t.task_id for t in tasks]
+        assert [list(r.dependencies) for r in records] == [
+            t.dependencies for t in tasks
+        ]
+        assert [r.phase for r in records] == [t.phase for t in tasks]
+        assert [r.is_completed for r in records] == [t.is_completed for t in tasks]
+
+    def test_stream_tasks_file_matches_parse(self, sample_tasks_file):
+        """Test streamed tasks equal tasks parsed in one go."""
+        streamed = list(TaskParser().stream_tasks_file(sample_tasks_file))
+        parsed = TaskParser().parse_tasks_file(sample_tasks_file)
+
+        assert streamed == parsed
+
+    def test_stream_tasks_file_reuses_records(self, sample_tasks_file):
+        """Test passing scanned records skips the dependency pass."""
+        parser = TaskParser()
+        records = parser.scan_tasks_file(sample_tasks_file)
+
+        streamed = list(parser.stream_tasks_file(sample_tasks_file, records))
+
+        assert [t.dependencies for t in streamed] == [
+            list(r.dependencies) for r in records
+        ]
+
+    def test_stream_tasks_file_not_found(self, temp_project_dir):
+        """Test streaming a missing file raises FileNotFoundError."""
+        parser = TaskParser()
+        nonexistent = temp_project_dir / "nonexistent.md"
+
+        with pytest.raises(FileNotFoundError):
+            list(parser.stream_tasks_file(nonexistent))
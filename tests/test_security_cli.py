@@ -8,6 +8,7 @@ import pytest
 from typer.testing import CliRunner
 
 from flowspec_cli import app
+from flowspec_cli.security.adapters.base import ScannerAdapter
 from flowspec_cli.security.models import (
     Confidence,
     Finding,
@@ -18,6 +19,43 @@ from flowspec_cli.security.models import (
 runner = CliRunner()
 
 
+class FixedScanner(ScannerAdapter):
+    """Scanner adapter that reports a fixed list of findings."""
+
+    def __init__(self, name: str, findings: list[Finding]):
+        self._name = name
+        self._findings = findings
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    def is_available(self) -> bool:
+        return True
+
+    def scan(self, target: Path, config: dict | None = None) -> list[Finding]:
+        return list(self._findings)
+
+    def get_install_instructions(self) -> str:
+        return "Built in"
+
+
+def make_sql_injection(rule: str, severity: Severity) -> Finding:
+    return Finding(
+        id=rule,
+        scanner="semgrep",
+        severity=severity,
+        title="SQL Injection",
+        description="Potentially vulnerable to SQL injection",
+        location=Location(file=Path("app.py"), line_start=42, line_end=42),
+        cwe_id="CWE-89",
+    )
+
+
 @pytest.fixture
 def sample_findings():
     """Create sample findings for testing."""
@@ -86,7 +124,7 @@ class TestSecurityScan:
         mock_adapter_class.return_value = mock_adapter
 
         mock_orchestrator = MagicMock()
-        mock_orchestrator.scan.return_value = sample_findings
+        mock_orchestrator.iter_scan.return_value = sample_findings
         mock_orchestrator.list_scanners.return_value = ["semgrep"]
         mock_orchestrator_class.return_value = mock_orchestrator
 
@@ -110,7 +148,7 @@ class TestSecurityScan:
         mock_adapter_class.return_value = mock_adapter
 
         mock_orchestrator = MagicMock()
-        mock_orchestrator.scan.return_value = sample_findings
+        mock_orchestrator.iter_scan.return_value = sample_findings
         mock_orchestrator.list_scanners.return_value = ["semgrep"]
         mock_orchestrator_class.return_value = mock_orchestrator
 
@@ -134,7 +172,7 @@ class TestSecurityScan:
         mock_adapter_class.return_value = mock_adapter
 
         mock_orchestrator = MagicMock()
-        mock_orchestrator.scan.return_value = []
+        mock_orchestrator.iter_scan.return_value = []
         mock_orchestrator.list_scanners.return_value = ["semgrep"]
         mock_orchestrator_class.return_value = mock_orchestrator
 
@@ -158,7 +196,7 @@ class TestSecurityScan:
         mock_adapter_class.return_value = mock_adapter
 
         mock_orchestrator = MagicMock()
-        mock_orchestrator.scan.return_value = sample_findings
+        mock_orchestrator.iter_scan.return_value = sample_findings
         mock_orchestrator.list_scanners.return_value = ["semgrep"]
         mock_orchestrator_class.return_value = mock_orchestrator
 
@@ -191,7 +229,7 @@ class TestSecurityScan:
         mock_adapter_class.return_value = mock_adapter
 
         mock_orchestrator = MagicMock()
-        mock_orchestrator.scan.return_value = sample_findings
+        mock_orchestrator.iter_scan.return_value = sample_findings
         mock_orchestrator.list_scanners.return_value = ["semgrep"]
         mock_orchestrator_class.return_value = mock_orchestrator
 
@@ -211,6 +249,112 @@ class TestSecurityScan:
         assert data["version"] == "2.1.0"
         assert "$schema" in data
 
+    @patch("flowspec_cli.security.adapters.semgrep.SemgrepAdapter")
+    @patch("flowspec_cli.security.orchestrator.ScannerOrchestrator")
+    def test_scan_command_jsonl_output(
+        self, mock_orchestrator_class, mock_adapter_class, sample_findings, tmp_path
+    ):
+        """Test scan with JSON Lines output format."""
+        # Arrange
+        mock_adapter = MagicMock()
+        mock_adapter.name = "Semgrep"
+        mock_adapter.is_available.return_value = True
+        mock_adapter_class.return_value = mock_adapter
+
+        mock_orchestrator = MagicMock()
+        mock_orchestrator.iter_scan.return_value = sample_findings
+        mock_orchestrator.list_scanners.return_value = ["semgrep"]
+        mock_orchestrator_class.return_value = mock_orchestrator
+
+        output_file = tmp_path / "findings.jsonl"
+
+        # Act
+        result = runner.invoke(
+            app,
+            ["security", "scan", ".", "--format", "jsonl", "-o", str(output_file)],
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        lines = output_file.read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [
+            "SEMGREP-001",
+            "SEMGREP-002",
+            "SEMGREP-003",
+        ]
+
+    @patch("flowspec_cli.security.adapters.semgrep.SemgrepAdapter")
+    @patch("flowspec_cli.security.orchestrator.ScannerOrchestrator")
+    def test_scan_command_streams_json_to_stdout(
+        self, mock_orchestrator_class, mock_adapter_class, sample_findings
+    ):
+        """Test JSON on stdout is written from the findings stream."""
+        mock_adapter = MagicMock()
+        mock_adapter.name = "Semgrep"
+        mock_adapter.is_available.return_value = True
+        mock_adapter_class.return_value = mock_adapter
+
+        mock_orchestrator = MagicMock()
+        mock_orchestrator.iter_scan.return_value = iter(sample_findings)
+        mock_orchestrator.list_scanners.return_value = ["semgrep"]
+        mock_orchestrator_class.return_value = mock_orchestrator
+
+        result = runner.invoke(app, ["security", "scan", ".", "--format", "json"])
+
+        assert result.exit_code == 1
+        document, _ = json.JSONDecoder().raw_decode(result.stdout)
+        assert len(document["findings"]) == 3
+        assert "Found 1 findings at or above high" in result.stdout
+
+    @patch("flowspec_cli.security.adapters.semgrep.SemgrepAdapter")
+    @patch("flowspec_cli.security.orchestrator.ScannerOrchestrator")
+    def test_scan_command_text_table_is_capped(
+        self, mock_orchestrator_class, mock_adapter_class, sample_findings
+    ):
+        """Test the text table lists the first findings and counts the rest."""
+        mock_adapter = MagicMock()
+        mock_adapter.name = "Semgrep"
+        mock_adapter.is_available.return_value = True
+        mock_adapter_class.return_value = mock_adapter
+
+        mock_orchestrator = MagicMock()
+        mock_orchestrator.iter_scan.return_value = iter(sample_findings)
+        mock_orchestrator.list_scanners.return_value = ["semgrep"]
+        mock_orchestrator_class.return_value = mock_orchestrator
+
+        with patch("flowspec_cli.MAX_TABLE_FINDINGS", 2):
+            result = runner.invoke(
+                app, ["security", "scan", ".", "--fail-on", "critical"]
+            )
+
+        assert result.exit_code == 0
+        assert "Showing the first 2" in result.stdout
+        assert "Total: 3 findings (1 high, 1 medium, 1 low)" in result.stdout
+
+    def test_scan_command_merges_duplicate_severities(self):
+        """Test duplicate findings export and gate on the highest severity."""
+        semgrep = FixedScanner(
+            "semgrep",
+            [
+                make_sql_injection("sql-format", Severity.MEDIUM),
+                make_sql_injection("sql-taint", Severity.CRITICAL),
+            ],
+        )
+
+        with patch(
+            "flowspec_cli.security.adapters.semgrep.SemgrepAdapter",
+            return_value=semgrep,
+        ):
+            result = runner.invoke(
+                app,
+                ["security", "scan", ".", "--format", "json", "--fail-on", "critical"],
+            )
+
+        assert result.exit_code == 1
+        document, _ = json.JSONDecoder().raw_decode(result.stdout)
+        assert [f["severity"] for f in document["findings"]] == ["critical"]
+        assert "Found 1 findings at or above critical" in result.stdout
+
     def test_scan_command_invalid_severity(self):
         """Test scan with invalid severity level."""
         # Act
@@ -239,12 +383,89 @@ class TestSecurityScan:
         assert result.exit_code == 2
         assert "not available" in result.stdout
 
+    @patch("flowspec_cli.security.adapters.semgrep.SemgrepAdapter")
+    @patch("flowspec_cli.security.orchestrator.ScannerOrchestrator")
+    def test_scan_command_incremental(
+        self, mock_orchestrator_class, mock_adapter_class, sample_findings
+    ):
+        """Test incremental scan reuses stored findings."""
+        from flowspec_cli.security.incremental import IncrementalScanResult
+
+        # Arrange
+        mock_adapter = MagicMock()
+        mock_adapter.name = "Semgrep"
+        mock_adapter.is_available.return_value = True
+        mock_adapter_class.return_value = mock_adapter
+
+        mock_orchestrator = MagicMock()
+        mock_orchestrator.scan_incremental.return_value = IncrementalScanResult(
+            findings=sample_findings,
+            full_scan=False,
+            changed_files=["app.py"],
+            reused_findings=2,
+        )
+        mock_orchestrator.list_scanners.return_value = ["semgrep"]
+        mock_orchestrator_class.return_value = mock_orchestrator
+
+        # Act
+        result = runner.invoke(
+            app,
+            [
+                "security",
+                "scan",
+                ".",
+                "--incremental",
+                "--baseline",
+                "main",
+                "--fail-on",
+                "critical",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        assert "1 changed, 0 deleted files; reused 2 stored findings" in result.stdout
+        mock_orchestrator.iter_scan.assert_not_called()
+        kwargs = mock_orchestrator.scan_incremental.call_args.kwargs
+        assert kwargs["baseline_ref"] == "main"
+
+    @patch("flowspec_cli.security.adapters.semgrep.SemgrepAdapter")
+    @patch("flowspec_cli.security.orchestrator.ScannerOrchestrator")
+    def test_scan_command_jobs(self, mock_orchestrator_class, mock_adapter_class):
+        """Test --jobs enables sharded Semgrep workers."""
+        mock_adapter = MagicMock()
+        mock_adapter.is_available.return_value = True
+        mock_adapter_class.return_value = mock_adapter
+
+        mock_orchestrator = MagicMock()
+        mock_orchestrator.iter_scan.return_value = []
+        mock_orchestrator.list_scanners.return_value = ["semgrep"]
+        mock_orchestrator_class.return_value = mock_orchestrator
+
+        result = runner.invoke(app, ["security", "scan", ".", "--jobs", "4"])
+
+        assert result.exit_code == 0
+        config = mock_orchestrator.iter_scan.call_args.kwargs["config"]
+        assert config == {"semgrep": {"jobs": 4}}
+
+        result = runner.invoke(app, ["security", "scan", ".", "--jobs", "zero"])
+        assert result.exit_code == 2
+        assert "Invalid --jobs value" in result.stdout
+
+    def test_scan_command_baseline_requires_incremental(self):
+        """Test --baseline without --incremental is rejected."""
+        result = runner.invoke(app, ["security", "scan", ".", "--baseline", "main"])
+
+        assert result.exit_code == 2
+        assert "--baseline requires --incremental" in result.stdout
+
 
 class TestSecurityTriage:
     """Test security triage command (placeholder)."""
 
-    def test_triage_command_placeholder(self, tmp_path):
+    def test_triage_command_placeholder(self, tmp_path, monkeypatch):
         """Test triage command shows coming soon message."""
+        monkeypatch.chdir(tmp_path)
         # Arrange
         findings_file = tmp_path / "findings.json"
         findings_file.write_text('{"findings": []}')
@@ -256,6 +477,48 @@ class TestSecurityTriage:
         assert result.exit_code == 0
         assert "Phase 2" in result.stdout
 
+    def test_triage_no_cache(self, tmp_path, monkeypatch):
+        """Test --no-cache disables the LLM response cache."""
+        monkeypatch.chdir(tmp_path)
+        findings_file = tmp_path / "findings.json"
+        findings_file.write_text('{"findings": []}')
+
+        result = runner.invoke(
+            app, ["security", "triage", str(findings_file), "--no-cache"]
+        )
+
+        assert result.exit_code == 0
+        assert "LLM cache: disabled" in result.stdout
+
+    def test_triage_loads_findings_db(self, tmp_path, sample_findings, monkeypatch):
+        """Test triage reads findings through the findings database."""
+        monkeypatch.chdir(tmp_path)
+        findings_file = tmp_path / "findings.json"
+        findings_file.write_text(
+            json.dumps({"findings": [f.to_dict() for f in sample_findings]})
+        )
+
+        result = runner.invoke(
+            app,
+            ["security", "triage", str(findings_file), "--min-severity", "medium"],
+        )
+
+        assert result.exit_code == 0
+        assert "Findings at or above medium: 2 (3 new, 0 fixed" in result.stdout
+        assert (tmp_path / "docs" / "security" / "findings.db").exists()
+        assert not (tmp_path / "findings.db").exists()
+
+    def test_triage_invalid_findings_file(self, tmp_path, monkeypatch):
+        """Test triage rejects files that are not findings documents."""
+        monkeypatch.chdir(tmp_path)
+        findings_file = tmp_path / "findings.json"
+        findings_file.write_text("not json")
+
+        result = runner.invoke(app, ["security", "triage", str(findings_file)])
+
+        assert result.exit_code == 2
+        assert "Invalid findings file" in result.stdout
+
 
 class TestSecurityFix:
     """Test security fix command (placeholder)."""
@@ -297,7 +560,7 @@ class TestExitCodes:
         mock_adapter_class.return_value = mock_adapter
 
         mock_orchestrator = MagicMock()
-        mock_orchestrator.scan.return_value = []
+        mock_orchestrator.iter_scan.return_value = []
         mock_orchestrator.list_scanners.return_value = ["semgrep"]
         mock_orchestrator_class.return_value = mock_orchestrator
 
@@ -320,7 +583,7 @@ class TestExitCodes:
         mock_adapter_class.return_value = mock_adapter
 
         mock_orchestrator = MagicMock()
-        mock_orchestrator.scan.return_value = sample_findings
+        mock_orchestrator.iter_scan.return_value = sample_findings
         mock_orchestrator.list_scanners.return_value = ["semgrep"]
         mock_orchestrator_class.return_value = mock_orchestrator
 
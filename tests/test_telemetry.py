@@ -5,14 +5,17 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
 from flowspec_cli.telemetry import (
+    BufferedTelemetryWriter,
     RoleEvent,
     TelemetryEvent,
     TelemetryWriter,
+    flush_writer,
     hash_pii,
     reset_writer,
     sanitize_path,
@@ -285,6 +288,121 @@ class TestTelemetryWriter:
         assert nested_path.exists()
 
 
+class TestBufferedTelemetryWriter:
+    """Tests for the BufferedTelemetryWriter class."""
+
+    def test_write_is_deferred_until_flush(self, tmp_path: Path):
+        """Test events are queued, not written, on the calling thread."""
+        path = tmp_path / "telemetry.jsonl"
+        writer = BufferedTelemetryWriter(path, flush_interval=60)
+        try:
+            assert writer.write_event(TelemetryEvent.create(RoleEvent.ROLE_SELECTED))
+            assert not path.exists()
+
+            assert writer.flush() == 1
+            assert TelemetryWriter(path).count_events() == 1
+        finally:
+            writer.close()
+
+    def test_batch_size_triggers_background_flush(self, tmp_path: Path):
+        """Test the flush thread writes once batch_size events are queued."""
+        path = tmp_path / "telemetry.jsonl"
+        writer = BufferedTelemetryWriter(path, batch_size=3, flush_interval=60)
+        try:
+            for _ in range(3):
+                writer.write_event(TelemetryEvent.create(RoleEvent.ROLE_SELECTED))
+
+            reader = TelemetryWriter(path)
+            deadline = time.monotonic() + 5
+            while reader.count_events() < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert reader.count_events() == 3
+        finally:
+            writer.close()
+
+    def test_close_flushes_pending_events(self, tmp_path: Path):
+        """Test close writes pending events and later writes go straight through."""
+        path = tmp_path / "telemetry.jsonl"
+        writer = BufferedTelemetryWriter(path, flush_interval=60)
+        writer.write_event(TelemetryEvent.create(RoleEvent.ROLE_SELECTED))
+
+        writer.close()
+        writer.write_event(TelemetryEvent.create(RoleEvent.ROLE_CHANGED))
+
+        assert [e["event_type"] for e in TelemetryWriter(path).read_events()] == [
+            "role.changed",
+            "role.selected",
+        ]
+
+    def test_full_queue_drops_events(self, tmp_path: Path):
+        """Test events beyond the queue bound are dropped and counted."""
+        writer = BufferedTelemetryWriter(
+            tmp_path / "telemetry.jsonl", max_queue=2, flush_interval=60
+        )
+        try:
+            events = [TelemetryEvent.create(RoleEvent.ROLE_SELECTED) for _ in range(5)]
+
+            assert writer.write_events(events) == 2
+            assert writer.dropped_events == 3
+            assert writer.flush() == 2
+
+            # The drop count is recorded once, after the written events
+            recorded = writer.read_events()
+            assert [e["event_type"] for e in recorded] == [
+                "telemetry.events_dropped",
+                "role.selected",
+                "role.selected",
+            ]
+            assert recorded[0]["context"] == {"dropped": 3}
+            assert writer.flush() == 0
+            assert writer.count_events() == 3
+        finally:
+            writer.close()
+
+    def test_failed_batch_is_counted_as_dropped(self, tmp_path: Path, monkeypatch):
+        """Test events of a batch that could not be written are counted."""
+        writer = BufferedTelemetryWriter(
+            tmp_path / "telemetry.jsonl", flush_interval=60
+        )
+        try:
+            writer.write_events(
+                [TelemetryEvent.create(RoleEvent.ROLE_SELECTED) for _ in range(2)]
+            )
+
+            def fail(lines, fsync=True):
+                raise OSError("disk full")
+
+            monkeypatch.setattr(writer, "_append", fail)
+            assert writer.flush() == 0
+            assert writer.dropped_events == 2
+
+            monkeypatch.undo()
+            writer.write_event(TelemetryEvent.create(RoleEvent.ROLE_CHANGED))
+            assert writer.flush() == 1
+
+            recorded = writer.read_events()
+            assert [e["event_type"] for e in recorded] == [
+                "telemetry.events_dropped",
+                "role.changed",
+            ]
+            assert recorded[0]["context"] == {"dropped": 2}
+        finally:
+            writer.close()
+
+    def test_close_at_exit_skips_fsync(self, tmp_path: Path, monkeypatch):
+        """Test the exit flush writes pending events without syncing them."""
+        path = tmp_path / "telemetry.jsonl"
+        writer = BufferedTelemetryWriter(path, flush_interval=60)
+        writer.write_event(TelemetryEvent.create(RoleEvent.ROLE_SELECTED))
+        fsyncs = []
+        monkeypatch.setattr(os, "fsync", fsyncs.append)
+
+        writer.close(fsync=False)
+
+        assert fsyncs == []
+        assert TelemetryWriter(path).count_events() == 1
+
+
 class TestTrackRoleEvent:
     """Tests for the track_role_event function."""
 
@@ -306,6 +424,7 @@ class TestTrackRoleEvent:
             role="dev",
             project_root=tmp_path,
         )
+        flush_writer()
 
         assert event is not None
         assert event.role == "dev"
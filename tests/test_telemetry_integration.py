@@ -10,6 +10,7 @@ import pytest
 
 from flowspec_cli.telemetry import (
     enable_telemetry,
+    flush_writer,
     is_telemetry_enabled,
     reset_writer,
     track_agent_invocation,
@@ -121,6 +122,7 @@ class TestRoleSelectionTracking:
 
     def _read_events(self, project_root: Path) -> list[dict]:
         """Read events from telemetry file."""
+        flush_writer()
         telemetry_path = project_root / ".flowspec" / "telemetry.jsonl"
         if not telemetry_path.exists():
             return []
@@ -204,6 +206,7 @@ class TestAgentInvocationTracking:
 
     def _read_events(self, project_root: Path) -> list[dict]:
         """Read events from telemetry file."""
+        flush_writer()
         telemetry_path = project_root / ".flowspec" / "telemetry.jsonl"
         if not telemetry_path.exists():
             return []
@@ -244,6 +247,7 @@ class TestHandoffTracking:
 
     def _read_events(self, project_root: Path) -> list[dict]:
         """Read events from telemetry file."""
+        flush_writer()
         telemetry_path = project_root / ".flowspec" / "telemetry.jsonl"
         if not telemetry_path.exists():
             return []
@@ -284,6 +288,7 @@ class TestCommandTracking:
 
     def _read_events(self, project_root: Path) -> list[dict]:
         """Read events from telemetry file."""
+        flush_writer()
         telemetry_path = project_root / ".flowspec" / "telemetry.jsonl"
         if not telemetry_path.exists():
             return []
@@ -342,6 +347,7 @@ class TestWorkflowTracking:
 
     def _read_events(self, project_root: Path) -> list[dict]:
         """Read events from telemetry file."""
+        flush_writer()
         telemetry_path = project_root / ".flowspec" / "telemetry.jsonl"
         if not telemetry_path.exists():
             return []
@@ -417,6 +423,7 @@ class TestEndToEndIntegration:
 
     def _read_events(self, project_root: Path) -> list[dict]:
         """Read events from telemetry file."""
+        flush_writer()
         telemetry_path = project_root / ".flowspec" / "telemetry.jsonl"
         if not telemetry_path.exists():
             return []
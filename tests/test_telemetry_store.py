@@ -0,0 +1,228 @@
+"""Tests for the indexed telemetry store.
+
+Tests cover:
+- Per-day rollups and incremental indexing
+- Time-bounded event reads
+- Index invalidation when the JSONL file is cleared
+- Tail reads and the stats/view/export commands
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from flowspec_cli.telemetry.cli import telemetry_app
+from flowspec_cli.telemetry.store import TelemetryStore, open_store
+from flowspec_cli.telemetry.writer import TelemetryWriter
+
+
+def days_ago(days: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def make_event(days: float = 0, **fields) -> dict:
+    return {"event_type": "role.selected", "timestamp": days_ago(days), **fields}
+
+
+def append(path: Path, *events: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+@pytest.fixture
+def telemetry_path(tmp_path: Path) -> Path:
+    return tmp_path / ".flowspec" / "telemetry.jsonl"
+
+
+class TestTelemetryStore:
+    """Tests for TelemetryStore."""
+
+    def test_rollups_by_day(self, telemetry_path: Path):
+        append(
+            telemetry_path,
+            make_event(40, role="pm"),
+            make_event(2, role="dev", agent="backend-engineer"),
+            make_event(0, event_type="agent.invoked", role="dev", command="/flow:x"),
+        )
+
+        store = open_store(telemetry_path)
+
+        assert store.total == 3
+        assert len(store.days) == 3
+        recent = store.rollup(days=7)
+        assert recent.count == 2
+        assert recent.roles == {"dev": 2}
+        assert recent.agents == {"backend-engineer": 1}
+        assert recent.commands == {"/flow:x": 1}
+        assert store.rollup().count == 3
+
+    def test_refresh_is_incremental(self, telemetry_path: Path, monkeypatch):
+        append(telemetry_path, make_event(), make_event())
+        open_store(telemetry_path)
+
+        append(telemetry_path, make_event(role="qa"))
+        indexed = []
+        original = TelemetryStore._index_line
+        monkeypatch.setattr(
+            TelemetryStore,
+            "_index_line",
+            lambda self, line, pos: indexed.append(line) or original(self, line, pos),
+        )
+        store = open_store(telemetry_path)
+
+        assert len(indexed) == 1
+        assert store.total == 3
+        assert store.rollup(days=1).roles == {"qa": 1}
+
+    def test_partial_line_is_not_indexed(self, telemetry_path: Path):
+        append(telemetry_path, make_event())
+        with telemetry_path.open("a") as f:
+            f.write('{"event_type": "role.sel')
+
+        store = open_store(telemetry_path)
+        assert store.total == 1
+
+        with telemetry_path.open("a") as f:
+            f.write('ected", "timestamp": "%s"}\n' % days_ago(0))
+        store.refresh()
+        assert store.total == 2
+
+    def test_iter_events_skips_old_days(self, telemetry_path: Path):
+        append(
+            telemetry_path,
+            make_event(30, role="old"),
+            make_event(1, role="new"),
+            make_event(0, role="newer"),
+        )
+
+        store = open_store(telemetry_path)
+
+        assert [e["role"] for e in store.iter_events(days=7)] == ["new", "newer"]
+        assert len(list(store.iter_events())) == 3
+        assert list(store.iter_events(days=0)) == []
+
+    def test_window_covers_last_n_days(self, telemetry_path: Path):
+        append(
+            telemetry_path,
+            make_event(50 / 24, role="old"),
+            make_event(25 / 24, role="old"),
+            make_event(23 / 24, role="new"),
+            make_event(1 / 24, role="new"),
+        )
+
+        store = open_store(telemetry_path)
+
+        assert store.rollup(days=1).roles == {"new": 2}
+        assert [e["role"] for e in store.iter_events(days=1)] == ["new", "new"]
+        assert store.rollup(days=2).count == 3
+
+    def test_out_of_order_events_count_once(self, telemetry_path: Path, monkeypatch):
+        start = datetime(2026, 1, 10, 12, tzinfo=timezone.utc)
+        monkeypatch.setattr(
+            "flowspec_cli.telemetry.store.window_start", lambda days: start
+        )
+        append(
+            telemetry_path,
+            {"event_type": "role.selected", "timestamp": "2026-01-10T11:00:00+00:00"},
+            {"event_type": "role.selected", "timestamp": "2026-01-10T13:00:00+00:00"},
+            {"event_type": "role.selected", "timestamp": "2026-01-11T01:00:00+00:00"},
+            {"event_type": "role.selected", "timestamp": "2026-01-10T14:00:00+00:00"},
+        )
+
+        store = open_store(telemetry_path)
+
+        assert store.rollup(days=1).count == 3
+        assert len(list(store.iter_events(days=1))) == 3
+
+    def test_undated_events_are_outside_windows(self, telemetry_path: Path):
+        append(
+            telemetry_path,
+            {"event_type": "role.selected"},
+            make_event(role="dev"),
+        )
+
+        store = open_store(telemetry_path)
+
+        assert store.total == 2
+        assert store.rollup(days=7).count == 1
+        assert len(list(store.iter_events(days=7))) == 1
+        assert len(list(store.iter_events())) == 2
+
+    def test_cleared_file_rebuilds_index(self, telemetry_path: Path):
+        append(telemetry_path, make_event(role="dev"), make_event(role="dev"))
+        open_store(telemetry_path)
+
+        telemetry_path.unlink()
+        append(telemetry_path, make_event(role="pm", agent="pm-planner"))
+        store = open_store(telemetry_path)
+
+        assert store.total == 1
+        assert store.rollup().roles == {"pm": 1}
+
+    def test_unreadable_index_is_rebuilt(self, telemetry_path: Path):
+        append(telemetry_path, make_event())
+        store = open_store(telemetry_path)
+        store.index_path.write_text("{not json")
+
+        assert open_store(telemetry_path).total == 1
+
+
+class TestTailRead:
+    """Tests for reading recent events from the end of the file."""
+
+    def test_read_events_across_blocks(self, telemetry_path: Path, monkeypatch):
+        monkeypatch.setattr("flowspec_cli.telemetry.writer.TAIL_BLOCK_SIZE", 64)
+        append(telemetry_path, *[make_event(role=f"r{i}") for i in range(50)])
+
+        events = TelemetryWriter(telemetry_path).read_events(limit=3)
+
+        assert [e["role"] for e in events] == ["r49", "r48", "r47"]
+        assert len(TelemetryWriter(telemetry_path).read_events(limit=0)) == 50
+
+
+class TestTelemetryCommands:
+    """Tests for commands reading through the store."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path, telemetry_path: Path) -> Path:
+        append(
+            telemetry_path,
+            make_event(60, role="pm"),
+            *[make_event(1, role="dev", agent="backend-engineer") for _ in range(3)],
+        )
+        return tmp_path
+
+    def test_stats_uses_window(self, project: Path):
+        result = CliRunner().invoke(
+            telemetry_app, ["stats", "--days", "7", "--project-root", str(project)]
+        )
+
+        assert result.exit_code == 0
+        assert "backend-engineer" in result.output
+        assert "pm" not in result.output.split("Roles Used")[1]
+        assert "Total events: 3" in result.output
+
+    def test_view_shows_total(self, project: Path):
+        result = CliRunner().invoke(
+            telemetry_app, ["view", "-n", "2", "--project-root", str(project)]
+        )
+
+        assert result.exit_code == 0
+        assert "showing 2 of 4" in result.output
+
+    def test_export_reads_all_events(self, project: Path):
+        output = project / "export.json"
+        result = CliRunner().invoke(
+            telemetry_app,
+            ["export", "-o", str(output), "--project-root", str(project)],
+        )
+
+        assert result.exit_code == 0
+        assert len(json.loads(output.read_text())) == 4
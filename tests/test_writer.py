@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime
 
-from flowspec_cli.backlog.writer import BacklogWriter
+from flowspec_cli.backlog.writer import BacklogWriter, scan_frontmatter
 from flowspec_cli.backlog.parser import Task
 
 
@@ -451,3 +451,107 @@ class TestBacklogWriter:
         assert "status: To Do" in content1
         assert "status: Done" in content2
         assert "status: To Do" in content3
+
+    def test_write_tasks_streamed_in_order(self, backlog_dir):
+        """Test a task stream larger than one batch is written in order."""
+        writer = BacklogWriter(backlog_dir, max_workers=4)
+        count = BacklogWriter.BATCH_SIZE + 10
+
+        created = writer.write_tasks(
+            Task(task_id=f"T{i:04d}", description=f"Task {i}") for i in range(count)
+        )
+
+        assert len(created) == count
+        assert [p.name.split(" ")[0] for p in created] == [
+            f"task-{i:04d}" for i in range(count)
+        ]
+
+    def test_write_tasks_leaves_no_temp_files(self, backlog_dir):
+        """Test atomic writes clean up their temporary files."""
+        writer = BacklogWriter(backlog_dir)
+        tasks = [Task(task_id=f"T00{i}", description=f"Task {i}") for i in range(5)]
+
+        writer.write_tasks(tasks)
+        writer.write_tasks(tasks, overwrite=True)
+
+        names = [p.name for p in writer.tasks_dir.iterdir()]
+        assert len(names) == 5
+        assert not [name for name in names if name.endswith(".tmp")]
+
+    def test_write_tasks_duplicate_target_last_wins(self, backlog_dir):
+        """Test two tasks mapping to one file keep sequential semantics."""
+        writer = BacklogWriter(backlog_dir)
+        tasks = [
+            Task(task_id="T001", description="Same task"),
+            Task(task_id="T001", description="Same task", is_completed=True),
+        ]
+
+        created = writer.write_tasks(tasks, overwrite=True)
+
+        assert len(created) == 2
+        assert "status: Done" in created[0].read_text()
+
+    def test_get_task_stats_labels(self, backlog_dir):
+        """Test label histogram only counts frontmatter labels."""
+        writer = BacklogWriter(backlog_dir)
+        tasks = [
+            Task(task_id="T001", description="Task 1", user_story="US1"),
+            Task(
+                task_id="T002",
+                description="Task 2",
+                user_story="US1",
+                is_parallelizable=True,
+                dependencies=["T001"],
+            ),
+        ]
+
+        writer.write_tasks(tasks)
+        stats = writer.get_task_stats()
+
+        assert stats["by_label"] == {"US1": 2, "parallelizable": 1}
+
+
+class TestScanFrontmatter:
+    """Test suite for the frontmatter scanner."""
+
+    def test_block_labels(self):
+        """Test status and block-style labels are extracted."""
+        lines = [
+            "---",
+            "id: task-001",
+            "status: In Progress",
+            "assignee:",
+            "  - alice",
+            "labels:",
+            "  - backend",
+            "  - 'US1'",
+            "dependencies:",
+            "  - task-000",
+            "---",
+            "status: ignored",
+            "  - ignored",
+        ]
+
+        assert scan_frontmatter(lines) == ("In Progress", ["backend", "US1"])
+
+    def test_inline_labels(self):
+        """Test inline list labels are extracted."""
+        lines = ["---", "status: To Do", "labels: [a, 'b']", "---"]
+
+        assert scan_frontmatter(lines) == ("To Do", ["a", "b"])
+
+    def test_no_frontmatter(self):
+        """Test files without frontmatter yield nothing."""
+        assert scan_frontmatter(["status: Done", "labels: [a]"]) == (None, [])
+
+    def test_stops_at_closing_marker(self):
+        """Test lines after the frontmatter are never consumed."""
+        consumed = []
+
+        def lines():
+            for line in ["---\n", "status: Done\n", "---\n", "body\n", "more\n"]:
+                consumed.append(line)
+                yield line
+
+        assert scan_frontmatter(lines()) == ("Done", [])
+        assert len(consumed) == 3